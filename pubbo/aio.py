@@ -0,0 +1,251 @@
+import asyncio
+import inspect
+import time
+from .client import InterfaceProxy
+from .util import under_score_to_camel
+from .flight import AsyncSingleFlight
+from .metrics import NOOP
+from .serialization import EVENT_FLAG, REQUEST_FLAG, TWO_WAY_FLAG, FastJSONSerialization, HessianSerialization
+from .transport import HEAD_LENGTH
+
+
+class AsyncConnection(object):
+    # asyncio 版的 Connection 一条连接上可以同时有多个调用在等待响应
+    reader = None
+    writer = None
+    closed = False
+    error = None
+    # 同 Connection.heartbeat
+    heartbeat = 60
+    last_read = 0
+    last_write = 0
+
+    def __init__(self, reader, writer, heartbeat=60):
+        self.reader = reader
+        self.writer = writer
+        self.heartbeat = heartbeat
+        self.closed = False
+        self.error = None
+        self.pending = {}
+        self.last_read = self.last_write = time.monotonic()
+        self.task = asyncio.ensure_future(self.run())
+
+    @classmethod
+    async def open(cls, ip, port, timeout=5, heartbeat=60):
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(ip, int(port)), timeout)
+        return cls(reader, writer, heartbeat)
+
+    async def request(self, request_id, message, timeout=None):
+        if self.closed:
+            raise Exception("dubbo connection closed") from self.error
+
+        future = asyncio.get_event_loop().create_future()
+        self.pending[request_id] = future
+
+        async def call():
+            self.writer.write(message)
+            self.last_write = time.monotonic()
+            # 对端不读时 drain 会一直等 和等待响应一起算在 timeout 内
+            await self.writer.drain()
+            return await future
+
+        try:
+            return await asyncio.wait_for(call(), timeout)
+        except asyncio.TimeoutError:
+            # 3.11 起 asyncio.TimeoutError 就是内置的 TimeoutError 属于 OSError 超时不应关闭连接
+            raise
+        except OSError as e:
+            self.close(e)
+            raise
+        finally:
+            self.pending.pop(request_id, None)
+
+    def keep_alive(self):
+        now = time.monotonic()
+        if now - self.last_read > self.heartbeat * 3:
+            raise Exception("dubbo connection heartbeat timeout")
+        if now - max(self.last_read, self.last_write) >= self.heartbeat:
+            self.last_write = now
+            self.writer.write(HessianSerialization().encode_heartbeat())
+
+    def close(self, error=None):
+        if self.closed:
+            return
+        self.closed = True
+        self.error = error
+
+        pending, self.pending = self.pending, {}
+        self.writer.close()
+        if self.task is not asyncio.current_task():
+            self.task.cancel()
+
+        for future in pending.values():
+            if not future.done():
+                exception = Exception("dubbo connection closed")
+                exception.__cause__ = error
+                future.set_exception(exception)
+
+    async def run(self):
+        try:
+            while True:
+                try:
+                    # 等待中被取消时 readexactly 不会消费 buffer 中的数据
+                    head = await asyncio.wait_for(self.reader.readexactly(HEAD_LENGTH), self.heartbeat)
+                except asyncio.TimeoutError:
+                    self.keep_alive()
+                    continue
+
+                self.last_read = time.monotonic()
+                request_id = int.from_bytes(head[4:12], byteorder="big")
+                length = int.from_bytes(head[12:16], byteorder="big")
+                payload = await self.reader.readexactly(length)
+
+                if head[2] & EVENT_FLAG:
+                    # 心跳的响应直接丢弃 provider 发来的心跳请求需要回复
+                    if head[2] & REQUEST_FLAG and head[2] & TWO_WAY_FLAG:
+                        self.writer.write(HessianSerialization().encode_heartbeat(head[4:12]))
+                    continue
+
+                # 已经超时的调用不再等待 响应直接丢弃
+                future = self.pending.pop(request_id, None)
+                if future is not None and not future.done():
+                    future.set_result((head, payload))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.close(e)
+
+
+class AsyncInterfaceProxy(InterfaceProxy):
+    # 用法与 InterfaceProxy 一致 调用返回 coroutine
+    # await proxy.xxx_method(parameter, timeout=1)
+    _flight_class = AsyncSingleFlight
+
+    async def invoke(self, method, *args, timeout=None, columnar=False, lazy=False, **kwargs):
+        invocation = self._message(method, args)
+        invocation.timeout, invocation.columnar, invocation.lazy = timeout, columnar, lazy
+        # filter 可以不经过 invoker 直接返回非 awaitable 的结果
+        result = self._invoker(invocation)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
+    async def _call(self, message):
+        # 不记录 send wait receive 三个阶段 发送到收到响应的耗时只计入 pubbo_call_seconds
+        method, timeout, columnar, lazy = message.method_name, message.timeout, message.columnar, message.lazy
+        probe = self.client.metrics.probe(self.interface, method)
+        request_id, message_byte, key = self._encode(message)
+        probe.stage("encode")
+        probe.size("request", len(message_byte))
+
+        cache = self._caches.get(method)
+        if cache is not None:
+            # 缓存解析好的对象时 columnar lazy 不同的调用拿到的形状不同 分开缓存
+            cache_key = key if cache.raw else key + (columnar, lazy)
+            found, value = cache.get(cache_key)
+            if found:
+                # 命中时不发请求 取缓存和解析的耗时记为 cache 阶段
+                if cache.raw:
+                    value = self._decode(*value, columnar, lazy, probe)
+                probe.stage("cache")
+                probe.finish()
+                return value
+
+        def request():
+            return self.client.request(request_id, message_byte, timeout)
+
+        try:
+            if self._coalesced(method):
+                head, payload = await self._flight.do(key, request, timeout)
+            else:
+                head, payload = await request()
+            probe.skip()
+            probe.size("response", HEAD_LENGTH + len(payload))
+            value = self._decode(head, payload, columnar, lazy, probe)
+            probe.stage("decode")
+        except Exception as e:
+            probe.error(e)
+            raise
+        finally:
+            probe.finish()
+
+        if cache is not None:
+            cache.put(cache_key, (head, payload) if cache.raw else value, len(payload))
+        return value
+
+    async def _batch(self, calls, concurrency=64, timeout=None):
+        # 同 InterfaceProxy._batch
+        timeout = self.client.timeout if timeout is None else timeout
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(method, args):
+            async with semaphore:
+                return await self.invoke(under_score_to_camel(method), *args)
+
+        tasks = [asyncio.ensure_future(call(method, args)) for method, args in calls]
+        if not tasks:
+            return []
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+
+        results = []
+        for task in tasks:
+            if task in pending:
+                task.cancel()
+                results.append(asyncio.TimeoutError("dubbo batch timeout"))
+            elif task.exception() is not None:
+                results.append(task.exception())
+            else:
+                results.append(task.result())
+        return results
+
+    def _stream(self, method, *args, **kwargs):
+        raise Exception("stream is not supported by AsyncDubboClient")
+
+
+class AsyncDubboClient(object):
+    url = None
+    timeout = None
+    serialization = FastJSONSerialization
+    heartbeat = 60
+    metrics = NOOP
+    filters = ()
+    connection = None
+
+    def __init__(self, url: str, timeout=5, serialization=FastJSONSerialization, heartbeat=60, metrics=None,
+                 filters=()):
+        # 第一次调用时才建立连接 之后所有调用共用这一条连接
+        self.url = url
+        self.timeout = timeout
+        self.serialization = serialization
+        self.heartbeat = heartbeat
+        self.metrics = NOOP if metrics is None else metrics
+        self.filters = tuple(filters)
+        self.connection = None
+        self.lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def connect(self):
+        async with self.lock:
+            if self.connection is None or self.connection.closed:
+                ip, port = self.url.split(":")
+                self.connection = await AsyncConnection.open(ip, port, self.timeout, self.heartbeat)
+            return self.connection
+
+    async def request(self, request_id, message, timeout=None):
+        connection = self.connection
+        if connection is None or connection.closed:
+            connection = await self.connect()
+        return await connection.request(request_id, message, self.timeout if timeout is None else timeout)
+
+    async def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def proxy(self, interface, service_version, filters=()):
+        return AsyncInterfaceProxy(self, interface, service_version, filters)
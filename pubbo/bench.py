@@ -0,0 +1,372 @@
+import argparse
+import asyncio
+import datetime
+import json
+import platform
+import sys
+import threading
+import time
+from .aio import AsyncDubboClient
+from .client import DubboClient
+from .common import JavaClass, RequestMessage
+from .hessian import Hessian2Deserializer, Hessian2Serializer
+from .mock import MockProvider, items
+from .serialization import FastJSONSerialization, HessianSerialization
+
+# 编码 解析 和端到端调用的基准测试 结果输出为 JSON
+# python -m pubbo.bench [--quick] [--only decode] [--output result.json] [--compare baseline.json]
+
+INTERFACE = "com.pubbo.bench.BenchFacade"
+
+# name -> function(scale) 返回该项的结果 dict
+cases = {}
+
+
+def case(name):
+    def decorator(function):
+        cases[name] = function
+        return function
+
+    return decorator
+
+
+def measure(function, repeat, min_time=0.2):
+    # 每轮至少跑 min_time 秒 取最快一轮的单次耗时
+    number, best = 1, None
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return None
+    return values[min(int(len(values) * p / 100), len(values) - 1)]
+
+
+def serialize(value):
+    serializer = Hessian2Serializer()
+    serializer.serialize(value)
+    return bytes(serializer.message)
+
+
+def decode_result(message, repeat, **kwargs):
+    seconds = measure(lambda: Hessian2Deserializer(message, **kwargs).deserialize(), repeat)
+    return {
+        "bytes": len(message),
+        "seconds": seconds,
+        "ops_per_second": 1 / seconds,
+        "mb_per_second": len(message) / seconds / 1024 / 1024,
+    }
+
+
+def object_graph(scale):
+    # 多层嵌套的对象 子节点引用父节点 同一个 owner 被大量引用
+    owner = JavaClass("com.pubbo.bench.User")
+    owner.user_id, owner.user_name, owner.created_at = 1, "owner", datetime.datetime(2020, 1, 2)
+
+    def node(depth, parent):
+        value = JavaClass("com.pubbo.bench.Node")
+        value.node_id, value.depth, value.weight = depth * 100, depth, depth / 3
+        value.label, value.owner, value.parent = "node-{}".format(depth), owner, parent
+        value.children = [node(depth - 1, value) for _ in range(3)] if depth > 0 else []
+        return value
+
+    return [node(5, None) for _ in range(max(scale // 10, 1))]
+
+
+def strings(scale):
+    return ["{}-{}".format(i, ("ascii-text-" if i % 2 else "中文内容-") * 40) for i in range(scale * 10)]
+
+
+def numbers(scale):
+    return {
+        "ints": list(range(-scale * 100, scale * 100, 3)),
+        "longs": [i * 2 ** 33 for i in range(scale * 50)],
+        "doubles": [i / 7 for i in range(scale * 50)],
+    }
+
+
+def maps_with_refs(scale):
+    shared = {"region": "cn-east", "tags": ["a", "b"]}
+    result = []
+    for i in range(scale * 10):
+        value = {"id": i, "name": "row-{}".format(i), "shared": shared}
+        if result:
+            value["previous"] = result[-1]
+        result.append(value)
+    return result
+
+
+@case("decode_object_graph")
+def decode_object_graph(scale, repeat):
+    return decode_result(serialize(object_graph(scale)), repeat)
+
+
+@case("decode_object_graph_lazy")
+def decode_object_graph_lazy(scale, repeat):
+    message = serialize(object_graph(scale))
+    result = decode_result(message, repeat, lazy=True)
+    # 只访问根节点的一个字段
+    result["seconds_first_field"] = measure(
+        lambda: Hessian2Deserializer(message, lazy=True).deserialize()[0].label, repeat
+    )
+    return result
+
+
+@case("decode_strings")
+def decode_strings(scale, repeat):
+    return decode_result(serialize(strings(scale)), repeat)
+
+
+@case("decode_numbers")
+def decode_numbers(scale, repeat):
+    return decode_result(serialize(numbers(scale)), repeat)
+
+
+@case("decode_maps_with_refs")
+def decode_maps_with_refs(scale, repeat):
+    return decode_result(serialize(maps_with_refs(scale)), repeat)
+
+
+@case("decode_list_columnar")
+def decode_list_columnar(scale, repeat):
+    message = serialize(items(scale * 10)())
+    return decode_result(message, repeat, columnar=True)
+
+
+def request_message(scale):
+    order = JavaClass("com.pubbo.bench.OrderRequest")
+    order.order_id, order.buyer_name, order.created_at = 1, "买家", datetime.datetime(2020, 1, 2)
+    order.items = []
+    for i in range(scale):
+        item = JavaClass("com.pubbo.bench.OrderItem")
+        item.sku_id, item.quantity, item.price = i, i % 5 + 1, i * 1.5
+        item.sku = JavaClass("com.pubbo.bench.Sku")
+        item.sku.sku_name, item.sku.attributes = "sku-{}".format(i), {"color": "red", "size": i}
+        order.items.append(item)
+
+    message = RequestMessage()
+    message.dubbo_version = "2.6.2"
+    message.service_name = INTERFACE
+    message.service_version = "1.0.0"
+    message.method_name = "createOrder"
+    message.method_parameter_types = ["com.pubbo.bench.OrderRequest"]
+    message.method_arguments = [order]
+    return message
+
+
+def encode_result(serialization, scale, repeat):
+    message = request_message(scale)
+    size = len(serialization().encode_request(message))
+    seconds = measure(lambda: serialization().encode_request(message), repeat)
+    return {"bytes": size, "seconds": seconds, "ops_per_second": 1 / seconds}
+
+
+@case("encode_fastjson")
+def encode_fastjson(scale, repeat):
+    return encode_result(FastJSONSerialization, scale, repeat)
+
+
+@case("encode_hessian")
+def encode_hessian(scale, repeat):
+    return encode_result(HessianSerialization, scale, repeat)
+
+
+def call_result(latencies, elapsed):
+    return {
+        "calls": len(latencies),
+        "seconds": elapsed,
+        "ops_per_second": len(latencies) / elapsed,
+        "p50": percentile(latencies, 50),
+        "p90": percentile(latencies, 90),
+        "p99": percentile(latencies, 99),
+        "max": max(latencies),
+    }
+
+
+def fastest(results):
+    # 端到端调用跑 repeat 轮 与 measure 一样取最快的一轮
+    return max(results, key=lambda i: i["ops_per_second"])
+
+
+def provider(scale):
+    value = JavaClass("com.pubbo.bench.User")
+    value.user_id, value.user_name = 1, "user"
+    mock = MockProvider(workers=32)
+    mock.register(INTERFACE, "getUser", lambda user_id: value)
+    mock.register(INTERFACE, "listItems", items(scale * 10))
+    mock.start()
+    return mock
+
+
+def sync_calls(url, method, calls, concurrency, serialization, repeat):
+    client = DubboClient(url, serialization=serialization)
+    proxy = client.proxy(INTERFACE, "1.0.0")
+    function = getattr(proxy, method)
+
+    def work(count, latencies):
+        for _ in range(count):
+            start = time.perf_counter()
+            function(1)
+            latencies.append(time.perf_counter() - start)
+
+    def once():
+        latencies = []
+        count = max(calls // concurrency, 1)
+        threads = [threading.Thread(target=work, args=(count, latencies)) for _ in range(concurrency)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return call_result(latencies, time.perf_counter() - start)
+
+    # 预热 建好连接
+    function(1)
+    try:
+        return fastest([once() for _ in range(repeat)])
+    finally:
+        client.close()
+
+
+@case("call_sync")
+def call_sync(scale, repeat):
+    mock = provider(scale)
+    try:
+        return sync_calls(mock.url, "get_user", scale * 20, 16, FastJSONSerialization, repeat)
+    finally:
+        mock.close()
+
+
+@case("call_sync_hessian")
+def call_sync_hessian(scale, repeat):
+    mock = provider(scale)
+    try:
+        return sync_calls(mock.url, "get_user", scale * 20, 16, HessianSerialization, repeat)
+    finally:
+        mock.close()
+
+
+@case("call_sync_list")
+def call_sync_list(scale, repeat):
+    mock = provider(scale)
+    try:
+        return sync_calls(mock.url, "list_items", scale * 2, 4, FastJSONSerialization, repeat)
+    finally:
+        mock.close()
+
+
+@case("call_async")
+def call_async(scale, repeat):
+    mock = provider(scale)
+    calls, concurrency = scale * 20, 64
+
+    async def main():
+        async with AsyncDubboClient(mock.url) as client:
+            proxy = client.proxy(INTERFACE, "1.0.0")
+
+            async def work(count, latencies):
+                for _ in range(count):
+                    start = time.perf_counter()
+                    await proxy.get_user(1)
+                    latencies.append(time.perf_counter() - start)
+
+            async def once():
+                latencies = []
+                start = time.perf_counter()
+                await asyncio.gather(*[work(max(calls // concurrency, 1), latencies) for _ in range(concurrency)])
+                return call_result(latencies, time.perf_counter() - start)
+
+            await proxy.get_user(1)
+            return fastest([await once() for _ in range(repeat)])
+
+    try:
+        return asyncio.run(main())
+    finally:
+        mock.close()
+
+
+def run(names, scale, repeat):
+    results = {}
+    for name in names:
+        results[name] = cases[name](scale, repeat)
+        print("{:<28}{:>14.1f} ops/s".format(name, results[name]["ops_per_second"]), file=sys.stderr)
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "time": datetime.datetime.now().isoformat(timespec="seconds"),
+        "scale": scale,
+        "results": results,
+    }
+
+
+def compare(report, baseline, threshold):
+    # 返回 ops_per_second 比基线低 threshold 以上的项
+    regressions = {}
+    for name, result in report["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        ratio = result["ops_per_second"] / base["ops_per_second"]
+        result["baseline_ratio"] = ratio
+        if ratio < 1 - threshold:
+            regressions[name] = ratio
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m pubbo.bench")
+    parser.add_argument("--only", action="append", default=[], help="只跑名字中包含该字符串的项 可以多次指定")
+    parser.add_argument("--quick", action="store_true", help="缩小数据量 用于快速检查")
+    parser.add_argument("--scale", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="结果写入文件 默认输出到 stdout")
+    parser.add_argument("--compare", help="对比的基线结果文件")
+    parser.add_argument("--threshold", type=float, default=0.1, help="ops/s 低于基线的比例超过该值时视为退化")
+    parser.add_argument("--list", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(cases))
+        return 0
+
+    names = [i for i in cases if not args.only or any(j in i for j in args.only)]
+    scale = args.scale or (10 if args.quick else 100)
+    report = run(names, scale, 1 if args.quick else args.repeat)
+
+    regressions = {}
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        report["regressions"] = regressions
+
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    for name, ratio in regressions.items():
+        print("regression: {} {:.1%} of baseline".format(name, ratio), file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+import collections
+import threading
+import time
+
+
+class ResponseCache(object):
+    # 调用结果缓存 key 为请求 body 中 attachments 之前的部分 (服务 版本 方法 编码后的参数) 和影响结果的 attachments
+    # 超过 ttl 秒的过期 超过 max_size 个或 max_bytes 时淘汰最久没有用到的
+    # raw 为 True 时缓存响应的 head 和 payload 命中时再解析 否则缓存解析好的对象 命中时返回同一个对象
+    ttl = 60
+    max_size = 1024
+    max_bytes = None
+    raw = False
+
+    def __init__(self, ttl=60, max_size=1024, max_bytes=None, raw=False):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.raw = raw
+
+        self.entries = collections.OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        # 返回 (是否命中, 值)
+        now = time.monotonic()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] <= now:
+                self.remove(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return False, None
+
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return True, entry[1]
+
+    def put(self, key, value, size):
+        # size 为响应 payload 的 byte 数 用于 max_bytes
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        with self.lock:
+            if key in self.entries:
+                self.remove(key)
+            self.entries[key] = (time.monotonic() + self.ttl, value, size)
+            self.size += size
+
+            while len(self.entries) > self.max_size or (self.max_bytes is not None and self.size > self.max_bytes):
+                self.remove(next(iter(self.entries)))
+                self.evictions += 1
+
+    def remove(self, key):
+        _, _, size = self.entries.pop(key)
+        self.size -= size
+
+    def invalidate(self, key=None):
+        # 不指定 key 时清空 key 为 tuple 时同时去掉以它开头的 key
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+                self.size = 0
+            elif isinstance(key, tuple):
+                for i in [i for i in self.entries if i[:len(key)] == key]:
+                    self.remove(i)
+            elif key in self.entries:
+                self.remove(key)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self.entries),
+                "bytes": self.size,
+            }
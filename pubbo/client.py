@@ -1,13 +1,25 @@
-import socket
+import threading
+import time
+from concurrent.futures import TimeoutError
+from concurrent.futures import ThreadPoolExecutor
+from .cache import ResponseCache
 from .common import JavaObject, RequestMessage, GenericException
+from .filter import chain
+from .flight import SingleFlight
+from .hessian import ColumnTable
+from .metrics import NOOP, NOOP_PROBE
 from .serialization import ResponseTypeEnum, FastJSONSerialization, HessianSerialization
+from .transport import ConnectionPool, HEAD_LENGTH
 from .util import under_score_to_camel
 
 
 class InterfaceProxy(object):
+    # 没有定义的属性都是 Java 方法 proxy.get_user(...) 调用 getUser
+    # 内部的方法和属性都以 _ 开头 不会挡住同名的 Java 方法 batch enable_cache 等为模块级函数
     client = None
     interface = None
     service_version = None
+    _flight_class = SingleFlight
 
     class Method(object):
         def __init__(self, proxy, method):
@@ -17,12 +29,23 @@ class InterfaceProxy(object):
         def __call__(self, *args, **kwargs):
             return self.proxy.invoke(self.method, *args, **kwargs)
 
-    def __init__(self, client, interface, service_version):
+        def stream(self, *args, **kwargs):
+            return self.proxy._stream(self.method, *args, **kwargs)
+
+    def __init__(self, client, interface, service_version, filters=()):
         self.client = client
         self.interface = interface
         self.service_version = service_version
+        # 方法名 -> ResponseCache
+        self._caches = {}
+        # enable_single_flight 后才有 _flight_methods 为 None 时合并所有方法
+        self._flight = None
+        self._flight_methods = None
+        # client 的 filter 在前 proxy 的在后 创建时串好 之后不能再修改
+        self._filters = tuple(client.filters) + tuple(filters)
+        self._invoker = chain(self._filters, self._call)
 
-    def invoke(self, method, *args, **kwargs):
+    def _message(self, method, args):
         message = RequestMessage()
         message.dubbo_version = "2.6.2"
         message.service_name = self.interface
@@ -30,6 +53,8 @@ class InterfaceProxy(object):
         message.method_name = method
         message.method_parameter_types = []
         message.method_arguments = []
+        message.attachments = {}
+        message.ignored_attachments = set()
 
         for i in args:
             if not isinstance(i, (JavaObject,)):
@@ -37,50 +62,321 @@ class InterfaceProxy(object):
             message.method_parameter_types.append(i._class)
             message.method_arguments.append(i)
 
-        request_serialization = FastJSONSerialization()
+        return message
+
+    def _encode(self, message):
+        # 返回 (request_id, 请求帧, 缓存和合并调用的 key)
+        request_serialization = self.client.serialization()
         message_byte = request_serialization.encode_request(message)
+        request_id = int.from_bytes(request_serialization.request_id, byteorder="big")
 
-        self.client.connect.send(message_byte)
+        return request_id, message_byte, request_serialization.key
 
-        response_serialization = HessianSerialization()
+    def invoke(self, method, *args, timeout=None, columnar=False, lazy=False, **kwargs):
+        # timeout 为本次调用的超时 不指定时使用 client 的超时
+        # columnar 为 True 时 返回的同类对象 list 解析为 ColumnTable
+        # lazy 为 True 时 返回对象的字段在第一次访问时才解析 只用到少数字段的大对象可以省去大部分解析
+        invocation = self._message(method, args)
+        invocation.timeout, invocation.columnar, invocation.lazy = timeout, columnar, lazy
+        return self._invoker(invocation)
+
+    def _call(self, message):
+        # filter 链的最后一环 编码 发送 解析
+        method, timeout, columnar, lazy = message.method_name, message.timeout, message.columnar, message.lazy
+        if message.stream:
+            request_id, message_byte, _ = self._encode(message)
+            head, chunks = self.client.request(request_id, message_byte, True, timeout, message)
+            return self._iterate(head, chunks, message.keep_refs)
+
+        probe = self.client.metrics.probe(self.interface, method)
+        request_id, message_byte, key = self._encode(message)
+        probe.stage("encode")
+        probe.size("request", len(message_byte))
+
+        cache = self._caches.get(method)
+        if cache is not None:
+            # 缓存解析好的对象时 columnar lazy 不同的调用拿到的形状不同 分开缓存
+            cache_key = key if cache.raw else key + (columnar, lazy)
+            found, value = cache.get(cache_key)
+            if found:
+                # 命中时不发请求 取缓存和解析的耗时记为 cache 阶段
+                if cache.raw:
+                    value = self._decode(*value, columnar, lazy, probe)
+                probe.stage("cache")
+                probe.finish()
+                return value
+
+        def request():
+            return self.client.request(request_id, message_byte, False, timeout, message)
+
+        try:
+            if self._coalesced(method):
+                # 共享的是响应的 bytes 每个调用方各自解析 拿到各自的对象
+                head, payload = self._flight.do(key, request, timeout)
+            else:
+                head, payload = request()
+            # 发送和等待响应的耗时由 transport 分阶段记录
+            probe.skip()
+            probe.size("response", HEAD_LENGTH + len(payload))
+            value = self._decode(head, payload, columnar, lazy, probe)
+            probe.stage("decode")
+        except Exception as e:
+            probe.error(e)
+            raise
+        finally:
+            probe.finish()
+
+        # 异常响应在 _decode 中抛出 不会被缓存
+        if cache is not None:
+            cache.put(cache_key, (head, payload) if cache.raw else value, len(payload))
+        return value
+
+    def _batch(self, calls, concurrency=64, timeout=None):
+        # 请求在连接上流水线发出 响应按到达顺序处理
+        timeout = self.client.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        if self._filters:
+            return self._batch_filtered(calls, concurrency, deadline)
+        semaphore = threading.Semaphore(concurrency)
+
+        futures = []
+        for method, args in calls:
+            if not semaphore.acquire(timeout=max(deadline - time.monotonic(), 0)):
+                futures.append(TimeoutError("dubbo batch timeout"))
+                continue
 
-        head = self.client.connect.recv(16)
-        payload_length = response_serialization.deserialize_head(head)
+            try:
+                message = self._message(under_score_to_camel(method), args)
+                request_id, message_byte, _ = self._encode(message)
+                future = self.client.submit(request_id, message_byte, False, deadline - time.monotonic(), message)
+            except Exception as e:
+                semaphore.release()
+                futures.append(e)
+                continue
 
-        payload = b""
-        while len(payload) != payload_length:
-            payload += self.client.connect.recv(1024)
+            future.add_done_callback(lambda _: semaphore.release())
+            futures.append(future)
 
-        response = response_serialization.deserialize_payload(payload)
+        results = []
+        for future in futures:
+            if isinstance(future, (Exception,)):
+                results.append(future)
+                continue
+
+            try:
+                head, payload = future.result(max(deadline - time.monotonic(), 0))
+                results.append(self._decode(head, payload))
+            except TimeoutError:
+                future.cancel()
+                results.append(TimeoutError("dubbo batch timeout"))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def _batch_filtered(self, calls, concurrency, deadline):
+        # 有 filter 时每个调用都要经过 filter 链 改为在线程池中并发调用
+        def call(method, args):
+            return self.invoke(under_score_to_camel(method), *args, timeout=max(deadline - time.monotonic(), 0))
+
+        executor = ThreadPoolExecutor(max(min(concurrency, len(calls)), 1), thread_name_prefix="pubbo-batch")
+        try:
+            futures = [executor.submit(call, method, args) for method, args in calls]
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result(max(deadline - time.monotonic(), 0)))
+                except TimeoutError:
+                    future.cancel()
+                    results.append(TimeoutError("dubbo batch timeout"))
+                except Exception as e:
+                    results.append(e)
+            return results
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _coalesced(self, method):
+        return self._flight is not None and (self._flight_methods is None or method in self._flight_methods)
+
+
+    @staticmethod
+    def _decode(head, payload, columnar=False, lazy=False, probe=NOOP_PROBE):
+        # 同步和异步客户端共用的响应解析
+        response_serialization = HessianSerialization()
+        response_serialization.deserialize_head(head)
+        response = response_serialization.deserialize_payload(payload, columnar, lazy)
+        probe.decoded(response)
 
         if response.type is ResponseTypeEnum.NULL:
             return response.message
         elif response.type is ResponseTypeEnum.VALUE:
+            if isinstance(response.message, (ColumnTable,)):
+                return response.message
             return JavaObject.parse(response.message).value()
         elif response.type is ResponseTypeEnum.EXCEPTION:
             raise GenericException(response.message)
         else:
             raise Exception("dubbo response type undefined")
 
+    def _stream(self, method, *args, timeout=None, keep_refs=True, **kwargs):
+        # 返回值为 list 时边收边解 逐个产出元素 filter 拿到的结果为这个生成器
+        # keep_refs 为 False 时已产出的元素不再被引用 内存不随元素个数增长 元素之间有引用时不能用
+        invocation = self._message(method, args)
+        invocation.timeout, invocation.stream, invocation.keep_refs = timeout, True, keep_refs
+        return self._invoker(invocation)
+
+    @staticmethod
+    def _iterate(head, chunks, keep_refs=True):
+        try:
+            response_serialization = HessianSerialization()
+            response_serialization.deserialize_head(head)
+            response = response_serialization.deserialize_stream(chunks, keep_refs)
+            if response.type is ResponseTypeEnum.EXCEPTION:
+                raise GenericException(response.message)
+            yield from response.message
+        finally:
+            # 提前结束时关闭 stream 独占的连接
+            chunks.close()
+
     def __call__(self, method, *args, **kwargs):
         return self.invoke(method, *args, **kwargs)
 
-    def __getattr__(self, method):
-        method = under_score_to_camel(method)
-        return self.Method(self, method)
+    def __getattr__(self, name):
+        # 生成的 Method 放进实例属性 之后的访问不再经过 __getattr__
+        if name.startswith("__"):
+            raise AttributeError(name)
+        method = self.Method(self, under_score_to_camel(name))
+        self.__dict__[name] = method
+        return method
+
+
+def batch(proxy, calls, concurrency=64, timeout=None):
+    # calls 为 (method, args) 的 list 结果按输入顺序返回 AsyncInterfaceProxy 上返回 coroutine
+    # concurrency 为同时在途的请求数 timeout 为整批的期限
+    # 单个调用失败或超时时 对应位置为异常对象 不影响其他调用
+    return proxy._batch(calls, concurrency, timeout)
+
+
+def enable_single_flight(proxy, *methods):
+    # 同一时刻参数相同的调用共用一个请求 不指定方法时对所有方法生效
+    proxy._flight = proxy._flight_class()
+    proxy._flight_methods = {under_score_to_camel(i) for i in methods} or None
+
+
+def enable_cache(proxy, method, ttl=60, max_size=1024, max_bytes=None, raw=False):
+    # 对只读方法开启结果缓存 返回的 ResponseCache 可以查看命中统计
+    cache = ResponseCache(ttl, max_size, max_bytes, raw)
+    proxy._caches[under_score_to_camel(method)] = cache
+    return cache
+
+
+def invalidate(proxy, method, *args):
+    # 不传参数时清空这个方法的缓存 否则只去掉这组参数对应的结果
+    cache = proxy._caches.get(under_score_to_camel(method))
+    if cache is None:
+        return
+    if not args:
+        cache.invalidate()
+        return
+
+    # 去掉这组参数带任意 attachments 的结果
+    _, _, key = proxy._encode(proxy._message(under_score_to_camel(method), args))
+    cache.invalidate(key[:2])
 
 
 class DubboClient(object):
-    connect = None
+    pool = None
+    timeout = None
+    serialization = FastJSONSerialization
+    metrics = NOOP
+    filters = ()
+
+    def __init__(self, url: str, timeout=5, buffer_size=None, serialization=FastJSONSerialization,
+                 pool_size=4, max_pending=64, max_idle_time=60, heartbeat=60, metrics=None, filters=()):
+        # serialization 为请求使用的序列化 HessianSerialization 时按 hessian2 (id 2) 发送
+        # metrics 为 metrics.Metrics 的实例 不指定时不打点
+        # filters 为 filter.Filter 的 list 这个 client 创建的 proxy 都会经过它们
+        self.serialization = serialization
+        self.timeout = timeout
+        self.metrics = NOOP if metrics is None else metrics
+        self.filters = tuple(filters)
 
-    def __init__(self, url: str, timeout=5):
         ip, port = url.split(":")
-        self.connect = socket.socket()
-        self.connect.settimeout(timeout)
-        self.connect.connect((ip, int(port)))
+        # 连接按需创建 每条连接都可以被多个线程同时使用 请求按 request_id 对应响应
+        # 空闲的连接每 heartbeat 秒发一次心跳 None 为不发
+        self.pool = ConnectionPool(
+            ip, port, timeout, buffer_size, pool_size, max_pending, max_idle_time, heartbeat, self.metrics.enabled
+        )
 
     def __del__(self):
-        self.connect.close()
+        if self.pool is not None:
+            self.pool.close()
+
+    def request(self, request_id, message, stream=False, timeout=None, invocation=None):
+        # invocation 为请求对应的 RequestMessage 供集群选择 provider 使用
+        # timeout 是整个调用的期限 从连接池取连接 发送 到收到响应都算在内
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        future = self.submit(request_id, message, stream, timeout, invocation)
+        try:
+            return future.result(max(deadline - time.monotonic(), 0))
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def submit(self, request_id, message, stream=False, timeout=None, invocation=None):
+        # 发出请求后立即返回 Future 结果为 (head, payload) 完成或被取消时归还连接
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        probe = NOOP_PROBE
+        if invocation is not None:
+            probe = self.metrics.probe(invocation.service_name, invocation.method_name)
+
+        if stream:
+            return self.submit_stream(request_id, message, deadline)
+
+        connection = self.pool.checkout(timeout)
+        probe.stage("checkout")
+        try:
+            future = connection.request(request_id, message, stream, deadline)
+        except BaseException:
+            self.pool.checkin(connection)
+            raise
+
+        def done(future):
+            if future.cancelled():
+                connection.cancel(request_id)
+            self.pool.checkin(connection)
+
+            # 回调在 request 返回之后才加上 这时 sent 已经记下 stream 和失败的调用没有 received
+            if probe.enabled and hasattr(future, "received"):
+                probe.stage("send", future.sent - future.started)
+                probe.stage("wait", future.arrived - future.sent)
+                probe.stage("receive", future.received - future.arrived)
+
+        future.add_done_callback(done)
+        return future
+
+    def submit_stream(self, request_id, message, deadline):
+        # stream 独占一条新连接 消费方不读时 reader 停下也不会挡住其他调用
+        # 连接由 payload 的 Stream 关闭 没有拿到 Stream 时在这里关闭
+        connection = self.pool.connect()
+        try:
+            future = connection.request(request_id, message, True, deadline)
+        except BaseException:
+            connection.close()
+            raise
+
+        def done(future):
+            if future.cancelled() or future.exception() is not None:
+                connection.close()
+
+        future.add_done_callback(done)
+        return future
+
+    def close(self):
+        self.pool.close()
 
-    def proxy(self, interface, service_version):
-        return InterfaceProxy(self, interface, service_version)
+    def proxy(self, interface, service_version, filters=()):
+        return InterfaceProxy(self, interface, service_version, filters)
@@ -0,0 +1,303 @@
+import bisect
+import collections
+import hashlib
+import itertools
+import math
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, TimeoutError, wait
+from .client import DubboClient, InterfaceProxy
+from .common import JavaPrimitiveClass
+from .metrics import NOOP
+from .serialization import FastJSONSerialization, request_id_counter
+from .util import under_score_to_camel
+
+
+class Provider(object):
+    # 集群中的一个 provider 以及选择时用到的统计
+    url = None
+    client = None
+    active = 0
+    ewma = 0.0
+    last_update = 0
+
+    def __init__(self, url, client):
+        self.url = url
+        self.client = client
+        self.active = 0
+        self.ewma = 0.0
+        self.last_update = time.monotonic()
+        self.lock = threading.Lock()
+
+    def start(self):
+        with self.lock:
+            self.active += 1
+
+    def finish(self, elapsed, decay):
+        # 按距离上次更新的时间衰减旧值 比当前均值慢的响应直接作为新的峰值
+        with self.lock:
+            self.active -= 1
+            now = time.monotonic()
+            if elapsed > self.ewma:
+                self.ewma = elapsed
+            else:
+                weight = math.exp(-(now - self.last_update) / decay)
+                self.ewma = self.ewma * weight + elapsed * (1 - weight)
+            self.last_update = now
+
+    def cost(self):
+        # 还没有响应过的 provider 优先被尝试
+        return self.ewma * (self.active + 1)
+
+
+class LatencyWindow(object):
+    # 一个方法最近 size 次调用的耗时 percentile 分位数作为 hedge 前等待的时间
+    # 样本足够后才开始 hedge 之后每 64 次调用重新计算一次
+    percentile = 95
+    size = 1024
+    min_samples = 32
+
+    def __init__(self, percentile=95, size=1024):
+        self.percentile = percentile
+        self.samples = collections.deque(maxlen=size)
+        self.count = 0
+        self.value = None
+        self.lock = threading.Lock()
+
+    def add(self, elapsed):
+        with self.lock:
+            self.samples.append(elapsed)
+            self.count += 1
+            if len(self.samples) >= self.min_samples and (self.value is None or self.count % 64 == 0):
+                samples = sorted(self.samples)
+                self.value = samples[min(len(samples) - 1, len(samples) * self.percentile // 100)]
+
+    def delay(self):
+        return self.value
+
+
+class HedgeBudget(object):
+    # 令牌桶 每秒最多 rate 次 hedge 避免 provider 整体变慢时请求量翻倍
+    rate = 10
+
+    def __init__(self, rate=10):
+        self.rate = rate
+        self.tokens = rate
+        self.last_update = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.last_update) * self.rate)
+            self.last_update = now
+            if self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+
+class LoadBalance(object):
+    def select(self, providers, invocation):
+        raise Exception("need to overwrite")
+
+
+class RandomLoadBalance(LoadBalance):
+    def select(self, providers, invocation):
+        return random.choice(providers)
+
+
+class RoundRobinLoadBalance(LoadBalance):
+    def __init__(self):
+        self.counter = itertools.count()
+
+    def select(self, providers, invocation):
+        return providers[next(self.counter) % len(providers)]
+
+
+class LeastActiveLoadBalance(LoadBalance):
+    def select(self, providers, invocation):
+        least = min(i.active for i in providers)
+        return random.choice([i for i in providers if i.active == least])
+
+
+class PeakEwmaLoadBalance(LoadBalance):
+    # 随机取两个 provider 选 延迟峰值均值 * (进行中的调用 + 1) 较小的
+    def select(self, providers, invocation):
+        if len(providers) == 1:
+            return providers[0]
+        a, b = random.sample(providers, 2)
+        return a if a.cost() <= b.cost() else b
+
+
+class ConsistentHashLoadBalance(LoadBalance):
+    # 与 dubbo 的 ConsistentHashLoadBalance 一致 相同参数的调用总是落到同一个 provider
+    # arguments 为参与 hash 的参数下标
+    replicas = 160
+    arguments = (0,)
+
+    def __init__(self, arguments=(0,), replicas=160):
+        self.arguments = arguments
+        self.replicas = replicas
+        self.rings = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def hash(key):
+        digest = hashlib.md5(key.encode("utf-8")).digest()
+        return [int.from_bytes(digest[i * 4:i * 4 + 4], byteorder="little") for i in range(4)]
+
+    def ring(self, providers):
+        key = tuple(i.url for i in providers)
+        ring = self.rings.get(key)
+        if ring is None:
+            nodes = []
+            for provider in providers:
+                for i in range(self.replicas // 4):
+                    for h in self.hash("{}{}".format(provider.url, i)):
+                        nodes.append((h, provider))
+            nodes.sort(key=lambda i: i[0])
+            ring = ([i[0] for i in nodes], [i[1] for i in nodes])
+            with self.lock:
+                self.rings[key] = ring
+        return ring
+
+    @staticmethod
+    def key(argument):
+        if isinstance(argument, (JavaPrimitiveClass,)):
+            argument = argument.value()
+        return str(argument)
+
+    def select(self, providers, invocation):
+        hashes, nodes = self.ring(providers)
+        arguments = invocation.method_arguments
+        key = "".join(self.key(arguments[i]) for i in self.arguments if i < len(arguments))
+        index = bisect.bisect_left(hashes, self.hash(key)[0])
+        return nodes[index % len(nodes)]
+
+
+LOAD_BALANCE = {
+    "random": RandomLoadBalance,
+    "roundrobin": RoundRobinLoadBalance,
+    "leastactive": LeastActiveLoadBalance,
+    "peakewma": PeakEwmaLoadBalance,
+    "consistenthash": ConsistentHashLoadBalance,
+}
+
+
+class ClusterClient(object):
+    # 多个 provider 组成的集群 每次调用按 load_balance 选择一个 provider
+    # load_balance 可以是 LOAD_BALANCE 中的名字 也可以是 LoadBalance 实例
+    providers = None
+    load_balance = None
+    timeout = None
+    serialization = FastJSONSerialization
+    decay = 10
+    metrics = NOOP
+    filters = ()
+
+    def __init__(self, urls, load_balance="random", timeout=5, serialization=FastJSONSerialization, decay=10,
+                 idempotent=(), hedge_percentile=95, hedge_budget=10, metrics=None, filters=(), **kwargs):
+        # kwargs 原样传给每个 provider 的 DubboClient
+        # idempotent 中的方法可以 hedge: 超过最近耗时的 hedge_percentile 分位数还没有响应时
+        # 向另一个 provider 再发一次 取先到的响应 每秒最多 hedge_budget 次
+        # metrics 由各个 provider 的 DubboClient 共用
+        self.timeout = timeout
+        self.serialization = serialization
+        self.decay = decay
+        self.metrics = NOOP if metrics is None else metrics
+        # filter 包在选择 provider 之外 每次调用只经过一次
+        self.filters = tuple(filters)
+
+        # 方法名可以是 get_user 或 getUser 与 proxy 一样按驼峰名匹配
+        self.latencies = {under_score_to_camel(method): LatencyWindow(hedge_percentile) for method in idempotent}
+        self.budget = HedgeBudget(hedge_budget)
+
+        if isinstance(load_balance, str):
+            load_balance = LOAD_BALANCE[load_balance]()
+        self.load_balance = load_balance
+
+        self.providers = [
+            Provider(url, DubboClient(url, timeout=timeout, serialization=serialization, metrics=metrics, **kwargs))
+            for url in urls
+        ]
+
+    def select(self, invocation):
+        return self.load_balance.select(self.providers, invocation)
+
+    def request(self, request_id, message, stream=False, timeout=None, invocation=None):
+        window = None if stream or invocation is None else self.latencies.get(invocation.method_name)
+        if window is not None:
+            return self.hedge(window, request_id, message, timeout, invocation)
+
+        provider = self.select(invocation)
+        provider.start()
+        start = time.monotonic()
+        try:
+            return provider.client.request(request_id, message, stream, timeout, invocation)
+        finally:
+            provider.finish(time.monotonic() - start, self.decay)
+
+    def hedge(self, window, request_id, message, timeout, invocation):
+        timeout = self.timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+
+        provider = self.select(invocation)
+        futures = [self.submit_to(provider, request_id, message, False, timeout, invocation)]
+
+        try:
+            delay = window.delay()
+            if delay is not None and delay < timeout and not wait(futures, delay)[0] and self.budget.acquire():
+                # 换一个 provider 和新的 request_id 再发一次
+                others = [i for i in self.providers if i is not provider] or self.providers
+                backup = self.load_balance.select(others, invocation)
+                hedge_id = next(request_id_counter)
+                hedge_message = message[:4] + hedge_id.to_bytes(length=8, byteorder="big") + message[12:]
+                try:
+                    futures.append(self.submit_to(
+                        backup, hedge_id, hedge_message, False, deadline - time.monotonic(), invocation
+                    ))
+                    labels = {"interface": invocation.service_name, "method": invocation.method_name}
+                    self.metrics.increment("pubbo_hedges_total", 1, labels)
+                except Exception:
+                    # hedge 发不出去时继续等第一个请求
+                    pass
+
+            while futures:
+                done, _ = wait(futures, max(deadline - time.monotonic(), 0), FIRST_COMPLETED)
+                if not done:
+                    raise TimeoutError("dubbo request timeout")
+                for future in done:
+                    futures.remove(future)
+                    # 先完成的失败了 还有另一个请求时继续等
+                    if future.exception() is None or not futures:
+                        result = future.result()
+                        window.add(time.monotonic() - start)
+                        return result
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def submit(self, request_id, message, stream=False, timeout=None, invocation=None):
+        return self.submit_to(self.select(invocation), request_id, message, stream, timeout, invocation)
+
+    def submit_to(self, provider, request_id, message, stream=False, timeout=None, invocation=None):
+        provider.start()
+        start = time.monotonic()
+        try:
+            future = provider.client.submit(request_id, message, stream, timeout, invocation)
+        except BaseException:
+            provider.finish(time.monotonic() - start, self.decay)
+            raise
+
+        future.add_done_callback(lambda _: provider.finish(time.monotonic() - start, self.decay))
+        return future
+
+    def close(self):
+        for provider in self.providers:
+            provider.client.close()
+
+    def proxy(self, interface, service_version, filters=()):
+        return InterfaceProxy(self, interface, service_version, filters)
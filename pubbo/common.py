@@ -1,5 +1,6 @@
 import inspect
 import enum
+import functools
 import types
 import time
 import datetime
@@ -51,11 +52,24 @@ class RequestMessage(Message):
     method_name = None
     method_parameter_types = []
     method_arguments = []
+    # 除 path interface version generic 外额外发给 provider 的 attachments
+    attachments = None
+    # 不影响返回结果的 attachments 名 如 trace id 其余 attachments 都计入缓存和合并调用的 key
+    ignored_attachments = ()
+    # 调用选项 filter 可以修改
+    timeout = None
+    columnar = False
+    lazy = False
+    stream = False
+    keep_refs = True
 
 
 class ResponseMessage(Message):
     type = None
     message = None
+    # 解析出的 list/map/object 和引用的个数 用于打点
+    refs = ()
+    ref_count = 0
 
 
 JAVA_PRIMITIVE_RELATION = {
@@ -70,21 +84,66 @@ JAVA_PRIMITIVE_RELATION = {
 }
 
 
+# 不是字段的类属性
+NOT_FIELD_TYPES = (
+    types.FunctionType, types.LambdaType, types.CodeType, types.MappingProxyType, types.GeneratorType,
+    types.CoroutineType, types.AsyncGeneratorType, types.MethodType, types.BuiltinFunctionType,
+    types.BuiltinMethodType, types.WrapperDescriptorType, types.MethodWrapperType,
+    types.MethodDescriptorType, types.ClassMethodDescriptorType, types.ModuleType,
+    types.GetSetDescriptorType, types.MemberDescriptorType
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def java_class_fields(clazz):
+    # 类上声明的字段 包括 __slots__ 和有默认值的类属性 每个类只反射一次
+    names = []
+    for i in clazz.__mro__:
+        names.extend(i.__dict__.get("__slots__", ()))
+    for name, value in inspect.getmembers(clazz):
+        if name in names or isinstance(value, NOT_FIELD_TYPES): continue
+        names.append(name)
+    return tuple(i for i in names if not i.startswith("_"))
+
+
+@functools.lru_cache(maxsize=1024)
+def java_class_camel_names(clazz):
+    # 每个类一份 字段名 -> 驼峰字段名 遇到新字段时补充
+    return {}
+
+
+def java_class_members(o):
+    # JavaClass 的公开字段 类上声明的字段加上实例的 __dict__ 不再对每个对象做 inspect.getmembers
+    # java_class 生成的类只有 __slots__ 没有 __dict__
+    fields = java_class_fields(type(o))
+    members = [(name, getattr(o, name, None)) for name in fields]
+
+    for name, value in getattr(o, "__dict__", {}).items():
+        if name.startswith("_") or name in fields: continue
+        if isinstance(value, (types.FunctionType, types.MethodType,)): continue
+        members.append((name, value))
+    return members
+
+
+def java_class_camel_members(o):
+    # 同 java_class_members 字段名为 Java 端的驼峰风格
+    names = java_class_camel_names(type(o))
+    members = []
+    for name, value in java_class_members(o):
+        camel = names.get(name)
+        if camel is None:
+            camel = names[name] = under_score_to_camel(name)
+        members.append((camel, value))
+    return members
+
+
 class JavaObjectJsonEncoder(json.JSONEncoder):
 
     def serializable_datetime(self, o):
         return int(time.mktime(o.timetuple())) * 1000
 
     def serializable_java_class(self, o):
-        i = {}
-        members = inspect.getmembers(o)
-        for member in members:
-            name, *_ = member
-            if name.startswith("_"): continue
-            if isinstance(member[1], (types.FunctionType, types.MethodType,)): continue
-            value = getattr(o, name)
-            i[name] = value
-        return i
+        return dict(java_class_members(o))
 
     def serializable_java_primitive_class(self, o):
         return o.value()
@@ -113,27 +172,16 @@ class JavaObjectJsonEncoder(json.JSONEncoder):
 
 
 class JavaObjectCamelJsonEncoder(JavaObjectJsonEncoder):
+    # fastjson 请求用 对象带上 class 与 dubbo 泛化调用的 map 一致 嵌套的对象在 provider 端也能还原类型
     def serializable_java_class(self, o):
-        i = {}
-        members = inspect.getmembers(o)
-        for member in members:
-            name, *_ = member
-            if name.startswith("_"): continue
-            if isinstance(member[1], (
-                    types.FunctionType, types.LambdaType, types.CodeType, types.MappingProxyType, types.GeneratorType,
-                    types.CoroutineType, types.AsyncGeneratorType, types.MethodType, types.BuiltinFunctionType,
-                    types.BuiltinMethodType, types.WrapperDescriptorType, types.MethodWrapperType,
-                    types.MethodDescriptorType, types.ClassMethodDescriptorType, types.ModuleType,
-                    types.GetSetDescriptorType, types.MemberDescriptorType
-            )):
-                continue
-            value = getattr(o, name)
-            name = under_score_to_camel(name)
-            i[name] = value
-        return i
+        members = dict(java_class_camel_members(o))
+        members["class"] = o._class
+        return members
 
 
 class JavaObject(object):
+    # 基类不带 __dict__ java_class 生成的 __slots__ 子类才真正省内存
+    __slots__ = ()
     _class = None
 
     def __init__(self, clazz):
@@ -147,6 +195,9 @@ class JavaObject(object):
 
     @staticmethod
     def parse(value):
+        if isinstance(value, (JavaObject,)):
+            return value
+
         if isinstance(value, (dict,)):
             if "class" in value.keys():
                 clazz = JavaClass(value.pop("class"))
@@ -169,10 +220,20 @@ class JavaObject(object):
 
 
 class JavaClass(JavaObject):
+    __slots__ = ()
+
+    def __new__(cls, *args, **kwargs):
+        # 直接构造的 JavaClass 字段不固定 实际是带 __dict__ 的 DynamicJavaClass
+        return object.__new__(DynamicJavaClass if cls is JavaClass else cls)
+
     def value(self):
         return self
 
 
+class DynamicJavaClass(JavaClass):
+    pass
+
+
 class JavaPrimitiveClass(JavaObject):
     _value = None
 
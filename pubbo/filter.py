@@ -0,0 +1,88 @@
+import inspect
+import logging
+import time
+from .util import under_score_to_camel
+
+
+class Filter(object):
+    # 客户端调用的拦截器 类似 dubbo 的 Filter 按顺序包在 InterfaceProxy 的调用外面
+    # invocation 为 RequestMessage 可以修改 method_arguments attachments timeout columnar lazy
+    # invoker(invocation) 为链上的下一环 返回解析好的结果 不调用 invoker 直接返回即为短路
+    # AsyncInterfaceProxy 上 invoker 返回 awaitable 要处理结果时 invoke 需要是 async def
+    def invoke(self, invoker, invocation):
+        return invoker(invocation)
+
+
+def chain(filters, invoker):
+    # 创建 proxy 时把 filter 串成一个调用 没有 filter 时就是 invoker 本身
+    for i in reversed(filters):
+        invoker = bind(i, invoker)
+    return invoker
+
+
+def bind(filter, invoker):
+    invoke = filter.invoke
+    return lambda invocation: invoke(invoker, invocation)
+
+
+class AttachmentFilter(Filter):
+    # 给每次调用加上 attachments 值为 callable 时每次调用时求值 如 trace id 和 token
+    # ignored 为 True 时这些 attachments 不影响返回结果 如 trace id 不计入缓存和合并调用的 key
+    def __init__(self, attachments, ignored=False):
+        self.attachments = attachments
+        self.ignored = ignored
+
+    def invoke(self, invoker, invocation):
+        for key, value in self.attachments.items():
+            invocation.attachments[key] = value() if callable(value) else value
+            if self.ignored:
+                invocation.ignored_attachments.add(key)
+        return invoker(invocation)
+
+
+class TimeoutFilter(Filter):
+    # 按方法设置超时 调用时传入的 timeout 优先 没有配置的方法用 client 的超时
+    def __init__(self, timeouts):
+        self.timeouts = {under_score_to_camel(k): v for k, v in timeouts.items()}
+
+    def invoke(self, invoker, invocation):
+        if invocation.timeout is None:
+            invocation.timeout = self.timeouts.get(invocation.method_name)
+        return invoker(invocation)
+
+
+class LoggingFilter(Filter):
+    # 记录每次调用的方法 耗时 和失败原因 同步和异步 proxy 都可以用
+    def __init__(self, logger=None, level=logging.INFO):
+        self.logger = logger or logging.getLogger("pubbo")
+        self.level = level
+
+    def invoke(self, invoker, invocation):
+        start = time.monotonic()
+        try:
+            result = invoker(invocation)
+        except Exception as e:
+            self.log(invocation, start, e)
+            raise
+
+        if inspect.isawaitable(result):
+            return self.wait(result, invocation, start)
+        self.log(invocation, start)
+        return result
+
+    async def wait(self, result, invocation, start):
+        try:
+            result = await result
+        except Exception as e:
+            self.log(invocation, start, e)
+            raise
+        self.log(invocation, start)
+        return result
+
+    def log(self, invocation, start, error=None):
+        elapsed = (time.monotonic() - start) * 1000
+        name = "{}.{}".format(invocation.service_name, invocation.method_name)
+        if error is None:
+            self.logger.log(self.level, "dubbo call %s %.1fms", name, elapsed)
+        else:
+            self.logger.log(max(self.level, logging.WARNING), "dubbo call %s failed %.1fms: %r", name, elapsed, error)
@@ -0,0 +1,62 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+
+
+class SingleFlight(object):
+    # 同一个 key 同时只有一个调用在进行 其他调用等待并共享它的结果或异常
+    def __init__(self):
+        self.calls = {}
+        self.lock = threading.Lock()
+
+    def do(self, key, function, timeout=None):
+        with self.lock:
+            future = self.calls.get(key)
+            leader = future is None
+            if leader:
+                future = self.calls[key] = Future()
+
+        if not leader:
+            return future.result(timeout)
+
+        try:
+            result = function()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self.lock:
+                self.calls.pop(key, None)
+
+
+class AsyncSingleFlight(object):
+    # asyncio 版的 SingleFlight function 为返回 coroutine 的函数
+    def __init__(self):
+        self.calls = {}
+
+    async def do(self, key, function, timeout=None):
+        future = self.calls.get(key)
+        if future is not None:
+            # 等待方超时或被取消不影响正在进行的调用
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+        future = asyncio.get_event_loop().create_future()
+        self.calls[key] = future
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 没有等待方时不要报 exception was never retrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self.calls.pop(key, None)
@@ -1,18 +1,118 @@
+import array
+import bisect
 import datetime
-from .common import JavaClass
+import functools
+import math
+import re
+import struct
+from .common import JavaClass, JavaEnum, JavaPrimitiveClass, java_class_camel_members
 from .util import camel_to_under_score
 
 
+unpack_byte = struct.Struct(">b").unpack_from
+unpack_short = struct.Struct(">h").unpack_from
+unpack_unsigned_short = struct.Struct(">H").unpack_from
+unpack_int = struct.Struct(">i").unpack_from
+unpack_long = struct.Struct(">q").unpack_from
+unpack_double = struct.Struct(">d").unpack_from
+
+pack_short = struct.Struct(">h").pack
+pack_unsigned_short = struct.Struct(">H").pack
+pack_int = struct.Struct(">i").pack
+pack_long = struct.Struct(">q").pack
+pack_double = struct.Struct(">d").pack
+
+INT_MIN, INT_MAX = -0x80000000, 0x7fffffff
+LONG_MIN, LONG_MAX = -0x8000000000000000, 0x7fffffffffffffff
+
+# 与 Java 端一致 string 和 binary 超过 32k 时分块
+CHUNK_SIZE = 0x8000
+
+# utf-8 首字节 -> 该字符占用的 byte 长度 0 为非法首字节
+utf8_length_table = bytes(
+    1 if i < 0xc0 else 2 if i < 0xe0 else 3 if i < 0xf0 else 4 if i < 0xf8 else 0 for i in range(256)
+)
+
+surrogate_pattern = re.compile("[\ud800-\udfff]")
+
+# 删掉 utf-8 中除后续字节 [x80-xbf] 以外的所有 byte
+utf8_lead_bytes = bytes(i for i in range(256) if not 0x80 <= i <= 0xbf)
+
+
+@functools.lru_cache(maxsize=1024)
+def java_class(name, fields):
+    # 每个 Java 类生成一个带 __slots__ 的 JavaClass 子类 进程内共享 按 LRU 淘汰
+    # 这里很不好 把 Java 中的驼峰风格改为下划线风格 但我就是有强迫症啊
+    slots = tuple(camel_to_under_score(i) for i in fields)
+
+    def __init__(self, *args):
+        for i, field in enumerate(slots):
+            setattr(self, field, args[i] if i < len(args) else None)
+
+    try:
+        return type(name.rsplit(".", 1)[-1], (JavaClass,), {
+            "__slots__": slots,
+            "__init__": __init__,
+            "_class": name,
+        })
+    except (TypeError, ValueError):
+        # 字段名无法作为 slot 时退回普通的 JavaClass
+        return None
+
+
+@functools.lru_cache(maxsize=1024)
+def lazy_java_class(clazz):
+    # lazy 模式下使用的子类 字段在第一次访问时才从 payload 中解析
+    index = {field: i for i, field in enumerate(clazz.__slots__)}
+
+    def __getattr__(self, name):
+        i = index.get(name)
+        if i is None:
+            raise AttributeError(name)
+        deserializer, positions = self._lazy
+        value = deserializer.deserialize_at(*positions[i])
+        setattr(self, name, value)
+        return value
+
+    return type(clazz.__name__, (clazz,), {"__slots__": ("_lazy",), "__getattr__": __getattr__})
+
+
+class LazyRef(object):
+    # lazy 模式下被跳过的 list/map/object 在 refs 中的占位 被引用时才解析
+    def __init__(self, cursor):
+        self.cursor = cursor
+
+
+# 流式解析中已经释放的元素在 refs 中的占位 保持后面的引用下标不变
+RELEASED = object()
+
+
 class ClassDef(object):
     name = None
     fields = None
+    clazz = None
+    setters = None
 
     def __init__(self, name, fields):
         self.name = name
-        # 这里很不好 把 Java 中的驼峰风格改为下划线风格 但我就是有强迫症啊
-        self.fields = [camel_to_under_score(i) for i in fields]
+        self.clazz = java_class(name, tuple(fields))
+
+        if self.clazz is not None:
+            self.fields = list(self.clazz.__slots__)
+            # 直接调用 slot 描述符赋值 跳过 __setattr__
+            self.setters = [getattr(self.clazz, i).__set__ for i in self.fields]
+        else:
+            self.fields = [camel_to_under_score(i) for i in fields]
+            self.setters = [functools.partial(self.set_field, i) for i in self.fields]
+
+    @staticmethod
+    def set_field(field, o, value):
+        o.__setattr__(field, value)
 
     def new(self):
+        if self.clazz is not None:
+            return self.clazz.__new__(self.clazz)
+
         o = JavaClass(self.name)
 
         for i in self.fields:
@@ -21,17 +121,152 @@ class ClassDef(object):
         return o
 
 
+class ColumnTable(object):
+    # 同一个 ClassDef 的对象 list 按列存放 不为每一行创建对象
+    # int/long/double/boolean 列为 array.array date 列为毫秒时间戳的 array('q') 其余为 list
+    class Ref(object):
+        # 行在 refs 中的占位 被引用时才生成对应的行对象
+        def __init__(self, table):
+            self.table = table
+
+    class_def = None
+    columns = None
+    dates = None
+    date_rows = None
+    objects = None
+    complete = 0
+
+    def __init__(self, class_def):
+        self.class_def = class_def
+        self.columns = [[] for _ in class_def.fields]
+        # compact 之后全部为 date 的列
+        self.dates = set()
+        # 解析中 列 -> 值为 date 的行 同一列中可能混有 date 和 long
+        self.date_rows = {}
+        # 行 -> 被引用的行对象 只生成一次
+        self.objects = {}
+        # 已经解析完所有字段的行数
+        self.complete = 0
+        self.ref = self.Ref(self)
+        self.refs = []
+
+    @property
+    def name(self):
+        return self.class_def.name
+
+    @property
+    def fields(self):
+        return self.class_def.fields
+
+    def __len__(self):
+        return len(self.refs)
+
+    def __getitem__(self, field):
+        return self.columns[self.fields.index(field)]
+
+    def __iter__(self):
+        return (self.row(i) for i in range(len(self)))
+
+    def __repr__(self):
+        return "{}[{} rows]".format(self.name, len(self))
+
+    def add_date(self, column, row):
+        rows = self.date_rows.get(column)
+        if rows is None:
+            rows = self.date_rows[column] = set()
+        rows.add(row)
+
+    def compact(self):
+        for i, rows in self.date_rows.items():
+            if len(rows) == len(self.columns[i]):
+                self.dates.add(i)
+            else:
+                # 有 null 或混有其他值的 date 列 只把 date 还原成 datetime
+                self.columns[i] = [self.date(value) if j in rows else value for j, value in enumerate(self.columns[i])]
+        self.date_rows = {}
+
+        for i, values in enumerate(self.columns):
+            kinds = {type(value) for value in values}
+            if i in self.dates:
+                typecode = "q"
+            elif kinds == {int}:
+                typecode = "q"
+            elif kinds == {float}:
+                typecode = "d"
+            elif kinds == {bool}:
+                typecode = "b"
+            else:
+                continue
+            try:
+                self.columns[i] = array.array(typecode, values)
+            except OverflowError:
+                pass
+
+    @staticmethod
+    def date(value):
+        return None if value is None else datetime.datetime.fromtimestamp(value / 1000)
+
+    def row(self, index):
+        o = self.objects.get(index)
+        if o is not None:
+            return o
+
+        o = self.class_def.new()
+        if index < self.complete:
+            self.fill(o, index)
+        else:
+            # 行还在解析中 (字段引用了自己所在的行) 先生成对象 解析完这一行后再 fill
+            self.objects[index] = o
+        return o
+
+    def fill(self, o, index):
+        for i, (setter, column) in enumerate(zip(self.class_def.setters, self.columns)):
+            value = column[index]
+            if i in self.dates or index in self.date_rows.get(i, ()):
+                value = self.date(value)
+            elif isinstance(column, (array.array,)) and column.typecode == "b":
+                value = bool(value)
+            setter(o, value)
+
+    def to_dict(self):
+        return dict(zip(self.fields, self.columns))
+
+    def to_numpy(self):
+        try:
+            import numpy
+        except ImportError:
+            raise Exception("to_numpy need numpy")
+
+        result = {}
+        for i, (field, column) in enumerate(zip(self.fields, self.columns)):
+            if isinstance(column, (array.array,)):
+                value = numpy.frombuffer(column, dtype=column.typecode)
+                if i in self.dates:
+                    value = value.astype("datetime64[ms]")
+                elif column.typecode == "b":
+                    value = value.astype(bool)
+            else:
+                value = numpy.array(column, dtype=object)
+            result[field] = value
+        return result
+
+
 deserialize_relation = {}
 
+# opcode -> 反序列化函数 每个 byte 只算一次 condition
+deserialize_table = [None] * 256
+
 
 def register(condition):
     def decorator(function):
         deserialize_relation.update({condition: function})
 
-        def wrapper(self, *args, **kwargs):
-            return function(self, *args, **kwargs)
+        # 后注册的覆盖先注册的 便于自定义类型替换内置实现
+        for code in range(256):
+            if condition(code) is True:
+                deserialize_table[code] = function
 
-        return wrapper
+        return function
 
     return decorator
 
@@ -44,10 +279,24 @@ class Hessian2Deserializer(object):
     class_def = []
     refs = []
 
-    def __init__(self, message):
-        self.message = message
+    columnar = False
+    lazy = False
+    replay = None
+    # 解析过的引用 (0x51) 个数
+    ref_count = 0
+
+    def __init__(self, message, columnar=False, lazy=False):
+        # memoryview 上直接 unpack 避免切片拷贝
+        self.message = memoryview(message)
         self.cursor = 0
         self.class_def, self.refs = [], []
+        # columnar 为 True 时 元素都是同一个类的 list 解析为 ColumnTable
+        self.columnar = columnar
+        # lazy 为 True 时 对象的字段先跳过 只记下位置 第一次访问时才解析 (字段中嵌套的对象随字段一起解析)
+        # 跳过时 list/map/object 仍按顺序占用 refs 的下标 ends 记录它们结束的位置
+        self.lazy = lazy
+        self.replay = None
+        self.ends = {}
 
     @property
     def code(self):
@@ -61,6 +310,37 @@ class Hessian2Deserializer(object):
         self.move_cursor(1)
         return code
 
+    def unpack(self, unpack_from, scale):
+        value, = unpack_from(self.message, self.cursor)
+        self.cursor += scale
+        return value
+
+    def add_ref(self, value):
+        if self.replay is None:
+            self.refs.append(value)
+        else:
+            # 重新解析跳过的值时 放回跳过时占用的下标
+            self.refs[self.replay] = value
+            self.replay += 1
+
+    def replayed(self):
+        # 重新解析跳过的值时 已经生成的 list/map/object 直接复用 跳到它结束的位置
+        # 还没有生成的返回 None 按跳过时占用的下标解析
+        value = self.refs[self.replay]
+        if value.__class__ is LazyRef:
+            return None
+        self.cursor, self.replay = self.ends[self.replay]
+        return value
+
+    def deserialize_at(self, cursor, replay):
+        # 解析 lazy 模式下跳过的值 replay 为其中第一个 list/map/object 在 refs 中的下标
+        saved = self.cursor, self.replay
+        self.cursor, self.replay = cursor, replay
+        try:
+            return self.deserialize()
+        finally:
+            self.cursor, self.replay = saved
+
     @register(lambda x: x == 0x41 or x == 0x42 or 0x20 <= x <= 0x2f or 0x34 <= x <= 0x37)
     def deserialize_binary(self):
         #            # 8-bit binary data split into 64k chunks
@@ -69,27 +349,31 @@ class Hessian2Deserializer(object):
         #            ::= [x20-x2f] <binary-data>        # binary data of length 0-15
         #            ::= [x34-x37] <binary-data>        # binary data of length 0-1023
 
-        code = self.move_one_scale()
+        binary = []
 
-        if code == 0x41:
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            scale = (b1 << 8) + b0
-        elif code == 0x42:
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            scale = (b1 << 8) + b0
-        elif 0x20 <= code <= 0x2f:
-            scale = code - 0x20
-        elif 0x34 <= code <= 0x37:
-            b0 = self.move_one_scale()
-            scale = ((code - 0x34) << 8) + b0
-        else:
-            raise Exception("oop")
+        while True:
+            code = self.move_one_scale()
 
-        value = self.message[self.cursor:self.cursor + scale]
-        self.move_cursor(scale)
-        return value
+            if code == 0x41 or code == 0x42:
+                scale = self.unpack(unpack_unsigned_short, 2)
+            elif 0x20 <= code <= 0x2f:
+                scale = code - 0x20
+            elif 0x34 <= code <= 0x37:
+                scale = ((code - 0x34) << 8) + self.move_one_scale()
+            else:
+                raise Exception("oop")
+
+            if self.cursor + scale > len(self.message):
+                raise IndexError("hessian 2 message is incomplete")
+
+            binary.append(self.message[self.cursor:self.cursor + scale])
+            self.move_cursor(scale)
+
+            # 0x41 之后紧跟下一个 chunk
+            if code != 0x41:
+                break
+
+        return b"".join(binary)
 
     @register(lambda x: x == 0x54 or x == 0x46)
     def deserialize_boolean(self):
@@ -111,20 +395,30 @@ class Hessian2Deserializer(object):
         #            # definition for an object (compact map)
         # class-def  ::= 'C' string int string*
 
+        self.read_class_def()
+        return self.deserialize_object()
+
+    def read_class_def(self):
         self.move_one_scale()
         class_name = self.deserialize_string()
         field_count = self.deserialize_int()
         fields = [self.deserialize_string() for _ in range(field_count)]
         class_def = ClassDef(class_name, fields)
-        self.class_def.append(class_def)
-
-        return self.deserialize_object()
+        # 重新解析跳过的值时 class-def 已经登记过了
+        if self.replay is None:
+            self.class_def.append(class_def)
+        return class_def
 
     @register(lambda x: x == 0x4f or 0x60 <= x <= 0x6f)
     def deserialize_object(self):
         #            # Object instance
         # object     ::= 'O' int value*
         # 	         ::= [x60-x6f] value*
+        if self.replay is not None:
+            value = self.replayed()
+            if value is not None:
+                return value
+
         code = self.move_one_scale()
 
         if code == 0x4f:  # O
@@ -135,12 +429,23 @@ class Hessian2Deserializer(object):
             raise Exception("oop")
 
         class_def = self.class_def[ref_index]
-        instance = class_def.new()
-        self.refs.append(instance)
 
-        for i in class_def.fields:
-            value = self.deserialize()
-            instance.__setattr__(i, value)
+        if self.lazy and self.replay is None and class_def.clazz is not None:
+            clazz = lazy_java_class(class_def.clazz)
+            instance = clazz.__new__(clazz)
+            self.refs.append(instance)
+
+            positions = []
+            for _ in class_def.fields:
+                positions.append((self.cursor, len(self.refs)))
+                self.skip()
+            instance._lazy = (self, positions)
+        else:
+            instance = class_def.new()
+            self.add_ref(instance)
+
+            for setter in class_def.setters:
+                setter(instance, self.deserialize())
 
         return instance
 
@@ -151,7 +456,19 @@ class Hessian2Deserializer(object):
 
         self.move_one_scale()
         ref_index = self.deserialize_int()
-        return self.refs[ref_index]
+        value = self.refs[ref_index]
+        self.ref_count += 1
+
+        if value.__class__ is ColumnTable.Ref:
+            # 引用了 ColumnTable 中的某一行 生成行对象 之后按行取到的是同一个对象
+            table = value.table
+            i = bisect.bisect_left(table.refs, ref_index)
+            value = self.refs[ref_index] = table.objects[i] = table.row(i)
+        elif value.__class__ is LazyRef:
+            value = self.deserialize_at(value.cursor, ref_index)
+        elif value is RELEASED:
+            raise Exception("hessian 2 reference to a released stream element")
+        return value
 
     @register(lambda x: x == 0x4a or x == 0x4b)
     def deserialize_date(self):
@@ -162,21 +479,9 @@ class Hessian2Deserializer(object):
 
         code = self.move_one_scale()
         if code == 0x4a:
-            b7 = self.move_one_scale()
-            b6 = self.move_one_scale()
-            b5 = self.move_one_scale()
-            b4 = self.move_one_scale()
-            b3 = self.move_one_scale()
-            b2 = self.move_one_scale()
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            value = (b7 << 56) + (b6 << 48) + (b5 << 40) + (b4 << 32) + (b3 << 24) + (b2 << 16) + (b1 << 8) + b0
+            value = self.unpack(unpack_long, 8)
         elif code == 0x4b:
-            b3 = self.move_one_scale()
-            b2 = self.move_one_scale()
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            value = ((b3 << 24) + (b2 << 16) + (b1 << 8) + b0) * 60000
+            value = self.unpack(unpack_int, 4) * 60000
         else:
             raise Exception("oop")
 
@@ -195,32 +500,18 @@ class Hessian2Deserializer(object):
         code = self.move_one_scale()
 
         if code == 0x44:
-            b7 = self.move_one_scale()
-            b6 = self.move_one_scale()
-            b5 = self.move_one_scale()
-            b4 = self.move_one_scale()
-            b3 = self.move_one_scale()
-            b2 = self.move_one_scale()
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            value = (b7 << 56) + (b6 << 48) + (b5 << 40) + (b4 << 32) + (b3 << 24) + (b2 << 16) + (b1 << 8) + b0
+            value = self.unpack(unpack_double, 8)
         elif code == 0x5b:
             value = 0.0
         elif code == 0x5c:
             value = 1.0
         elif code == 0x5d:
-            b0 = self.move_one_scale()
-            value = b0
+            value = float(self.unpack(unpack_byte, 1))
         elif code == 0x5e:
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            value = (b1 << 8) + b0
+            value = float(self.unpack(unpack_short, 2))
         elif code == 0x5f:
-            b3 = self.move_one_scale()
-            b2 = self.move_one_scale()
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            value = (b3 << 24) + (b2 << 16) + (b1 << 8) + b0 * 0.001
+            # Java 端写的是 double * 1000 后的 int
+            value = self.unpack(unpack_int, 4) * 0.001
         else:
             raise Exception("oop")
         return value
@@ -235,21 +526,15 @@ class Hessian2Deserializer(object):
 
         code = self.move_one_scale()
 
-        if code == 0x49:
-            b3 = self.move_one_scale()
-            b2 = self.move_one_scale()
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            value = (b3 << 24) + (b2 << 16) + (b1 << 8) + b0
-        elif 0x80 <= code <= 0xbf:
+        if 0x80 <= code <= 0xbf:
             value = code - 0x90
+        elif code == 0x49:
+            value = self.unpack(unpack_int, 4)
         elif 0xc0 <= code <= 0xcf:
-            b0 = self.move_one_scale()
-            value = ((code - 0xc8) << 8) + b0
+            value = ((code - 0xc8) << 8) + self.message[self.cursor]
+            self.cursor += 1
         elif 0xd0 <= code <= 0xd7:
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            value = ((code - 0xd4) << 16) + (b1 << 8) + b0
+            value = ((code - 0xd4) << 16) + self.unpack(unpack_unsigned_short, 2)
         else:
             raise Exception("oop")
         return value
@@ -264,41 +549,120 @@ class Hessian2Deserializer(object):
         # 	         ::= [x70-77] type value*  # fixed-length typed list
         # 	         ::= [x78-7f] value*       # fixed-length untyped list
 
-        code = self.move_one_scale()
+        if self.replay is not None:
+            value = self.replayed()
+            if value is not None:
+                return value
 
         result = []
-        self.refs.append(result)
+        index = len(self.refs)
+        self.add_ref(result)
 
-        if code == 0x55:
-            type = self.deserialize()
+        length = self.deserialize_list_head()
+
+        if self.columnar and not self.lazy and length != 0:
+            code = self.code
+            if code == 0x43 or code == 0x4f or 0x60 <= code <= 0x6f:
+                table = self.deserialize_columns(result, index, length)
+                if table is not None:
+                    return table
+                length = None if length is None else length - len(result)
+
+        if length is None:
             while self.code != 0x5a:
                 result.append(self.deserialize())
             self.move_one_scale()
-        elif code == 0x56:  # V
-            type = self.deserialize()
-            length = self.move_one_scale() - 0x90
+        else:
             for _ in range(length):
                 result.append(self.deserialize())
+        return result
+
+    def deserialize_columns(self, result, index, length):
+        # 按列解析 list 中的对象 遇到不同类的元素时把已解析的行还原成对象放回 list 返回 None
+        table = None
+        count = 0
+
+        while count != length:
+            cursor = self.cursor
+            code = self.move_one_scale()
+
+            if length is None and code == 0x5a:
+                break
+
+            if code == 0x43:
+                self.cursor = cursor
+                self.read_class_def()
+                cursor = self.cursor
+                code = self.move_one_scale()
+
+            if code == 0x4f:
+                class_def = self.class_def[self.deserialize_int()]
+            elif 0x60 <= code <= 0x6f:
+                class_def = self.class_def[code - 0x60]
+            else:
+                class_def = None
+
+            if class_def is None or (table is not None and class_def is not table.class_def):
+                self.cursor = cursor
+                self.refs[index] = result
+                if table is not None:
+                    table.compact()
+                    for i, ref_index in enumerate(table.refs):
+                        row = self.refs[ref_index]
+                        if row.__class__ is ColumnTable.Ref:
+                            row = self.refs[ref_index] = table.row(i)
+                        result.append(row)
+                return None
+
+            if table is None:
+                table = ColumnTable(class_def)
+                self.refs[index] = table
+
+            table.refs.append(len(self.refs))
+            self.refs.append(table.ref)
+
+            for i, column in enumerate(table.columns):
+                code = self.code
+                if code == 0x4a or code == 0x4b:
+                    table.add_date(i, count)
+                    self.move_one_scale()
+                    value = self.unpack(unpack_long, 8) if code == 0x4a else self.unpack(unpack_int, 4) * 60000
+                else:
+                    value = self.deserialize()
+                column.append(value)
+
+            table.complete += 1
+            if table.objects:
+                o = table.objects.get(count)
+                if o is not None:
+                    table.fill(o, count)
+            count += 1
+
+        table.compact()
+        return table
+
+    def deserialize_list_head(self):
+        # 返回 list 的长度 变长 list 返回 None
+        code = self.move_one_scale()
+
+        if code == 0x55:
+            type = self.deserialize()
+            length = None
+        elif code == 0x56:  # V
+            type = self.deserialize()
+            length = self.deserialize_int()
         elif code == 0x57:
-            while self.code != 0x5a:
-                result.append(self.deserialize())
-            self.move_one_scale()
+            length = None
         elif code == 0x58:
             length = self.deserialize_int()
-            for i in range(length):
-                result.append(self.deserialize())
         elif 0x70 <= code <= 0x77:
             length = code - 0x70
             type = self.deserialize()
-            for _ in range(length):
-                result.append(self.deserialize())
         elif 0x78 <= code <= 0x7f:
             length = code - 0x78
-            for _ in range(length):
-                result.append(self.deserialize())
         else:
             raise Exception("oop")
-        return result
+        return length
 
     @register(lambda x: x == 0x4c or 0xd8 <= x <= 0xef or 0xf0 <= x <= 0xff or 0x38 <= x <= 0x3f or x == 0x59)
     def deserialize_long(self):
@@ -311,31 +675,17 @@ class Hessian2Deserializer(object):
 
         code = self.move_one_scale()
 
-        if code == 0x4c:
-            b7 = self.move_one_scale()
-            b6 = self.move_one_scale()
-            b5 = self.move_one_scale()
-            b4 = self.move_one_scale()
-            b3 = self.move_one_scale()
-            b2 = self.move_one_scale()
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            value = (b7 << 56) + (b6 << 48) + (b5 << 40) + (b4 << 32) + (b3 << 24) + (b2 << 16) + (b1 << 8) + b0
-        elif 0xd8 <= code <= 0xef:
+        if 0xd8 <= code <= 0xef:
             value = code - 0xe0
+        elif code == 0x4c:
+            value = self.unpack(unpack_long, 8)
         elif 0xf0 <= code <= 0xff:
-            b0 = self.move_one_scale()
-            value = ((code - 0xf8) << 8) + b0
+            value = ((code - 0xf8) << 8) + self.message[self.cursor]
+            self.cursor += 1
         elif 0x38 <= code <= 0x3f:
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            value = ((code - 0x3c) << 16) + (b1 << 8) + b0
+            value = ((code - 0x3c) << 16) + self.unpack(unpack_unsigned_short, 2)
         elif code == 0x59:
-            b3 = self.move_one_scale()
-            b2 = self.move_one_scale()
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            value = (b3 << 24) + (b2 << 16) + (b1 << 8) + b0
+            value = self.unpack(unpack_int, 4)
         else:
             raise Exception("oop")
 
@@ -347,11 +697,16 @@ class Hessian2Deserializer(object):
         # map        ::= 'M' type (value value)* 'Z'  # key, value map pairs
         # 	         ::= 'H' (value value)* 'Z'       # untyped key, value
 
+        if self.replay is not None:
+            value = self.replayed()
+            if value is not None:
+                return value
+
         code = self.move_one_scale()
 
         values = []
         map = dict()
-        self.refs.append(map)
+        self.add_ref(map)
 
         if code == 0x4d:  # M
             type = self.deserialize()
@@ -381,52 +736,643 @@ class Hessian2Deserializer(object):
         #            ::= [x00-x1f] <utf8-data>         # string of length   0-31
         #            ::= [x30-x33] b0 <utf8-data>      # string of length   0-1023
 
-        # 嗅探 utf-8 使用的 byte 长度
-        def sniff_utf8_length(flag):
-            flag = format(flag, "#010b")
-
-            if flag.startswith("0b0") or flag.startswith("0b10"):
-                return 1
-            elif flag.startswith("0b110"):
-                return 2
-            elif flag.startswith("0b1110"):
-                return 3
-            elif flag.startswith("0b11110"):
-                return 4
+        string = []
+
+        while True:
+            code = self.move_one_scale()
+
+            if code == 0x52 or code == 0x53:
+                count = self.unpack(unpack_unsigned_short, 2)
+            elif 0x00 <= code <= 0x1f:
+                count = code
+            elif 0x30 <= code <= 0x33:
+                count = ((code - 0x30) << 8) + self.move_one_scale()
             else:
                 raise Exception("oop")
 
-        code = self.move_one_scale()
+            string.append(self.read_utf8(count))
+
+            # 0x52 之后紧跟下一个 chunk
+            if code != 0x52:
+                break
 
-        if code == 0x52 or code == 0x53:
-            b1 = self.move_one_scale()
-            b0 = self.move_one_scale()
-            count = (b1 << 8) + b0
-        elif 0x00 <= code <= 0x1f:
-            count = code
-        elif 0x30 <= code <= 0x33:
-            b0 = self.move_one_scale()
-            count = ((code - 0x30) << 8) + b0
+        if len(string) == 1:
+            return string[0]
+        return "".join(string)
+
+    def read_utf8(self, count):
+        message = self.message
+        start = self.cursor
+        end = start + count
+
+        if end > len(message):
+            raise IndexError("hessian 2 message is incomplete")
+
+        try:
+            # 纯 ASCII 时 byte 长度就是字符数 不需要嗅探
+            value = str(message[start:end], encoding="ascii")
+            self.cursor = end
+            return value
+        except UnicodeDecodeError as e:
+            # 从第一个非 ASCII 字符开始 按首字节嗅探剩余字符的 byte 长度
+            end = start + e.start
+            remain = count - e.start
+
+        for _ in range(remain):
+            length = utf8_length_table[message[end]]
+            if length == 0:
+                raise Exception("oop")
+            end += length
+
+        if end > len(message):
+            raise IndexError("hessian 2 message is incomplete")
+
+        value = str(message[start:end], encoding="utf-8", errors="surrogatepass")
+        # Java 把 BMP 之外的字符写成两个代理 这里合并回来
+        if surrogate_pattern.search(value):
+            value = value.encode("utf-16", "surrogatepass").decode("utf-16")
+        self.cursor = end
+        return value
+
+    def deserialize(self):
+        function = deserialize_table[self.message[self.cursor]]
+        if function is None:
+            raise Exception("have unkown hessian 2 code")
+        return function(self)
+
+    def skip(self):
+        # 跳过一个值 不生成任何对象
+        # list/map/object 在 refs 中放占位 保证后续引用的下标不变
+        code = self.message[self.cursor]
+        scale = skip_table[code]
+        if scale:
+            self.cursor += scale
+            if self.cursor > len(self.message):
+                raise IndexError("hessian 2 message is incomplete")
+        elif scale is None:
+            raise Exception("have unkown hessian 2 code")
+        elif code <= 0x1f or 0x30 <= code <= 0x33 or code == 0x52 or code == 0x53:
+            self.skip_string()
+        elif code <= 0x2f or 0x34 <= code <= 0x37 or code == 0x41 or code == 0x42:
+            self.skip_binary()
+        elif code == 0x43:
+            self.read_class_def()
+            self.skip()
+        elif code == 0x48 or code == 0x4d:
+            self.skip_map()
+        elif code == 0x51:
+            self.move_one_scale()
+            self.skip()
+        elif code == 0x4f or 0x60 <= code <= 0x6f:
+            self.skip_object()
         else:
-            raise Exception("oop")
+            self.skip_list()
 
-        string = []
-        for i in range(count):
-            length = sniff_utf8_length(self.code)
-            string.append(str(self.message[self.cursor:self.cursor + length], encoding="utf-8"))
-            self.move_cursor(length)
+    def skip_string(self):
+        message, cursor = self.message, self.cursor
 
-        if code == 0x52:
-            tail = self.deserialize_string()
-            string.append(tail)
+        while True:
+            code = message[cursor]
 
-        return "".join(string)
+            if code <= 0x1f:
+                count = code
+                cursor += 1
+            elif code == 0x52 or code == 0x53:
+                count, = unpack_unsigned_short(message, cursor + 1)
+                cursor += 3
+            else:
+                count = ((code - 0x30) << 8) + message[cursor + 1]
+                cursor += 2
+
+            # 先假设都是单字节字符 每多出一个后续字节就少读到一个字符 再往后补
+            start = end = cursor
+            while count:
+                chunk = message[end:end + count].tobytes()
+                if len(chunk) < count:
+                    raise IndexError("hessian 2 message is incomplete")
+                end += count
+                count = len(chunk.translate(None, utf8_lead_bytes))
+
+            # 最后一个字符可能只读到了首字节
+            if end > start and message[end - 1] >= 0x80:
+                lead = end - 1
+                while lead > start and 0x80 <= message[lead] <= 0xbf:
+                    lead -= 1
+                end = max(end, lead + utf8_length_table[message[lead]])
+                if end > len(message):
+                    raise IndexError("hessian 2 message is incomplete")
+            cursor = end
+
+            if code != 0x52:
+                break
+
+        self.cursor = cursor
+
+    def skip_binary(self):
+        while True:
+            code = self.move_one_scale()
+
+            if code == 0x41 or code == 0x42:
+                scale = self.unpack(unpack_unsigned_short, 2)
+            elif code <= 0x2f:
+                scale = code - 0x20
+            else:
+                scale = ((code - 0x34) << 8) + self.move_one_scale()
+
+            self.move_cursor(scale)
+            if self.cursor > len(self.message):
+                raise IndexError("hessian 2 message is incomplete")
+
+            if code != 0x41:
+                break
+
+    def skip_list(self):
+        index = len(self.refs)
+        self.refs.append(LazyRef(self.cursor))
+
+        length = self.deserialize_list_head()
+        if length is None:
+            while self.code != 0x5a:
+                self.skip()
+            self.move_one_scale()
+        else:
+            for _ in range(length):
+                self.skip()
+
+        self.ends[index] = (self.cursor, len(self.refs))
+
+    def skip_object(self):
+        index = len(self.refs)
+        self.refs.append(LazyRef(self.cursor))
+
+        code = self.move_one_scale()
+        class_def = self.class_def[self.deserialize_int() if code == 0x4f else code - 0x60]
+        skip = self.skip
+        for _ in class_def.fields:
+            skip()
+
+        self.ends[index] = (self.cursor, len(self.refs))
+
+    def skip_map(self):
+        index = len(self.refs)
+        self.refs.append(LazyRef(self.cursor))
+
+        if self.move_one_scale() == 0x4d:
+            self.skip()
+        while self.code != 0x5a:
+            self.skip()
+        self.move_one_scale()
+
+        self.ends[index] = (self.cursor, len(self.refs))
+
+
+def skip_scale(code):
+    # 定长的值 返回连同 opcode 在内的 byte 数 0 为需要单独处理的变长值 None 为未定义的 opcode
+    if 0x80 <= code <= 0xbf or 0xd8 <= code <= 0xef or code in (0x46, 0x4e, 0x54, 0x5b, 0x5c):
+        return 1
+    if 0xc0 <= code <= 0xcf or 0xf0 <= code <= 0xff or code == 0x5d:
+        return 2
+    if 0xd0 <= code <= 0xd7 or 0x38 <= code <= 0x3f or code == 0x5e:
+        return 3
+    if code in (0x49, 0x4b, 0x59, 0x5f):
+        return 5
+    if code in (0x44, 0x4a, 0x4c):
+        return 9
+    if code <= 0x37 or 0x60 <= code <= 0x7f or code in (0x41, 0x42, 0x43, 0x48, 0x4d, 0x4f, 0x51, 0x52, 0x53,
+                                                       0x55, 0x56, 0x57, 0x58):
+        return 0
+    return None
+
+
+skip_table = [skip_scale(i) for i in range(256)]
+
+
+class Hessian2StreamDeserializer(object):
+    # 边收边解 chunks 为按到达顺序产出 bytes 的可迭代对象
+    # 数据不完整时回滚到上一个完整的值 拉取更多数据后重试
+    chunks = None
+    buffer = None
+    deserializer = None
+    closed = False
+    wanted = 0
+
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.buffer = bytearray()
+        self.deserializer = Hessian2Deserializer(b"")
+        self.closed = False
+        self.wanted = 0
+
+    def pull(self):
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            self.closed = True
+        else:
+            self.buffer += chunk
+
+    def attempt(self, function):
+        deserializer = self.deserializer
+        refs, class_def = len(deserializer.refs), len(deserializer.class_def)
+
+        message = memoryview(self.buffer)
+        deserializer.message, deserializer.cursor = message, 0
+        try:
+            return True, function(deserializer)
+        except (IndexError, struct.error):
+            if self.closed:
+                raise Exception("hessian 2 message is incomplete")
+            del deserializer.refs[refs:]
+            del deserializer.class_def[class_def:]
+            return False, None
+        finally:
+            deserializer.message = None
+            message.release()
+
+    def read(self, function):
+        while True:
+            # 解析失败后至少等 buffer 翻倍再重试 避免大对象被反复从头解析
+            if self.closed or len(self.buffer) >= self.wanted:
+                done, value = self.attempt(function)
+                if done:
+                    del self.buffer[:self.deserializer.cursor]
+                    self.wanted = 0
+                    return value
+                self.wanted = len(self.buffer) * 2
+            self.pull()
+
+    def code(self):
+        return self.read(lambda deserializer: deserializer.code)
 
     def deserialize(self):
-        for condition in deserialize_relation.keys():
-            if condition(self.code) is True:
-                function = deserialize_relation.get(condition)
-                value = function(self)
-                return value
+        return self.read(Hessian2Deserializer.deserialize)
+
+    def is_list(self):
+        return deserialize_table[self.code()] is Hessian2Deserializer.deserialize_list
+
+    def deserialize_list(self, keep_refs=True):
+        # 逐个产出 list 中的元素 已产出元素对应的 bytes 会被丢弃
+        # keep_refs 为 True 时元素保留在 refs 中 后续元素可以引用它们 内存随已产出的元素增长
+        # 为 False 时元素解析完就从 refs 中释放 只留下占位 后续元素引用到它们时报错
+        def deserialize_list_head(deserializer):
+            length = deserializer.deserialize_list_head()
+            deserializer.refs.append([])
+            return length
+
+        def element():
+            refs = self.deserializer.refs
+            start = len(refs)
+            value = self.deserialize()
+            if not keep_refs:
+                refs[start:] = [RELEASED] * (len(refs) - start)
+            return value
+
+        length = self.read(deserialize_list_head)
+
+        if length is None:
+            while self.code() != 0x5a:
+                yield element()
+            self.read(Hessian2Deserializer.move_one_scale)
         else:
-            raise Exception("have unkown hessian 2 code")
+            for _ in range(length):
+                yield element()
+
+
+serialize_relation = {}
+
+
+def register_type(*classes):
+    def decorator(function):
+        for clazz in classes:
+            serialize_relation.update({clazz: function})
+
+        return function
+
+    return decorator
+
+
+class Hessian2Serializer(object):
+    buffer = None
+
+    class_def = {}
+    refs = {}
+    types = {}
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.class_def, self.refs, self.types = {}, {}, {}
+
+    @property
+    def message(self):
+        return bytes(self.buffer)
+
+    def write_ref(self, value):
+        # 已经写过的 list/map/object 写成 back-reference
+        ref = self.refs.get(id(value))
+        if ref is not None:
+            self.buffer.append(0x51)
+            self.serialize_int(ref[0])
+            return True
+
+        # 同时持有对象 避免序列化期间 id 被复用
+        self.refs[id(value)] = (len(self.refs), value)
+        return False
+
+    def write_type(self, type):
+        ref = self.types.get(type)
+        if ref is not None:
+            self.serialize_int(ref)
+        else:
+            self.types[type] = len(self.types)
+            self.serialize_string(type)
+
+    @register_type(type(None))
+    def serialize_null(self, value):
+        self.buffer.append(0x4e)
+
+    @register_type(bool)
+    def serialize_boolean(self, value):
+        self.buffer.append(0x54 if value else 0x46)
+
+    @register_type(int)
+    def serialize_int(self, value):
+        #            # 32-bit signed integer
+        # int        ::= 'I' b3 b2 b1 b0
+        #            ::= [x80-xbf]             # -x10 to x3f
+        #            ::= [xc0-xcf] b0          # -x800 to x7ff
+        #            ::= [xd0-xd7] b1 b0       # -x40000 to x3ffff
+
+        buffer = self.buffer
+
+        if -0x10 <= value <= 0x2f:
+            buffer.append(0x90 + value)
+        elif -0x800 <= value <= 0x7ff:
+            buffer.append(0xc8 + (value >> 8))
+            buffer.append(value & 0xff)
+        elif -0x40000 <= value <= 0x3ffff:
+            buffer.append(0xd4 + (value >> 16))
+            buffer += pack_unsigned_short(value & 0xffff)
+        elif INT_MIN <= value <= INT_MAX:
+            buffer.append(0x49)
+            buffer += pack_int(value)
+        else:
+            # 超出 int 范围时按 long 写
+            self.serialize_long(value)
+
+    def serialize_long(self, value):
+        #            # 64-bit signed long integer
+        # long       ::= 'L' b7 b6 b5 b4 b3 b2 b1 b0
+        #            ::= [xd8-xef]             # -x08 to x0f
+        #            ::= [xf0-xff] b0          # -x800 to x7ff
+        #            ::= [x38-x3f] b1 b0       # -x40000 to x3ffff
+        #            ::= x59 b3 b2 b1 b0       # 32-bit integer cast to long
+
+        buffer = self.buffer
+
+        if -0x08 <= value <= 0x0f:
+            buffer.append(0xe0 + value)
+        elif -0x800 <= value <= 0x7ff:
+            buffer.append(0xf8 + (value >> 8))
+            buffer.append(value & 0xff)
+        elif -0x40000 <= value <= 0x3ffff:
+            buffer.append(0x3c + (value >> 16))
+            buffer += pack_unsigned_short(value & 0xffff)
+        elif INT_MIN <= value <= INT_MAX:
+            buffer.append(0x59)
+            buffer += pack_int(value)
+        elif LONG_MIN <= value <= LONG_MAX:
+            buffer.append(0x4c)
+            buffer += pack_long(value)
+        else:
+            raise Exception("int out of java long range")
+
+    @register_type(float)
+    def serialize_double(self, value):
+        #            # 64-bit IEEE double
+        # double     ::= 'D' b7 b6 b5 b4 b3 b2 b1 b0
+        #            ::= x5b                   # 0.0
+        #            ::= x5c                   # 1.0
+        #            ::= x5d b0                # byte cast to double  (-128.0 to 127.0)
+        #            ::= x5e b1 b0             # short cast to double
+        #            ::= x5f b3 b2 b1 b0       # 32-bit float cast to double
+
+        buffer = self.buffer
+
+        if math.isfinite(value) and value == int(value):
+            integer = int(value)
+            if integer == 0:
+                buffer.append(0x5b)
+                return
+            elif integer == 1:
+                buffer.append(0x5c)
+                return
+            elif -0x80 <= integer <= 0x7f:
+                buffer.append(0x5d)
+                buffer.append(integer & 0xff)
+                return
+            elif -0x8000 <= integer <= 0x7fff:
+                buffer.append(0x5e)
+                buffer += pack_short(integer)
+                return
+
+        if math.isfinite(value):
+            mills = int(value * 1000)
+            if INT_MIN <= mills <= INT_MAX and mills * 0.001 == value:
+                buffer.append(0x5f)
+                buffer += pack_int(mills)
+                return
+
+        buffer.append(0x44)
+        buffer += pack_double(value)
+
+    @register_type(str)
+    def serialize_string(self, value):
+        #            # UTF-8 encoded character string split into 64k chunks
+        # string     ::= x52 b1 b0 <utf8-data> string  # non-final chunk
+        #            ::= 'S' b1 b0 <utf8-data>         # string of length   0-65535
+        #            ::= [x00-x1f] <utf8-data>         # string of length   0-31
+        #            ::= [x30-x33] b0 <utf8-data>      # string of length   0-1023
+
+        # Java 按 utf-16 计算长度 BMP 之外的字符拆成代理对
+        if value and max(value) > "\uffff":
+            value = "".join(
+                i if i <= "\uffff" else chr(0xd800 + ((ord(i) - 0x10000) >> 10)) + chr(0xdc00 + (ord(i) & 0x3ff))
+                for i in value
+            )
+
+        buffer = self.buffer
+
+        while len(value) > CHUNK_SIZE:
+            count = CHUNK_SIZE
+            # 不在代理对中间截断
+            if "\ud800" <= value[count - 1] <= "\udbff":
+                count -= 1
+            buffer.append(0x52)
+            buffer += pack_unsigned_short(count)
+            buffer += value[:count].encode("utf-8", "surrogatepass")
+            value = value[count:]
+
+        count = len(value)
+        if count <= 0x1f:
+            buffer.append(count)
+        elif count <= 0x3ff:
+            buffer.append(0x30 + (count >> 8))
+            buffer.append(count & 0xff)
+        else:
+            buffer.append(0x53)
+            buffer += pack_unsigned_short(count)
+        buffer += value.encode("utf-8", "surrogatepass")
+
+    @register_type(bytes, bytearray, memoryview)
+    def serialize_binary(self, value):
+        #            # 8-bit binary data split into 64k chunks
+        # binary     ::= x41 b1 b0 <binary-data> binary # non-final chunk
+        #            ::= 'B' b1 b0 <binary-data>        # final chunk
+        #            ::= [x20-x2f] <binary-data>        # binary data of length 0-15
+        #            ::= [x34-x37] <binary-data>        # binary data of length 0-1023
+
+        buffer = self.buffer
+        value = memoryview(value).cast("B")
+
+        while len(value) > CHUNK_SIZE:
+            buffer.append(0x41)
+            buffer += pack_unsigned_short(CHUNK_SIZE)
+            buffer += value[:CHUNK_SIZE]
+            value = value[CHUNK_SIZE:]
+
+        scale = len(value)
+        if scale <= 0x0f:
+            buffer.append(0x20 + scale)
+        elif scale <= 0x3ff:
+            buffer.append(0x34 + (scale >> 8))
+            buffer.append(scale & 0xff)
+        else:
+            buffer.append(0x42)
+            buffer += pack_unsigned_short(scale)
+        buffer += value
+
+    @register_type(datetime.datetime)
+    def serialize_date(self, value):
+        #            # time in UTC encoded as 64-bit long milliseconds since
+        #            #  epoch
+        # date       ::= x4a b7 b6 b5 b4 b3 b2 b1 b0
+        #            ::= x4b b3 b2 b1 b0       # minutes since epoch
+
+        mills = round(value.timestamp() * 1000)
+
+        if mills % 60000 == 0 and INT_MIN <= mills // 60000 <= INT_MAX:
+            self.buffer.append(0x4b)
+            self.buffer += pack_int(mills // 60000)
+        else:
+            self.buffer.append(0x4a)
+            self.buffer += pack_long(mills)
+
+    @register_type(list, tuple)
+    def serialize_list(self, value, type=None):
+        #            # list/vector
+        # list       ::= 'V' type int value*   # fixed-length list
+        #            ::= x58 int value*        # fixed-length untyped list
+        # 	         ::= [x70-77] type value*  # fixed-length typed list
+        # 	         ::= [x78-7f] value*       # fixed-length untyped list
+
+        if self.write_ref(value):
+            return
+
+        length = len(value)
+
+        if type is None:
+            if length <= 7:
+                self.buffer.append(0x78 + length)
+            else:
+                self.buffer.append(0x58)
+                self.serialize_int(length)
+        else:
+            if length <= 7:
+                self.buffer.append(0x70 + length)
+                self.write_type(type)
+            else:
+                self.buffer.append(0x56)
+                self.write_type(type)
+                self.serialize_int(length)
+
+        for i in value:
+            self.serialize(i)
+
+    @register_type(dict)
+    def serialize_map(self, value):
+        #            # map/object
+        # 	         ::= 'H' (value value)* 'Z'       # untyped key, value
+
+        if self.write_ref(value):
+            return
+
+        self.buffer.append(0x48)
+        for k, v in value.items():
+            self.serialize(k)
+            self.serialize(v)
+        self.buffer.append(0x5a)
+
+    def write_object_head(self, name, fields):
+        #            # definition for an object (compact map)
+        # class-def  ::= 'C' string int string*
+        #            # Object instance
+        # object     ::= 'O' int value*
+        # 	         ::= [x60-x6f] value*
+
+        key = (name, fields)
+        ref_index = self.class_def.get(key)
+
+        if ref_index is None:
+            ref_index = self.class_def[key] = len(self.class_def)
+            self.buffer.append(0x43)
+            self.serialize_string(name)
+            self.serialize_int(len(fields))
+            for i in fields:
+                self.serialize_string(i)
+
+        if ref_index <= 0x0f:
+            self.buffer.append(0x60 + ref_index)
+        else:
+            self.buffer.append(0x4f)
+            self.serialize_int(ref_index)
+
+    @register_type(JavaClass)
+    def serialize_object(self, value):
+        if self.write_ref(value):
+            return
+
+        members = java_class_camel_members(value)
+
+        self.write_object_head(value._class, tuple(k for k, _ in members))
+        for _, v in members:
+            self.serialize(v)
+
+    @register_type(JavaEnum)
+    def serialize_enum(self, value):
+        # Java 端 enum 是只有 name 一个字段的 object
+        if self.write_ref(value):
+            return
+
+        self.write_object_head(value._class, ("name",))
+        self.serialize_string(value._name)
+
+    @register_type(JavaPrimitiveClass)
+    def serialize_primitive(self, value):
+        if value._class == "java.lang.Long":
+            self.serialize_long(value._value)
+        else:
+            self.serialize(value._value)
+
+    def serialize(self, value):
+        function = serialize_relation.get(type(value))
+
+        if function is None:
+            # 子类按 mro 查找 找到后缓存
+            for clazz in type(value).__mro__:
+                function = serialize_relation.get(clazz)
+                if function is not None:
+                    serialize_relation[type(value)] = function
+                    break
+            else:
+                raise Exception("have unkown hessian 2 type {}".format(type(value)))
+
+        function(self, value)
@@ -0,0 +1,230 @@
+import asyncio
+import bisect
+import concurrent.futures
+import threading
+import time
+from .common import GenericException, JavaObject, ResponseStatusEnum
+from .hessian import ColumnTable
+
+# 客户端打点的指标
+# pubbo_stage_seconds{interface, method, stage}  各阶段耗时 stage 为 encode checkout send wait receive decode
+#   send 含等待发送锁 wait 为发送完到收到响应头 receive 为读 payload 命中结果缓存的调用只有 encode 和 cache
+# pubbo_call_seconds{interface, method}  整个调用的耗时
+# pubbo_request_bytes / pubbo_response_bytes{interface, method}  请求和响应的帧大小
+# pubbo_errors_total{interface, method, status}  失败的调用 status 为 ResponseStatusEnum 的名字
+# pubbo_decoded_objects_total / pubbo_decoded_refs_total{interface, method}  解析出的对象数和引用数
+# pubbo_hedges_total{interface, method}  ClusterClient 发出的 hedge 请求数
+
+SECONDS_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+BYTES_BUCKETS = tuple(256 * 4 ** i for i in range(10))
+
+TIMEOUT_ERRORS = (TimeoutError, concurrent.futures.TimeoutError, asyncio.TimeoutError)
+
+
+def error_status(e):
+    # 异常对应的 ResponseStatusEnum 名字 provider 抛出的业务异常算作 SERVICE_ERROR
+    if isinstance(e, (GenericException,)):
+        return ResponseStatusEnum.SERVICE_ERROR.name
+    if isinstance(e, TIMEOUT_ERRORS):
+        return ResponseStatusEnum.CLIENT_TIMEOUT.name
+    # 响应头中的非 OK 状态在 deserialize_head 中以状态名抛出
+    if str(e) in ResponseStatusEnum.__members__:
+        return str(e)
+    return ResponseStatusEnum.CLIENT_ERROR.name
+
+
+class Metrics(object):
+    # 打点的接口 默认实现什么都不做
+    # enabled 为 False 时客户端不取时间也不统计 热路径上只多几次空调用
+    enabled = False
+
+    def observe(self, name, value, labels=None):
+        # 耗时和大小等分布
+        pass
+
+    def increment(self, name, value=1, labels=None):
+        pass
+
+    def probe(self, interface, method):
+        # 一次调用的打点器
+        return NOOP_PROBE if not self.enabled else Probe(self, interface, method)
+
+
+class Probe(object):
+    # 记录一次调用的各阶段耗时 stage 记录的是从上一个打点到现在的时间
+    enabled = True
+
+    def __init__(self, metrics, interface, method):
+        self.metrics = metrics
+        self.labels = {"interface": interface, "method": method}
+        self.start = self.last = time.perf_counter()
+
+    def stage(self, stage, seconds=None):
+        now = time.perf_counter()
+        if seconds is None:
+            seconds, self.last = now - self.last, now
+        self.metrics.observe("pubbo_stage_seconds", seconds, dict(self.labels, stage=stage))
+
+    def skip(self):
+        # 这段时间不计入任何阶段 (由 transport 分阶段记录)
+        self.last = time.perf_counter()
+
+    def size(self, direction, value):
+        self.metrics.observe("pubbo_{}_bytes".format(direction), value, self.labels)
+
+    def decoded(self, response):
+        # response.refs 为解析出的 list/map/object lazy 模式下跳过的不算
+        objects = sum(1 for i in response.refs if isinstance(i, (JavaObject, ColumnTable.Ref)))
+        self.metrics.increment("pubbo_decoded_objects_total", objects, self.labels)
+        self.metrics.increment("pubbo_decoded_refs_total", response.ref_count, self.labels)
+
+    def error(self, e):
+        self.metrics.increment("pubbo_errors_total", 1, dict(self.labels, status=error_status(e)))
+
+    def finish(self):
+        self.metrics.observe("pubbo_call_seconds", time.perf_counter() - self.start, self.labels)
+
+
+class NoopProbe(Probe):
+    enabled = False
+
+    def __init__(self):
+        pass
+
+    def stage(self, stage, seconds=None):
+        pass
+
+    def skip(self):
+        pass
+
+    def size(self, direction, value):
+        pass
+
+    def decoded(self, response):
+        pass
+
+    def error(self, e):
+        pass
+
+    def finish(self):
+        pass
+
+
+NOOP = Metrics()
+NOOP_PROBE = NoopProbe()
+
+
+class Histogram(object):
+    # 固定 bucket 的直方图 counts[i] 为 <= buckets[i] 且 > buckets[i - 1] 的个数 最后一个为 +Inf
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def percentile(self, p):
+        # 返回第 p 分位数所在 bucket 的上界 落在 +Inf 中时为 None
+        if self.count == 0:
+            return None
+        rank, total = self.count * p / 100, 0
+        for i, count in enumerate(self.counts):
+            total += count
+            if total >= rank:
+                return self.buckets[i] if i < len(self.buckets) else None
+        return None
+
+
+class MemoryMetrics(Metrics):
+    # 进程内的指标存储 可以直接查看 也可以输出 Prometheus 文本格式
+    # buckets 为 指标名 -> bucket 上界 没有指定时 _bytes 结尾的用 BYTES_BUCKETS 其余用 SECONDS_BUCKETS
+    enabled = True
+
+    def __init__(self, buckets=None):
+        self.buckets = buckets or {}
+        # (name, labels) -> Histogram / value labels 为排好序的 (key, value) tuple
+        self.histograms = {}
+        self.counters = {}
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(name, labels):
+        return name, tuple(sorted(labels.items())) if labels else ()
+
+    def observe(self, name, value, labels=None):
+        key = self.key(name, labels)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                buckets = self.buckets.get(name, BYTES_BUCKETS if name.endswith("_bytes") else SECONDS_BUCKETS)
+                histogram = self.histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def increment(self, name, value=1, labels=None):
+        key = self.key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def histogram(self, name, **labels):
+        return self.histograms.get(self.key(name, labels))
+
+    def counter(self, name, **labels):
+        return self.counters.get(self.key(name, labels), 0)
+
+    def reset(self):
+        with self.lock:
+            self.histograms, self.counters = {}, {}
+
+    def snapshot(self):
+        # 可以直接转成 JSON 的 dict
+        with self.lock:
+            histograms, counters = list(self.histograms.items()), list(self.counters.items())
+
+        result = {"histograms": [], "counters": []}
+        for (name, labels), histogram in histograms:
+            result["histograms"].append({
+                "name": name, "labels": dict(labels), "count": histogram.count, "sum": histogram.sum,
+                "p50": histogram.percentile(50), "p90": histogram.percentile(90), "p99": histogram.percentile(99),
+            })
+        for (name, labels), value in counters:
+            result["counters"].append({"name": name, "labels": dict(labels), "value": value})
+        return result
+
+    @staticmethod
+    def format_labels(labels, *extra):
+        labels = list(labels) + list(extra)
+        if not labels:
+            return ""
+        escape = lambda x: str(x).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+        return "{" + ",".join('{}="{}"'.format(k, escape(v)) for k, v in labels) + "}"
+
+    def exposition(self):
+        # Prometheus 文本格式
+        with self.lock:
+            histograms = sorted(self.histograms.items(), key=lambda x: (x[0][0], str(x[0][1])))
+            counters = sorted(self.counters.items(), key=lambda x: (x[0][0], str(x[0][1])))
+            histograms = [(key, histogram.buckets, list(histogram.counts), histogram.sum, histogram.count)
+                          for key, histogram in histograms]
+
+        lines, typed = [], set()
+        for (name, labels), buckets, counts, total, count in histograms:
+            if name not in typed:
+                typed.add(name)
+                lines.append("# TYPE {} histogram".format(name))
+            cumulative = 0
+            for bound, value in zip(list(buckets) + ["+Inf"], counts):
+                cumulative += value
+                lines.append("{}_bucket{} {}".format(name, self.format_labels(labels, ("le", bound)), cumulative))
+            lines.append("{}_sum{} {}".format(name, self.format_labels(labels), total))
+            lines.append("{}_count{} {}".format(name, self.format_labels(labels), count))
+
+        for (name, labels), value in counters:
+            if name not in typed:
+                typed.add(name)
+                lines.append("# TYPE {} counter".format(name))
+            lines.append("{}{} {}".format(name, self.format_labels(labels), value))
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,57 @@
+import random
+import time
+from .common import JavaClass
+from .server import DubboServer
+
+
+class MockProvider(DubboServer):
+    # 进程内的 dubbo provider 替身 用于测试和压测 不限制排队的调用数
+    # latency 为每次调用的延迟秒数 可以是数字 (low, high) 区间 或 callable(method, args)
+    host = "127.0.0.1"
+    port = 0
+    latency = None
+    workers = 16
+    queue_size = None
+
+    def __init__(self, host="127.0.0.1", port=0, latency=None, workers=16):
+        super(MockProvider, self).__init__(host, port, workers, queue_size=None)
+        self.latency = latency
+
+    def register(self, interface, method, function, latency=None):
+        # latency 不为 None 时覆盖 provider 的 latency
+        def handler(*args):
+            delay = self.delay(method, args, self.latency if latency is None else latency)
+            if delay:
+                time.sleep(delay)
+            return function(*args)
+
+        self.export_method(interface, method, handler)
+
+    @staticmethod
+    def delay(method, args, latency):
+        if latency is None:
+            return 0
+        if callable(latency):
+            return latency(method, args)
+        if isinstance(latency, (tuple, list)):
+            return random.uniform(*latency)
+        return latency
+
+
+def items(count, fields=8, class_name="com.pubbo.mock.Item"):
+    # 返回 count 个对象的 handler 用于测试解析吞吐 对象只生成一次
+    result = []
+    for i in range(count):
+        item = JavaClass(class_name)
+        item.id = i
+        item.name = "item-{}".format(i)
+        for j in range(fields - 2):
+            setattr(item, "field_{}".format(j), j)
+        result.append(item)
+    return lambda *args: result
+
+
+def blob(size):
+    # 返回 size 个 byte 的 handler
+    value = b"x" * size
+    return lambda *args: value
@@ -1,10 +1,21 @@
-import random
+import functools
+import itertools
 import json
-from .common import ResponseMessage, ResponseTypeEnum, ResponseStatusEnum, JavaObjectCamelJsonEncoder
-from .hessian import Hessian2Deserializer
+from .common import RequestMessage, ResponseMessage, ResponseTypeEnum, ResponseStatusEnum, JavaObjectCamelJsonEncoder
+from .hessian import Hessian2Deserializer, Hessian2StreamDeserializer, Hessian2Serializer
 
 REQUEST_FLAG = 0b10000000
 RESPONSE_FLAG = 0b00000000
+TWO_WAY_FLAG = 0b01000000
+EVENT_FLAG = 0b00100000
+
+# 单调递增的 request_id 连接上靠它把响应对应回请求
+request_id_counter = itertools.count(1)
+
+GENERIC_METHOD_NAME = "$invoke"
+GENERIC_PARAMETER_DESC = "Ljava/lang/String;[Ljava/lang/String;[Ljava/lang/Object;"
+# 没有指定版本的服务 与 dubbo consumer 一样按 0.0.0 发送
+DEFAULT_SERVICE_VERSION = "0.0.0"
 
 
 class Serialization(object):
@@ -18,6 +29,8 @@ class Serialization(object):
     request_id: bytes = None
     data_length: bytes = None
     variable_part: bytes = None
+    prefix: bytes = None
+    arguments: bytes = None
 
     @property
     def magic(self):
@@ -31,15 +44,117 @@ class Serialization(object):
 
     def init_request(self):
         self.flag = REQUEST_FLAG
-        self.two_way = 0b01000000
+        self.two_way = TWO_WAY_FLAG
         self.event = 0b00000000
         self.status = 0b00000000.to_bytes(length=1, byteorder="big")
-        self.request_id = random.randint(0, 4294967295).to_bytes(length=8, byteorder="big")
+        self.request_id = next(request_id_counter).to_bytes(length=8, byteorder="big")
+
+    @staticmethod
+    def attachments(message):
+        # 额外的 attachments 在前 值都转成字符串 不能覆盖 path interface version generic
+        attachments = {k: str(v) for k, v in message.attachments.items()} if message.attachments else {}
+        attachments.update({
+            "path": message.service_name,
+            "interface": message.service_name,
+            "version": message.service_version or DEFAULT_SERVICE_VERSION,
+            "generic": "true"
+        })
+        return attachments
+
+    def encode_request(self, message):
+        # body 中只有参数类型和参数随调用变化 前后不变的部分按 (接口, 版本, 方法) 缓存
+        # 带额外 attachments 的调用在缓存的 prefix 之后重新编码 suffix
+        self.init_request()
+        prefix, suffix = self.template(
+            message.dubbo_version, message.service_name, message.service_version, message.method_name
+        )
+        if message.attachments:
+            suffix = self.encode_suffix(message)
+        self.prefix, self.arguments = prefix, self.encode_arguments(message)
+        self.key_attachments = self.encode_key_attachments(message) if message.attachments else ()
+        self.variable_part = prefix + self.arguments + suffix
+        self.data_length = len(self.variable_part).to_bytes(length=4, byteorder="big")
+        return self.message
+
+    @staticmethod
+    def encode_key_attachments(message):
+        # token 等会影响返回结果的 attachments 不同的调用不能共用结果
+        ignored = message.ignored_attachments
+        return tuple(sorted((k, str(v)) for k, v in message.attachments.items() if k not in ignored))
+
+    @property
+    def key(self):
+        # 请求的方法和参数 加上除 ignored_attachments 外的 attachments
+        # prefix 为缓存的同一个 bytes hash 只算一次
+        return self.prefix, self.arguments, self.key_attachments
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def template(cls, dubbo_version, service_name, service_version, method_name):
+        # 返回 body 中参数之前和之后的 bytes
+        message = RequestMessage()
+        message.dubbo_version = dubbo_version
+        message.service_name = service_name
+        message.service_version = service_version or DEFAULT_SERVICE_VERSION
+        message.method_name = method_name
+        return cls.encode_prefix(message), cls.encode_suffix(message)
+
+    @classmethod
+    def encode_prefix(cls, message):
+        raise Exception("need to overwrite")
+
+    @classmethod
+    def encode_suffix(cls, message):
+        raise Exception("need to overwrite")
+
+    def encode_arguments(self, message):
+        raise Exception("need to overwrite")
 
 
 class HessianSerialization(Serialization):
     serialization_id = 0b00000010  # 2
 
+    def encode_heartbeat(self, request_id=None):
+        # 心跳 event 帧 body 为 null
+        # 不传 request_id 时为心跳请求 否则为对 provider 心跳请求的响应 request_id 为请求中的 8 个 byte
+        if request_id is None:
+            self.init_request()
+        else:
+            self.flag = RESPONSE_FLAG
+            self.two_way = 0b00000000
+            self.status = ResponseStatusEnum.OK.value.to_bytes(length=1, byteorder="big")
+            self.request_id = bytes(request_id)
+        self.event = EVENT_FLAG
+
+        self.variable_part = b"N"
+        self.data_length = len(self.variable_part).to_bytes(length=4, byteorder="big")
+        return self.message
+
+    @classmethod
+    def encode_prefix(cls, message):
+        serializer = Hessian2Serializer()
+        serializer.serialize_string(message.dubbo_version)
+        serializer.serialize_string(message.service_name)
+        serializer.serialize_string(message.service_version)
+        serializer.serialize_string(GENERIC_METHOD_NAME)
+        serializer.serialize_string(GENERIC_PARAMETER_DESC)
+        serializer.serialize_string(message.method_name)
+        return serializer.message
+
+    @classmethod
+    def encode_suffix(cls, message):
+        # attachments 是不带类型的 map 不会引用前面的值 可以单独写
+        serializer = Hessian2Serializer()
+        serializer.serialize_map(cls.attachments(message))
+        return serializer.message
+
+    def encode_arguments(self, message):
+        # 同一个 serializer 写参数类型和参数 class-def 和引用在各参数间共享
+        serializer = Hessian2Serializer()
+        serializer.serialize_list(message.method_parameter_types, "[string")
+        serializer.serialize_list(message.method_arguments, "[object")
+        return serializer.message
+
     def deserialize_head(self, message):
 
         if len(message) != 16:
@@ -58,46 +173,68 @@ class HessianSerialization(Serialization):
         payload_length = int.from_bytes(message[12:16], byteorder='big')
         return payload_length
 
-    def deserialize_payload(self, message):
+    def deserialize_payload(self, message, columnar=False, lazy=False):
+        # columnar 为 True 时 同一个类的对象 list 解析为 ColumnTable
+        # lazy 为 True 时 对象的字段在第一次访问时才解析
 
         payload_length = int.from_bytes(self.data_length, byteorder='big')
         assert payload_length == len(message)
 
+        deserializer = Hessian2Deserializer(message, columnar, lazy)
+
         response = ResponseMessage()
-        response.type = ResponseTypeEnum.response_type(Hessian2Deserializer(message[0:1]).deserialize())
+        response.type = ResponseTypeEnum.response_type(deserializer.deserialize())
 
         if response.type is ResponseTypeEnum.NULL:
             response.message = None
             return response
 
-        response.message = Hessian2Deserializer(message[1:]).deserialize()
+        response.message = deserializer.deserialize()
+        response.refs, response.ref_count = deserializer.refs, deserializer.ref_count
+        return response
+
+    def deserialize_stream(self, chunks, keep_refs=True):
+        # VALUE 类型的 response.message 为逐个产出 list 元素的生成器 keep_refs 同 Hessian2StreamDeserializer
+        stream = Hessian2StreamDeserializer(chunks)
+
+        response = ResponseMessage()
+        response.type = ResponseTypeEnum.response_type(stream.deserialize())
+
+        if response.type is ResponseTypeEnum.NULL:
+            response.message = iter(())
+        elif response.type is ResponseTypeEnum.VALUE:
+            if not stream.is_list():
+                raise Exception("dubbo response is not a list")
+            response.message = stream.deserialize_list(keep_refs)
+        else:
+            response.message = stream.deserialize()
         return response
 
 
 class FastJSONSerialization(Serialization):
     serialization_id = 0b00000110  # 6
 
-    def encode_request(self, message):
-        self.init_request()
-        attachments = {
-            "path": message.service_name,
-            "interface": message.service_name,
-            "version": message.service_version,
-            "generic": "true"
-        }
+    @classmethod
+    def encode_prefix(cls, message):
         message_list = [
             '"{}"'.format(message.dubbo_version),
             '"{}"'.format(message.service_name),
             '"{}"'.format(message.service_version),
-            '"$invoke"',
-            '"Ljava/lang/String;[Ljava/lang/String;[Ljava/lang/Object;"',
+            '"{}"'.format(GENERIC_METHOD_NAME),
+            '"{}"'.format(GENERIC_PARAMETER_DESC),
             '"{}"'.format(message.method_name),
+        ]
+        return ("\r\n".join(message_list) + "\r\n").encode("utf-8")
+
+    @classmethod
+    def encode_suffix(cls, message):
+        return (json.dumps(cls.attachments(message), separators=(",", ":")) + "\r\n").encode("utf-8")
+
+    def encode_arguments(self, message):
+        message_list = [
             '[{}]'.format(",".join(['"{}"'.format(i) for i in message.method_parameter_types])),
             '[{}]'.format(",".join(json.dumps(
                 i, cls=JavaObjectCamelJsonEncoder, separators=(",", ":")
             ) for i in message.method_arguments)),
-            '{}'.format(json.dumps(attachments, separators=(",", ":")))
         ]
-        self.variable_part = ("\r\n".join(message_list) + "\r\n").encode("utf-8")
-        self.data_length = len(self.variable_part).to_bytes(length=4, byteorder="big")
-        return self.message
+        return ("\r\n".join(message_list) + "\r\n").encode("utf-8")
@@ -0,0 +1,363 @@
+import asyncio
+import functools
+import inspect
+import json
+import re
+import socket
+import socketserver
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .common import JavaClass, RequestMessage, ResponseStatusEnum, ResponseTypeEnum
+from .hessian import Hessian2Deserializer, Hessian2Serializer
+from .serialization import (
+    EVENT_FLAG, GENERIC_METHOD_NAME, REQUEST_FLAG, TWO_WAY_FLAG, FastJSONSerialization, HessianSerialization
+)
+from .transport import HEAD_LENGTH
+from .util import camel_to_under_score, under_score_to_camel
+
+GENERIC_EXCEPTION_CLASS = "com.alibaba.dubbo.rpc.service.GenericException"
+RUNTIME_EXCEPTION_CLASS = "java.lang.RuntimeException"
+
+SERIALIZATION_MASK = 0b00011111
+
+
+@functools.lru_cache(maxsize=1024)
+def parameter_types(desc):
+    # 方法描述中的参数类型 如 Ljava/lang/String;I[J 为 ("java.lang.String", "I", "[J")
+    types = re.findall(r"\[*(?:L[^;]+;|[ZBCDFIJS])", desc)
+    return tuple(i[1:-1].replace("/", ".") if i.startswith("L") else i for i in types)
+
+
+def parameter_count(desc):
+    return len(parameter_types(desc))
+
+
+def from_json(value, clazz=None):
+    # fastjson 的参数转成和 hessian2 解析结果一样的形状 对象为 JavaClass 字段名为下划线风格
+    # clazz 为声明的参数类型 不是 java.* 或数组的 dict 以及带 class 或 @type 的 dict 视为对象 其余的为 map
+    if isinstance(value, (list,)):
+        return [from_json(i) for i in value]
+    if not isinstance(value, (dict,)):
+        return value
+
+    clazz = value.get("@type") or value.get("class") or clazz
+    if clazz is None or "." not in clazz or clazz.startswith(("java.", "[")):
+        return {k: from_json(v) for k, v in value.items()}
+
+    o = JavaClass(clazz)
+    for k, v in value.items():
+        if k != "@type" and k != "class":
+            setattr(o, camel_to_under_score(k), from_json(v))
+    return o
+
+
+class DubboServer(object):
+    # dubbo 协议的 provider 把 Python 对象暴露给 Java 等 dubbo consumer
+    # 请求按 hessian2 解析 (pubbo 发出的 fastjson 泛化调用也可以) 响应为 hessian2 按 request_id 对应请求
+    # 方法在 workers 个线程的线程池中执行 async def 的方法在单独的事件循环中执行
+    # 正在执行和排队的调用超过 workers + queue_size 时 直接返回 SERVER_THREAD_POOL_EXHAUSTED_ERROR queue_size 为 None 时不限制
+    host = "0.0.0.0"
+    port = 20880
+    workers = 64
+    queue_size = 64
+    # 超过 max_payload 的请求视为非法 关闭连接
+    max_payload = 8 * 1024 * 1024
+    buffer_size = 65536
+
+    def __init__(self, host="0.0.0.0", port=20880, workers=64, queue_size=64, max_payload=8 * 1024 * 1024):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_payload = max_payload
+        # (interface, version, method) -> function version 为 None 时匹配任意版本
+        self.handlers = {}
+        self.server = None
+        self.executor = None
+        self.loop = None
+        self.loop_thread = None
+        # 已经接受的连接 关闭时一起断开
+        self.connections = set()
+        self.lock = threading.Lock()
+        self.active = 0
+        self.requests = 0
+        self.rejected = 0
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return "{}:{}".format(host, port)
+
+    def export(self, interface, service, version=None):
+        # service 的公开方法按驼峰名暴露 get_user 对应 getUser
+        for name in dir(service):
+            function = getattr(service, name)
+            if name.startswith("_") or not callable(function):
+                continue
+            self.export_method(interface, under_score_to_camel(name), function, version)
+
+    def export_method(self, interface, method, function, version=None):
+        self.handlers[(interface, version, method)] = function
+
+    def start(self):
+        server = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                server.serve(self.request)
+
+        class TCPServer(socketserver.ThreadingTCPServer):
+            allow_reuse_address = True
+            daemon_threads = True
+
+        self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix="pubbo-server")
+        self.loop = asyncio.new_event_loop()
+        self.loop_thread = threading.Thread(target=self.loop.run_forever, name="pubbo-server-loop", daemon=True)
+        self.loop_thread.start()
+
+        self.server = TCPServer((self.host, self.port), Handler)
+        threading.Thread(target=self.server.serve_forever, name="pubbo-server", daemon=True).start()
+        return self.url
+
+    def close(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        with self.lock:
+            connections, self.connections = self.connections, set()
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
+        if self.loop is not None:
+            loop, self.loop = self.loop, None
+            loop.call_soon_threadsafe(loop.stop)
+            self.loop_thread.join()
+            # 取消还在执行的 async 方法 等它们结束后关闭事件循环
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.close()
+
+    def serve(self, connection):
+        # 每条连接一个读线程 只负责切帧和分发 解析和执行都在线程池中
+        send_lock = threading.Lock()
+
+        def send(message):
+            with send_lock:
+                connection.sendall(message)
+
+        with self.lock:
+            self.connections.add(connection)
+        try:
+            for head, body in self.frames(connection):
+                if not head[2] & REQUEST_FLAG:
+                    continue
+                if head[2] & EVENT_FLAG:
+                    if head[2] & TWO_WAY_FLAG:
+                        send(HessianSerialization().encode_heartbeat(head[4:12]))
+                    continue
+                self.submit(send, head, body)
+        except OSError:
+            return
+        finally:
+            with self.lock:
+                self.connections.discard(connection)
+
+    def frames(self, connection):
+        # 一次 recv 尽量多读 流水线发来的多个请求在同一块 buffer 中切出
+        buffer = bytearray()
+        chunk = bytearray(self.buffer_size)
+        view = memoryview(chunk)
+        while True:
+            scale = connection.recv_into(view)
+            if scale == 0:
+                return
+            buffer += view[:scale]
+
+            start = 0
+            while len(buffer) - start >= HEAD_LENGTH:
+                if buffer[start] != 0xda or buffer[start + 1] != 0xbb:
+                    raise OSError("dubbo magic mismatch")
+                length = int.from_bytes(buffer[start + 12:start + 16], byteorder="big")
+                if length > self.max_payload:
+                    raise OSError("dubbo payload too large")
+                end = start + HEAD_LENGTH + length
+                if len(buffer) < end:
+                    break
+                yield bytes(buffer[start:start + HEAD_LENGTH]), bytes(buffer[start + HEAD_LENGTH:end])
+                start = end
+            del buffer[:start]
+
+    def submit(self, send, head, body):
+        with self.lock:
+            self.requests += 1
+            saturated = self.queue_size is not None and self.active >= self.workers + self.queue_size
+            if saturated:
+                self.rejected += 1
+            else:
+                self.active += 1
+
+        if saturated:
+            # 背压 不排队直接拒绝 consumer 可以换一个 provider 重试
+            if head[2] & TWO_WAY_FLAG:
+                message = "server thread pool exhausted, workers: {}, queue: {}".format(self.workers, self.queue_size)
+                send(self.error_response(head, ResponseStatusEnum.SERVER_THREAD_POOL_EXHAUSTED_ERROR, message))
+            return
+
+        # 关闭后到达的请求 断开连接
+        executor = self.executor
+        try:
+            if executor is None:
+                raise RuntimeError("server closed")
+            executor.submit(self.dispatch, send, head, body)
+        except RuntimeError:
+            with self.lock:
+                self.active -= 1
+            raise OSError("dubbo server closed")
+
+    def finish(self, send, head, message):
+        # 每个调用只 finish 一次 单向调用不响应
+        # 先释放名额再响应 consumer 收到响应后马上发出的下一个请求不会被拒绝
+        with self.lock:
+            self.active -= 1
+        try:
+            if head[2] & TWO_WAY_FLAG:
+                send(message)
+        except OSError:
+            pass
+
+    def dispatch(self, send, head, body):
+        try:
+            invocation, generic = self.parse(head[2] & SERIALIZATION_MASK, body)
+            function = self.lookup(invocation)
+            if function is None:
+                message = "service not found: {}:{}.{}".format(
+                    invocation.service_name, invocation.service_version, invocation.method_name
+                )
+                message = self.error_response(head, ResponseStatusEnum.SERVICE_NOT_FOUND, message)
+            elif inspect.iscoroutinefunction(function):
+                # 线程不等待 完成时在事件循环中响应
+                future = asyncio.run_coroutine_threadsafe(function(*invocation.method_arguments), self.loop)
+                future.add_done_callback(lambda f: self.finish(send, head, self.future_response(head, f, generic)))
+                return
+            else:
+                try:
+                    message = self.response(head, function(*invocation.method_arguments), generic=generic)
+                except Exception as e:
+                    message = self.response(head, error=e, generic=generic)
+        except Exception as e:
+            message = self.error_response(head, ResponseStatusEnum.BAD_REQUEST, "{}: {}".format(type(e).__name__, e))
+        self.finish(send, head, message)
+
+    def lookup(self, invocation):
+        key = (invocation.service_name, invocation.service_version or None, invocation.method_name)
+        function = self.handlers.get(key)
+        if function is None:
+            function = self.handlers.get((key[0], None, key[2]))
+        return function
+
+    @staticmethod
+    def parse(serialization_id, body):
+        # 返回 (RequestMessage, 是否为泛化调用)
+        # body 依次为 dubbo 版本 path 版本 方法名 参数描述 每个参数 attachments
+        # 两种序列化的参数都整理成 hessian2 解析出的形状 对象为 JavaClass 字段名为下划线风格
+        fastjson = serialization_id == FastJSONSerialization.serialization_id
+        if serialization_id == HessianSerialization.serialization_id:
+            deserializer = Hessian2Deserializer(body)
+            read = deserializer.deserialize
+        elif fastjson:
+            lines = iter(body.decode("utf-8").split("\r\n"))
+            read = lambda: json.loads(next(lines))
+        else:
+            raise Exception("unsupported serialization: {}".format(serialization_id))
+
+        invocation = RequestMessage()
+        invocation.dubbo_version = read()
+        invocation.service_name = read()
+        invocation.service_version = read()
+        invocation.method_name = read()
+        desc = read()
+        types = parameter_types(desc)
+        invocation.method_arguments = [read() for _ in types]
+        invocation.attachments = read() or {}
+        invocation.method_parameter_types = desc
+
+        generic = invocation.method_name == GENERIC_METHOD_NAME
+        if generic:
+            invocation.method_name, invocation.method_parameter_types, arguments = invocation.method_arguments
+            invocation.method_arguments = list(arguments or ())
+            types = invocation.method_parameter_types or ()
+        if fastjson:
+            invocation.method_arguments = [
+                from_json(value, types[i] if i < len(types) else None)
+                for i, value in enumerate(invocation.method_arguments)
+            ]
+        return invocation, generic
+
+    def future_response(self, head, future, generic):
+        if future.cancelled():
+            return self.error_response(head, ResponseStatusEnum.SERVER_ERROR, "server closed")
+        try:
+            return self.response(head, future.result(), generic=generic)
+        except Exception as e:
+            return self.response(head, error=e, generic=generic)
+
+    def response(self, head, value=None, error=None, generic=False):
+        # 值不能序列化时返回 SERVICE_ERROR
+        serializer = Hessian2Serializer()
+        try:
+            if error is not None:
+                serializer.serialize_int(ResponseTypeEnum.EXCEPTION.value)
+                serializer.serialize(self.exception(error, generic))
+            elif value is None:
+                serializer.serialize_int(ResponseTypeEnum.NULL.value)
+            else:
+                serializer.serialize_int(ResponseTypeEnum.VALUE.value)
+                serializer.serialize(value)
+        except Exception as e:
+            message = "serialize response error {}: {}".format(type(e).__name__, e)
+            return self.error_response(head, ResponseStatusEnum.SERVICE_ERROR, message)
+        return self.frame(head, ResponseStatusEnum.OK, serializer.message)
+
+    def error_response(self, head, status, message):
+        # 非 OK 的响应 body 为错误信息
+        serializer = Hessian2Serializer()
+        serializer.serialize_string(message)
+        return self.frame(head, status, serializer.message)
+
+    @staticmethod
+    def frame(head, status, body):
+        second_position = bytes((HessianSerialization.serialization_id, status.value))
+        length = len(body).to_bytes(length=4, byteorder="big")
+        return b"\xda\xbb" + second_position + bytes(head[4:12]) + length + bytes(body)
+
+    @staticmethod
+    def exception(e, generic=False):
+        # 泛化调用返回 GenericException 其他调用返回 RuntimeException consumer 端都可以反序列化
+        message = "{}: {}".format(type(e).__name__, e)
+        if generic:
+            exception = JavaClass(GENERIC_EXCEPTION_CLASS)
+            exception.exception_class = type(e).__name__
+            exception.exception_message = str(e)
+        else:
+            exception = JavaClass(RUNTIME_EXCEPTION_CLASS)
+        exception.detail_message = message
+        exception.cause = None
+        exception.stack_trace = []
+        exception.suppressed_exceptions = []
+        return exception
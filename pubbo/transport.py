@@ -0,0 +1,414 @@
+import queue
+import selectors
+import socket
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from .serialization import EVENT_FLAG, REQUEST_FLAG, TWO_WAY_FLAG, HessianSerialization
+
+HEAD_LENGTH = 16
+
+
+class Connection(object):
+    # 一条 TCP 连接 可以同时承载多个调用
+    # 独立的 reader 线程读取响应 按 request_id 分发给等待中的调用
+    socket = None
+    timeout = None
+    buffer_size = 65536
+    closed = False
+    error = None
+    # 由 ConnectionPool 维护 正在使用这条连接的调用数和最后一次归还的时间
+    active = 0
+    last_used = 0
+    # 连接上超过 heartbeat 秒没有读写时发心跳 超过 3 倍仍然没有收到任何数据时关闭连接 None 为不发心跳
+    heartbeat = 60
+    last_read = 0
+    last_write = 0
+    selector = None
+    # 为 True 时在 Future 上记下 started sent arrived received 四个时间点 (time.perf_counter)
+    timing = False
+
+    def __init__(self, ip, port, timeout=5, buffer_size=None, heartbeat=60, timing=False):
+        self.timeout = timeout
+        self.heartbeat = heartbeat
+        self.timing = timing
+        self.socket = socket.socket()
+        self.socket.settimeout(timeout)
+
+        # 不指定时沿用系统默认的 socket 缓冲区 以免关掉内核的自动调整
+        if buffer_size is not None:
+            self.buffer_size = buffer_size
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_size)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, buffer_size)
+
+        self.socket.connect((ip, int(port)))
+
+        self.closed = False
+        self.error = None
+        self.active = 0
+        self.last_used = self.last_read = self.last_write = time.monotonic()
+        self.pending = {}
+        self.streaming = None
+        self.lock = threading.Lock()
+        self.send_lock = threading.Lock()
+        # 带 deadline 的发送用它等待可写 不受 select 只能处理 1024 以下 fd 的限制
+        self.selector = None
+
+        self.reader = threading.Thread(target=self.run, name="pubbo-reader-{}:{}".format(ip, port), daemon=True)
+        self.reader.start()
+
+    def request(self, request_id, message, stream=False, deadline=None):
+        # 返回的 Future 结果为 (head, payload) stream 时 payload 为逐块产出 bytes 的 Stream
+        # 消费方不读时 stream 会让 reader 停下 stream 只能在不和其他调用共用的连接上发出
+        # deadline 为 time.monotonic() 的时间点 等待发送和发送都不会超过它
+        future = Future()
+
+        with self.lock:
+            if self.closed:
+                raise Exception("dubbo connection closed") from self.error
+            self.pending[request_id] = (future, stream)
+
+        if self.timing:
+            future.started = time.perf_counter()
+        try:
+            if not self.send_lock.acquire(timeout=-1 if deadline is None else max(deadline - time.monotonic(), 0)):
+                raise TimeoutError("dubbo request send timeout")
+            try:
+                self.send(message, deadline)
+                if self.timing:
+                    future.sent = time.perf_counter()
+            finally:
+                self.send_lock.release()
+        except BaseException as e:
+            # 任何异常都不能把调用留在 pending 中
+            self.cancel(request_id)
+            if isinstance(e, OSError) and not isinstance(e, TimeoutError):
+                self.close(e)
+            raise
+
+        return future
+
+    def send(self, message, deadline=None):
+        self.last_write = time.monotonic()
+        if deadline is None:
+            self.socket.sendall(message)
+            return
+
+        if self.selector is None:
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.socket, selectors.EVENT_WRITE)
+
+        view = memoryview(message)
+        while view:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self.selector.select(remaining):
+                error = TimeoutError("dubbo request send timeout")
+                # 只发出了一部分的帧会让连接上之后的数据错位 只能关闭连接
+                if len(view) != len(message):
+                    self.close(error)
+                raise error
+            view = view[self.socket.send(view):]
+
+    def cancel(self, request_id):
+        # 调用方不再等待 之后到达的响应直接丢弃
+        with self.lock:
+            self.pending.pop(request_id, None)
+
+    def close(self, error=None):
+        with self.lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.error = error
+            pending, self.pending = self.pending, {}
+            streaming, self.streaming = self.streaming, None
+
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        if self.selector is not None:
+            self.selector.close()
+        self.socket.close()
+
+        exception = Exception("dubbo connection closed")
+        exception.__cause__ = error
+        for future, _ in pending.values():
+            self.resolve(future, exception=exception)
+        if streaming is not None:
+            # 队列满时丢掉最早的 chunk 保证消费方一定能收到异常
+            while True:
+                try:
+                    streaming.put_nowait(exception)
+                    break
+                except queue.Full:
+                    try:
+                        streaming.get_nowait()
+                    except queue.Empty:
+                        pass
+
+    @staticmethod
+    def resolve(future, result=None, exception=None):
+        # 调用方可能已经放弃了这个 Future
+        try:
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+        except InvalidStateError:
+            pass
+
+    def run(self):
+        try:
+            while not self.closed:
+                head = self.read_head()
+                if head is None:
+                    self.keep_alive()
+                    continue
+
+                self.last_read = time.monotonic()
+                arrived = time.perf_counter() if self.timing else None
+                request_id = int.from_bytes(head[4:12], byteorder="big")
+                length = int.from_bytes(head[12:16], byteorder="big")
+
+                if head[2] & EVENT_FLAG:
+                    self.dispatch_event(head, length)
+                    continue
+
+                with self.lock:
+                    call = self.pending.pop(request_id, None)
+
+                if call is None:
+                    for _ in self.receive(length):
+                        pass
+                    continue
+
+                future, stream = call
+                if stream:
+                    self.dispatch_stream(future, head, length)
+                else:
+                    payload = self.read(length)
+                    if self.timing:
+                        future.arrived, future.received = arrived, time.perf_counter()
+                    self.resolve(future, (head, payload))
+        except Exception as e:
+            self.close(e)
+
+    def keep_alive(self):
+        if self.heartbeat is None:
+            return
+
+        now = time.monotonic()
+        if now - self.last_read > self.heartbeat * 3:
+            raise Exception("dubbo connection heartbeat timeout")
+        if now - max(self.last_read, self.last_write) >= self.heartbeat:
+            with self.send_lock:
+                self.send(HessianSerialization().encode_heartbeat())
+
+    def dispatch_event(self, head, length):
+        # 心跳的响应直接丢弃 provider 发来的心跳请求需要回复
+        self.read(length)
+        if head[2] & REQUEST_FLAG and head[2] & TWO_WAY_FLAG:
+            with self.send_lock:
+                self.send(HessianSerialization().encode_heartbeat(head[4:12]))
+
+    def dispatch_stream(self, future, head, length):
+        # 有界队列 消费方处理不过来时 reader 停止读取 形成背压
+        chunks = queue.Queue(maxsize=64)
+        with self.lock:
+            self.streaming = chunks
+        self.resolve(future, (head, Stream(self, chunks)))
+
+        for chunk in self.receive(length):
+            self.offer(chunks, bytes(chunk))
+        self.offer(chunks, None)
+
+        with self.lock:
+            self.streaming = None
+
+    def offer(self, chunks, chunk):
+        while not self.closed:
+            try:
+                chunks.put(chunk, timeout=self.timeout)
+                return
+            except queue.Full:
+                pass
+
+    @staticmethod
+    def iterate(chunks):
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    def read_head(self):
+        # 空闲时的超时不算错误 返回 None 继续等待
+        buffer = bytearray(HEAD_LENGTH)
+        try:
+            scale = self.socket.recv_into(buffer)
+        except socket.timeout:
+            return None
+        if scale == 0:
+            raise Exception("dubbo connection closed by peer")
+        if scale < HEAD_LENGTH:
+            self.read_into(memoryview(buffer)[scale:])
+        return buffer
+
+    def read_into(self, view):
+        received, length = 0, len(view)
+        while received < length:
+            scale = self.socket.recv_into(view[received:])
+            if scale == 0:
+                raise Exception("dubbo connection closed by peer")
+            received += scale
+
+    def read(self, length):
+        # 一帧直接读进预分配好的 buffer 不做拼接
+        buffer = bytearray(length)
+        self.read_into(memoryview(buffer))
+        return buffer
+
+    def receive(self, length):
+        # 复用同一块 buffer 产出的 chunk 在下一次读取前有效
+        buffer = bytearray(min(length, self.buffer_size))
+        view = memoryview(buffer)
+        while length > 0:
+            scale = self.socket.recv_into(view, min(length, len(buffer)))
+            if scale == 0:
+                raise Exception("dubbo connection closed by peer")
+            length -= scale
+            yield view[:scale]
+
+
+class Stream(object):
+    # stream 调用的 payload 逐块产出 bytes 读完 提前 close 或被回收时关闭独占的连接
+    # 连接关闭后 reader 不再等待消费方 直接退出
+    def __init__(self, connection, chunks):
+        self.connection = connection
+        self.chunks = Connection.iterate(chunks)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self.chunks)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self):
+        self.connection.close()
+
+    def __del__(self):
+        self.close()
+
+
+class ConnectionPool(object):
+    # 单个 provider 地址的有界连接池 连接在需要时才创建
+    # 一条连接可以同时承载 max_pending 个调用 已有连接都在忙时才新建连接 把调用分散到多条连接上
+    ip = None
+    port = None
+    timeout = None
+    buffer_size = None
+    max_size = 4
+    max_pending = 64
+    max_idle_time = 60
+    heartbeat = 60
+    timing = False
+    closed = False
+
+    def __init__(self, ip, port, timeout=5, buffer_size=None, max_size=4, max_pending=64, max_idle_time=60,
+                 heartbeat=60, timing=False):
+        self.ip = ip
+        self.port = port
+        self.timeout = timeout
+        self.buffer_size = buffer_size
+        self.max_size = max_size
+        self.max_pending = max_pending
+        self.max_idle_time = max_idle_time
+        self.heartbeat = heartbeat
+        self.timing = timing
+        self.closed = False
+
+        self.connections = []
+        self.creating = 0
+        self.condition = threading.Condition()
+
+    def evict(self):
+        # 去掉已断开的连接 关闭空闲太久的连接
+        # 开启心跳时保留一条空闲连接 靠心跳保活 安静一段时间后的第一次调用不用重新建连
+        now = time.monotonic()
+        for connection in list(self.connections):
+            idle = connection.active == 0 and now - connection.last_used > self.max_idle_time
+            keep = self.heartbeat is not None and len(self.connections) == 1
+            if connection.closed or (idle and not keep):
+                self.connections.remove(connection)
+                connection.close()
+
+    def checkout(self, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self.condition:
+            while True:
+                if self.closed:
+                    raise Exception("dubbo connection pool closed")
+
+                self.evict()
+
+                connection = min(self.connections, key=lambda i: i.active, default=None)
+                size = len(self.connections) + self.creating
+
+                if connection is not None and connection.active < self.max_pending:
+                    if connection.active == 0 or size >= self.max_size:
+                        connection.active += 1
+                        return connection
+
+                if size < self.max_size:
+                    self.creating += 1
+                    break
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("dubbo connection pool checkout timeout")
+                self.condition.wait(remaining)
+
+        # 建立连接时不持有锁 其他调用可以继续使用已有连接
+        try:
+            connection = Connection(self.ip, self.port, self.timeout, self.buffer_size, self.heartbeat, self.timing)
+        except BaseException:
+            with self.condition:
+                self.creating -= 1
+                self.condition.notify()
+            raise
+
+        with self.condition:
+            self.creating -= 1
+            connection.active = 1
+            self.connections.append(connection)
+        return connection
+
+    def connect(self):
+        # 不进连接池的连接 给 stream 调用独占 由调用方关闭
+        if self.closed:
+            raise Exception("dubbo connection pool closed")
+        return Connection(self.ip, self.port, self.timeout, self.buffer_size, None, self.timing)
+
+    def checkin(self, connection):
+        with self.condition:
+            connection.active -= 1
+            connection.last_used = time.monotonic()
+            self.condition.notify()
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            connections, self.connections = self.connections, []
+            self.condition.notify_all()
+
+        for connection in connections:
+            connection.close()
@@ -1,9 +1,13 @@
+import functools
 import re
 
 
+# 字段名的种类有限 转换结果缓存起来 避免每次响应都跑正则
+@functools.lru_cache(maxsize=4096)
 def camel_to_under_score(message):
     return re.sub(r'([a-z]|\d)([A-Z])', r'\1_\2', message).lower()
 
 
+@functools.lru_cache(maxsize=4096)
 def under_score_to_camel(message):
     return re.sub(r'(_\w)', lambda x: x.group(1)[1].upper(), message)
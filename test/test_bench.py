@@ -0,0 +1,36 @@
+import json
+import os
+import tempfile
+import unittest
+
+from pubbo import bench
+
+
+class BenchTest(unittest.TestCase):
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "result.json")
+            argv = ["--only", "encode", "--only", "decode_strings", "--scale", "1", "--repeat", "1"]
+            self.assertEqual(bench.main(argv + ["--output", output]), 0)
+            with open(output) as f:
+                report = json.load(f)
+            self.assertEqual(set(report["results"]), {"encode_fastjson", "encode_hessian", "decode_strings"})
+
+            # 基线快 10 倍时视为退化
+            for result in report["results"].values():
+                result["ops_per_second"] *= 10
+            with open(output, "w") as f:
+                json.dump(report, f)
+            self.assertEqual(bench.main(argv + ["--output", output + ".new", "--compare", output]), 1)
+
+    def test_call_repeat(self):
+        # 端到端调用按 --repeat 跑多轮 取最快一轮
+        rounds = []
+        fastest = bench.fastest
+        bench.fastest = lambda results: rounds.append(results) or fastest(results)
+        self.addCleanup(setattr, bench, "fastest", fastest)
+
+        for name in ("call_sync", "call_async"):
+            result = bench.cases[name](1, 3)
+            self.assertEqual(len(rounds[-1]), 3)
+            self.assertEqual(result["ops_per_second"], max(i["ops_per_second"] for i in rounds[-1]))
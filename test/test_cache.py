@@ -0,0 +1,140 @@
+import time
+import unittest
+
+from pubbo.cache import ResponseCache
+from pubbo import mock
+from pubbo.client import DubboClient, enable_cache, invalidate
+from pubbo.hessian import ColumnTable
+from pubbo.mock import MockProvider
+
+INTERFACE = "com.pubbo.UserFacade"
+
+
+class ResponseCacheTest(unittest.TestCase):
+    def test_lru(self):
+        cache = ResponseCache(max_size=2)
+        cache.put(b"a", 1, 1)
+        cache.put(b"b", 2, 1)
+        self.assertEqual(cache.get(b"a"), (True, 1))
+        cache.put(b"c", 3, 1)
+
+        # b 最久没有用到 被淘汰
+        self.assertEqual(cache.get(b"b"), (False, None))
+        self.assertEqual(cache.get(b"c"), (True, 3))
+        self.assertEqual(cache.stats(), {"hits": 2, "misses": 1, "evictions": 1, "entries": 2, "bytes": 2})
+
+    def test_max_bytes(self):
+        cache = ResponseCache(max_bytes=10)
+        cache.put(b"a", 1, 6)
+        cache.put(b"b", 2, 6)
+        cache.put(b"c", 3, 11)
+        self.assertEqual(cache.get(b"a"), (False, None))
+        self.assertEqual(cache.get(b"b"), (True, 2))
+        self.assertEqual(cache.get(b"c"), (False, None))
+
+    def test_ttl_and_invalidate(self):
+        cache = ResponseCache(ttl=0.05)
+        cache.put(b"a", None, 1)
+        cache.put(b"b", 2, 1)
+        self.assertEqual(cache.get(b"a"), (True, None))
+
+        cache.invalidate(b"b")
+        self.assertEqual(cache.get(b"b"), (False, None))
+
+        time.sleep(0.06)
+        self.assertEqual(cache.get(b"a"), (False, None))
+        self.assertEqual(cache.stats()["bytes"], 0)
+
+    def test_invalidate_prefix(self):
+        cache = ResponseCache()
+        cache.put((b"a", b"1", ()), 1, 1)
+        cache.put((b"a", b"1", (("token", "x"),)), 2, 1)
+        cache.put((b"a", b"2", ()), 3, 1)
+
+        # 同一组参数带不同 attachments 的结果一起去掉
+        cache.invalidate((b"a", b"1"))
+        self.assertEqual(cache.stats()["entries"], 1)
+        self.assertEqual(cache.get((b"a", b"2", ())), (True, 3))
+
+
+class ProxyCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.provider = MockProvider()
+        cls.provider.register(INTERFACE, "getUser", lambda user_id: {"id": user_id})
+        cls.provider.register(INTERFACE, "listItems", mock.items(4))
+        cls.provider.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.provider.close()
+
+    def setUp(self):
+        self.client = DubboClient(self.provider.url)
+        self.proxy = self.client.proxy(INTERFACE, "1.0.0")
+
+    def tearDown(self):
+        self.client.close()
+
+    def calls(self, function):
+        # 返回 function 执行期间 provider 收到的请求数
+        start = self.provider.requests
+        function()
+        return self.provider.requests - start
+
+    def test_cache(self):
+        cache = enable_cache(self.proxy, "get_user")
+        first = self.proxy.get_user(1)
+        # 命中时返回同一个对象 不发请求
+        self.assertEqual(self.calls(lambda: self.assertIs(self.proxy.get_user(1), first)), 0)
+        self.assertEqual(self.calls(lambda: self.proxy.get_user(2)), 1)
+        self.assertEqual(cache.stats()["entries"], 2)
+
+    def test_raw(self):
+        cache = enable_cache(self.proxy, "get_user", raw=True)
+        first = self.proxy.get_user(1)
+        second = []
+        self.assertEqual(self.calls(lambda: second.append(self.proxy.get_user(1))), 0)
+        # 命中时重新解析 每次拿到各自的对象
+        self.assertEqual(second[0], first)
+        self.assertIsNot(second[0], first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_decode_options(self):
+        # 缓存解析好的对象时 columnar lazy 不同的调用各自缓存
+        cache = enable_cache(self.proxy, "list_items")
+        self.assertEqual(self.calls(lambda: self.proxy.list_items()), 1)
+        self.assertEqual(self.calls(lambda: self.proxy.list_items(columnar=True)), 1)
+        self.assertEqual(self.calls(lambda: self.proxy.list_items(lazy=True)), 1)
+
+        self.assertIsInstance(self.proxy.list_items(), list)
+        self.assertIsInstance(self.proxy.list_items(columnar=True), ColumnTable)
+        self.assertEqual(self.proxy.list_items(lazy=True)[0].name, "item-0")
+        self.assertEqual((cache.hits, cache.misses), (3, 3))
+
+        # 原始响应缓存命中时按本次的选项解析 共用一份
+        cache = enable_cache(self.proxy, "list_items", raw=True)
+        self.proxy.list_items()
+        self.assertEqual(self.calls(lambda: self.assertIsInstance(self.proxy.list_items(columnar=True), ColumnTable)), 0)
+        self.assertEqual(cache.stats()["entries"], 1)
+
+    def test_invalidate(self):
+        enable_cache(self.proxy, "get_user")
+        self.proxy.get_user(1)
+        self.proxy.get_user(2)
+
+        invalidate(self.proxy, "get_user", 1)
+        self.assertEqual(self.calls(lambda: self.proxy.get_user(1)), 1)
+        self.assertEqual(self.calls(lambda: self.proxy.get_user(2)), 0)
+
+        invalidate(self.proxy, "get_user")
+        self.assertEqual(self.calls(lambda: (self.proxy.get_user(1), self.proxy.get_user(2))), 2)
+        # 没有开启缓存的方法什么都不做
+        invalidate(self.proxy, "get_nothing", 1)
+
+    def test_ttl(self):
+        enable_cache(self.proxy, "get_user", ttl=0.05)
+        self.proxy.get_user(1)
+        self.assertEqual(self.calls(lambda: self.proxy.get_user(1)), 0)
+        time.sleep(0.06)
+        self.assertEqual(self.calls(lambda: self.proxy.get_user(1)), 1)
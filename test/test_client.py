@@ -0,0 +1,176 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from pubbo import mock
+from pubbo.aio import AsyncDubboClient
+from pubbo.client import DubboClient, batch, enable_cache, invalidate
+from pubbo.cluster import ClusterClient
+from pubbo.common import GenericException
+from pubbo.filter import AttachmentFilter
+from pubbo.mock import MockProvider
+from pubbo.serialization import HessianSerialization
+
+INTERFACE = "com.pubbo.UserFacade"
+
+
+def get_user(user_id):
+    return {"id": user_id, "name": "user-{}".format(user_id)}
+
+
+def fail(*args):
+    raise ValueError("bad user")
+
+
+class DubboClientTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.provider = MockProvider()
+        cls.provider.register(INTERFACE, "getUser", get_user)
+        cls.provider.register(INTERFACE, "getNothing", lambda: None)
+        cls.provider.register(INTERFACE, "fail", fail)
+        cls.provider.register(INTERFACE, "listItems", mock.items(100))
+        # 和 proxy 的内部方法同名的 Java 方法
+        # 超过 reader 的 chunk 队列和 socket 缓冲区的大 list
+        cls.provider.register(INTERFACE, "listBlobs", lambda: [b"x" * 65536] * 256)
+        for name in ("request", "stream", "iterate", "encode", "decode", "message", "batch", "call", "invalidate"):
+            cls.provider.register(INTERFACE, name, lambda *args, name=name: [name] + list(args))
+        # 参数越小响应越慢 并发调用的响应乱序到达
+        cls.provider.register(INTERFACE, "slow", lambda i: i, latency=lambda method, args: 0.05 / (args[0] + 1))
+        cls.provider.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.provider.close()
+
+    def setUp(self):
+        self.client = DubboClient(self.provider.url)
+        self.proxy = self.client.proxy(INTERFACE, "1.0.0")
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_invoke(self):
+        self.assertEqual(self.proxy.get_user(1), {"id": 1, "name": "user-1"})
+        self.assertIsNone(self.proxy.get_nothing())
+
+        items = self.proxy.list_items()
+        self.assertEqual(len(items), 100)
+        self.assertEqual(items[3].name, "item-3")
+
+    def test_java_method_names(self):
+        self.assertEqual(self.proxy.request(1), ["request", 1])
+        self.assertEqual(self.proxy.stream(), ["stream"])
+        self.assertEqual(list(self.proxy.iterate.stream(2)), ["iterate", 2])
+        self.assertEqual(self.proxy.encode("x"), ["encode", "x"])
+        self.assertEqual(self.proxy.decode(), ["decode"])
+        self.assertEqual(self.proxy.message("x", 1), ["message", "x", 1])
+        self.assertEqual(self.proxy.batch([1]), ["batch", [1]])
+        self.assertEqual(self.proxy.call(), ["call"])
+        self.assertEqual(self.proxy.invalidate(), ["invalidate"])
+
+    def test_hessian_request(self):
+        client = DubboClient(self.provider.url, serialization=HessianSerialization)
+        try:
+            self.assertEqual(client.proxy(INTERFACE, "1.0.0").get_user(2)["id"], 2)
+        finally:
+            client.close()
+
+    def test_errors(self):
+        with self.assertRaises(GenericException) as context:
+            self.proxy.fail(1)
+        self.assertEqual(context.exception.exception_message, "bad user")
+
+        with self.assertRaises(Exception) as context:
+            self.proxy.unknown()
+        self.assertEqual(str(context.exception), "SERVICE_NOT_FOUND")
+
+    def test_multiplex(self):
+        client = DubboClient(self.provider.url, pool_size=1)
+        proxy = client.proxy(INTERFACE, "1.0.0")
+        results = {}
+
+        def call(i):
+            results[i] = proxy.slow(i)
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.close()
+
+        self.assertEqual(results, {i: i for i in range(8)})
+        self.assertEqual(len(client.pool.connections), 0)
+
+    def test_stream(self):
+        self.assertEqual([i.id for i in self.proxy.list_items.stream()], list(range(100)))
+        self.assertEqual([i.id for i in self.proxy.list_items.stream(keep_refs=False)], list(range(100)))
+
+    def test_stream_not_consumed(self):
+        # 打开后不读的 stream 不影响其他调用
+        for pool_size in (1, 4):
+            client = DubboClient(self.provider.url, pool_size=pool_size, timeout=3)
+            proxy = client.proxy(INTERFACE, "1.0.0")
+            try:
+                blobs = proxy.list_blobs.stream()
+                time.sleep(0.2)
+                self.assertEqual(proxy.get_user(1)["id"], 1)
+                self.assertEqual(len(next(blobs)), 65536)
+                # 提前结束的 stream 关闭它的连接
+                blobs.close()
+                self.assertEqual(proxy.get_user(2)["id"], 2)
+            finally:
+                client.close()
+
+    def test_batch(self):
+        results = batch(self.proxy, [("get_user", (i,)) for i in range(20)] + [("fail", ())], concurrency=4)
+        self.assertEqual([i["id"] for i in results[:20]], list(range(20)))
+        self.assertIsInstance(results[20], GenericException)
+
+    def test_cache_key_ignored_attachments(self):
+        # 每次调用的 trace id 不同 同一组参数仍然命中缓存
+        client = DubboClient(self.provider.url, filters=[
+            AttachmentFilter({"trace_id": iter(range(10)).__next__}, ignored=True)
+        ])
+        try:
+            proxy = client.proxy(INTERFACE, "1.0.0")
+            cache = enable_cache(proxy, "get_user")
+            self.assertEqual([proxy.get_user(1)["id"] for _ in range(3)], [1, 1, 1])
+            self.assertEqual((cache.hits, cache.misses), (2, 1))
+        finally:
+            client.close()
+
+    def test_cache_key_attachments(self):
+        # token 不同的调用不共用缓存的结果
+        tokens = iter(["a", "b", "a"])
+        client = DubboClient(self.provider.url, filters=[AttachmentFilter({"token": tokens.__next__})])
+        try:
+            proxy = client.proxy(INTERFACE, "1.0.0")
+            cache = enable_cache(proxy, "get_user")
+            for _ in range(3):
+                proxy.get_user(1)
+            self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+            # 不带 token 时也能去掉这组参数的所有结果
+            invalidate(proxy, "get_user", 1)
+            self.assertEqual(cache.stats()["entries"], 0)
+        finally:
+            client.close()
+
+    def test_cluster(self):
+        client = ClusterClient([self.provider.url, self.provider.url], load_balance="roundrobin")
+        try:
+            proxy = client.proxy(INTERFACE, "1.0.0")
+            self.assertEqual([proxy.get_user(i)["id"] for i in range(4)], [0, 1, 2, 3])
+        finally:
+            client.close()
+
+    def test_async(self):
+        async def main():
+            async with AsyncDubboClient(self.provider.url) as client:
+                proxy = client.proxy(INTERFACE, "1.0.0")
+                return await asyncio.gather(*[proxy.slow(i) for i in range(8)])
+
+        self.assertEqual(asyncio.run(main()), list(range(8)))
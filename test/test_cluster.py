@@ -0,0 +1,125 @@
+import time
+import unittest
+
+from pubbo.cluster import (
+    ClusterClient, ConsistentHashLoadBalance, HedgeBudget, LatencyWindow, LeastActiveLoadBalance, PeakEwmaLoadBalance,
+    Provider, RandomLoadBalance, RoundRobinLoadBalance
+)
+from pubbo.common import RequestMessage
+from pubbo.metrics import MemoryMetrics
+from pubbo.mock import MockProvider
+
+INTERFACE = "com.pubbo.UserFacade"
+
+
+class HedgeTest(unittest.TestCase):
+    def test_latency_window(self):
+        window = LatencyWindow(percentile=90)
+        for i in range(31):
+            window.add(i * 0.01)
+        # 样本不够时不 hedge
+        self.assertIsNone(window.delay())
+
+        window.add(0.31)
+        self.assertAlmostEqual(window.delay(), 0.28)
+
+    def test_budget(self):
+        budget = HedgeBudget(rate=3)
+        self.assertEqual([budget.acquire() for _ in range(4)], [True, True, True, False])
+
+
+def invocation(*args):
+    message = RequestMessage()
+    message.method_name = "getUser"
+    message.method_arguments = list(args)
+    return message
+
+
+class LoadBalanceTest(unittest.TestCase):
+    def setUp(self):
+        self.providers = [Provider("127.0.0.1:{}".format(20880 + i), None) for i in range(4)]
+
+    def test_random(self):
+        selected = [RandomLoadBalance().select(self.providers, invocation(1)) for _ in range(200)]
+        self.assertEqual({i.url for i in selected}, {i.url for i in self.providers})
+
+    def test_least_active(self):
+        for provider, active in zip(self.providers, (3, 1, 2, 1)):
+            provider.active = active
+        selected = {LeastActiveLoadBalance().select(self.providers, invocation(1)) for _ in range(50)}
+        self.assertEqual(selected, {self.providers[1], self.providers[3]})
+
+    def test_peak_ewma(self):
+        fast, slow = self.providers[:2]
+        for provider, elapsed in ((fast, 0.01), (slow, 0.1)):
+            provider.start()
+            provider.finish(elapsed, decay=10)
+        load_balance = PeakEwmaLoadBalance()
+        self.assertIs(load_balance.select([fast, slow], invocation(1)), fast)
+
+        # 进行中的调用多时 延迟低的也会让出
+        fast.active = 20
+        self.assertIs(load_balance.select([fast, slow], invocation(1)), slow)
+
+        # 比均值慢的响应直接成为新的峰值 快的响应按时间衰减
+        slow.start()
+        slow.finish(0.5, decay=10)
+        self.assertEqual(slow.ewma, 0.5)
+        slow.start()
+        slow.finish(0.1, decay=10)
+        self.assertTrue(0.1 < slow.ewma < 0.5)
+        self.assertEqual(slow.active, 0)
+
+    def test_consistent_hash(self):
+        load_balance = ConsistentHashLoadBalance(arguments=(0,))
+        hashes, nodes = load_balance.ring(self.providers)
+        self.assertEqual(len(nodes), 160 * len(self.providers))
+        self.assertEqual(hashes, sorted(hashes))
+        # md5 的环与 provider 的顺序和实例无关
+        other = ConsistentHashLoadBalance(arguments=(0,))
+        self.assertEqual(other.ring(list(reversed(self.providers)))[0], hashes)
+
+        selected = [load_balance.select(self.providers, invocation(i, "x")).url for i in range(100)]
+        self.assertEqual([other.select(self.providers, invocation(i, "y")).url for i in range(100)], selected)
+        self.assertEqual(len(set(selected)), len(self.providers))
+
+        # 去掉一个 provider 只有原来落在它上面的参数换 provider
+        removed = self.providers[0]
+        for i, url in enumerate(selected):
+            if url != removed.url:
+                self.assertEqual(load_balance.select(self.providers[1:], invocation(i)).url, url)
+
+
+class ClusterHedgeTest(unittest.TestCase):
+    def setUp(self):
+        self.slow = MockProvider(latency=0.5)
+        self.slow.register(INTERFACE, "getUser", lambda user_id: "slow")
+        self.fast = MockProvider()
+        self.fast.register(INTERFACE, "getUser", lambda user_id: "fast")
+        self.slow.start()
+        self.fast.start()
+
+    def tearDown(self):
+        self.slow.close()
+        self.fast.close()
+
+    def test_hedge(self):
+        metrics = MemoryMetrics()
+        # 第一个请求总是发给 slow
+        client = ClusterClient(
+            [self.slow.url, self.fast.url], load_balance=RoundRobinLoadBalance(), idempotent=("get_user",),
+            metrics=metrics,
+        )
+        try:
+            window = client.latencies["getUser"]
+            for _ in range(window.min_samples):
+                window.add(0.01)
+
+            start = time.monotonic()
+            self.assertEqual(client.proxy(INTERFACE, "1.0.0").get_user(1), "fast")
+            self.assertLess(time.monotonic() - start, 0.4)
+            # 两个 provider 都收到了请求 取先到的 fast 的响应
+            self.assertEqual((self.slow.requests, self.fast.requests), (1, 1))
+            self.assertEqual(metrics.counter("pubbo_hedges_total", interface=INTERFACE, method="getUser"), 1)
+        finally:
+            client.close()
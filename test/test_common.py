@@ -0,0 +1,27 @@
+import json
+import unittest
+
+from pubbo.common import JavaClass, JavaObjectCamelJsonEncoder, java_class_members
+
+
+class JavaClassMembersTest(unittest.TestCase):
+    def test_members(self):
+        class User(JavaClass):
+            level = 3
+
+            def display_name(self):
+                return self.user_name
+
+        user = User("com.x.User")
+        user.user_name = "a"
+        user._hidden = 1
+
+        self.assertEqual(java_class_members(user), [("level", 3), ("user_name", "a")])
+
+    def test_camel_json(self):
+        item = JavaClass("com.x.Item")
+        item.item_id, item.sub = 1, JavaClass("com.x.Sub")
+        item.sub.sub_value = "x"
+
+        message = json.dumps(item, cls=JavaObjectCamelJsonEncoder, separators=(",", ":"))
+        self.assertEqual(json.loads(message), {"class": "com.x.Item", "itemId": 1, "sub": {"class": "com.x.Sub", "subValue": "x"}})
@@ -0,0 +1,141 @@
+import asyncio
+import json
+import unittest
+
+from pubbo.aio import AsyncDubboClient
+from pubbo.client import DubboClient, batch
+from pubbo.common import RequestMessage
+from pubbo.filter import AttachmentFilter, Filter, LoggingFilter, TimeoutFilter
+from pubbo.hessian import Hessian2Deserializer
+from pubbo.mock import MockProvider
+from pubbo.serialization import FastJSONSerialization, HessianSerialization
+
+INTERFACE = "com.pubbo.UserFacade"
+
+
+class RecordFilter(Filter):
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def invoke(self, invoker, invocation):
+        self.calls.append(self.name)
+        result = invoker(invocation)
+        self.calls.append("/" + self.name)
+        return result
+
+
+class MockFilter(Filter):
+    def invoke(self, invoker, invocation):
+        if invocation.method_name == "getUser" and invocation.method_arguments[0].value() == 0:
+            return {"id": 0, "name": "mock"}
+        return invoker(invocation)
+
+
+class AsyncUpperFilter(Filter):
+    async def invoke(self, invoker, invocation):
+        result = await invoker(invocation)
+        return dict(result, name=result["name"].upper())
+
+
+class FilterTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.provider = MockProvider()
+        cls.provider.register(INTERFACE, "getUser", lambda i: {"id": i, "name": "user-{}".format(i)})
+        cls.provider.register(INTERFACE, "slow", lambda: 1, latency=0.2)
+        cls.provider.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.provider.close()
+
+    def test_empty_chain(self):
+        client = DubboClient(self.provider.url)
+        proxy = client.proxy(INTERFACE, "1.0.0")
+        # 没有 filter 时直接调用 _call
+        self.assertEqual(proxy._invoker, proxy._call)
+        self.assertEqual(proxy.get_user(1)["name"], "user-1")
+        client.close()
+
+    def test_chain(self):
+        calls = []
+        client = DubboClient(self.provider.url, filters=[RecordFilter("a", calls), MockFilter()])
+        proxy = client.proxy(INTERFACE, "1.0.0", filters=[RecordFilter("b", calls)])
+        try:
+            self.assertEqual(proxy.get_user(0)["name"], "mock")
+            self.assertEqual(calls, ["a", "/a"])
+
+            del calls[:]
+            self.assertEqual(proxy.get_user(1)["name"], "user-1")
+            self.assertEqual(calls, ["a", "b", "/b", "/a"])
+
+            results = batch(proxy, [("get_user", (i,)) for i in range(3)])
+            self.assertEqual([i["name"] for i in results], ["mock", "user-1", "user-2"])
+        finally:
+            client.close()
+
+    def test_timeout(self):
+        client = DubboClient(self.provider.url, filters=[TimeoutFilter({"slow": 0.05}), LoggingFilter()])
+        proxy = client.proxy(INTERFACE, "1.0.0")
+        try:
+            with self.assertLogs("pubbo", "WARNING"):
+                with self.assertRaises(TimeoutError):
+                    proxy.slow()
+            self.assertEqual(proxy.slow(timeout=1), 1)
+        finally:
+            client.close()
+
+    def test_attachments(self):
+        filters = [AttachmentFilter({"token": "abc", "trace_id": iter(range(10)).__next__})]
+        client = DubboClient(self.provider.url, filters=filters)
+        proxy = client.proxy(INTERFACE, "1.0.0")
+
+        encoded = []
+        encode = proxy._encode
+
+        def record(message):
+            request_id, message_byte, key = encode(message)
+            encoded.append(message_byte)
+            return request_id, message_byte, key
+
+        proxy._encode = record
+        try:
+            self.assertEqual(proxy.get_user(1)["id"], 1)
+            proxy.get_user(1)
+        finally:
+            client.close()
+
+        attachments = [json.loads(bytes(i[16:]).decode("utf-8").split("\r\n")[8]) for i in encoded]
+        self.assertEqual(attachments[0]["token"], "abc")
+        self.assertEqual([i["trace_id"] for i in attachments], ["0", "1"])
+        self.assertEqual(attachments[0]["interface"], INTERFACE)
+
+    def test_hessian_attachments(self):
+        invocation = RequestMessage()
+        invocation.dubbo_version = "2.6.2"
+        invocation.service_name = INTERFACE
+        invocation.service_version = "1.0.0"
+        invocation.method_name = "getUser"
+        invocation.method_parameter_types = ["java.lang.Integer"]
+        invocation.method_arguments = [1]
+        invocation.attachments = {"interface": "other", "retries": 2}
+
+        deserializer = Hessian2Deserializer(HessianSerialization().encode_request(invocation)[16:])
+        attachments = [deserializer.deserialize() for _ in range(9)][8]
+        self.assertEqual(attachments["interface"], INTERFACE)
+        self.assertEqual(attachments["retries"], "2")
+
+        # 没有额外 attachments 的调用仍使用缓存的 suffix
+        invocation.attachments = {}
+        request = FastJSONSerialization().encode_request(invocation)
+        self.assertNotIn(b"retries", request)
+
+    def test_async(self):
+        async def main():
+            filters = [MockFilter(), AsyncUpperFilter()]
+            async with AsyncDubboClient(self.provider.url, filters=filters) as client:
+                proxy = client.proxy(INTERFACE, "1.0.0", filters=[LoggingFilter()])
+                return await proxy.get_user(0), await proxy.get_user(1)
+
+        self.assertEqual(asyncio.run(main()), ({"id": 0, "name": "mock"}, {"id": 1, "name": "USER-1"}))
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from pubbo.aio import AsyncDubboClient
+from pubbo.client import DubboClient, enable_single_flight
+from pubbo.flight import AsyncSingleFlight, SingleFlight
+from pubbo.mock import MockProvider
+
+INTERFACE = "com.pubbo.UserFacade"
+
+
+class SingleFlightTest(unittest.TestCase):
+    def test_share(self):
+        flight = SingleFlight()
+        calls, results = [], []
+
+        def function():
+            calls.append(1)
+            time.sleep(0.05)
+            return "value"
+
+        threads = [threading.Thread(target=lambda: results.append(flight.do(b"key", function))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["value"] * 8)
+        self.assertEqual(flight.calls, {})
+
+    def test_exception(self):
+        flight = SingleFlight()
+        errors = []
+
+        def function():
+            time.sleep(0.05)
+            raise ValueError("oop")
+
+        def call():
+            try:
+                flight.do(b"key", function)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(errors), 4)
+        self.assertEqual(len({id(i) for i in errors}), 1)
+
+
+class AsyncSingleFlightTest(unittest.TestCase):
+    def test_share(self):
+        calls = []
+
+        async def function():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+
+        async def main():
+            flight = AsyncSingleFlight()
+            results = await asyncio.gather(*[flight.do(b"key", function) for _ in range(8)])
+            # 结束后再调用会发起新的请求
+            await flight.do(b"key", function)
+            return results
+
+        self.assertEqual(asyncio.run(main()), ["value"] * 8)
+        self.assertEqual(len(calls), 2)
+
+
+class ProxySingleFlightTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.provider = MockProvider(latency=0.1)
+        cls.provider.register(INTERFACE, "getUser", lambda user_id: {"id": user_id})
+        cls.provider.register(INTERFACE, "getOther", lambda user_id: {"id": user_id})
+        cls.provider.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.provider.close()
+
+    def test_coalesce(self):
+        client = DubboClient(self.provider.url)
+        proxy = client.proxy(INTERFACE, "1.0.0")
+        enable_single_flight(proxy, "get_user")
+        results = []
+
+        def call(method):
+            results.append(getattr(proxy, method)(1))
+
+        try:
+            for method, requests in (("get_user", 1), ("get_other", 4)):
+                start, results[:] = self.provider.requests, []
+                threads = [threading.Thread(target=call, args=(method,)) for _ in range(4)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                self.assertEqual(self.provider.requests - start, requests, method)
+                self.assertEqual(results, [{"id": 1}] * 4)
+                # 共享的是响应 每个调用方拿到各自解析的对象
+                self.assertEqual(len({id(i) for i in results}), 4)
+        finally:
+            client.close()
+
+    def test_async(self):
+        async def main():
+            async with AsyncDubboClient(self.provider.url) as client:
+                proxy = client.proxy(INTERFACE, "1.0.0")
+                enable_single_flight(proxy)
+                return await asyncio.gather(*[proxy.get_user(1) for _ in range(4)] + [proxy.get_user(2)])
+
+        start = self.provider.requests
+        self.assertEqual(asyncio.run(main()), [{"id": 1}] * 4 + [{"id": 2}])
+        self.assertEqual(self.provider.requests - start, 2)
@@ -0,0 +1,287 @@
+import datetime
+import struct
+import unittest
+
+from pubbo import hessian
+from pubbo.common import JavaClass, RequestMessage
+from pubbo.hessian import Hessian2Deserializer, Hessian2StreamDeserializer, Hessian2Serializer
+from pubbo.serialization import HessianSerialization
+
+
+class Hessian2DeserializerTest(unittest.TestCase):
+    def test_compact_values(self):
+        self.assertEqual(Hessian2Deserializer(b"\x90").deserialize(), 0)
+        self.assertEqual(Hessian2Deserializer(b"\xc8\x30").deserialize(), 48)
+        self.assertEqual(Hessian2Deserializer(b"\xe0").deserialize(), 0)
+        self.assertEqual(Hessian2Deserializer(b"\x5c").deserialize(), 1.0)
+        self.assertEqual(Hessian2Deserializer(b"\x03abc").deserialize(), "abc")
+        self.assertIs(Hessian2Deserializer(b"T").deserialize(), True)
+        self.assertIsNone(Hessian2Deserializer(b"N").deserialize())
+
+    def test_fixed_width_values(self):
+        self.assertEqual(Hessian2Deserializer(b"I" + struct.pack(">i", -2)).deserialize(), -2)
+        self.assertEqual(Hessian2Deserializer(b"L" + struct.pack(">q", -5)).deserialize(), -5)
+        self.assertEqual(Hessian2Deserializer(b"D" + struct.pack(">d", 3.25)).deserialize(), 3.25)
+        self.assertEqual(Hessian2Deserializer(b"\x5e\x80\x00").deserialize(), -32768.0)
+        self.assertEqual(Hessian2Deserializer(b"\x5f" + struct.pack(">i", 12500)).deserialize(), 12.5)
+        self.assertEqual(Hessian2Deserializer(b"B\x00\x02ab").deserialize(), b"ab")
+
+    def test_string(self):
+        self.assertEqual(Hessian2Deserializer(b"\x05a\xe4\xb8\xadb\xc3\xa9z").deserialize(), "a中béz")
+        message = "中文".encode("utf-8") * 100
+        self.assertEqual(Hessian2Deserializer(b"\x30\xc8" + message).deserialize(), "中文" * 100)
+
+        message = b"R\x00\x03ab\xc3\xa9" + b"R\x00\x01z" + b"\x02\xe4\xb8\xadq"
+        self.assertEqual(Hessian2Deserializer(message).deserialize(), "abéz中q")
+
+        with self.assertRaises(IndexError):
+            Hessian2Deserializer(b"\x05ab").deserialize()
+
+    def test_list_and_map(self):
+        message = b"\x7a\x91\x92" + b"H\x01a\x91\x01b\x79\x92Z"
+        deserializer = Hessian2Deserializer(message)
+        self.assertEqual(deserializer.deserialize(), [1, 2])
+        self.assertEqual(deserializer.deserialize(), {"a": 1, "b": [2]})
+
+    def test_object_and_ref(self):
+        message = b"C\x0bcom.x.Point\x92\x01x\x06yValue" + b"\x60\x91\x92" + b"\x51\x90"
+        deserializer = Hessian2Deserializer(message)
+        point = deserializer.deserialize()
+        self.assertEqual(point._class, "com.x.Point")
+        self.assertEqual((point.x, point.y_value), (1, 2))
+        self.assertIs(deserializer.deserialize(), point)
+
+    def test_object_class(self):
+        message = b"C\x0bcom.x.Point\x92\x01x\x06yValue" + b"\x60\x91\x92"
+        a = Hessian2Deserializer(message).deserialize()
+        b = Hessian2Deserializer(message).deserialize()
+        # 同一个 Java 类在进程内只生成一次 字段放在 __slots__ 中
+        self.assertIs(type(a), type(b))
+        self.assertIsInstance(a, JavaClass)
+        self.assertEqual(type(a).__slots__, ("x", "y_value"))
+
+        point = type(a)(3)
+        self.assertEqual((point.x, point.y_value, point._class), (3, None, "com.x.Point"))
+
+        # 整条继承链都没有 __dict__ 实例只占 slot 的空间
+        self.assertFalse(hasattr(a, "__dict__"))
+        self.assertFalse(hasattr(point, "__dict__"))
+        lazy = Hessian2Deserializer(message, lazy=True).deserialize()
+        self.assertFalse(hasattr(lazy, "__dict__"))
+        self.assertEqual(lazy.y_value, 2)
+        self.assertEqual(repr(a), 'com.x.Point{"x": 1, "y_value": 2}')
+
+        # 直接构造的 JavaClass 仍然可以随意加字段
+        c = JavaClass("com.x.Point")
+        c.z = 3
+        self.assertIsInstance(c, JavaClass)
+        self.assertEqual(c.z, 3)
+
+    def test_unknown_code(self):
+        with self.assertRaises(Exception):
+            Hessian2Deserializer(b"\x5a").deserialize()
+
+    def test_register(self):
+        condition = lambda x: x == 0x5a
+
+        @hessian.register(condition)
+        def deserialize_end(self):
+            self.move_one_scale()
+            return "end"
+
+        try:
+            self.assertEqual(Hessian2Deserializer(b"\x5a").deserialize(), "end")
+        finally:
+            hessian.deserialize_relation.pop(condition)
+            hessian.deserialize_table[0x5a] = None
+
+
+class LazyDeserializerTest(unittest.TestCase):
+    def test_skip(self):
+        values = [None, True, -2048, 2 ** 40, 12.5, "a中" * 20000, "😀ab", b"x" * 100000,
+                  datetime.datetime(2020, 1, 2), [1, [2]], {"a": 1}]
+        for value in values:
+            serializer = Hessian2Serializer()
+            serializer.serialize(value)
+            serializer.serialize(7)
+            deserializer = Hessian2Deserializer(serializer.message, lazy=True)
+            deserializer.skip()
+            self.assertEqual(deserializer.deserialize(), 7)
+
+    def test_lazy_fields(self):
+        items = [1, 2]
+        a = JavaClass("com.x.Order")
+        a.items, a.name, a.alias, a.parent = items, "a中", items, None
+        b = JavaClass("com.x.Order")
+        b.items, b.name, b.alias, b.parent = [3], "b", a.items, a
+
+        serializer = Hessian2Serializer()
+        serializer.serialize([a, b])
+        result = Hessian2Deserializer(serializer.message, lazy=True).deserialize()
+
+        a, b = result
+        # 先访问引用方 再访问被引用的字段 仍然是同一个对象
+        self.assertEqual(b.alias, [1, 2])
+        self.assertIs(a.items, b.alias)
+        self.assertIs(b.parent, a)
+        self.assertEqual((a.name, b.name, b.items), ("a中", "b", [3]))
+        self.assertIs(a.alias, a.items)
+
+
+class ColumnTableTest(unittest.TestCase):
+    head = b"C\x0bcom.x.Point\x93\x01x\x01y\x04name"
+
+    def test_columns(self):
+        message = b"\x7a\x7a" + self.head + b"\x60\x91D" + struct.pack(">d", 0.5) + b"\x01a" + b"\x60\x92\x5c\x01b" + b"\x51\x92"
+        deserializer = Hessian2Deserializer(message, columnar=True)
+        tables = deserializer.deserialize()
+        table = tables[0]
+        self.assertIsInstance(table, hessian.ColumnTable)
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table["x"].tolist(), [1, 2])
+        self.assertEqual(table["y"].typecode, "d")
+        self.assertEqual(table["name"], ["a", "b"])
+        self.assertEqual([(i.x, i.name) for i in table], [(1, "a"), (2, "b")])
+        # 引用列表中的某一行时生成行对象
+        self.assertEqual(tables[1].x, 1)
+
+    def test_dates_and_nulls(self):
+        date = datetime.datetime(2020, 1, 2, 3, 4)
+        millis = hessian.pack_long(int(date.timestamp() * 1000))
+        message = b"\x7a" + self.head + b"\x60\x91\x4a" + millis + b"N" + b"\x60\x92\x4a" + millis + b"\x01b"
+        table = Hessian2Deserializer(message, columnar=True).deserialize()
+        self.assertEqual(table["y"].typecode, "q")
+        self.assertEqual(table["name"], [None, "b"])
+        self.assertEqual(table.row(1).y, date)
+
+    def test_mixed_dates_and_longs(self):
+        # 同一列中有 date 也有 long 时只把 date 还原成 datetime
+        date = datetime.datetime(2020, 1, 2, 3, 4)
+        millis = hessian.pack_long(int(date.timestamp() * 1000))
+        message = b"\x7b" + self.head + b"\x60\x91\x4a" + millis + b"N" + b"\x60\x92\x95\x01b" + b"\x60\x93\x01c\x01c"
+        table = Hessian2Deserializer(message, columnar=True).deserialize()
+        self.assertEqual(table["y"], [date, 5, "c"])
+        self.assertEqual([i.y for i in table], [date, 5, "c"])
+
+    def test_cycle(self):
+        # 字段引用了正在解析的行 (包括自己) 时行对象只生成一次
+        rows = b"\x60\x91\x51\x92\x01a" + b"\x60\x92\x51\x92\x01b" + b"\x60\x93\x51\x94\x51\x93"
+        message = b"\x7a\x7b" + self.head + rows + b"\x51\x92"
+        tables = Hessian2Deserializer(message, columnar=True).deserialize()
+        table = tables[0]
+        first, second, third = table.row(0), table.row(1), table.row(2)
+        self.assertIs(first.y, first)
+        self.assertIs(second.y, first)
+        self.assertIs(third.y, third)
+        self.assertIs(third.name, second)
+        self.assertEqual([first.x, first.name, third.x], [1, "a", 3])
+        self.assertIs(tables[1], first)
+
+    def test_fallback(self):
+        other = b"C\x0bcom.x.Other\x91\x01z" + b"\x61\x93"
+        message = b"\x57" + self.head + b"\x60\x91\x92\x01a" + other + b"N" + b"Z"
+        result = Hessian2Deserializer(message, columnar=True).deserialize()
+        self.assertIsInstance(result, list)
+        self.assertEqual([result[0].x, result[1].z, result[2]], [1, 3, None])
+
+
+class Hessian2StreamDeserializerTest(unittest.TestCase):
+    message = b"\x57" + b"C\x0bcom.x.Point\x92\x01x\x01y" + b"\x60\x91\x92" + b"\x60\x93\x94" + b"\x51\x91" + b"Z"
+
+    def test_list(self):
+        for size in (1, 3, len(self.message)):
+            chunks = (self.message[i:i + size] for i in range(0, len(self.message), size))
+            stream = Hessian2StreamDeserializer(chunks)
+            self.assertTrue(stream.is_list())
+            points = list(stream.deserialize_list())
+            self.assertEqual([i.x for i in points], [1, 3, 1])
+            self.assertIs(points[2], points[0])
+
+    def test_release_refs(self):
+        message = b"\x57" + b"C\x0bcom.x.Point\x92\x01x\x01y" + b"\x60\x91\x92" + b"\x60\x93\x94" + b"Z"
+        stream = Hessian2StreamDeserializer([message])
+        self.assertTrue(stream.is_list())
+        self.assertEqual([i.x for i in stream.deserialize_list(keep_refs=False)], [1, 3])
+        self.assertEqual(stream.deserializer.refs, [[], hessian.RELEASED, hessian.RELEASED])
+
+        # 引用了已释放的元素
+        stream = Hessian2StreamDeserializer([self.message])
+        stream.is_list()
+        with self.assertRaises(Exception):
+            list(stream.deserialize_list(keep_refs=False))
+
+    def test_incomplete(self):
+        stream = Hessian2StreamDeserializer([self.message[:-3]])
+        with self.assertRaises(Exception):
+            list(stream.deserialize_list())
+
+
+class Hessian2SerializerTest(unittest.TestCase):
+    def round_trip(self, value):
+        serializer = Hessian2Serializer()
+        serializer.serialize(value)
+        return Hessian2Deserializer(serializer.message).deserialize()
+
+    def test_primitive(self):
+        values = [
+            None, True, False, 0, -16, 47, -2048, 2048, 262144, 2 ** 31, -2 ** 63,
+            0.0, 1.0, -128.0, -32768.0, 12.5, 3.14159, 1e300,
+            "", "a" * 32, "中" * 1024, "x" * 40000, "😀ab",
+            b"", b"x" * 16, b"x" * 1024, b"y" * 100000,
+            datetime.datetime(2020, 1, 2, 3, 4), datetime.datetime(2020, 1, 2, 3, 4, 5, 123000)
+        ]
+        for value in values:
+            self.assertEqual(self.round_trip(value), value)
+
+    def test_compact(self):
+        serializer = Hessian2Serializer()
+        serializer.serialize([1, 1.0, "a"])
+        self.assertEqual(serializer.message, b"\x7b\x91\x5c\x01a")
+
+    def test_object(self):
+        a = JavaClass("com.x.User")
+        a.user_name, a.age = "a", 1
+        b = JavaClass("com.x.User")
+        b.user_name, b.age = "b", 2
+
+        serializer = Hessian2Serializer()
+        serializer.serialize([a, b, a])
+        # class-def 只写一次 重复对象写成引用
+        self.assertEqual(serializer.message.count(b"userName"), 1)
+
+        users = Hessian2Deserializer(serializer.message).deserialize()
+        self.assertEqual([i.user_name for i in users], ["a", "b", "a"])
+        self.assertIs(users[0], users[2])
+
+    def test_encode_request(self):
+        message = RequestMessage()
+        message.dubbo_version = "2.6.2"
+        message.service_name = "com.x.UserFacade"
+        message.service_version = "1.0.0"
+        message.method_name = "getUser"
+        message.method_parameter_types = ["java.lang.Integer"]
+        message.method_arguments = [1]
+
+        request = HessianSerialization().encode_request(message)
+        self.assertEqual(request[2], 0b11000010)
+        self.assertEqual(int.from_bytes(request[12:16], byteorder="big"), len(request) - 16)
+
+        deserializer = Hessian2Deserializer(request[16:])
+        values = [deserializer.deserialize() for _ in range(9)]
+        self.assertEqual(values[3], "$invoke")
+        self.assertEqual(values[5:8], ["getUser", ["java.lang.Integer"], [1]])
+        self.assertEqual(values[8]["generic"], "true")
+
+        # body 中不变的部分来自缓存 两次请求只有 request_id 不同
+        again = HessianSerialization().encode_request(message)
+        self.assertEqual(again[:4] + again[12:], request[:4] + request[12:])
+        self.assertNotEqual(again[4:12], request[4:12])
+
+    def test_heartbeat(self):
+        request = HessianSerialization().encode_heartbeat()
+        self.assertEqual(request[2], 0b11100010)
+        self.assertEqual(request[12:], b"\x00\x00\x00\x01N")
+
+        response = HessianSerialization().encode_heartbeat(request[4:12])
+        self.assertEqual(response[2:4], b"\x22\x14")
+        self.assertEqual(response[4:12], request[4:12])
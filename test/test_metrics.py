@@ -0,0 +1,130 @@
+import asyncio
+import unittest
+
+from pubbo import mock
+from pubbo.aio import AsyncDubboClient
+from pubbo.client import DubboClient, enable_cache
+from pubbo.common import JavaClass
+from pubbo.metrics import NOOP, MemoryMetrics
+from pubbo.mock import MockProvider
+
+INTERFACE = "com.pubbo.UserFacade"
+
+
+def get_user(user_id):
+    user = JavaClass("com.pubbo.User")
+    user.user_id, user.friend = user_id, None
+    user.friend = user
+    return user
+
+
+def fail():
+    raise ValueError("bad user")
+
+
+class MemoryMetricsTest(unittest.TestCase):
+    def test_histogram(self):
+        metrics = MemoryMetrics(buckets={"latency": (1, 2, 4)})
+        for value in (0.5, 1, 1.5, 3, 10):
+            metrics.observe("latency", value, {"method": "getUser"})
+        metrics.increment("errors_total", labels={"status": "CLIENT_TIMEOUT"})
+        metrics.increment("errors_total", 2, {"status": "CLIENT_TIMEOUT"})
+
+        histogram = metrics.histogram("latency", method="getUser")
+        self.assertEqual(histogram.counts, [2, 1, 1, 1])
+        self.assertEqual((histogram.count, histogram.sum), (5, 16))
+        self.assertEqual((histogram.percentile(50), histogram.percentile(80), histogram.percentile(100)), (2, 4, None))
+        self.assertEqual(metrics.counter("errors_total", status="CLIENT_TIMEOUT"), 3)
+
+        text = metrics.exposition()
+        self.assertIn("# TYPE latency histogram", text)
+        self.assertIn('latency_bucket{method="getUser",le="2"} 3', text)
+        self.assertIn('latency_bucket{method="getUser",le="+Inf"} 5', text)
+        self.assertIn('latency_count{method="getUser"} 5', text)
+        self.assertIn('errors_total{status="CLIENT_TIMEOUT"} 3', text)
+
+        metrics.observe("size_bytes", 300, {"name": 'a"b\n'})
+        self.assertIn('size_bytes_bucket{name="a\\"b\\n",le="1024"} 1', metrics.exposition())
+
+
+class ClientMetricsTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.provider = MockProvider()
+        cls.provider.register(INTERFACE, "getUser", get_user)
+        cls.provider.register(INTERFACE, "fail", fail)
+        cls.provider.register(INTERFACE, "listItems", mock.items(10))
+        cls.provider.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.provider.close()
+
+    def test_default(self):
+        client = DubboClient(self.provider.url)
+        try:
+            self.assertIs(client.metrics, NOOP)
+            self.assertEqual(client.proxy(INTERFACE, "1.0.0").get_user(1).user_id, 1)
+            self.assertFalse(client.pool.connections[0].timing)
+        finally:
+            client.close()
+
+    def test_stages(self):
+        metrics = MemoryMetrics()
+        client = DubboClient(self.provider.url, metrics=metrics)
+        proxy = client.proxy(INTERFACE, "1.0.0")
+        try:
+            for i in range(3):
+                proxy.get_user(i)
+            proxy.list_items()
+            with self.assertRaises(Exception):
+                proxy.fail()
+            with self.assertRaises(Exception):
+                proxy.unknown()
+        finally:
+            client.close()
+
+        labels = {"interface": INTERFACE, "method": "getUser"}
+        for stage in ("encode", "checkout", "send", "wait", "receive", "decode"):
+            self.assertEqual(metrics.histogram("pubbo_stage_seconds", stage=stage, **labels).count, 3, stage)
+        self.assertEqual(metrics.histogram("pubbo_call_seconds", **labels).count, 3)
+        self.assertGreater(metrics.histogram("pubbo_response_bytes", **labels).sum, 3 * 16)
+        # 每个 user 引用自己一次
+        self.assertEqual(metrics.counter("pubbo_decoded_objects_total", **labels), 3)
+        self.assertEqual(metrics.counter("pubbo_decoded_refs_total", **labels), 3)
+        self.assertEqual(metrics.counter("pubbo_decoded_objects_total", interface=INTERFACE, method="listItems"), 10)
+
+        self.assertEqual(metrics.counter("pubbo_errors_total", interface=INTERFACE, method="fail",
+                                         status="SERVICE_ERROR"), 1)
+        self.assertEqual(metrics.counter("pubbo_errors_total", interface=INTERFACE, method="unknown",
+                                         status="SERVICE_NOT_FOUND"), 1)
+
+    def test_async(self):
+        metrics = MemoryMetrics()
+
+        async def main():
+            async with AsyncDubboClient(self.provider.url, metrics=metrics) as client:
+                proxy = client.proxy(INTERFACE, "1.0.0")
+                await asyncio.gather(*[proxy.get_user(i) for i in range(4)])
+
+        asyncio.run(main())
+        labels = {"interface": INTERFACE, "method": "getUser"}
+        self.assertEqual(metrics.histogram("pubbo_stage_seconds", stage="decode", **labels).count, 4)
+        self.assertEqual(metrics.histogram("pubbo_call_seconds", **labels).count, 4)
+
+    def test_cache(self):
+        metrics = MemoryMetrics()
+        client = DubboClient(self.provider.url, metrics=metrics)
+        proxy = client.proxy(INTERFACE, "1.0.0")
+        try:
+            enable_cache(proxy, "get_user", raw=True)
+            for _ in range(3):
+                self.assertEqual(proxy.get_user(1).user_id, 1)
+        finally:
+            client.close()
+
+        labels = {"interface": INTERFACE, "method": "getUser"}
+        self.assertEqual(metrics.histogram("pubbo_call_seconds", **labels).count, 3)
+        self.assertEqual(metrics.histogram("pubbo_stage_seconds", stage="encode", **labels).count, 3)
+        self.assertEqual(metrics.histogram("pubbo_stage_seconds", stage="cache", **labels).count, 2)
+        self.assertEqual(metrics.histogram("pubbo_stage_seconds", stage="wait", **labels).count, 1)
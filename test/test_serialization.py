@@ -1,26 +1,51 @@
 import unittest
 
-from pubbo.serialization import Serialization
+from pubbo.common import RequestMessage
+from pubbo.serialization import HessianSerialization, FastJSONSerialization
+from pubbo.server import DubboServer
+
+
+def decode_response(message):
+    serialization = HessianSerialization()
+    serialization.deserialize_head(message[:16])
+    return serialization.deserialize_payload(message[16:])
 
 
 class SerializationTest(unittest.TestCase):
     def test_string(self):
         unicode_message = "tdKgAnlpdtCsVrTFRodCohmfGrhzevl"
         message = b'\xda\xbb\x02\x14\x00\x00\x00\x00\t\xe9>\x82\x00\x00\x00!\x91\x1ftdKgAnlpdtCsVrTFRodCohmfGrhzevl'
-        message = Serialization().decode_response(message)
+        message = decode_response(message)
         self.assertEqual(message.message, unicode_message)
 
         unicode_message = "YtWsbcIaRvuOvdcxnRoASKwYERfeWYtUCGfYRHvgQvLRCTzetrrcTWeMnEYRbSbLuoEvcBuSDbsedoJtjMNDNPzUZGWiqqkGAmgAxngRKQBfUrLddHmZGvwqxaNgcVnGlhoBysIAoyQENboyKPcODIaxKDMVMgEqygrJOguhLQmXDmnbLKvPdYcJhSmCokDpqlpnKFLqKmjVUIzbQeJNFzHphcRXcUKHUsKHDiNXAsULFJRnTZOmslYsbXpqSAvszKyVzXSLcAqwESMYSEaGcVyzQDNRBskwXEJmMzUuUaMPsEhbjDvUxFRCllrbNpaGReAsIBTtYrjlBdXggCgSxFmPyRtGptCuYXMnNsQueTfwzvGoDoSlraqkbPFHuPfuVMZrKiWLPZdPrOeIubYafsPdInxnaRgCsofrNBZxHhrikRQKdDaCdAsYBcTKEwmVDuvjavMyYlJucvaJCDEVyEIRzKJiumPJtmVFsvehLhXcdbvnGEEhwkEMHvrExrHlWJzNUBwniQmjCauQAlFhXwuqIpFHgclFdZaKIrdcXhlAIJzlTgmoqfJMpCPcNESifDCFNePFIMLwDzsMKXoKmeatHLAfMNkdUMyGZBYLCSKEgLIAevngvRkjDJNxwNMZUnpiLKNWdjWNDBOHCstvUAyTvhPmcvyhbfHGGfhehjlrhfPeuxHLmvUIaFAOculsXOvbaeHMbyfMUauVTkveLBrzBmELkjmUdxuRdhdXkUjXTpAnUraXcOozVgQMeJDNbKaSlvGZBoLQARQluUEGowvaSICjMeTqGNmaHBhXNpEhDvddaJRCCRygWcxXAZuOrYafVNAcKDJuNClbBbakEpYhxblhnfFZioradOtBISPNLXHFBMaxwPwoznxLEtpdthGeIPWmzinSDPdzoqEPukxOsDhjAYfOuWWnAWItOzYsVJjCbdkkMAxZOllVEeOsSaetesRTMQUSTFUCUtUxqivNueNgixCGUtXpIdXsdosTfEmFSgtCMyMKXGNSfIxb"
         message = b'\xda\xbb\x02\x14\x00\x00\x00\x00\xa96_#\x00\x00\x04\x04\x91S\x04\x00YtWsbcIaRvuOvdcxnRoASKwYERfeWYtUCGfYRHvgQvLRCTzetrrcTWeMnEYRbSbLuoEvcBuSDbsedoJtjMNDNPzUZGWiqqkGAmgAxngRKQBfUrLddHmZGvwqxaNgcVnGlhoBysIAoyQENboyKPcODIaxKDMVMgEqygrJOguhLQmXDmnbLKvPdYcJhSmCokDpqlpnKFLqKmjVUIzbQeJNFzHphcRXcUKHUsKHDiNXAsULFJRnTZOmslYsbXpqSAvszKyVzXSLcAqwESMYSEaGcVyzQDNRBskwXEJmMzUuUaMPsEhbjDvUxFRCllrbNpaGReAsIBTtYrjlBdXggCgSxFmPyRtGptCuYXMnNsQueTfwzvGoDoSlraqkbPFHuPfuVMZrKiWLPZdPrOeIubYafsPdInxnaRgCsofrNBZxHhrikRQKdDaCdAsYBcTKEwmVDuvjavMyYlJucvaJCDEVyEIRzKJiumPJtmVFsvehLhXcdbvnGEEhwkEMHvrExrHlWJzNUBwniQmjCauQAlFhXwuqIpFHgclFdZaKIrdcXhlAIJzlTgmoqfJMpCPcNESifDCFNePFIMLwDzsMKXoKmeatHLAfMNkdUMyGZBYLCSKEgLIAevngvRkjDJNxwNMZUnpiLKNWdjWNDBOHCstvUAyTvhPmcvyhbfHGGfhehjlrhfPeuxHLmvUIaFAOculsXOvbaeHMbyfMUauVTkveLBrzBmELkjmUdxuRdhdXkUjXTpAnUraXcOozVgQMeJDNbKaSlvGZBoLQARQluUEGowvaSICjMeTqGNmaHBhXNpEhDvddaJRCCRygWcxXAZuOrYafVNAcKDJuNClbBbakEpYhxblhnfFZioradOtBISPNLXHFBMaxwPwoznxLEtpdthGeIPWmzinSDPdzoqEPukxOsDhjAYfOuWWnAWItOzYsVJjCbdkkMAxZOllVEeOsSaetesRTMQUSTFUCUtUxqivNueNgixCGUtXpIdXsdosTfEmFSgtCMyMKXGNSfIxb'
-        message = Serialization().decode_response(message)
+        message = decode_response(message)
         self.assertEqual(message.message, unicode_message)
 
         unicode_message = "BXvyZkUHHWCmKqOzaQUKscRNwFihQTLvXYsqWMFDtUlkIrMTbcEkMUNUAtqNgiwSRSictSiVmEFLUYykXfWUvfnwfcnfGpATZxBqMyZQzuJUCArEdGggwtmjKRFuyzkGIHslPzyxUurHuFNjOLswLgEIGZRzJQAnCGGGAufCarnskkSJkVTvlcldAPfsasDhTwpmHwVbAmDAgUGYjzjrHJRTxcXiYbtiPsSwONNPsjeCaKVZCPcYlhDIdQDfLvgdlndPgCjLxIggUuzijjZsXbfBTkYJANFlPRhnAiRNWOIHlMtTslAhXqLmPOfbjzpJHpOdJKoLdCIXswyGRJZoRYnGXLAuZlHgoloOHWfdXMtGqerpOaDKkOkvFLCQabnFGRrviMaqaCdomrYIVqGAaqrFpGEOCXGeGyySxMTEThQLWDOrpblHglrlOcUFCTiCaQmCsLiVzHRwWKmPbFvLxLDXNtKlXrKyfRCbMMLxzOULTZiAzEJByUrmiILvxAIGoUcPYSBBejKVGzlYycTixKyJqodawxReipVaBzfnKWWyXdtDDqYXYHUAOInZSalTSwfQajJeYeoQdoOXcFoZMSLgCkbptLZBwSwFCiOWagZququmjqOYcERuPSaYmOpMRtWzipMmRmeGtsYnndlnwgFkvoylCKsdQrBWokrEfSldKmHSOpzXIWYfcNJxRYwzoFZsQOgXDOOVPfyikrDayHCrexjAvouLLjfutxtwYShuHSmwnZNtEXDkGhpAkkmIVxrTHVtpPMinIOfjoVcnlBoKoJbnyOxZzsxURxfkrByHImKTUwbqBNjOteTIHHFFWuRptftMyuRZpJVKBCzboGDIyBACWrzgFPEpvpCkodReknujYDpCppalEYkMFlIOFpKPbcIevfXsYSwwvuBQrOGVGJUDiUTdyeZwXvwjYZdniHYLmxXIaLmrEpZRkZhbYibHaKgQmcHvVPFzeGLplJBVBACJccuNzjKXwdVdevvYTbkIJjCosCOlnweBAosRGbUQrgjagmZHCXXsyYwZncskCaMWDQbBMAFkFmfvQvaWlvThXgDBBWvTLFxsMEdtwnzDIwJqgslHeIAWIcmDpqfAlKaTWZNzWjEeHFJkTyYUByvdmjCdwsMfsWDRCffSIkONkTOtXVwjrLHIPmFceWTqHEWNDIOljsyfFEkzegVGKCqUFotyaDJMLCfmlIAwaSyLFcNdGONnEbGbFXmJgySLhpuFChXyfRwxSnCThMjrfNcheUwpfSdOvrFKOYYBCNWbukMOJXlihXuSrfjSEeZUHpTRtoqCvJroLQibPasWeQXGbjrUziwHftbiNmdsXvjEdaZVXSPYlaGRIzfAxOmaPviBQCwkxbfRQjErfOwihPdSjBdyUPHAobbzGnzBAJPVYQpUxtLkTKBMMHOlmQThMDmHYyeqGjTUjLnYMHBfcVtQutvBwFbxVhjtBlXOVMsHaMLxaJINqLuywNJvimfvRNEIzcqdVhomqtyYYDXvWwffGxIhPnYfMnqzADnJrHPTNBBtvAtriDsFanUAZenUUOKqhRaLBktbCsIsJuguPHpbbxcJNSvCsRaFrKfrXzPFMlxnAziEyCiRfSsyCfgeeUOdqNplaVvrrcBusElAfnPXMEQkPCmvHvcAkGLFVwctGKVFNLxXMgwiEDsDDHlnKCGukRniZqwRqajzFntEAoFOOOKytcTdExohyEzXpvKoJluKDQybZmvbFwqkedruPcnsvYcjCpozPcwreVYtJfmpCwJTPtmhxEdBzcLodpjxLTqViwaTfrvnkjqILnvfotqCfGwWtQSwUIESGRClnUIrZwGsqLOpiWHnKLVyzCznpnUkhRqMeZFkKwOAZIzqkuaHJpOPMQszzEjFGAIHZPpyTAhZuWgOZyMGxKARDgpCqHKDCejXEwUBiKzpNGOXamjcqXXvlUUbyEWzIOnbkHlSdkpdspjObrtmByvpTNJUTfMGfcKuCiwjmZkCwUuiNGWLiRyhmSJIpuKOLzWgIKVGssPkPPwmzjhOYlbhgHROuLSNLTJZSjKbBQndbAQNTgiBDmIHTeYDeQQAeaPnXEGiRKeLEsFbsHaTfiWmodUbDqPgMhCTDnNuWOfgduiGZaoMDlIARhHYsAPfAzsuNSHWzxwfHhlJvjzpdLIIlecvxEstwjEGFqRmFsoBkPEIvYbvFTntfJcwpNiChOzHgTmkAwwsmtHyKbZGLXYheZmaTLeoPsfsdicUfnkYYWAfIXkwNXtsxEfUSdpzxKwUPqvvutaZODCIpyNUQtjNosedBFyCnZvvhJXZTAgIPPftEDcKGhVSdxolGXcTvCfVurpEYhvipFYxZwNOvrHyOmSpLMwSkurcVHEYYXdQjQBZtIrMhCSwYsyivcHSnemamOXIwDJFtcKQAQXNjUhZsXDkBNgIzOdqTRbNeixLBarxIVzgjTHrYxTXZDIqhYYgDtxwEdLhQxRXqvFKqDdJmfVJiZDtIfbOlRrHvEbyenONbtrHbYJZnwDgFZmNEgvCkLmzoFbwlfaOfiAtlYZBKcdXGpWSIYVUZnUrAMiectiduSobchGMPYxXrTYDuyCGsIUvYxVpBSVbPRYrDHgsaMOuyFDcFlYBkVduYMJRvAKVZMvvcmSWErVBSLveixgfsWUGCCWlamHeDAJsZrrpQOftaBeuAcylACqAYZFXKIvgGFFGgvLCdyvojCUfVMzGyMGaKJTalukadeKWdNtlpWDIoEyUWbFgBSYkKifyuYImwjRcorpGBqwpXysHwEBsatTDcunKOJiqbZtNeHLoOcFPINPeQuqxABfOYYbUTHUTXbATuWWSKqiBGrJcvsByFXVWcuYIUKgFPKuHSYGiOFrUxZKlgwhIfAUaClSWITELHBrnSAQIMbmhIVClkyWXBqFzFoRUHBLQWAqHLeSRMQzTOsbykuCdvwVTvdCTJxUHvwbsGGrhOAUqYcklHjhBufyomXiczURbBRleAKEPRDtPkBYXJVAtWOIJYjACnpppKEgMgxGhIAhRnYPgmBwGqPCFMjSqsOEYTPwLUgydePSXlHpzKgcKmLDGGGzReLROkJkyYNWYqAJHEwtvmuxYmCqllPfurRBjvIhmAGYPtVKfrDUWbLelWPTITIbnWSVMhNbaIYhuMvczkisoGRGmDNVjnOHjLJBEnlxsnBJOHNWuPFBqbuRALTUusUQAWfzFBBcMerGRXvHhJTVosKbnENhyczrvsJVfVwQbveKKaangnzVpFSLoIJdNuJkvpVFpmELNobuGcphGiDfjLifXxAGZNAuuTvhunkudGTIPCTmMwsmGbldOSKvtUQTqnoWkLHQKuPJnAKrVWOufgoqkPZsKTNWNfaujhbVKmhRYlcTddoZuHHhbEQHfpEdUinXDEkHOmOpQilnokyQHqGpgcpdoEoCMtLToqgbnnrckjlhEQIcLDrZQSCwAcBdnbddtpSbtiPwrgJErpPchTrqjPQNUwjBwYPLyluDFgqRUVeDpFkYuWEFZJjScSwzbOMjFMXgieTOFERCPMsnkBuxAAzLXFmwohsPMOyRGKhWwvUxDFJeWTNmkmJwchbtjahIuulGEEPqCWFoZabXbmeTVQZLySMOieUJqKTeHrrkAmNfvztmdYbgIdBMEoZBaYgYdHZuhRBwONEHeFRDmMPkzRVAGzngZNCKgfdAVKpIzfkKsMLzEFtXBNGxdjtHHmcQvjjKBbZGbFjWZzFTooTFIbleNJqTNCavPCcSmFrUZMDpHVNPOSnzeIupOtKMmhdnEIIpUxdSyLobDpQEbnFFROYfVNYKmRKjFoWyadSVCHKVtpTqsojFesTOmjhUaWkzHeHrLVprvLRQhiplRkqimFlwGNPycCQdWpqYXvWGsGpkEjcCvOXPgbYeUJOUuUTXshEsfnmfuQDRulNHghxzYIlWBlYxlnYTDewLakTHZjgFAuuMviSmYjUdGLQkMrCyrSMBaLFWvZvgmYagRSLJhGJFbGHCSliDpfbciULyqLUWROvHRKiTGLjxlRdofUuVYBkAZHNOvUUcqIgHZGPwnIrVEVYKZbiFBJxBPwDiEUzSbgrZIvhflklWnlwdGIqybDZeWPGVcbgxcfQbRnqmHYeLnhOuFnNcFAfgTQtGfeYYcEWUFdICRWkOLzeNtfBCWMkSMrqTlctdRiJCyGmqzZeCRgbEmOCnnNEmlLacMVjuTNrpnqxcrCWVAhxJjWalFcKXOmUiwcVIQtYqznugetGuTCTRyGivoXLOfrcebAJVzpFIJPjuWirXSEbLLElAQZvtUNGWnGCRsEZYAamKxOpPHnbqRfJebAXdrFYjtWNJTJWkvMiExQEsojpshpPjRbtmUSnaEyPnGkAYPvXLMkBGvhiqDkOtUTOTbEZdUFMlhDKuFYhqvtqKSVNqzsiDfTQjmnbJTZvtHNrnjIJUCQLtFOqNSvrgGPbIyWKGstHuFtOPMXBbdWeUtPYAzNVRBFTVYdinKAWjtjBaInQBTDTOFPjJlONvfcOeoAzzzjEIYQhsYhQDdrkRNBhYfblAasdintfDDhGIJuJYyHFSeDbBsazWirUOXzDhMtBaYunNFAtAbZniWMMWHFKqOtzpzrjLqqyukjEGUWLdGVjbnyBUbsGsZpFVjsQwZmlFjKHFKRyRnLHwrTClLcfDsQfZviAsOmOoInTssOSpxvUBbaQdyBocecDiolaKiuttJJoITphEDESSUnqjQEnuaxuEueVeFrcDWEFMrSRRBHhzhYOltOuzoSZcztWDaLxsBaDxtrmnwoawdisnCOtTpIwRQADOFsrEkWCnHLnHNkcBXzJkulaftbSMUlMmmzNVXMydnVXfhlSyyEgxAgaDMVxySisGBEWyZbJNyywcrepxCfokqWIFYJNDZxDGwTwvGHjdvFHxvhqoDsEtsVNRthzAyEeMMtVKFmJVlIgmPvhKHMwRJcdgOPZSQDnAtWCxPeIExrxYxGWCOrFJsKhCXpMDdHPQpSZbjnjybnxUipSJqLBdsiyTRSsddVeCRlkoFQfarKGejLwGYxCBjOrnAmCXVLruqvpCqeohOLSNnwFyyzPDxpsYWsMhiyahJJYVWghTdMecIvgGquVNXkzDKPCuXaoYGBpyjwiWfnCHqRoOBFbrSVaHwKtfLLtomrTsgqLNmSpfCMpUBFVAkvOmmydOrGbLCiNbnAMviBygCwJUKyfDADTCZnpiuFIbGhPiBKcBkocqIHFKQLjRXDoPbZhCBsnDcDktPEMfolHDhUMDOSLXfudiZMSnkVpxcoTaipDieCjHnvezWKzxBtZmfARZoFzLdZnFNhptclKEpGGezTBtVsaEbNNvtmwGcIbOlqcmuRVcdbVgoSxKPpuIKDQxtDpmmaOQiqCdUgAZSPRcNbRkENnXGEeLTnmADTHbynvudMUQNLIYLanWWsrxkoiDMFFIomkjWBancSilESxjygFakTwhluNlvYvxNUzdZyaMPAtsHTtqnRvZtbVRlcyWaFNhMyoyymaRPhixKRHmiYDdlNqDaVISvgzqiMFUTdyHWSQvIhkwNStZrYoYBZGDEwUjaDLxdgpQftpOwQjIJclNoalvymsraCncpFEovuGZzOPomoOLALjRpFuGPndQszJWBVPAMQIMwLnhkJRcAHsHETeLtyeuFBnqfqgThnDgMFgEHvsTHwxdVHXveyPoimwlpdbCBfIeSPhiZEZRqNURIICQElBbrFYhthuXOSCMlhyZrqjvstCUCCwwjhPnUcjJXMfAzaPXorMnEfgywNuesFREDqCxQLExGMwKxdsQmXGcxBdclFzMljoxrjaNQzrXhuqfyVQXSvcLKQhwLzoMxvGpdiPNQDIuQoVfuEODfOOluPYjqxaQBWifFFgOkLDLjnGRCiXmKcGhYOdGRoTjSkyQywftvZMPssanaZsbgmrOccSjBexNYsxKSEYkUkPxmVxOrvPGhsZIbaTxqPIGWdqNRtSkPUaAbvkekqbGZFRilUtzXQpHqqMxpEfvNnZtwPiTIWGCkcgXrRJeZHOfKwKKJylvMRfGPuCTxgRJPtxweavgWbkttTyplDorvsFlIhDPwAVhbzgQUAFZJVOkTetDUjTVAqrEihICvIvDcEdhXPmGCshawmpLYzAbTkgLBSWzHKYQNObtupVMAkVqdruAuFAJPfRsliFjSaVUKlBBYgVjiaNsybdkhAIBqtirvGMRvcFmwEMGGEETxoybamHpNVKTZmhnuQLpHxzTZxefoVyUMxbfggZBONTWQXiRfMcBxVIHDZgVbHnMcKIJpiTUtWcQKukDMvDrfTVfqFjRxOqpoaPrWzViBQgpPvLSoPxwdArxdnxvTaAyAPxWcjahEVONKDDYayAnHSlaIRNJXVYaMuKtiQfntiQPNoAsnnHqQhftVoLfSUoUjZdKlAHVQYPaPGksYZyhPfgGgDjKLTLWOVzgpUddHQEUHKyZQuQzaOPtaRQjqcldoPOgDROBLqWpAfdiCSimBCaWCWKkhPjUZfFbGUlnRlQaVcNlrMVLdtrpdveBXQBFHEPKkBBgxZAoudwgoUHRIxxZRIueNSzrPnUSrDTFMDpJZBmFtDnxtRlxeYJlayljXvtwTLWihahSIAYWvOhtBZNllMTjwWRFwCKxDbwAgUypkubPogViDkJoFsFFjKHRboXdxbaFFGxVouBVrvsfNEcNQpticiUTLIWNouoekgcAUKRNYBpBGfRsELzNcVgqvSbfOhKsNrUCFTMvnVsXpkrgErtpDKxzOEJdkmclqhFpsOhXcCpmcxheZAfQXIBKMOTXGAAyrPnKFNIWAEfFSpQdgvmiZvLSvcTSzKQXVFAvOBCSDwOIRYCnpWCrfKWWOsyLeGyrSRZtYXKCuyXRMVpHRgWFPcQRTYDkWOviGzYAPmTVgWpsChcVYerkLdcEKKoqgmkgngOofElaAmGoempzDgJVPIyPvYJIMGErRCfIYnyxWoYZZyvCjUJCJBdugDZuCJMjukZARforMpCTPEdTDIYISAWFqKRarGacahfevGJnZZttSVGfunVzcRAQefcARKrCNdKDysEUddymaKyjtkwoAWJFmAGCPnpreUcyxdmZEsyoRebfJjaSLemWqJzVmpOPyHavOVdFIfUqwSndpTUfJAfxauLhAlcCavoNrQGkdMgMwkjoddgqqXKgCcpFHjDEIkxbZYkLyKaXwWhqwtREQqlIlFKQYzdOVnOpsHjmkIxrpVlagYTeKZySjCJOAmiqHswbvscjladJUMboldvbpTAlnzcpfKqkYLNInEnfXYeHyOXHygqnFiVlMsRftGOpUVhKCpCvsuPTXoXyeVVTbPHvbMFSnCTtzltlafNZocfWyBntTDieZaBahapLzoXGBbObhoFzhTeEQCirvtRiFBqjihKKYaUQVIQxsVAsWyGxjlOROdIYxGcZoqjLzErKOlSnKeLNenJYlNnCwNKgvDyVashOpqpoRxqdcAcvsdtRkVLYXDquYrtvbNvdYfMbRnVBGhzwUYZUJnKFxnvOpWdeMLCCMpJPvYsiKVfvfhfMXIudVpykPgZvfQvMVMWQLzEbqxuGjgtORuroiHNtrhskNlxEkBRTFVjvQPxWrlbHtCQLZkyNfWfhzBgFjznPilQduyzlqtojmhkpcqFnpPNyvwVTTNrxxgUclbWvKdKZKkgrmpimVMlbNtkJAXUwdaFwmdErdaQdOnYMFZEzyYdWRXfUZtTEeKtbRyGyUleELEJOxPFHvucwzeUYftYOdWbPiKFbRHrLERnKbREeyqOJAmrQIrmeNXmCzSYoXfuqZbMLBamNwDFlyCEHgymnRdwNqWcaSLKHvoLcNaeWywdYlXMaBxcZdfISXrRIvdydVhqKvuCiFDqPmAnjTaSRBqcQfEWlWvqGIpVKIJOaUpfRUaTwowDtXvcJNLrZmXagubYNAeQUlxtaimnnZeJWzzmyswWcgWFPEqsaSCSwdhJBYuMzcaMeNGiTOICAlIEjeWzTpxvvTNhmjaGDFfJwvQZtQfEzONMBXdRYbIeJgoMpnNAFUWgAvwDWCegKhcgYpfGCsDhZmOajtlMsOsbEwqlRVHrPYDDcMQflRzxXFUrJeFunNwrBqWCvoIHGtugcEgMXntMPYZYcNmuzWSPmRcXobnwcqOWLtLaddfvpEWrQOmEpheCOiFqksSktwvcMkaPqrSlHOWjHkghfLhSdfhtXfoOVWlWvoOfvOdZSdOzfJYFIeQLxZTQaTjVsgGRChnderMrtVPwClHegnUpmaEFRKMJemgAvEUMgucWOLelkGrSqZRsnngSatWweayVlgwGaGUBHQknUMAAWIQCpfisZkypebOjgdgxgzgJBARaaTjnFDGhwPVYPkviXQZPSMtRgRUYjOuqQsVTtjSGPdDWspVrtyEXNXPuytHUVsPkYlJTKaphfHVyDgyaJJFXgfXEFoxKkqKiDLeQgmhwzUuypzHDihrUjAiFxFQbRTdIuWqyknQQtDfBwcFsGQbLypuoUPKPWtVFKAThqaRZlznYYesXlsXCZKxeYDIteuzKGcUOUAMrkxvPtdIZgBYNUtIoeuHDHSoeVKssgTfpZkytddiYbeBBYFsafipESItDBegldUreVSNbzLlumIWKUkMcTXCxYInLsbMLIypFFmIBHhlRxgGbkDEWPSRsvcBOJINrSwqXteymwvtPvTPkxVUhWKmjCEiOEyYKGiagktwiMrgeDuLwcWHhpZMgGWPWDaoNTkUzBXBlnOuFOaWXCksoylXEMWnpSvoDNbFutMsgoPRnaqZctPhUXdsOdgbmwWigFnhkxNXRXTIlUWFXTGuZpecukHioVwwadjINbGeCIWmWPFMQLfPiMgICJBzdYmjAyzAvlheouvdajWyAufwzYLIvmHPTkNfriMXleGRNHgCcjyLXeJTsQStGOASMmlZWSlEsjxgLulDBNXuzgCYXTRhUANBfsMAwTCMihxkwCNpwyyrMybqLtSbJCEXoiwiWLamfgdZRgJFLBySGHtYiKMQHuupSbRqDPvfZRDACptpIPVCgFGYynFMFYebmjZBWDivgiXentKELLDJTHeAuJIKwqmeidOcJunvQbLKVbsghJGVSOrDqifSiuLSCetWtOijHjPNukhVoectEfJiwgVyCrRBAdtZJkhNojAneOQdmDNEEfqNppaRjIiJdYgREfjOaHDfNZviornBKJDGeOMQRkPTbFWufJjXrnbWzSXvZfDKMjSsuwkhKnteaeCgKsLLSiFnXcOxzomiUKVVgAHTysMtdVVjffXXbIDYSRUlqRnTspXREILPTIKCnngyEnlonPkHiONyTvUPwloAWwQjUqzlTVYbAEOwpFYRWTKeSpChBPTjcCBgERBQrNDFcxkHuVLjsbFuGjhqWdOFYPIMQUbUGqIkdNDstDxvBPXcyLTNAMItOhFoeiQttYuguByzIEbRFwbixOWyWLlOUCPizbosZAgavNbywcVMDkHFuchZKqPzZEPwoNIUlZqRlkxCtkSECuiIrXiibLCancUEcvNppkpsmtaWRhLURylWIMACUSZalMIVbxvDXMJZeNFbRncILkbtHtOloJWmvhgziHzDQzOGCaEKkXbCEylGCSAhbdezusOPZUgRaSjyFshksMkxrEZyrHoQZrbzWuoCfDdYKUElvoLteTLvAjPAsbjduPVFPdxdWbQfbBVtXTBmWFKObStjurXpwBjNkIFDtySZPGnyPcYJxqohokJlZlNBbezvkzYJWmoivZmpPvMQwgWZsKYOwCoCmqiZGpMqETpEwEFBBBrtZaaEsKwURQuynPIUPWhaDsWLKNobYWRtYrcqlLYSIrWwzaAEoUsGdVYXfTthwFfzxXxQfsBpvyudIWnjmYfLWdDijARexflllloOOKKOrYprfJiOJoCyzKkRsYwoifmIdQqRFyJLNVbgzthlyzHFmeEOfLEfcLGQySnLBbZoGrbMEZLYKzwxuOpMAsYMlTVGwxfvYvfdBCOHqPqTwojSFxmfObItbnpRllTlykLYhypfZUqgOiGiJvKNhpkjaQBAgrEoZUEWeSIcPYLkJjZOFljpjTSgEWITkEuCUcffNKvBxeqTgzNnpHuXuNUqVowGNYoCISWUURoCQLtIuoQYAxRNhKlvYVxzsvVAmViOXKRBJOqzcqVWEhUKFbdrQuyZPCLEBNPEBaLHbmrtYWNSGljKqxriKqcwPoOIQxRwPSGGRALlDnSisOZrTmXUwXkkUOkHveKjNRtvNhbvagHonFYiBdWFuTxTWwjlcDwjzOfDraxwUJBMuQdJlUWElokASzGwttxLRjCfAQwvBWSpZgrDwYKHBnfonbDMAxtMODhOVGGJfApFhgFgWhIuGdiZyoTBDnWBSqdmXWiqEZsmnoZrQjORUcStXXsiZPekYxzWykMrWKfcwbSiMMmvmkDTMEUHaAqrkMeGfBBebeICAAxdaRYGHxlbyflvZHKcxUzALbECrIDviYeREFKToExKrHhHbabyZUUEbivneAZmIXLwTmcDasKxGRyzHuopJkvDsYmooPbuqOshGsWafEDJtbcddPMXuPrNZmVkjdMcfYivlmRjePbSAgwCnZZKeAeXmRIpbCuuQoHRtdWWWjeFyNothKzdLMHQZlHcdnkbHMlfBtosAOrCxduEkJLLBFqlwehEBEUDlKAAwmDKCUpueudyQKcMVNyjLukCGBTFvxXWbfIVEBQHXkNwfhDhcuZVPIJEpimlqwXybLNVDrtSRSlpGNPpzDrmFMzAqMZYkXiUbGQsnmpXtTtaGCHdxpACKxNgdSudZEorIGhWbKcvkqaSirPXCNlcaqTyfHYokYTvLMhCJqiYVbqsmjTMTwhwqprupAhUovUCCGmXxuRIciHeDQSwfUJrgPmTNwaaNRoRtZmYhlZpUuLHinLjgEdSdnadvnjZlWepOvqrSfQMKiRJKJMaNJIzeySlkZSNsGuDJMzHOXzOfJKkxrIHtqOCymvWIctTVyfufIVLwLuSMynmAwcBUKpCGesIZVbNKRinLzsFtYRMXOhIvlzGPPEmsRaudowKqYeesUdIVZBvFIkoeGAhzBZfRBabnwdUSIIvfdxcpKvEchwcpwVVNcWQWmgAkJIHnObvfefYyezsDTjLbOLoniCMWCaeQkkQnxjECFVZdxgiCbQhpBDuiqqlbCHPyECZIlRiXQBjatvztYSKyNusszDyNuRuVxUJTrLlhYSlkdRAWeJJkpNyjHhVJMGFfEmmTcsmWpzhJlXfngArPffGydIMCYpWsatXumBZxblkRarFXvhqkHLlkYgZzcFwmwieLWKnNsLliRYYuIuKxzpfwZKtDTpRpUwsVacqJgDCuFJnvHUZjoMVoEBFtlZSUziVzbgVtRfngtYITgxcgyCvUzrOorezTnghLZZiRamTpGtvYAQFlJuXPNjFKRoceyBkjEfrbGACmEdguBDuZGMbjZmobPQGUCKsPDvkXRhYQpsXqGAkmcnYQGuobFeFIoQwvGEgvBQvPrpNwAhetVyKYQGgGUCXlACLaGAcOMNZTAPIoUxwBokKtDgUWEzSGIVsXLHuDkcfLJWWXQtiIPABQrrweouobeppGTnJIwZpCxjjhDKJKsJIlLOBGdoEbmOtZXixwoRJMhJjwoCQPyFjTlnPhnGbRwvHbwhZQVOppxPmBySkSigMdHcuxPOYLhtQShAgoJuCbqSZScvogmvXLSiPmYsrPyFPumPTnriThNJhztotoHSPVxUoIIKuuerwKVePMuvJnayRVddHiHVelGLEZZruEQqxSPahFMpmImwfoiDvTupeYDuvSmxqIFXpeionIAYSVGnanoTuhbEFGqqlkAobZsLNlMNtQDXeEGRUeKHkTYemHWhsfebHQpPbmylXKXJLrIlSkLwPiQjbxjEVvqTDYPyvlohVfgQqaKQFVXUYpJostTQmADucSGQisIYgeVVNSHDoBQgDKypyODhygNrFHsdciAXbrBNFrDFIdyNioVEtlDXfUuKDavLDkNlaIMwcnqzPpyHUEpGvcBTxmgfDkYwbaIEByaPFKVERcTRopzDnWHABPsGSimCCiCqByidQkOvYSmOstnlavWCTAEylsmgJbbcKgEgeftgfeDSmtJjdlFGQTSzKAOmxWodoClvslPgZwXIJeaFebmnFRjfqNGgvuQkTrHhkIeaRWuibmcKjtuGHLivZpYzBeSgIoLMDdJOBwYWETMevqrRPGQeifTdOqBYSzBwBTZdCpzxbAblKtWdoncZrWmszIYesSZDKErgCFfUYUknHsCrdpjIPaJcCyVzkiTpKZqfhSVHYWmtLFdAoKzsMGabCSnzyCHPKGTHnTMEZiTSWGeyHXMephlLKiDgbyCmjYuaWWLfayWGPxlSgulaDGxgndUBuvVIcEfjCsxogHCdYwfPXqnRBDJAHLysZnZvkudwPbFqTcuEdzmCmxgBlMwNcMqNrFxaBCMkyaBeurUSDDRqumfLgNPWrrrCxzXjpNqFsGrBKmVjQjuENRdYjVpiOFKShgNwlmBBSLOGdAjNMnTJBAiOmSTdojpDkzYxNJpcJlxdgRyOsPNkGIXTAXHvSEmmKaahyCUFgWqGPsMAALaHKdHRipqofuFiaxDhXMPpdYpqsOtvLsXJVgnnpgZmnFFPBsWLgbhuRcdgmjQIqTruTbdOjekSLdFwcTGCCNdxCqJYGOPslfmTlxkGVQCNdfLPrOIfruWjXQswHfPynpeIuNIVSRtcLVXikkXxgVSUkCJbZiifARmfQDSAUijUwwBHUVDcodgYINHsFvLNHNZLRLrpJKyjeaymdaPVVYZTesFTnGJrDdOnteYSGnTRlDbHNndveyiEGLjVUwzRcpSlKSwtoMCLufOsWTzlBULiHipmRvHCHAOEDDtGAoMqlNSuhKDSMwvAMLLyobABkOZIaHmwymvKLrsHGJXNYtiQEDZfqPYwAJcmBAljDFfdghNuZZgGFkkoCDgiYtiuUhXHXLWMBIfUqdwocxoDWchuTtlOCBmjuhSJrsAKHZIcxNkgHTpnmNtgbuXLRpptTAvkRcFthsPqHPcrxgaEDrvJXrivcTmuBrUiFJbOFZFsONVPrIMHtgnAWrLrpMUMLtfsrvdkPKaSOFwNGaQTKOBRlXlWsbYnoBWRiwYbsawSYnaUOySiETWxkyecPcWUfuEgbDGganoQiCSGfAViEoBBpCxxjAcqSGDIsjGKVFvZLYbbVxdawEoKGzYrjmuSdcaGgfOuvAnLOzxXiskgoFyPVRVDsLoKJsLxgCrLVLfVBfUQVKiuTkCwMrNJZBueQtiYAXaONKRZmuhnMnbFIFJgddvGgzrTHHmUgWmQIjkQTJNZtWLTMTSNcyXlePYmXqOsbhPLAEsSQbKGUuPEoBmGXmkdCGXtncwvDOuwkwhqncdklVNrdApvrRcZeTcpcScTLmvypWLpeWcnkotOpvnZYnPnPqSjuEUTBPIQHTaoHjJQLjSNCCdBHKwrqVzTiboWmXmLMKyqjutoHtxwZfBqSQMptByvoaSRJeGysCQBZaiOngVUTohhmmwdiwNwcBceadkmdKrmYmcucEvyylGdmakPJhKLiKUxZbCvFSSGKxiclroBUvcRpSfYhlVSHsipFfmLtLMmTYwvIjnwhDGRmXmJwveWUfcObbsidkGaUajeHVywZPsSUWbQmeGFTdzAWWsmdqtRiIMtERSKLhLBRQuxdxgvqjSfPlgDTxkPpaowRcrjbsHOUeJVMluyPFXBnuotHhOROdPCjCwAFpWAFSgjUHqrlTDXBybAgvVqEdjxtjUUVRJBXaMgkElxjNardfAraByCvoaEyeJOWitdDFtjqJvFqYBdbkqRayvIPuGzgODRjikOHeEJlFfjwmuaPZGQpslBaCNBqbzShtIHkqbSUOXKVxJjpzIhbKTbENhCAwpliIBHbrxSDkNCuxAJFaGLWMgIhAmWnAfPwFDNkuTJYjpLUdexhYrTliEoHRxiRAnumhxOkczhFhNciaTMLivErVwXJkmAJlYxAXanylTeHQzRToDrJLjwZgLchRcQODESjIiSrlCDIgOhlXhconiKOjHHtqYKZXCDJtIWUNMgIfOyWGpHZHZBVHbhjxctxQOsupGCLPFOAiULnygjoOzNSqUHMBkzlKOvpYZsmBRWqiRmIhUddufwuVANUEoGOGvQFLVLPLBDJTgODMiecPsDKxTIrODdtHQGlDlgtsjIYIpfSKhXGPkHXBCisHKcLprmKMnSivtymcUKhmcqBkdJTIPMzkhgeKRcfdZeonvhnMTjmFiBqZZCehJOrdnajBdldQaFumJWoqVXhkgxzSjaRHvWmSaYMZRCesJXNHTpCXvWxKKWWJboMvLfnJCbJuPMATCxfSNzvsVFJWRiqmZZXoTvHQiciYWHRFQjCEeecKAWFdqjPdzxWMxqFQGEimhAuBkWJLXIXdRUSKNdzgGBCxKnggqCXfBFoMwcbvCFvteCnlRRuyLmCMFccpmaYOElLQdOOJriHsOSLDnmpvbemMgtYrvxdYcDzEuIjemYegbvKCPQIJwVLsSJNGyNYHTwGhKAxvOlQIMOGihZMhnclUZtepxkbWkYoMIMuqYMqErSnDCffyZdhZnCwughwewkylOhJBhhUXGwsrJUfiPUQyMzdKuGNuBejjGVfVHVnguXSruBHcjGfdPEymmZfKMXoaRzqIDAiZDcShsceAMiCLOpJSYakpRFaGBjPiuDPTcQqffnkFyKybTZwqwJvMvzGzMihTPSOjtiLbgkFCGCMIfzfVnTGflSqQegXHKliHPhfGPwPLlpsFwslaeUzIJcbaKUHjDBslKVtjcNfZJUAlMjxBFkaSqTxaYHfCnHUvyemBHpWZvmLvGkMxtNEYNGVNdOGVbNQxYtKXpHZacnfdkIYlOoElvKokmpJqknxCxTvRqDHNdSflkRUJJCLquiDinvJSAaKADouBTnsbCUThBHOEAVipFzEeCoZnvRcINgxkpgqsQEIOKrGgsoRgcGnxvJYoCpOSbkooTdkkEbpRpAZNeoABVpsJtTkEBaxHfQAmIgnyvKpuQVHGgyrlWxOodmAOyJzxyindcadpOpSSHEWHGzEGgtPJeuELcFjLKIlRDkGKreMDmssSvbDxSKJTeQGPwsmjHHlEqAnbsiiKndKPeuPcrdCwLUabCUBTMFgxbMWeDJZEzJnjwWflErJDydELqDdMhASPynlTpjMZCBsxeOdJoIyFVDsvoOeNuCkYzoGayXUONOLUQlZAzBqINdLpYFCspCVKBQffvxeHXBtLclruGPvRYTXTbZMlMGIfMCvYHdTgGpUQBBLwuIKvHGjlUIJcIInKygFvvmuYPVIWzDrmPyWwShIiMwQAaWmHEMzQFpJyufwyABlLPuSAXNXuSprCqhiayNmhNtddBRzpfhfMouMjmRCuGUeCZAgjPKVymwgElQfnNEhwLRjvcNXPbwdAYMwJoWlwsjqkqyuPmDwPowGJdfCXDoiOvqKKKDbkYFAigMAzAAFMWavVTTYHaarOzMEonCDyerURWzWcRwCoWWwdJCERWwuHmbBDxeEFDfKHMsFERaDGNNXRIejmHqegBGyYbfymkFiIniiFjBVcNkVQIsrukTaJwcejqAbrjVAMdyKvukDMLoUOpdUpXCpYUDCEoolJeyMXNdRcnmOmvnqvXAWAgSUIhlhUbOltQFjYtptQRLqewsUCmQdPglOIPFZEedJOOHZPeIQnBCTADEItnNEAuHIGOYbJZeUrVBAVsZizLttZJQxAXeSnnrPxDJTKBSlaAWQAWYXtXVlgNwvsQVIcjLgAGeMpKolWUdwttjBXobGWSUoXqXHEZBHgBPJAkMnmfYczBuJCkiYkuqkwoAHbbMxZqSJNWHlkQZPHrFCDdyvkGtdZrxBwyZrnoNrMTNQvLJdvbZjrKPGpjrGNnbhMoQihqhxsRIUHketIHVlWuoWjQQCXMEPWEiftzHsgWIlOCEQYyiFgGrADFezCjDLTRabBFuTqZtzyHEjBHsyodOkGNHusEtjNajisBuedZgLMxxeDAuzSkFUAIpTbBIDanKuoOTZqacckSljQDPTbAEFMQLMkotbEHWowAqkmivfHVPnJxmJVgNsLiUnWbXlaQHspdVbdPPZXQPHSbrdQHRHlSIXiYkROnHogqdlluUKkSmgezgxErCfoLWupXLtJrBNSJnGyEmvqmIKKHevaVDIpHxZyRdqWFTnmXoFvlTZfmssdnoIuRrSztdzlbAQpOPRWSXJXdhaGwLNPiBkHqryjExUwrfNZyAeuExbvbdUaxqrQjWRiqAVyUNlfWkjrAfvFAQzAymkbkZiUvWJAPFlYuWqdppLqNxXMpnLnNrigOtZfvyAsKBxhdXjYryRuCPmhPskoPATtcBIuNaTVHRqjUErWYKCmQFVHJyhStnaOsxTjqhCKLbZaTUYtPjJxsssJXTEziYDVbJVPsxWhIRYqYmSmGOcCDOGpYqqOFWudcRMgNvrRAiXxpcivcDZMWedqpCwKVOumnZBWwQbTCygJiixnUUjsgsBviIcNdOCNFNFsBUOwkfoNoERiIGSVSvJlaJUYUEiWWGwSQtpeTVHNUNUcxXKGLYqWSlgKgUDtJaNmgSBXkEslfioLybKlHZwlDzimrEApgzsCKmrGXoUsyREtGpSPOTbTiFuzzXgpjfBMdnGrKtFjGqDsOVxkFzTsNQsniXcHvfESkWxxAPOrAnMNzsmTzpRxySoPdaLQpaOeRLtHEcoeLQLIaGHovWYFXQrwFvdjcQeQNoCwWcsrPcLOcoHJSAJJpvaHIBiRTBnVslUtdyRFeEbQmSiDqEcWigpnOelSRWSXOAkLJYwMdIZydfSynyTMnttfASznkzJBVtAOFoJkxseAKaPHSUpJXghiGMKgMqUkWPMJQCtvSkfSRLZvKGCyzSsQKVEWeTVImVzjyNqeBKSPdBjbgCkBVwojFSQyMGqEXxwXzVhAQAycyZMJJEzphBpnGRAwjSOyqMimqmknuzXbnJyqcdLcaGnfyYhpnswSSJJKAPwAkLvghintgeIzgeQpowwoyDPOCmZmEtJziJYxwNbKmmaRTKXbTLXUeDLLRKloisGEpxPiDBCHHGBIjhfykZzjsMZYbNAnvJcRbQHbPNrpSsZlZWvHWiOKfBrTOGRPECxpIRTPOitNLsnJTykhJtNZOLQpeFIakhrNLDlTsCoMbqjPoZXaMdZVtNWlwJfBmzIuBGONfhLZkhHGeFJtYlofSyeJbXxhvegLQyQzYIlVzgCPncilvKyHKHJFQTdFbmBTXIXtuBhAQuDTTIVMTaWQPetrpLuLAvRxOroEIsPSrcQlBynEEWayZrTUtbisrWikfXAKHnsjUTJaaczmJMVdLhpcFsGfZTMAEHwztRXVjFFyvFenkHnwVCWJGydQzNgCvrayKdezwpUugOQtulXqVzmgresooSuojjplmBonelqhuTxQFPsFmqhaBHarfHZiiSjnhPkQDdJuKQZZzviPPbetuSXUnYsSPmZjKObWMpQnOIpSAvcFigrcmVZtZXrnHATWzVkKxqrMTnpaoBhOJIabtvBIXDJVyLXkxuCcabcOsQxShZfJdcmcGQnrXOtWPyZvQGxtXIWuWlAMgqcCxlnMhbWMkBzSvEbsUjONSqNVkaBvlnfHuxJlGdtQpMPnfqeocEJpDcVjKEFLUBlkSmVSUmnmBJrNyeRKAnJGVznrYPMvKNNzVNEMcHRGcUDndxqIWefhyhPaJohfaTfJDWoeGlCmxFgKcUPqZdzyDwCUxKtjfRnqmorlNCMYogzSEuavskXkhjFozapQuyrGVLEYtPTdssXUjfCXgVxqkRDAEFmqMXvdYYRpQStCifsTxVcMmdmpuKRNlXJIEyJHYprOyfdHytopUsRaIcxnBxNbIQQVKqVDuEhLbONqwbzMjDMzBJSEKZxtEVxywPefKbfCjJlgANXCWJPpQYKcwmCeJmhuCcCdwekNBFbsSAnWyDKOYyXdAlhlGCJDQQnACFGwuTsYpUUHlQLkXHSUfMGgoQAbdxVHRSOfkxRLEKelLkxoszQcCdSqccdSWwfBYNJAEXYcAEhWhDLmZPpmEDGSdwsBVGaOzzNyZZNENHtqFczsAGkhpAGAfYTKlOFHGjWKHSpwmFRukJuFYYWWjvRicsuTogizHMtRSxGKkIymTinXTXzegBaztOXoAwPIiDKCadbfWJtNFrjVkcSjiThIXXagtgbkDPxMuqciKpvifwsHwXTeSbgKQYTzLIayeIDeQvipENCLZVBuqetptwKhjolKKkPbOfgRuiVwPOSQIcEbCgnVVbsHyAZQXjQYqFqRPUbGMTcWBwDuHnFbfzWvsrrRqjPorKdJwaNRNqytUmytHysdGptajkkMFcrzRSqjzqFmgqlEuSYePgUQPoOgkHQhuvcxmLvYcRmnRSeBAijBCKTNOgYCzAYrIBXHmdvPeNeSGbpHKbGEtFqjzvswFOaZEDFYoJwMfXaCDbjANjQQOJqfNAiwmLnMZoccRBqrjPgJsoknKUKmHjuJEuRQsmzJbdgqHNmdgGPMaQBagiErAqGLXMacqinFvtpHEYxIvEmKXBfIYaaExjKQFsWBHyLfvvAiPALuhUHIletQQElmxSFcPexRGeRrDoVmByNhwfFAgCQQyqKtjRNsxdlzMEKwCXBaipcfUcchRbKIGVonZospWwgDMDgGlmXLieyUPcMpcnzwOCVHJkkfEWxeZTIRSGQlQzxtbkgEHoswdGUPhhoDjNQJTfOiwMTOlVwJojCULdIcKjPlzdOdJTkkYGjSsFFBLOnGwNGIafkznNNEZLQpXLOCObsujDnAQbhXAmXOWkvwNafSHYYeMcQRFDBWjZsjcGBtpAnoDUtmUESDagbaUoeCqKEDSpMSAVrUsImPRiRSCIESrkACDievtPfINBVwZPtbTcbmXwBOAZEwOEgGEaRObUpKmOtFgpDbePBfcVjuetkMhLNYYJfzLdyiKOOlbQwIbpDIABITtLuvoYBKZWdRwBxzDUZzTxcRILNBqwNTVGGgAOHtamwcKENMXfhJaCtTyZCbOFCRrqidFwktlAbrRptkfvjHRNchtypCotfedXXPkOpOdyrwUgaWtAbrGafcOTqJKqjPboSwTgOoSDOpqrTyWqYnWanjrhWlZAGFfrOWkkEHAHbkoJyYEJOFTyBrfzWzExxildXSllhaqvlkaSUSWUgMnOFVmNTGqvMvnzDBiQrtAAUywabYgfsiSkhFYtVIbWqhSGypiotyWOLOSeBodjlcTHvECCydwbSMhbGLPqGHxUIUeWLsVWDDGwqckQbulrsGpqivRaXyAgPjknIqesXRONnPeYWOnoWMfeVjNwnyjKLxPwpubAKjCvvkiIhCkilMLqqUXYNqoZxpNIdYeVMQuUOfWZbfaLcIRPpCXCDqhgrkyELpkcuPXmtaRHZlAfoabjpIffevIiHGCasODmevqrNnpYfKEjBgUKjoIYtLAGSdLBkNoNakhQgnOCtPczywMocclrhkIHcGbXAuklEyRZyPHFOxfcjxuIUVuggLZwUYXdgQAielQaXzysJKFAkVgVNwgiykiMMcANCulUuknTSFFFgEEJmLNdhVOFWNvYCDeVJmykWfjBMxacRSDckaFDdAxQVmvvrCYLHcaibKzHKUqcQyqhWlOsrSvmhTdMfiTLosRgLIJqLSAbLcwvvcxfPMjtgfGbcKBsfODIYkDItAWaaacGAOFIbnlNaqmOpeODwFvZYaknfkpQxUDuVoOSeHfITGgRWIeRHHWRGoiBjOoKZXlTDxIuuHdkeOyGeeWleLoTosWxzjyvHIVfSehoacaGzevQBfwHqrCIpjlFbIEWuhsbtLgvVyvnqtZVkyNymYqmUtsPFBgPvKknbLZupWBXgxCNpnfzhIHfTlvlGuwIrufOempfPBlvtulwbCYrDYnjblYClAfZKbrLfBITeLjFKgOZzCtfoGMucOAtJpZaSwHfTjAdmzKtlYlxuLPTzziPWFdYkjgnNGiOJzyXfBGeBrKhQjMzTjViZumsJITcEkCajGLVnfhrcWFUMvuPcywvxKVEQHDHMFuAfEDdMeckXCqdkjPBTOQWnWDheZHkLZirgfEyOhtbmkolVBFygespiRMNWsBQvKwFJvZMJooWRPfzmDBOmbKBfotlacbVyCadYhiNMYdVENaDgbBTrweeGFEZeQAywTfFgYDPORADSkYzIoTllvIVjFOuqHWQPucsUFkaSsAkSSCTzcdwUgzEbXpWOUrumTygPTCKeQRIIzBgOYRiifTSXqlblPcBSamTAyeKJNhGWPkxaxeDtwyGrNVWapzOGgmgtzByMBOyHjXaOJikxEcNFrwivgjpFBwBORJuzsgdbpZyrjFtocywBmiETPzZrHtQFQYfMMJhCWqkhlxyFntLWYjLJwhMTCaBratAklZgAJppkbkxCMbYnbIshNlNFuQfenkqEParkUdqfpweTLlELzsNHwdMWzGDWMiqQPydgfBrvNbHDabZqXVhXztoQoPeJTKORxfbnAxNKNXrtvVaXewUTjbNdsrNCyJdfrghGBFMvBAtEFKyitVkpJHVamTfuLMIlpEvdDIqZszsAHoeHAjylJiASkNIVnIDhQwGMQmARliejwpeSWSqFYDZXxakfnHSYkNvgKXzkNRydaKXeGnYSKiMrvyRZlFJUoSxUaNidlhMkjNUuPZCpFhUHVRLXbchWtxSMSFnxlvbusYvxNdTFZaYBMFFMUXapfXuPDFRnwchKHeobWkmDeREOIxBTqkwGllFEzamtmfIiBzKIFcAuEVlKXmOEDsqLsNTvapoVfSuzdZILjdZEMzEAmAsVtGSDFKiebAruFoDrfBwuSsPCQzLYJcCEbBWlHoDsrSleLlmCeYZmrapbdEpUXfCBlvgkKcGmlBuaaBygxdmqbzvsaOAZzqyEwURCtlWEMoNXQsrpiOAeXIXqCHroZLuRHaXvdYpSkKXdgeFWAOMkJbuUlIxkknMeeDtUUGJqgrmuyzDDYVRDnVqMjyhyEZwPDVjquRhVtnLYuzzEaFQNtqMmpEVUzxVzdVvDvQeelIyPGecAWyMkCyVZfnRQyGeZMCBVYUNSLwhGWqClfUTvIpgJGODfAryihsLuNjaohljMJcZhZzPrTuhPyvaOABaMTgCdidGHkRuHPJsNCoKzRlIesVtyKGFNlwjzvSjDvtVfRqZynJPAQYlAYLzkZPTyeSdcoyeSNqyXdktXHXnrsPUnjCGcjhEWXTAMsXpBQGSsymZibQuqLKwOZNGZQNmodEIbmWjfHGwYwFVteHtMQOIYMPXbQkfChOCfcnheGYkTPhaKSLODhkiqxvtboTuOwlOorwbRGvsCjltmbYhCanGgjgBhjEQCmOZMjqBYQWDlQEHrzLgkptzaZCzUVttKttSolhijoGrFKBFslCmwaoesvCYnHAfAymzbaOcaQFBCrwWVkJHxAsUOBPapBJhwbIvMStjivIVachKfOfvUnnPFcNfWDqaHnhsCoQzAbvikJcEKSiEHfwhYykwnHakBsLqcQMfYYQXwBYZayIjPAgmWdBHxzKtCNVNuNbAgGNcVLItHmKjcqaURWQoumYLxwBOIcZjQzOluivVZIWPjmJYzTZsJqavZHNWRWVfQzmKcNnJbkICfIaVsoKYuTQrhihjKCXjZKNxSoBiYjpGbNHsPxpbONsurNQWtCaJmOdAQsoJOZsFJoWUqRqFhQjfJWKppDlbkKSFOazMuuiZPgBdvbbPNyRrLArpDjYQMMwWAbZLYXpULepUbCwJoKFQbMXsIKsZuTMSqTAwdRiEwwWJsqvTHZEafuTFcgKKLkGvFCbcmuPhUksUgXIhTJlLlDXecGsOPKLndnRwEpVvYEMZlIBirDqXFdjfuLiFmitvTTnxrFIxnBwQxMMokXAcakahYvZkIhhZHAwIQyuMqYuKUEIpANxvqLervtLscgaBBvmWuuXMTxBQHxcHdncfSzuISaMjovgRzheLbogarPaXgAmKZkKnJkfYmqWPQiDZBKuLlAYSeixPZVdphZKgvsVcBHRduwKGNCMBrzTbarCuOXCZEbsokwUdoAHeSeIxtuygsvmZQevfCjNYqHXnLUYzAopCjIQAolSotfyhUdaEymBnywRRvlDamZWSlUHRyHGPstYCctrciMjjaeWyYRVxXikxIdWaVPmoqQazzbvyhTwteaLQstcpQxvcgKfDTvgceMKmZPIujYzuxOjdvBunRVyTUIkyzgXtoMidZPlmBMLUuAoeUusZrBnOvaPPmPXzsDYPZheiIafILiENyTLutEoXACibaqASYbxxPeBsepuWiYKEYZFuBlbjduRRjXkiYDKdAsyibgVfVAhRAoYCMdRCClzcYNazFPVAgzQIclYyrmIOTcBxJqrNSXcdxUQfAaNmSrttYCBpfquGOktEtJEfrBhLjGsZpuPhcXFJRpWHKdyvjpncvfucfaOpwiVxrPJOJJSwnxBPXWloVCFynNzKSYXSfFEQrOgqvecWBbkJPshkXWgWDuiiXbVbhZmmBpOwLXdLaHXolLSKuPvWNirLRWvHRiSZuYpDQvXroKOkwYobEjJlwppYNOSzHcpwikMYdFclHWeVbGOdTVyMHPYJUJsohbJriKpODIsOJUSOgefWDJHuWPvFAnoqXmhXbUdnYCSQpfNzvYkqZaNRXRdaLXaYoSiKIQIUVuIEQtPTABuHfnAjyiLvQDewFPXwDXEEMivvrCFmAIPkHoHsenrLelMLsYoMrLyIOmjSpuPuEHqfAQqmPrtSkbpAHKBLOYcYFyTRMDZGcsRBhukbykXuCfijiAajfzAMgSaYvKtJrqebPfmIkMNPenBfNgQoZdIPesjMJWrtkdrvCHSmmvMnUqLSQceyQghYgQFtEJaBAYnOOcyPtSlmoKqateUvnDzLOUmcmQOmJPalNmivZLstpiIRfiXJUuROgjhvATzwEXONjHbnYZGnquLMLtwMcHnlKRrVQsdfqHKJVMCiECORItAsOKcjWhksmZNISBJrBBfxGVhxiQlsvPmBTbtMJRpVwVmqOfWfttVigKssiypVNsVBKMWkncheedQMAkOuewlybwLFHTgOUxaLHMZUhwGMgKUrZLmAmWctqRfTAhARBdKlZfuCtIiLDRPnCflvxExgNVKPdpEhTqRNdPZaJQZMqxbManrdGHLQPKoogMYNXsZIQAjhntfXEAneiCRnJzAfryQVceTzwLfngNqRxvPFECYtHqbflXxxQwjjHtJIBsqWGCIRCyHURloGolNcknjmEYvDvYvnyHytbrNZQDOyLZxBDpZfFmOBHGQwsIgCXXdHVnEZbQXIFNDUkBCPNgoEHmZsGAxzBZefdiKNoOXUnywagdfxsKZUIsEZUFdBVjxZQLTPUvkLnvnTPrrMIOJtDfYuiNTUzdaHCEtylhnPJWNZaYKfDmOZOMxHMxLsyJmIaQPHikzzNBOOezUlOBCOWVdjVGJIJyNwjPAeeUPkgyWAVhQueLnanuYMzpxAcpkgxfKXCAKnCrcIFmydcNMEYMluzRQmEnSgSWNRlrrQuKqbKlTtROglJrByatwTZBkgFWsocYyjgVHhujxAJHtXSgzRTtBildhaJLVKbLrcwTJsOQNJuJClCMoyqSQbFbotTdGNPGOvEoDQQEykCxJrXiXVVBaRsFrzdBdeMVasqHENuJabsFolrbPNeQfhNCEBigXulkxevKzLEVyHhXAPOlMDxEJYjHCZTrjuTsNnjuCYhvmmGCynZHrMKpEbRtIHgcvSphZRoDIvgdwrFAxwANSEMbenasQFnhhwdldrqObXapAExjniiKYUjWYrGbSRdRilgshXwQiyGYqKygBCJvyHKKZAkfVUkxDoXaYelURZAKIHmieeuLlTZpucZBtTmWcNqBxMxujEFrAtYMPByZSLLnRFqkZcpALSrktQQeeYVeRNbhwZpPObgbIKAvuzlOxlFOweKeqyuCYXqcIDRiCePRhTAhTndDIvHsdMlpZrISpjPHwCVosBeRRgnWrcTJLasKreajPLKaiUTFxAkYTonPBjzjMOleYnRxqtEPxpcFNtCjAOSuBSEPBJMsMShYRjdsHgwtGNzLMacyVVspSejSQiBfZTtGNOyMjjisxqgvIIdifylONBJMrwXMBzcawfZsEHAFkgQruKNCGEEhUVydCrNKWpztbOkPlMbBpWOGrvZWCKnnXNOJyzWllYcLhVOGiiegZqnhUZCjIIyDCswScEIbtAgJGHBeshQJJwCDquALMeCbLZsAnYjvcwxndFSCnSLWKBGNzyFkJoKLqOTJkFUdRIoSPLrOpsPNZWAplcIkUXKqxheuXmlcbvRvukbHTbKDgjFxGNvJZBepqmGfdhWNXWElOKfnkbfmgLvxcgKKblCthLptNYxBWVBJusRqElgUcgIToFgIEIgrknWxgiBAGCHUDqWWvjZWfuVjxlZvSgRjybyQruYrocmPDAJPghwlsMjLylpnRGXOSFIhzdCfLMgwtFrOpEAqMTugltZGiiirDaPxhNhJbYUppwlBANmqsFpNLitqmsxyrIsOJvTGfhfwIEtoOWEhUMfTIiqsBTPvizgocihFhfrmNkeoOVkIjljZSwEeMduHzksxmIJXwtalSczwkWMBvJFOgXGCqEhbdaPkggoBMNdciGGNBiukKLTEtZsHFIPaDRjIjnOUsxhijXpgdnKhgnBwzeDRLLYYBKVhOFLqogNwiYWyeBRWNYrwirYHcSuxeEqyRgIHdFewBTPXKNxhhHnNCxNVQzODTZgreuWJTMiVZvQBgmZVCCxklzbvECzImCvZiTOhruePBSIYxcAndwHDaWWbVpmcKhGHkdGeHSVKKslgAmsWhvCBfhmDsFGPnyemvdZzwVQDrKuFTSAixHuPVpRTxCivnRLFhsLxKZwITXmVjXtntSyAzxkeaTmHavDIlezMNPRqKhoexfhkiUbdOZdMUCSPAHAPBMOzTGGyYaGHllTYyQmIOIErbSRZSXCcyxQFPYoNKSzqvbuflyIaiThptDBviOZXafjFiHAYyvEIMBCHXUyVteXgEwYBpFzcSygkGqYXAMPRXuxCSylfosKlrWwDVpNYEfzufVSZVhHTcHQmFVrLxhejzJKDYhGSxYzOcsDchrBCKoXZnODCaIPiWXWRdnsxIvkHUXcsfjBGFctnTEAiowkqDtBHIGkAYiQVmdfadnKPVkShkVZkbjqQmJIafuqWLMLNnqsVUVNBzaEztxzQnUXyWDyZYnKLQmSxVnrcKJBzvZcWkRBWFjVeysMcQQHgLgXHLxssnMACcpPNKONwHsHvsHFnqDfrtICCjWQOjdxqTwYpfKHeHNFdXzgnOhvQxJBsvlkUxdPSxtvtfapPaqEHsVVbrDmNGmCMHuWJYTBAANoJvSqrPgdLEpIFexenBHwTwLRwYQXOdSPWvXzEVjNWzPteYWuxPyFDsCBqKMDwWDosVfrCWpKYWmNRhJrAgFvNOxDIzRuDQaVxASjOPJeOfOtUlXsCKOusiLKxPMpjVRAcNGhyuAbHjndmkjwhNOKeVajGkBlTSOMHFmZIehQZslcCwISEwGXRuePONYXtwTyRwJmFkWNKLrzCNvyZkpsJUeuWJlamqERBQnYntZKwmPQAhHeVYBgbtBFKxyfetfpDrzpruXeQVgMksFVPPFepeaDFBRUDYZCbELycuZLLKjiUhGKzZOUzLyoABxWEwaunwMRKBchgFowVytQsqoNMKQAdUsepLXgqhDoIpwEeTQFEhktJOZKAUsVgevdOPjrdLRtGJmdVxRcpEQcKmjOUHYSDQXzXXYYMiokSeGBwKkYxQtyoXSfYGovwBMGTpeVEgZEOQQyEiNuFyqbdcPJLzXfqSHHuLtJweBvEnXimbRsPuMvWXyzdXYsNNuRNfltFvTzyCtKHzAGWKGIAGrkqMjZBOBwwHLgdeHntUKYbUKIhrrvJSZwswvwqCtbZZwiwhBBeEpYKwyMjkbvPYKqdiWSVLVVdzOPqZyAUVxdBAqYcdcYGTKVJknaeAqNacuoIsTFTlElzWLGEGpeNXTRVZejTNNmRrIcglobdNFMHNwBQEXgxCexkhCXIvTJBMIqEOumRmcZAKhSHRnBKXPSyUQZhFUUhyJpdkgXmXlcTzozHabprnMuQsseghklHXRpfrjDnbqFAXcdmTVqVxrpDaIWCReCYmnKebBNYTEGviiJXKWRLMQyKzTWPfuZxXJdTlNsaIRXqutKyPFnCjXBkGgRdlTAbgTzIypOwQzKlGbdsSEIxOzCTbBKodiDTSwOesWfNvlafjIbRZqfnHopxmJTEquiaJxImtsmnviwMlXoUmraOJoVdvFKfVzuhcfZiGhWYTsZweSbFSIHrkacuaExMITkrdgqyYbqzLXvUvbzuwrhTpZyQehZiRLoSDAXKLThBGbQAszxrzYednCfgUgawMvLUOGAPdexnuvfLUcMmSDjrRoGBJkwOuAfaZlDInwnJqfwVYmzxYBUTFREMcfAyTmddosHxjpMvRkxdXSEGlOxaMFhbbCojFVTNzxtzCoUErFmbLAEwcqTdPZBVKVgfMZoVweTsSfqlwawcKyvwMKZBEnkLGCBvQmaxyLifdjIGKeYilLfPsyDaEmYOQhckFpzrWfuHzaNNAwhKNWcFqudsBPzmKanQJMvucRgwWzTPHYXKQMSGkWRvniMpEIbiZcUQBBRAyYRkvUSXZgRQNuBgVscKAwYNVQDDnFJqKaHKlVmhtZsPxLMgSSZSuPlMksUspQiYkBZKYCMJvbjarMwvxZMUoZoXhGHTFmxKvOZLsVyZBgNMBtBvullZTkxcvPasyvKUATIQecVlMGaAPRhYqkxgdnkylNgxqiuCyUpKEspPhhHXhkiubXstfbbgHUWFKKNTqJXRwRiLcDVgRWordqRRSQSdYMogScdodIyOBFMnmjwGQwZjQbtBpdqSBLpZLqSxWDldqyMSbsjbKDRcYYUtETxvRuUAeZvkPEwPdgEthlkWnrUmdehYptiXyhedXntlrgbSPFcddtAlHLqYOBXAftqxDCxLmwKsVYXKwIeYCyvetBvnkOIGFbTohdbQDTgjWaMgfqaeevlbyuwfJhDqIhJuFrWDhwTZWGioEimetCPvTnsJyLRSKaMuKyxpVENjWGFobpwaZtnNOgatAtFFjGhskhlXpUdpfAmFIWnqsdObgIKQAuRcvRDoSqMepSNbekTqDKOldlPxSaZAQgrZjSEyKxbcaVomlTZtWCtFsFgnlfcoedweFpwhFfsHppmPZWvDsnIuGRBbZQUbDeMYTTyRkdLVKDOQtZmoWFufpDmOkNFeYCpbtCitGzNaOGmlEEqfZfgOliosdYumhtjhMCYHysyPnGtStGbaVHVRWoQkVRydfoSqMgcwPewLpFWVXkqoQvOLLWwLpPcKHGTFztPJYItJDRinWGXTBrELHTQDVvAmyNFZfGNEigfsXCnoHNsowCqdTGqlEazrJgJyzpdehbObWdWIimZZwUgOeZDKHVEiQdfjDiJFVoDHtzJWvLhKMtvzNMkapzRQOPtEKTpcTjklxhJaFrIoHXXgtgfxnYlvtJcfMlvzwUnvuXzkcXuxLtwIHqhcLiSjuFvimgPDhnEgmLwpqiLyFaesHpTdeTkgEOZUeBmGZzrAvtzkcqEaAEzIqVFIiURjjIbTgWZalUoeGRPUIzunIjQWFxhFYyenMTQEoxEFcnRsxXBaLuTplGmsIMzLMcgtgJFdeQBlFNVubaPdkxycAtHWDyUwvPyhRSrNuHFvRDSlxOYFxUsGIKyIzsLWindaHRlyPHgbEWptFAIhttpGSLZUijFExDChtNAfUBZJdCPwrYvmmBEkqZrosSxXCrsJXUZSfCaGGmoyYBhNhZAZqoOqLAFqogvVOGhHkCKocpNczEkIYgZXTLOQvoqdTbQRsdlQzcPzMZPnWPMuuChlShuHBSpYEiqbKSMYqwsXrDBJSchTheZhoJmBYReUpbBjdxBBeVHGCxOqIPEmAIFRuSmyLCFVzsXRKUEoVelsnLhuYWcewvlMjCARsGEkgozuVPEODeZDnqLyeiUsvFYBPUIJBpZeVbqwBdRvmoeVVuIbTMAaytkzfmFqHTJsOFUKCXXGwmTseJklVuUTPjBPQiZhYXWIIZQoSBTzKaYTrFEfhpiMvJvkqmUWHRYXASPvQGLiXiqkONtlrBhnJvfSvPeNvYRtrsXNEnUHpxCyKNHQmEGrGnevkYgBmoEwbDAJAWJZcFXGzgrktPADXsZGSITCgKyKImDOFfFMRBOmFwWCgDDItLWFlpBpouxXKzKgAXJbrTKTCBLFvhVcZJTKsoSWfdWKnBKZVLMExUpOzjajzGLFgWgcENPCgDkozqMeJzidPotbpcqRAVJyVKZmjSycYcxdYHfYYxPnVkyEFEkBiEdisbtyrlVhPRJwBqqqUbVKeONWtEeuuAUscCVEGhVAlBJsJnicUujHagjdfnNkcMbkmEBSZNSZyPAYSYATYZShZfTwQabjyLWTSZqxHcbRuGhosmiOoqcPUryjhqjzqdLpSKoEsRqXUpNrSWcZpiKdRulDGDGyKOMidrynLBqfpcBcmxsHVtnwZRHEhIhBYhfEreRyvwzyIGoFlDRuIswJazPGBDDltMWWTMddXtiebcycntqMkZnZQmWWIwYcDNsDnBIjElLdkeNbLQuWkLBcwOSjPbWIVciPrvwOyXQiUeSjEnwdRZQeeRNjbgnLkwujUsKIaxapSPcQAmIRetvVnvDqGHewNWxaflHsDscYrRMEalGfDUuyNIOPAsLLdifvgiXyopBBXKjAqvsERjYNGXmqIlUwBHiYjmltumoRPRSGbVmKJdQPFtOFHzVdfhlqhsPKbEFdknOsJiBbLKLdqtGYNmuBAqWrMtuLRNKcRgbIcZsTXKzrKEaVfOoUJSsqmPtKCzYhAQhNGtLXfBWNDKYHMAQiqUcpQMsSGwMqyqGuXjstDLKRFxSWcFqDFrjnwQDmQxaKtwAyfTPRWlJRkNpYAyIBmvVVctpAbpQTmaKkNCtDuJJUiqCsrEypnRXYeeOzaGdDUpmBrosvsLFZOalnrvDzcgfXwPPJIjfVJKkwBlFaJHBgtwctlfKIaVfnXxhsNVVcZKUDNUfhBZPbPMbNUAwXElnZtOdNHyJUqeOYhYwUUmrcUzpBZpQDhxRCOhLcHLBEXgasStGsmYmMsCzvCOqakMHVeXzjlzxtooaxCCuoSCTzlyfjOXtRvOfjidKarreDtywWVPpcDRIMeFzJxymCRWghcHjvLUAjdSDRTPSPXrHOQFOVZfhipXmMItVrWPOGKrCkbigusTtfexlXUIKnKLFZXVVWENBiXlQzpSStFiEIZpTeuXGoHXlDLKXVyPIamuGPMCuuSACNVCihDFZgORcuRBCMAeQLbfKQPaaohkVmPVfQJumqlhvBdwHLNndBEaJTriNoYxSSrtCRtCmgZqmmmXrNtTMSDsMXSnbFerydqcHdeFwPYjaiHUMDbzPPWzKnUAeMDCuRxAUyRAfJbfbHKIRKQyjEwqcHezqJgOfpoUCIXEhKlxPMATfCKmADGIqmcvLVPJUrfoeaTWVavJcnDERPJYiqIxMHTHxbgRzaMgCzGWMoAPdejuVJAOUpGqiBwsemAYRZinjqOgmitvRtcHiJkXBiJeRBjLxtJBwxILOYLwPfYSesCchhYuFnvRaxLkWadmdWQuyddMmHThVaJrKJOARnfXGpMGBKCkpAlnfvgJbHxOIpGeluQzVaLpkpcsCROZiNrdQvuuzhkaTMKDDvwruDCsSSPUYnxkVsoHsQmsTcnlLyWfPQKXoHtauFCbVXqZbBvUGLrvAANReFpykUlGDKtMljMKNaopATTClWUOfcOQNejcrlcXrWqfduyLaCepXOiSJweCIEacOqWdrszOIAFMSdSOIcWynzWgjFxnmCfgpNLDBTUZuijoBwjPUZhMuDTbPCpwlnezsNEeMODqSHIyeVrrioacdigykNVkAMoUowdCWRvwrdqtdseawRVfNGQrRmwTKoGdRLbPgRhAPcorikjVhfKnDjySdVSMeMPJfcFrmTWzJDEwaWpypIsIUEvHgpxszLGVMefgWWNqpKXmtNkdtwWBimMEUfcwadBztrjLUMbYluGJzOyscjzUTuiBpWTbbsgqdglrtBKZpAuYFXpwASFUAbhlREZSOfYFHjUboMkDWAEIeIhCAkvslyLWLDBOOirMrQBtYJNwqlmTZLDrcJZmlJLnvHgNvwvvVBaIZFwejtlHjNVQANASkCqmwJaHjQFMCxScESCQiYfhhTWoYOFxEmnLzrepPTZGsIAzTLzzdjLWAbgQKybSbNqaxRQxpWgQUHxSdIkeuWzzLVCzWiZbRHLwaMbdjYlPbTBIXTtcvEsByNXPoMBaBTRMsOTVQWRGEVFcBNcwtITSHNpahvySAbSUxlWtRMyEtVfCAsmilkoTVlJvoWTBgsZHaIywfMsewljZcFrxHpYpQYurQGlSNxBPLgGHMCvWENsBJNwgRGyWtddfOniGumOQGbdpQVRlGtAeiWyOlRaWnwrdpsHHIREbYGzJCnchwRCZXFmKCyFxetXbSHLqznnmdhqAKGnmhdoYIaVympMyHmGMHBtyzhfmioojNvbNKaPcYmKiyQViKslEhVrlNScvULPdsYbVecuxqTWLzBhWpUIiPYJLaLbSJvWDORvnzBJGhFbhDDwVaYyKsBlHkCxSSEClFoOUVNXOZWifCVzxzrtbsVDYCScoBnSrGINKbxYJQmSnVtkxCUGYQcqKnsoOYDFjRJudDOOhyWFwrTzfYAdMONSybcoSpsFbikRMGcadcaKBJHncnpmlWvDKJVCHSUllhhEiWUNjSlAuPBwnmdAVxhdeeDqmieaDaFOfVVqcCvaouaprPYOMBPSfuvLNzzOSLAUcroOOjCGxkUXINTPkBGFrWeuOybgJEgXtFmtbvdgdengZDRCvwgNBWEAEhaCQTLIRWvfmoTFVgWycFSgXtFfkXBOBMyiOHbZPTkPVGvPBsvsMxwQGKhZxRfhCwxdVelVWimgICBVPUASeemvZZsWrcgVxJOZNtyOhzgNzWduwnfUdsXjLnMCFScveATmZCErMWnceOyKEJKkfVpBPPGHONoVZEFSWnNzdSHhLytbOAzdaCdQrTlAOQRadATzszkKtRekUxEjxDrKnhwkLFTAmFqNqXxKYTvEYXfBRhCWWGllRySoNlPssWZAlhiKSRseWAQfIMFYyHSEmMuwJzIhOKdrbVoEnWzCZtBYBXLJqaVKaFpEefEXrqpzsoZAZMSbyGDhwiWjGWDXMrAQnOhkbnPSVuThfTiwwbFXvBoGPtIMPzLqXBpCnhxLYTycSuWXePKBTlzydmcbRVWlbLvyYolaNRRrivGCzrkJRXntdggoTcQNljeLlJegDSqcZlxPqIqPrrIsmMnmyCLznVGvCOoiCWxaphdbrLisgMyNEAJsLASjqmkTlZrHdpjeRLUYeXATnifOigVkCyjZokJacBcSJXjEHIaLbyeGAuxzPmPJniOFpdZYHGhfpsJljqzZvwqPQJwkCwKVjSdbEiRvYidtcuywEPqIjqNOJRJDjkEznzckYbIcccnTmgfymfFKhltQlTymyDbPMXqPMblSqdnKceZknFvoCNONsYtypHNlRQbMxqazLHYWXJBgpoahFrAeRzfOeRdEKfkyqJvyJcAiIlfcumDHZVAyJGEiOFRVsOHQHqOjvmszlTZIPYaHXvMuxdPzKVClcorcLqFoiVkGpprPRTVAmiGcZCWCjKtvvJwkCtHaoJSvhqQsHrpCMFFMykKUUIzZcBNVHrEPGoqpRCegwBTCXBmMZvdrmQsprdOZvrNMHmqPfjEtYEESDXkpEzrESipfHsAwKFlHydmwAOrTpJqaYDLATVbOwwsxBNPiDAwUQtuXHBOQoFBkcHPaGxVLfpirYDJMgqtQMGGCkEpSaKaKWtgelUOXXJhHqVRDjCkJPrlaZCcAOSItdwENAJnQIcANPMBDxQArewdwElhNJqAmbMTAvDSRPmKMFnmEBHSQvzmcfQNulpJkSGLxUmCvCWRJuwTWTpMSRGnIPUwDDpLSXtSFosBiOxcNiYmpTbwVBzjoXoznkIVmBEZHbsGQKNcVuzQpDPFhpknVfaQVyxqDTnXQynJazsEAXlvaFrvkVcnrNVQMudCLTNmSeMRhgyaveyRNgIhyIgnXekaZMrlgWCNdkwMSSVFqAEwGyhxzkIGFTvfQfgebijThTiqxdzTuaOxMWfrdWGodBjLoesLnbEfQpnCGZBIFlvFqigqKpOXgtcPHrWZhGDDZBfrGSXdVxOHcFUSTpaDdNFpEOHLwRNatMbWdxsMJYwmZyNyeaMreHIoWpxUfwBeGfPLbybAnWphziVljocZkCtPPftFzMVauOeDSwVMGTEiTCOdCKgNqlgBMAYRgHRMgZdDuNtCkiYbKXXfUfpBkrqYupbPkyctROsiRUetNGRsOqEpPJLBseIqdbmzcaDDkILPXlpsFinzUoroEvJgIyIYjcwJQUEzzxL"
         message = b'\xda\xbb\x02\x14\x00\x00\x00\x00\x0e\xc2\xd3\x02\x00\x00\x80\x06\x91R\x80\x00BXvyZkUHHWCmKqOzaQUKscRNwFihQTLvXYsqWMFDtUlkIrMTbcEkMUNUAtqNgiwSRSictSiVmEFLUYykXfWUvfnwfcnfGpATZxBqMyZQzuJUCArEdGggwtmjKRFuyzkGIHslPzyxUurHuFNjOLswLgEIGZRzJQAnCGGGAufCarnskkSJkVTvlcldAPfsasDhTwpmHwVbAmDAgUGYjzjrHJRTxcXiYbtiPsSwONNPsjeCaKVZCPcYlhDIdQDfLvgdlndPgCjLxIggUuzijjZsXbfBTkYJANFlPRhnAiRNWOIHlMtTslAhXqLmPOfbjzpJHpOdJKoLdCIXswyGRJZoRYnGXLAuZlHgoloOHWfdXMtGqerpOaDKkOkvFLCQabnFGRrviMaqaCdomrYIVqGAaqrFpGEOCXGeGyySxMTEThQLWDOrpblHglrlOcUFCTiCaQmCsLiVzHRwWKmPbFvLxLDXNtKlXrKyfRCbMMLxzOULTZiAzEJByUrmiILvxAIGoUcPYSBBejKVGzlYycTixKyJqodawxReipVaBzfnKWWyXdtDDqYXYHUAOInZSalTSwfQajJeYeoQdoOXcFoZMSLgCkbptLZBwSwFCiOWagZququmjqOYcERuPSaYmOpMRtWzipMmRmeGtsYnndlnwgFkvoylCKsdQrBWokrEfSldKmHSOpzXIWYfcNJxRYwzoFZsQOgXDOOVPfyikrDayHCrexjAvouLLjfutxtwYShuHSmwnZNtEXDkGhpAkkmIVxrTHVtpPMinIOfjoVcnlBoKoJbnyOxZzsxURxfkrByHImKTUwbqBNjOteTIHHFFWuRptftMyuRZpJVKBCzboGDIyBACWrzgFPEpvpCkodReknujYDpCppalEYkMFlIOFpKPbcIevfXsYSwwvuBQrOGVGJUDiUTdyeZwXvwjYZdniHYLmxXIaLmrEpZRkZhbYibHaKgQmcHvVPFzeGLplJBVBACJccuNzjKXwdVdevvYTbkIJjCosCOlnweBAosRGbUQrgjagmZHCXXsyYwZncskCaMWDQbBMAFkFmfvQvaWlvThXgDBBWvTLFxsMEdtwnzDIwJqgslHeIAWIcmDpqfAlKaTWZNzWjEeHFJkTyYUByvdmjCdwsMfsWDRCffSIkONkTOtXVwjrLHIPmFceWTqHEWNDIOljsyfFEkzegVGKCqUFotyaDJMLCfmlIAwaSyLFcNdGONnEbGbFXmJgySLhpuFChXyfRwxSnCThMjrfNcheUwpfSdOvrFKOYYBCNWbukMOJXlihXuSrfjSEeZUHpTRtoqCvJroLQibPasWeQXGbjrUziwHftbiNmdsXvjEdaZVXSPYlaGRIzfAxOmaPviBQCwkxbfRQjErfOwihPdSjBdyUPHAobbzGnzBAJPVYQpUxtLkTKBMMHOlmQThMDmHYyeqGjTUjLnYMHBfcVtQutvBwFbxVhjtBlXOVMsHaMLxaJINqLuywNJvimfvRNEIzcqdVhomqtyYYDXvWwffGxIhPnYfMnqzADnJrHPTNBBtvAtriDsFanUAZenUUOKqhRaLBktbCsIsJuguPHpbbxcJNSvCsRaFrKfrXzPFMlxnAziEyCiRfSsyCfgeeUOdqNplaVvrrcBusElAfnPXMEQkPCmvHvcAkGLFVwctGKVFNLxXMgwiEDsDDHlnKCGukRniZqwRqajzFntEAoFOOOKytcTdExohyEzXpvKoJluKDQybZmvbFwqkedruPcnsvYcjCpozPcwreVYtJfmpCwJTPtmhxEdBzcLodpjxLTqViwaTfrvnkjqILnvfotqCfGwWtQSwUIESGRClnUIrZwGsqLOpiWHnKLVyzCznpnUkhRqMeZFkKwOAZIzqkuaHJpOPMQszzEjFGAIHZPpyTAhZuWgOZyMGxKARDgpCqHKDCejXEwUBiKzpNGOXamjcqXXvlUUbyEWzIOnbkHlSdkpdspjObrtmByvpTNJUTfMGfcKuCiwjmZkCwUuiNGWLiRyhmSJIpuKOLzWgIKVGssPkPPwmzjhOYlbhgHROuLSNLTJZSjKbBQndbAQNTgiBDmIHTeYDeQQAeaPnXEGiRKeLEsFbsHaTfiWmodUbDqPgMhCTDnNuWOfgduiGZaoMDlIARhHYsAPfAzsuNSHWzxwfHhlJvjzpdLIIlecvxEstwjEGFqRmFsoBkPEIvYbvFTntfJcwpNiChOzHgTmkAwwsmtHyKbZGLXYheZmaTLeoPsfsdicUfnkYYWAfIXkwNXtsxEfUSdpzxKwUPqvvutaZODCIpyNUQtjNosedBFyCnZvvhJXZTAgIPPftEDcKGhVSdxolGXcTvCfVurpEYhvipFYxZwNOvrHyOmSpLMwSkurcVHEYYXdQjQBZtIrMhCSwYsyivcHSnemamOXIwDJFtcKQAQXNjUhZsXDkBNgIzOdqTRbNeixLBarxIVzgjTHrYxTXZDIqhYYgDtxwEdLhQxRXqvFKqDdJmfVJiZDtIfbOlRrHvEbyenONbtrHbYJZnwDgFZmNEgvCkLmzoFbwlfaOfiAtlYZBKcdXGpWSIYVUZnUrAMiectiduSobchGMPYxXrTYDuyCGsIUvYxVpBSVbPRYrDHgsaMOuyFDcFlYBkVduYMJRvAKVZMvvcmSWErVBSLveixgfsWUGCCWlamHeDAJsZrrpQOftaBeuAcylACqAYZFXKIvgGFFGgvLCdyvojCUfVMzGyMGaKJTalukadeKWdNtlpWDIoEyUWbFgBSYkKifyuYImwjRcorpGBqwpXysHwEBsatTDcunKOJiqbZtNeHLoOcFPINPeQuqxABfOYYbUTHUTXbATuWWSKqiBGrJcvsByFXVWcuYIUKgFPKuHSYGiOFrUxZKlgwhIfAUaClSWITELHBrnSAQIMbmhIVClkyWXBqFzFoRUHBLQWAqHLeSRMQzTOsbykuCdvwVTvdCTJxUHvwbsGGrhOAUqYcklHjhBufyomXiczURbBRleAKEPRDtPkBYXJVAtWOIJYjACnpppKEgMgxGhIAhRnYPgmBwGqPCFMjSqsOEYTPwLUgydePSXlHpzKgcKmLDGGGzReLROkJkyYNWYqAJHEwtvmuxYmCqllPfurRBjvIhmAGYPtVKfrDUWbLelWPTITIbnWSVMhNbaIYhuMvczkisoGRGmDNVjnOHjLJBEnlxsnBJOHNWuPFBqbuRALTUusUQAWfzFBBcMerGRXvHhJTVosKbnENhyczrvsJVfVwQbveKKaangnzVpFSLoIJdNuJkvpVFpmELNobuGcphGiDfjLifXxAGZNAuuTvhunkudGTIPCTmMwsmGbldOSKvtUQTqnoWkLHQKuPJnAKrVWOufgoqkPZsKTNWNfaujhbVKmhRYlcTddoZuHHhbEQHfpEdUinXDEkHOmOpQilnokyQHqGpgcpdoEoCMtLToqgbnnrckjlhEQIcLDrZQSCwAcBdnbddtpSbtiPwrgJErpPchTrqjPQNUwjBwYPLyluDFgqRUVeDpFkYuWEFZJjScSwzbOMjFMXgieTOFERCPMsnkBuxAAzLXFmwohsPMOyRGKhWwvUxDFJeWTNmkmJwchbtjahIuulGEEPqCWFoZabXbmeTVQZLySMOieUJqKTeHrrkAmNfvztmdYbgIdBMEoZBaYgYdHZuhRBwONEHeFRDmMPkzRVAGzngZNCKgfdAVKpIzfkKsMLzEFtXBNGxdjtHHmcQvjjKBbZGbFjWZzFTooTFIbleNJqTNCavPCcSmFrUZMDpHVNPOSnzeIupOtKMmhdnEIIpUxdSyLobDpQEbnFFROYfVNYKmRKjFoWyadSVCHKVtpTqsojFesTOmjhUaWkzHeHrLVprvLRQhiplRkqimFlwGNPycCQdWpqYXvWGsGpkEjcCvOXPgbYeUJOUuUTXshEsfnmfuQDRulNHghxzYIlWBlYxlnYTDewLakTHZjgFAuuMviSmYjUdGLQkMrCyrSMBaLFWvZvgmYagRSLJhGJFbGHCSliDpfbciULyqLUWROvHRKiTGLjxlRdofUuVYBkAZHNOvUUcqIgHZGPwnIrVEVYKZbiFBJxBPwDiEUzSbgrZIvhflklWnlwdGIqybDZeWPGVcbgxcfQbRnqmHYeLnhOuFnNcFAfgTQtGfeYYcEWUFdICRWkOLzeNtfBCWMkSMrqTlctdRiJCyGmqzZeCRgbEmOCnnNEmlLacMVjuTNrpnqxcrCWVAhxJjWalFcKXOmUiwcVIQtYqznugetGuTCTRyGivoXLOfrcebAJVzpFIJPjuWirXSEbLLElAQZvtUNGWnGCRsEZYAamKxOpPHnbqRfJebAXdrFYjtWNJTJWkvMiExQEsojpshpPjRbtmUSnaEyPnGkAYPvXLMkBGvhiqDkOtUTOTbEZdUFMlhDKuFYhqvtqKSVNqzsiDfTQjmnbJTZvtHNrnjIJUCQLtFOqNSvrgGPbIyWKGstHuFtOPMXBbdWeUtPYAzNVRBFTVYdinKAWjtjBaInQBTDTOFPjJlONvfcOeoAzzzjEIYQhsYhQDdrkRNBhYfblAasdintfDDhGIJuJYyHFSeDbBsazWirUOXzDhMtBaYunNFAtAbZniWMMWHFKqOtzpzrjLqqyukjEGUWLdGVjbnyBUbsGsZpFVjsQwZmlFjKHFKRyRnLHwrTClLcfDsQfZviAsOmOoInTssOSpxvUBbaQdyBocecDiolaKiuttJJoITphEDESSUnqjQEnuaxuEueVeFrcDWEFMrSRRBHhzhYOltOuzoSZcztWDaLxsBaDxtrmnwoawdisnCOtTpIwRQADOFsrEkWCnHLnHNkcBXzJkulaftbSMUlMmmzNVXMydnVXfhlSyyEgxAgaDMVxySisGBEWyZbJNyywcrepxCfokqWIFYJNDZxDGwTwvGHjdvFHxvhqoDsEtsVNRthzAyEeMMtVKFmJVlIgmPvhKHMwRJcdgOPZSQDnAtWCxPeIExrxYxGWCOrFJsKhCXpMDdHPQpSZbjnjybnxUipSJqLBdsiyTRSsddVeCRlkoFQfarKGejLwGYxCBjOrnAmCXVLruqvpCqeohOLSNnwFyyzPDxpsYWsMhiyahJJYVWghTdMecIvgGquVNXkzDKPCuXaoYGBpyjwiWfnCHqRoOBFbrSVaHwKtfLLtomrTsgqLNmSpfCMpUBFVAkvOmmydOrGbLCiNbnAMviBygCwJUKyfDADTCZnpiuFIbGhPiBKcBkocqIHFKQLjRXDoPbZhCBsnDcDktPEMfolHDhUMDOSLXfudiZMSnkVpxcoTaipDieCjHnvezWKzxBtZmfARZoFzLdZnFNhptclKEpGGezTBtVsaEbNNvtmwGcIbOlqcmuRVcdbVgoSxKPpuIKDQxtDpmmaOQiqCdUgAZSPRcNbRkENnXGEeLTnmADTHbynvudMUQNLIYLanWWsrxkoiDMFFIomkjWBancSilESxjygFakTwhluNlvYvxNUzdZyaMPAtsHTtqnRvZtbVRlcyWaFNhMyoyymaRPhixKRHmiYDdlNqDaVISvgzqiMFUTdyHWSQvIhkwNStZrYoYBZGDEwUjaDLxdgpQftpOwQjIJclNoalvymsraCncpFEovuGZzOPomoOLALjRpFuGPndQszJWBVPAMQIMwLnhkJRcAHsHETeLtyeuFBnqfqgThnDgMFgEHvsTHwxdVHXveyPoimwlpdbCBfIeSPhiZEZRqNURIICQElBbrFYhthuXOSCMlhyZrqjvstCUCCwwjhPnUcjJXMfAzaPXorMnEfgywNuesFREDqCxQLExGMwKxdsQmXGcxBdclFzMljoxrjaNQzrXhuqfyVQXSvcLKQhwLzoMxvGpdiPNQDIuQoVfuEODfOOluPYjqxaQBWifFFgOkLDLjnGRCiXmKcGhYOdGRoTjSkyQywftvZMPssanaZsbgmrOccSjBexNYsxKSEYkUkPxmVxOrvPGhsZIbaTxqPIGWdqNRtSkPUaAbvkekqbGZFRilUtzXQpHqqMxpEfvNnZtwPiTIWGCkcgXrRJeZHOfKwKKJylvMRfGPuCTxgRJPtxweavgWbkttTyplDorvsFlIhDPwAVhbzgQUAFZJVOkTetDUjTVAqrEihICvIvDcEdhXPmGCshawmpLYzAbTkgLBSWzHKYQNObtupVMAkVqdruAuFAJPfRsliFjSaVUKlBBYgVjiaNsybdkhAIBqtirvGMRvcFmwEMGGEETxoybamHpNVKTZmhnuQLpHxzTZxefoVyUMxbfggZBONTWQXiRfMcBxVIHDZgVbHnMcKIJpiTUtWcQKukDMvDrfTVfqFjRxOqpoaPrWzViBQgpPvLSoPxwdArxdnxvTaAyAPxWcjahEVONKDDYayAnHSlaIRNJXVYaMuKtiQfntiQPNoAsnnHqQhftVoLfSUoUjZdKlAHVQYPaPGksYZyhPfgGgDjKLTLWOVzgpUddHQEUHKyZQuQzaOPtaRQjqcldoPOgDROBLqWpAfdiCSimBCaWCWKkhPjUZfFbGUlnRlQaVcNlrMVLdtrpdveBXQBFHEPKkBBgxZAoudwgoUHRIxxZRIueNSzrPnUSrDTFMDpJZBmFtDnxtRlxeYJlayljXvtwTLWihahSIAYWvOhtBZNllMTjwWRFwCKxDbwAgUypkubPogViDkJoFsFFjKHRboXdxbaFFGxVouBVrvsfNEcNQpticiUTLIWNouoekgcAUKRNYBpBGfRsELzNcVgqvSbfOhKsNrUCFTMvnVsXpkrgErtpDKxzOEJdkmclqhFpsOhXcCpmcxheZAfQXIBKMOTXGAAyrPnKFNIWAEfFSpQdgvmiZvLSvcTSzKQXVFAvOBCSDwOIRYCnpWCrfKWWOsyLeGyrSRZtYXKCuyXRMVpHRgWFPcQRTYDkWOviGzYAPmTVgWpsChcVYerkLdcEKKoqgmkgngOofElaAmGoempzDgJVPIyPvYJIMGErRCfIYnyxWoYZZyvCjUJCJBdugDZuCJMjukZARforMpCTPEdTDIYISAWFqKRarGacahfevGJnZZttSVGfunVzcRAQefcARKrCNdKDysEUddymaKyjtkwoAWJFmAGCPnpreUcyxdmZEsyoRebfJjaSLemWqJzVmpOPyHavOVdFIfUqwSndpTUfJAfxauLhAlcCavoNrQGkdMgMwkjoddgqqXKgCcpFHjDEIkxbZYkLyKaXwWhqwtREQqlIlFKQYzdOVnOpsHjmkIxrpVlagYTeKZySjCJOAmiqHswbvscjladJUMboldvbpTAlnzcpfKqkYLNInEnfXYeHyOXHygqnFiVlMsRftGOpUVhKCpCvsuPTXoXyeVVTbPHvbMFSnCTtzltlafNZocfWyBntTDieZaBahapLzoXGBbObhoFzhTeEQCirvtRiFBqjihKKYaUQVIQxsVAsWyGxjlOROdIYxGcZoqjLzErKOlSnKeLNenJYlNnCwNKgvDyVashOpqpoRxqdcAcvsdtRkVLYXDquYrtvbNvdYfMbRnVBGhzwUYZUJnKFxnvOpWdeMLCCMpJPvYsiKVfvfhfMXIudVpykPgZvfQvMVMWQLzEbqxuGjgtORuroiHNtrhskNlxEkBRTFVjvQPxWrlbHtCQLZkyNfWfhzBgFjznPilQduyzlqtojmhkpcqFnpPNyvwVTTNrxxgUclbWvKdKZKkgrmpimVMlbNtkJAXUwdaFwmdErdaQdOnYMFZEzyYdWRXfUZtTEeKtbRyGyUleELEJOxPFHvucwzeUYftYOdWbPiKFbRHrLERnKbREeyqOJAmrQIrmeNXmCzSYoXfuqZbMLBamNwDFlyCEHgymnRdwNqWcaSLKHvoLcNaeWywdYlXMaBxcZdfISXrRIvdydVhqKvuCiFDqPmAnjTaSRBqcQfEWlWvqGIpVKIJOaUpfRUaTwowDtXvcJNLrZmXagubYNAeQUlxtaimnnZeJWzzmyswWcgWFPEqsaSCSwdhJBYuMzcaMeNGiTOICAlIEjeWzTpxvvTNhmjaGDFfJwvQZtQfEzONMBXdRYbIeJgoMpnNAFUWgAvwDWCegKhcgYpfGCsDhZmOajtlMsOsbEwqlRVHrPYDDcMQflRzxXFUrJeFunNwrBqWCvoIHGtugcEgMXntMPYZYcNmuzWSPmRcXobnwcqOWLtLaddfvpEWrQOmEpheCOiFqksSktwvcMkaPqrSlHOWjHkghfLhSdfhtXfoOVWlWvoOfvOdZSdOzfJYFIeQLxZTQaTjVsgGRChnderMrtVPwClHegnUpmaEFRKMJemgAvEUMgucWOLelkGrSqZRsnngSatWweayVlgwGaGUBHQknUMAAWIQCpfisZkypebOjgdgxgzgJBARaaTjnFDGhwPVYPkviXQZPSMtRgRUYjOuqQsVTtjSGPdDWspVrtyEXNXPuytHUVsPkYlJTKaphfHVyDgyaJJFXgfXEFoxKkqKiDLeQgmhwzUuypzHDihrUjAiFxFQbRTdIuWqyknQQtDfBwcFsGQbLypuoUPKPWtVFKAThqaRZlznYYesXlsXCZKxeYDIteuzKGcUOUAMrkxvPtdIZgBYNUtIoeuHDHSoeVKssgTfpZkytddiYbeBBYFsafipESItDBegldUreVSNbzLlumIWKUkMcTXCxYInLsbMLIypFFmIBHhlRxgGbkDEWPSRsvcBOJINrSwqXteymwvtPvTPkxVUhWKmjCEiOEyYKGiagktwiMrgeDuLwcWHhpZMgGWPWDaoNTkUzBXBlnOuFOaWXCksoylXEMWnpSvoDNbFutMsgoPRnaqZctPhUXdsOdgbmwWigFnhkxNXRXTIlUWFXTGuZpecukHioVwwadjINbGeCIWmWPFMQLfPiMgICJBzdYmjAyzAvlheouvdajWyAufwzYLIvmHPTkNfriMXleGRNHgCcjyLXeJTsQStGOASMmlZWSlEsjxgLulDBNXuzgCYXTRhUANBfsMAwTCMihxkwCNpwyyrMybqLtSbJCEXoiwiWLamfgdZRgJFLBySGHtYiKMQHuupSbRqDPvfZRDACptpIPVCgFGYynFMFYebmjZBWDivgiXentKELLDJTHeAuJIKwqmeidOcJunvQbLKVbsghJGVSOrDqifSiuLSCetWtOijHjPNukhVoectEfJiwgVyCrRBAdtZJkhNojAneOQdmDNEEfqNppaRjIiJdYgREfjOaHDfNZviornBKJDGeOMQRkPTbFWufJjXrnbWzSXvZfDKMjSsuwkhKnteaeCgKsLLSiFnXcOxzomiUKVVgAHTysMtdVVjffXXbIDYSRUlqRnTspXREILPTIKCnngyEnlonPkHiONyTvUPwloAWwQjUqzlTVYbAEOwpFYRWTKeSpChBPTjcCBgERBQrNDFcxkHuVLjsbFuGjhqWdOFYPIMQUbUGqIkdNDstDxvBPXcyLTNAMItOhFoeiQttYuguByzIEbRFwbixOWyWLlOUCPizbosZAgavNbywcVMDkHFuchZKqPzZEPwoNIUlZqRlkxCtkSECuiIrXiibLCancUEcvNppkpsmtaWRhLURylWIMACUSZalMIVbxvDXMJZeNFbRncILkbtHtOloJWmvhgziHzDQzOGCaEKkXbCEylGCSAhbdezusOPZUgRaSjyFshksMkxrEZyrHoQZrbzWuoCfDdYKUElvoLteTLvAjPAsbjduPVFPdxdWbQfbBVtXTBmWFKObStjurXpwBjNkIFDtySZPGnyPcYJxqohokJlZlNBbezvkzYJWmoivZmpPvMQwgWZsKYOwCoCmqiZGpMqETpEwEFBBBrtZaaEsKwURQuynPIUPWhaDsWLKNobYWRtYrcqlLYSIrWwzaAEoUsGdVYXfTthwFfzxXxQfsBpvyudIWnjmYfLWdDijARexflllloOOKKOrYprfJiOJoCyzKkRsYwoifmIdQqRFyJLNVbgzthlyzHFmeEOfLEfcLGQySnLBbZoGrbMEZLYKzwxuOpMAsYMlTVGwxfvYvfdBCOHqPqTwojSFxmfObItbnpRllTlykLYhypfZUqgOiGiJvKNhpkjaQBAgrEoZUEWeSIcPYLkJjZOFljpjTSgEWITkEuCUcffNKvBxeqTgzNnpHuXuNUqVowGNYoCISWUURoCQLtIuoQYAxRNhKlvYVxzsvVAmViOXKRBJOqzcqVWEhUKFbdrQuyZPCLEBNPEBaLHbmrtYWNSGljKqxriKqcwPoOIQxRwPSGGRALlDnSisOZrTmXUwXkkUOkHveKjNRtvNhbvagHonFYiBdWFuTxTWwjlcDwjzOfDraxwUJBMuQdJlUWElokASzGwttxLRjCfAQwvBWSpZgrDwYKHBnfonbDMAxtMODhOVGGJfApFhgFgWhIuGdiZyoTBDnWBSqdmXWiqEZsmnoZrQjORUcStXXsiZPekYxzWykMrWKfcwbSiMMmvmkDTMEUHaAqrkMeGfBBebeICAAxdaRYGHxlbyflvZHKcxUzALbECrIDviYeREFKToExKrHhHbabyZUUEbivneAZmIXLwTmcDasKxGRyzHuopJkvDsYmooPbuqOshGsWafEDJtbcddPMXuPrNZmVkjdMcfYivlmRjePbSAgwCnZZKeAeXmRIpbCuuQoHRtdWWWjeFyNothKzdLMHQZlHcdnkbHMlfBtosAOrCxduEkJLLBFqlwehEBEUDlKAAwmDKCUpueudyQKcMVNyjLukCGBTFvxXWbfIVEBQHXkNwfhDhcuZVPIJEpimlqwXybLNVDrtSRSlpGNPpzDrmFMzAqMZYkXiUbGQsnmpXtTtaGCHdxpACKxNgdSudZEorIGhWbKcvkqaSirPXCNlcaqTyfHYokYTvLMhCJqiYVbqsmjTMTwhwqprupAhUovUCCGmXxuRIciHeDQSwfUJrgPmTNwaaNRoRtZmYhlZpUuLHinLjgEdSdnadvnjZlWepOvqrSfQMKiRJKJMaNJIzeySlkZSNsGuDJMzHOXzOfJKkxrIHtqOCymvWIctTVyfufIVLwLuSMynmAwcBUKpCGesIZVbNKRinLzsFtYRMXOhIvlzGPPEmsRaudowKqYeesUdIVZBvFIkoeGAhzBZfRBabnwdUSIIvfdxcpKvEchwcpwVVNcWQWmgAkJIHnObvfefYyezsDTjLbOLoniCMWCaeQkkQnxjECFVZdxgiCbQhpBDuiqqlbCHPyECZIlRiXQBjatvztYSKyNusszDyNuRuVxUJTrLlhYSlkdRAWeJJkpNyjHhVJMGFfEmmTcsmWpzhJlXfngArPffGydIMCYpWsatXumBZxblkRarFXvhqkHLlkYgZzcFwmwieLWKnNsLliRYYuIuKxzpfwZKtDTpRpUwsVacqJgDCuFJnvHUZjoMVoEBFtlZSUziVzbgVtRfngtYITgxcgyCvUzrOorezTnghLZZiRamTpGtvYAQFlJuXPNjFKRoceyBkjEfrbGACmEdguBDuZGMbjZmobPQGUCKsPDvkXRhYQpsXqGAkmcnYQGuobFeFIoQwvGEgvBQvPrpNwAhetVyKYQGgGUCXlACLaGAcOMNZTAPIoUxwBokKtDgUWEzSGIVsXLHuDkcfLJWWXQtiIPABQrrweouobeppGTnJIwZpCxjjhDKJKsJIlLOBGdoEbmOtZXixwoRJMhJjwoCQPyFjTlnPhnGbRwvHbwhZQVOppxPmBySkSigMdHcuxPOYLhtQShAgoJuCbqSZScvogmvXLSiPmYsrPyFPumPTnriThNJhztotoHSPVxUoIIKuuerwKVePMuvJnayRVddHiHVelGLEZZruEQqxSPahFMpmImwfoiDvTupeYDuvSmxqIFXpeionIAYSVGnanoTuhbEFGqqlkAobZsLNlMNtQDXeEGRUeKHkTYemHWhsfebHQpPbmylXKXJLrIlSkLwPiQjbxjEVvqTDYPyvlohVfgQqaKQFVXUYpJostTQmADucSGQisIYgeVVNSHDoBQgDKypyODhygNrFHsdciAXbrBNFrDFIdyNioVEtlDXfUuKDavLDkNlaIMwcnqzPpyHUEpGvcBTxmgfDkYwbaIEByaPFKVERcTRopzDnWHABPsGSimCCiCqByidQkOvYSmOstnlavWCTAEylsmgJbbcKgEgeftgfeDSmtJjdlFGQTSzKAOmxWodoClvslPgZwXIJeaFebmnFRjfqNGgvuQkTrHhkIeaRWuibmcKjtuGHLivZpYzBeSgIoLMDdJOBwYWETMevqrRPGQeifTdOqBYSzBwBTZdCpzxbAblKtWdoncZrWmszIYesSZDKErgCFfUYUknHsCrdpjIPaJcCyVzkiTpKZqfhSVHYWmtLFdAoKzsMGabCSnzyCHPKGTHnTMEZiTSWGeyHXMephlLKiDgbyCmjYuaWWLfayWGPxlSgulaDGxgndUBuvVIcEfjCsxogHCdYwfPXqnRBDJAHLysZnZvkudwPbFqTcuEdzmCmxgBlMwNcMqNrFxaBCMkyaBeurUSDDRqumfLgNPWrrrCxzXjpNqFsGrBKmVjQjuENRdYjVpiOFKShgNwlmBBSLOGdAjNMnTJBAiOmSTdojpDkzYxNJpcJlxdgRyOsPNkGIXTAXHvSEmmKaahyCUFgWqGPsMAALaHKdHRipqofuFiaxDhXMPpdYpqsOtvLsXJVgnnpgZmnFFPBsWLgbhuRcdgmjQIqTruTbdOjekSLdFwcTGCCNdxCqJYGOPslfmTlxkGVQCNdfLPrOIfruWjXQswHfPynpeIuNIVSRtcLVXikkXxgVSUkCJbZiifARmfQDSAUijUwwBHUVDcodgYINHsFvLNHNZLRLrpJKyjeaymdaPVVYZTesFTnGJrDdOnteYSGnTRlDbHNndveyiEGLjVUwzRcpSlKSwtoMCLufOsWTzlBULiHipmRvHCHAOEDDtGAoMqlNSuhKDSMwvAMLLyobABkOZIaHmwymvKLrsHGJXNYtiQEDZfqPYwAJcmBAljDFfdghNuZZgGFkkoCDgiYtiuUhXHXLWMBIfUqdwocxoDWchuTtlOCBmjuhSJrsAKHZIcxNkgHTpnmNtgbuXLRpptTAvkRcFthsPqHPcrxgaEDrvJXrivcTmuBrUiFJbOFZFsONVPrIMHtgnAWrLrpMUMLtfsrvdkPKaSOFwNGaQTKOBRlXlWsbYnoBWRiwYbsawSYnaUOySiETWxkyecPcWUfuEgbDGganoQiCSGfAViEoBBpCxxjAcqSGDIsjGKVFvZLYbbVxdawEoKGzYrjmuSdcaGgfOuvAnLOzxXiskgoFyPVRVDsLoKJsLxgCrLVLfVBfUQVKiuTkCwMrNJZBueQtiYAXaONKRZmuhnMnbFIFJgddvGgzrTHHmUgWmQIjkQTJNZtWLTMTSNcyXlePYmXqOsbhPLAEsSQbKGUuPEoBmGXmkdCGXtncwvDOuwkwhqncdklVNrdApvrRcZeTcpcScTLmvypWLpeWcnkotOpvnZYnPnPqSjuEUTBPIQHTaoHjJQLjSNCCdBHKwrqVzTiboWmXmLMKyqjutoHtxwZfBqSQMptByvoaSRJeGysCQBZaiOngVUTohhmmwdiwNwcBceadkmdKrmYmcucEvyylGdmakPJhKLiKUxZbCvFSSGKxiclroBUvcRpSfYhlVSHsipFfmLtLMmTYwvIjnwhDGRmXmJwveWUfcObbsidkGaUajeHVywZPsSUWbQmeGFTdzAWWsmdqtRiIMtERSKLhLBRQuxdxgvqjSfPlgDTxkPpaowRcrjbsHOUeJVMluyPFXBnuotHhOROdPCjCwAFpWAFSgjUHqrlTDXBybAgvVqEdjxtjUUVRJBXaMgkElxjNardfAraByCvoaEyeJOWitdDFtjqJvFqYBdbkqRayvIPuGzgODRjikOHeEJlFfjwmuaPZGQpslBaCNBqbzShtIHkqbSUOXKVxJjpzIhbKTbENhCAwpliIBHbrxSDkNCuxAJFaGLWMgIhAmWnAfPwFDNkuTJYjpLUdexhYrTliEoHRxiRAnumhxOkczhFhNciaTMLivErVwXJkmAJlYxAXanylTeHQzRToDrJLjwZgLchRcQODESjIiSrlCDIgOhlXhconiKOjHHtqYKZXCDJtIWUNMgIfOyWGpHZHZBVHbhjxctxQOsupGCLPFOAiULnygjoOzNSqUHMBkzlKOvpYZsmBRWqiRmIhUddufwuVANUEoGOGvQFLVLPLBDJTgODMiecPsDKxTIrODdtHQGlDlgtsjIYIpfSKhXGPkHXBCisHKcLprmKMnSivtymcUKhmcqBkdJTIPMzkhgeKRcfdZeonvhnMTjmFiBqZZCehJOrdnajBdldQaFumJWoqVXhkgxzSjaRHvWmSaYMZRCesJXNHTpCXvWxKKWWJboMvLfnJCbJuPMATCxfSNzvsVFJWRiqmZZXoTvHQiciYWHRFQjCEeecKAWFdqjPdzxWMxqFQGEimhAuBkWJLXIXdRUSKNdzgGBCxKnggqCXfBFoMwcbvCFvteCnlRRuyLmCMFccpmaYOElLQdOOJriHsOSLDnmpvbemMgtYrvxdYcDzEuIjemYegbvKCPQIJwVLsSJNGyNYHTwGhKAxvOlQIMOGihZMhnclUZtepxkbWkYoMIMuqYMqErSnDCffyZdhZnCwughwewkylOhJBhhUXGwsrJUfiPUQyMzdKuGNuBejjGVfVHVnguXSruBHcjGfdPEymmZfKMXoaRzqIDAiZDcShsceAMiCLOpJSYakpRFaGBjPiuDPTcQqffnkFyKybTZwqwJvMvzGzMihTPSOjtiLbgkFCGCMIfzfVnTGflSqQegXHKliHPhfGPwPLlpsFwslaeUzIJcbaKUHjDBslKVtjcNfZJUAlMjxBFkaSqTxaYHfCnHUvyemBHpWZvmLvGkMxtNEYNGVNdOGVbNQxYtKXpHZacnfdkIYlOoElvKokmpJqknxCxTvRqDHNdSflkRUJJCLquiDinvJSAaKADouBTnsbCUThBHOEAVipFzEeCoZnvRcINgxkpgqsQEIOKrGgsoRgcGnxvJYoCpOSbkooTdkkEbpRpAZNeoABVpsJtTkEBaxHfQAmIgnyvKpuQVHGgyrlWxOodmAOyJzxyindcadpOpSSHEWHGzEGgtPJeuELcFjLKIlRDkGKreMDmssSvbDxSKJTeQGPwsmjHHlEqAnbsiiKndKPeuPcrdCwLUabCUBTMFgxbMWeDJZEzJnjwWflErJDydELqDdMhASPynlTpjMZCBsxeOdJoIyFVDsvoOeNuCkYzoGayXUONOLUQlZAzBqINdLpYFCspCVKBQffvxeHXBtLclruGPvRYTXTbZMlMGIfMCvYHdTgGpUQBBLwuIKvHGjlUIJcIInKygFvvmuYPVIWzDrmPyWwShIiMwQAaWmHEMzQFpJyufwyABlLPuSAXNXuSprCqhiayNmhNtddBRzpfhfMouMjmRCuGUeCZAgjPKVymwgElQfnNEhwLRjvcNXPbwdAYMwJoWlwsjqkqyuPmDwPowGJdfCXDoiOvqKKKDbkYFAigMAzAAFMWavVTTYHaarOzMEonCDyerURWzWcRwCoWWwdJCERWwuHmbBDxeEFDfKHMsFERaDGNNXRIejmHqegBGyYbfymkFiIniiFjBVcNkVQIsrukTaJwcejqAbrjVAMdyKvukDMLoUOpdUpXCpYUDCEoolJeyMXNdRcnmOmvnqvXAWAgSUIhlhUbOltQFjYtptQRLqewsUCmQdPglOIPFZEedJOOHZPeIQnBCTADEItnNEAuHIGOYbJZeUrVBAVsZizLttZJQxAXeSnnrPxDJTKBSlaAWQAWYXtXVlgNwvsQVIcjLgAGeMpKolWUdwttjBXobGWSUoXqXHEZBHgBPJAkMnmfYczBuJCkiYkuqkwoAHbbMxZqSJNWHlkQZPHrFCDdyvkGtdZrxBwyZrnoNrMTNQvLJdvbZjrKPGpjrGNnbhMoQihqhxsRIUHketIHVlWuoWjQQCXMEPWEiftzHsgWIlOCEQYyiFgGrADFezCjDLTRabBFuTqZtzyHEjBHsyodOkGNHusEtjNajisBuedZgLMxxeDAuzSkFUAIpTbBIDanKuoOTZqacckSljQDPTbAEFMQLMkotbEHWowAqkmivfHVPnJxmJVgNsLiUnWbXlaQHspdVbdPPZXQPHSbrdQHRHlSIXiYkROnHogqdlluUKkSmgezgxErCfoLWupXLtJrBNSJnGyEmvqmIKKHevaVDIpHxZyRdqWFTnmXoFvlTZfmssdnoIuRrSztdzlbAQpOPRWSXJXdhaGwLNPiBkHqryjExUwrfNZyAeuExbvbdUaxqrQjWRiqAVyUNlfWkjrAfvFAQzAymkbkZiUvWJAPFlYuWqdppLqNxXMpnLnNrigOtZfvyAsKBxhdXjYryRuCPmhPskoPATtcBIuNaTVHRqjUErWYKCmQFVHJyhStnaOsxTjqhCKLbZaTUYtPjJxsssJXTEziYDVbJVPsxWhIRYqYmSmGOcCDOGpYqqOFWudcRMgNvrRAiXxpcivcDZMWedqpCwKVOumnZBWwQbTCygJiixnUUjsgsBviIcNdOCNFNFsBUOwkfoNoERiIGSVSvJlaJUYUEiWWGwSQtpeTVHNUNUcxXKGLYqWSlgKgUDtJaNmgSBXkEslfioLybKlHZwlDzimrEApgzsCKmrGXoUsyREtGpSPOTbTiFuzzXgpjfBMdnGrKtFjGqDsOVxkFzTsNQsniXcHvfESkWxxAPOrAnMNzsmTzpRxySoPdaLQpaOeRLtHEcoeLQLIaGHovWYFXQrwFvdjcQeQNoCwWcsrPcLOcoHJSAJJpvaHIBiRTBnVslUtdyRFeEbQmSiDqEcWigpnOelSRWSXOAkLJYwMdIZydfSynyTMnttfASznkzJBVtAOFoJkxseAKaPHSUpJXghiGMKgMqUkWPMJQCtvSkfSRLZvKGCyzSsQKVEWeTVImVzjyNqeBKSPdBjbgCkBVwojFSQyMGqEXxwXzVhAQAycyZMJJEzphBpnGRAwjSOyqMimqmknuzXbnJyqcdLcaGnfyYhpnswSSJJKAPwAkLvghintgeIzgeQpowwoyDPOCmZmEtJziJYxwNbKmmaRTKXbTLXUeDLLRKloisGEpxPiDBCHHGBIjhfykZzjsMZYbNAnvJcRbQHbPNrpSsZlZWvHWiOKfBrTOGRPECxpIRTPOitNLsnJTykhJtNZOLQpeFIakhrNLDlTsCoMbqjPoZXaMdZVtNWlwJfBmzIuBGONfhLZkhHGeFJtYlofSyeJbXxhvegLQyQzYIlVzgCPncilvKyHKHJFQTdFbmBTXIXtuBhAQuDTTIVMTaWQPetrpLuLAvRxOroEIsPSrcQlBynEEWayZrTUtbisrWikfXAKHnsjUTJaaczmJMVdLhpcFsGfZTMAEHwztRXVjFFyvFenkHnwVCWJGydQzNgCvrayKdezwpUugOQtulXqVzmgresooSuojjplmBonelqhuTxQFPsFmqhaBHarfHZiiSjnhPkQDdJuKQZZzviPPbetuSXUnYsSPmZjKObWMpQnOIpSAvcFigrcmVZtZXrnHATWzVkKxqrMTnpaoBhOJIabtvBIXDJVyLXkxuCcabcOsQxShZfJdcmcGQnrXOtWPyZvQGxtXIWuWlAMgqcCxlnMhbWMkBzSvEbsUjONSqNVkaBvlnfHuxJlGdtQpMPnfqeocEJpDcVjKEFLUBlkSmVSUmnmBJrNyeRKAnJGVznrYPMvKNNzVNEMcHRGcUDndxqIWefhyhPaJohfaTfJDWoeGlCmxFgKcUPqZdzyDwCUxKtjfRnqmorlNCMYogzSEuavskXkhjFozapQuyrGVLEYtPTdssXUjfCXgVxqkRDAEFmqMXvdYYRpQStCifsTxVcMmdmpuKRNlXJIEyJHYprOyfdHytopUsRaIcxnBxNbIQQVKqVDuEhLbONqwbzMjDMzBJSEKZxtEVxywPefKbfCjJlgANXCWJPpQYKcwmCeJmhuCcCdwekNBFbsSAnWyDKOYyXdAlhlGCJDQQnACFGwuTsYpUUHlQLkXHSUfMGgoQAbdxVHRSOfkxRLEKelLkxoszQcCdSqccdSWwfBYNJAEXYcAEhWhDLmZPpmEDGSdwsBVGaOzzNyZZNENHtqFczsAGkhpAGAfYTKlOFHGjWKHSpwmFRukJuFYYWWjvRicsuTogizHMtRSxGKkIymTinXTXzegBaztOXoAwPIiDKCadbfWJtNFrjVkcSjiThIXXagtgbkDPxMuqciKpvifwsHwXTeSbgKQYTzLIayeIDeQvipENCLZVBuqetptwKhjolKKkPbOfgRuiVwPOSQIcEbCgnVVbsHyAZQXjQYqFqRPUbGMTcWBwDuHnFbfzWvsrrRqjPorKdJwaNRNqytUmytHysdGptajkkMFcrzRSqjzqFmgqlEuSYePgUQPoOgkHQhuvcxmLvYcRmnRSeBAijBCKTNOgYCzAYrIBXHmdvPeNeSGbpHKbGEtFqjzvswFOaZEDFYoJwMfXaCDbjANjQQOJqfNAiwmLnMZoccRBqrjPgJsoknKUKmHjuJEuRQsmzJbdgqHNmdgGPMaQBagiErAqGLXMacqinFvtpHEYxIvEmKXBfIYaaExjKQFsWBHyLfvvAiPALuhUHIletQQElmxSFcPexRGeRrDoVmByNhwfFAgCQQyqKtjRNsxdlzMEKwCXBaipcfUcchRbKIGVonZospWwgDMDgGlmXLieyUPcMpcnzwOCVHJkkfEWxeZTIRSGQlQzxtbkgEHoswdGUPhhoDjNQJTfOiwMTOlVwJojCULdIcKjPlzdOdJTkkYGjSsFFBLOnGwNGIafkznNNEZLQpXLOCObsujDnAQbhXAmXOWkvwNafSHYYeMcQRFDBWjZsjcGBtpAnoDUtmUESDagbaUoeCqKEDSpMSAVrUsImPRiRSCIESrkACDievtPfINBVwZPtbTcbmXwBOAZEwOEgGEaRObUpKmOtFgpDbePBfcVjuetkMhLNYYJfzLdyiKOOlbQwIbpDIABITtLuvoYBKZWdRwBxzDUZzTxcRILNBqwNTVGGgAOHtamwcKENMXfhJaCtTyZCbOFCRrqidFwktlAbrRptkfvjHRNchtypCotfedXXPkOpOdyrwUgaWtAbrGafcOTqJKqjPboSwTgOoSDOpqrTyWqYnWanjrhWlZAGFfrOWkkEHAHbkoJyYEJOFTyBrfzWzExxildXSllhaqvlkaSUSWUgMnOFVmNTGqvMvnzDBiQrtAAUywabYgfsiSkhFYtVIbWqhSGypiotyWOLOSeBodjlcTHvECCydwbSMhbGLPqGHxUIUeWLsVWDDGwqckQbulrsGpqivRaXyAgPjknIqesXRONnPeYWOnoWMfeVjNwnyjKLxPwpubAKjCvvkiIhCkilMLqqUXYNqoZxpNIdYeVMQuUOfWZbfaLcIRPpCXCDqhgrkyELpkcuPXmtaRHZlAfoabjpIffevIiHGCasODmevqrNnpYfKEjBgUKjoIYtLAGSdLBkNoNakhQgnOCtPczywMocclrhkIHcGbXAuklEyRZyPHFOxfcjxuIUVuggLZwUYXdgQAielQaXzysJKFAkVgVNwgiykiMMcANCulUuknTSFFFgEEJmLNdhVOFWNvYCDeVJmykWfjBMxacRSDckaFDdAxQVmvvrCYLHcaibKzHKUqcQyqhWlOsrSvmhTdMfiTLosRgLIJqLSAbLcwvvcxfPMjtgfGbcKBsfODIYkDItAWaaacGAOFIbnlNaqmOpeODwFvZYaknfkpQxUDuVoOSeHfITGgRWIeRHHWRGoiBjOoKZXlTDxIuuHdkeOyGeeWleLoTosWxzjyvHIVfSehoacaGzevQBfwHqrCIpjlFbIEWuhsbtLgvVyvnqtZVkyNymYqmUtsPFBgPvKknbLZupWBXgxCNpnfzhIHfTlvlGuwIrufOempfPBlvtulwbCYrDYnjblYClAfZKbrLfBITeLjFKgOZzCtfoGMucOAtJpZaSwHfTjAdmzKtlYlxuLPTzziPWFdYkjgnNGiOJzyXfBGeBrKhQjMzTjViZumsJITcEkCajGLVnfhrcWFUMvuPcywvxKVEQHDHMFuAfEDdMeckXCqdkjPBTOQWnWDheZHkLZirgfEyOhtbmkolVBFygespiRMNWsBQvKwFJvZMJooWRPfzmDBOmbKBfotlacbVyCadYhiNMYdVENaDgbBTrweeGFEZeQAywTfFgYDPORADSkYzIoTllvIVjFOuqHWQPucsUFkaSsAkSSCTzcdwUgzEbXpWOUrumTygPTCKeQRIIzBgOYRiifTSXqlblPcBSamTAyeKJNhGWPkxaxeDtwyGrNVWapzOGgmgtzByMBOyHjXaOJikxEcNFrwivgjpFBwBORJuzsgdbpZyrjFtocywBmiETPzZrHtQFQYfMMJhCWqkhlxyFntLWYjLJwhMTCaBratAklZgAJppkbkxCMbYnbIshNlNFuQfenkqEParkUdqfpweTLlELzsNHwdMWzGDWMiqQPydgfBrvNbHDabZqXVhXztoQoPeJTKORxfbnAxNKNXrtvVaXewUTjbNdsrNCyJdfrghGBFMvBAtEFKyitVkpJHVamTfuLMIlpEvdDIqZszsAHoeHAjylJiASkNIVnIDhQwGMQmARliejwpeSWSqFYDZXxakfnHSYkNvgKXzkNRydaKXeGnYSKiMrvyRZlFJUoSxUaNidlhMkjNUuPZCpFhUHVRLXbchWtxSMSFnxlvbusYvxNdTFZaYBMFFMUXapfXuPDFRnwchKHeobWkmDeREOIxBTqkwGllFEzamtmfIiBzKIFcAuEVlKXmOEDsqLsNTvapoVfSuzdZILjdZEMzEAmAsVtGSDFKiebAruFoDrfBwuSsPCQzLYJcCEbBWlHoDsrSleLlmCeYZmrapbdEpUXfCBlvgkKcGmlBuaaBygxdmqbzvsaOAZzqyEwURCtlWEMoNXQsrpiOAeXIXqCHroZLuRHaXvdYpSkKXdgeFWAOMkJbuUlIxkknMeeDtUUGJqgrmuyzDDYVRDnVqMjyhyEZwPDVjquRhVtnLYuzzEaFQNtqMmpEVUzxVzdVvDvQeelIyPGecAWyMkCyVZfnRQyGeZMCBVYUNSLwhGWqClfUTvIpgJGODfAryihsLuNjaohljMJcZhZzPrTuhPyvaOABaMTgCdidGHkRuHPJsNCoKzRlIesVtyKGFNlwjzvSjDvtVfRqZynJPAQYlAYLzkZPTyeSdcoyeSNqyXdktXHXnrsPUnjCGcjhEWXTAMsXpBQGSsymZibQuqLKwOZNGZQNmodEIbmWjfHGwYwFVteHtMQOIYMPXbQkfChOCfcnheGYkTPhaKSLODhkiqxvtboTuOwlOorwbRGvsCjltmbYhCanGgjgBhjEQCmOZMjqBYQWDlQEHrzLgkptzaZCzUVttKttSolhijoGrFKBFslCmwaoesvCYnHAfAymzbaOcaQFBCrwWVkJHxAsUOBPapBJhwbIvMStjivIVachKfOfvUnnPFcNfWDqaHnhsCoQzAbvikJcEKSiEHfwhYykwnHakBsLqcQMfYYQXwBYZayIjPAgmWdBHxzKtCNVNuNbAgGNcVLItHmKjcqaURWQoumYLxwBOIcZjQzOluivVZIWPjmJYzTZsJqavZHNWRWVfQzmKcNnJbkICfIaVsoKYuTQrhihjKCXjZKNxSoBiYjpGbNHsPxpbONsurNQWtCaJmOdAQsoJOZsFJoWUqRqFhQjfJWKppDlbkKSFOazMuuiZPgBdvbbPNyRrLArpDjYQMMwWAbZLYXpULepUbCwJoKFQbMXsIKsZuTMSqTAwdRiEwwWJsqvTHZEafuTFcgKKLkGvFCbcmuPhUksUgXIhTJlLlDXecGsOPKLndnRwEpVvYEMZlIBirDqXFdjfuLiFmitvTTnxrFIxnBwQxMMokXAcakahYvZkIhhZHAwIQyuMqYuKUEIpANxvqLervtLscgaBBvmWuuXMTxBQHxcHdncfSzuISaMjovgRzheLbogarPaXgAmKZkKnJkfYmqWPQiDZBKuLlAYSeixPZVdphZKgvsVcBHRduwKGNCMBrzTbarCuOXCZEbsokwUdoAHeSeIxtuygsvmZQevfCjNYqHXnLUYzAopCjIQAolSotfyhUdaEymBnywRRvlDamZWSlUHRyHGPstYCctrciMjjaeWyYRVxXikxIdWaVPmoqQazzbvyhTwteaLQstcpQxvcgKfDTvgceMKmZPIujYzuxOjdvBunRVyTUIkyzgXtoMidZPlmBMLUuAoeUusZrBnOvaPPmPXzsDYPZheiIafILiENyTLutEoXACibaqASYbxxPeBsepuWiYKEYZFuBlbjduRRjXkiYDKdAsyibgVfVAhRAoYCMdRCClzcYNazFPVAgzQIclYyrmIOTcBxJqrNSXcdxUQfAaNmSrttYCBpfquGOktEtJEfrBhLjGsZpuPhcXFJRpWHKdyvjpncvfucfaOpwiVxrPJOJJSwnxBPXWloVCFynNzKSYXSfFEQrOgqvecWBbkJPshkXWgWDuiiXbVbhZmmBpOwLXdLaHXolLSKuPvWNirLRWvHRiSZuYpDQvXroKOkwYobEjJlwppYNOSzHcpwikMYdFclHWeVbGOdTVyMHPYJUJsohbJriKpODIsOJUSOgefWDJHuWPvFAnoqXmhXbUdnYCSQpfNzvYkqZaNRXRdaLXaYoSiKIQIUVuIEQtPTABuHfnAjyiLvQDewFPXwDXEEMivvrCFmAIPkHoHsenrLelMLsYoMrLyIOmjSpuPuEHqfAQqmPrtSkbpAHKBLOYcYFyTRMDZGcsRBhukbykXuCfijiAajfzAMgSaYvKtJrqebPfmIkMNPenBfNgQoZdIPesjMJWrtkdrvCHSmmvMnUqLSQceyQghYgQFtEJaBAYnOOcyPtSlmoKqateUvnDzLOUmcmQOmJPalNmivZLstpiIRfiXJUuROgjhvATzwEXONjHbnYZGnquLMLtwMcHnlKRrVQsdfqHKJVMCiECORItAsOKcjWhksmZNISBJrBBfxGVhxiQlsvPmBTbtMJRpVwVmqOfWfttVigKssiypVNsVBKMWkncheedQMAkOuewlybwLFHTgOUxaLHMZUhwGMgKUrZLmAmWctqRfTAhARBdKlZfuCtIiLDRPnCflvxExgNVKPdpEhTqRNdPZaJQZMqxbManrdGHLQPKoogMYNXsZIQAjhntfXEAneiCRnJzAfryQVceTzwLfngNqRxvPFECYtHqbflXxxQwjjHtJIBsqWGCIRCyHURloGolNcknjmEYvDvYvnyHytbrNZQDOyLZxBDpZfFmOBHGQwsIgCXXdHVnEZbQXIFNDUkBCPNgoEHmZsGAxzBZefdiKNoOXUnywagdfxsKZUIsEZUFdBVjxZQLTPUvkLnvnTPrrMIOJtDfYuiNTUzdaHCEtylhnPJWNZaYKfDmOZOMxHMxLsyJmIaQPHikzzNBOOezUlOBCOWVdjVGJIJyNwjPAeeUPkgyWAVhQueLnanuYMzpxAcpkgxfKXCAKnCrcIFmydcNMEYMluzRQmEnSgSWNRlrrQuKqbKlTtROglJrByatwTZBkgFWsocYyjgVHhujxAJHtXSgzRTtBildhaJLVKbLrcwTJsOQNJuJClCMoyqSQbFbotTdGNPGOvEoDQQEykCxJrXiXVVBaRsFrzdBdeMVasqHENuJabsFolrbPNeQfhNCEBigXulkxevKzLEVyHhXAPOlMDxEJYjHCZTrjuTsNnjuCYhvmmGCynZHrMKpEbRtIHgcvSphZRoDIvgdwrFAxwANSEMbenasQFnhhwdldrqObXapAExjniiKYUjWYrGbSRdRilgshXwQiyGYqKygBCJvyHKKZAkfVUkxDoXaYelURZAKIHmieeuLlTZpucZBtTmWcNqBxMxujEFrAtYMPByZSLLnRFqkZcpALSrktQQeeYVeRNbhwZpPObgbIKAvuzlOxlFOweKeqyuCYXqcIDRiCePRhTAhTndDIvHsdMlpZrISpjPHwCVosBeRRgnWrcTJLasKreajPLKaiUTFxAkYTonPBjzjMOleYnRxqtEPxpcFNtCjAOSuBSEPBJMsMShYRjdsHgwtGNzLMacyVVspSejSQiBfZTtGNOyMjjisxqgvIIdifylONBJMrwXMBzcawfZsEHAFkgQruKNCGEEhUVydCrNKWpztbOkPlMbBpWOGrvZWCKnnXNOJyzWllYcLhVOGiiegZqnhUZCjIIyDCswScEIbtAgJGHBeshQJJwCDquALMeCbLZsAnYjvcwxndFSCnSLWKBGNzyFkJoKLqOTJkFUdRIoSPLrOpsPNZWAplcIkUXKqxheuXmlcbvRvukbHTbKDgjFxGNvJZBepqmGfdhWNXWElOKfnkbfmgLvxcgKKblCthLptNYxBWVBJusRqElgUcgIToFgIEIgrknWxgiBAGCHUDqWWvjZWfuVjxlZvSgRjybyQruYrocmPDAJPghwlsMjLylpnRGXOSFIhzdCfLMgwtFrOpEAqMTugltZGiiirDaPxhNhJbYUppwlBANmqsFpNLitqmsxyrIsOJvTGfhfwIEtoOWEhUMfTIiqsBTPvizgocihFhfrmNkeoOVkIjljZSwEeMduHzksxmIJXwtalSczwkWMBvJFOgXGCqEhbdaPkggoBMNdciGGNBiukKLTEtZsHFIPaDRjIjnOUsxhijXpgdnKhgnBwzeDRLLYYBKVhOFLqogNwiYWyeBRWNYrwirYHcSuxeEqyRgIHdFewBTPXKNxhhHnNCxNVQzODTZgreuWJTMiVZvQBgmZVCCxklzbvECzImCvZiTOhruePBSIYxcAndwHDaWWbVpmcKhGHkdGeHSVKKslgAmsWhvCBfhmDsFGPnyemvdZzwVQDrKuFTSAixHuPVpRTxCivnRLFhsLxKZwITXmVjXtntSyAzxkeaTmHavDIlezMNPRqKhoexfhkiUbdOZdMUCSPAHAPBMOzTGGyYaGHllTYyQmIOIErbSRZSXCcyxQFPYoNKSzqvbuflyIaiThptDBviOZXafjFiHAYyvEIMBCHXUyVteXgEwYBpFzcSygkGqYXAMPRXuxCSylfosKlrWwDVpNYEfzufVSZVhHTcHQmFVrLxhejzJKDYhGSxYzOcsDchrBCKoXZnODCaIPiWXWRdnsxIvkHUXcsfjBGFctnTEAiowkqDtBHIGkAYiQVmdfadnKPVkShkVZkbjqQmJIafuqWLMLNnqsVUVNBzaEztxzQnUXyWDyZYnKLQmSxVnrcKJBzvZcWkRBWFjVeysMcQQHgLgXHLxssnMACcpPNKONwHsHvsHFnqDfrtICCjWQOjdxqTwYpfKHeHNFdXzgnOhvQxJBsvlkUxdPSxtvtfapPaqEHsVVbrDmNGmCMHuWJYTBAANoJvSqrPgdLEpIFexenBHwTwLRwYQXOdSPWvXzEVjNWzPteYWuxPyFDsCBqKMDwWDosVfrCWpKYWmNRhJrAgFvNOxDIzRuDQaVxASjOPJeOfOtUlXsCKOusiLKxPMpjVRAcNGhyuAbHjndmkjwhNOKeVajGkBlTSOMHFmZIehQZslcCwISEwGXRuePONYXtwTyRwJmFkWNKLrzCNvyZkpsJUeuWJlamqERBQnYntZKwmPQAhHeVYBgbtBFKxyfetfpDrzpruXeQVgMksFVPPFepeaDFBRUDYZCbELycuZLLKjiUhGKzZOUzLyoABxWEwaunwMRKBchgFowVytQsqoNMKQAdUsepLXgqhDoIpwEeTQFEhktJOZKAUsVgevdOPjrdLRtGJmdVxRcpEQcKmjOUHYSDQXzXXYYMiokSeGBwKkYxQtyoXSfYGovwBMGTpeVEgZEOQQyEiNuFyqbdcPJLzXfqSHHuLtJweBvEnXimbRsPuMvWXyzdXYsNNuRNfltFvTzyCtKHzAGWKGIAGrkqMjZBOBwwHLgdeHntUKYbUKIhrrvJSZwswvwqCtbZZwiwhBBeEpYKwyMjkbvPYKqdiWSVLVVdzOPqZyAUVxdBAqYcdcYGTKVJknaeAqNacuoIsTFTlElzWLGEGpeNXTRVZejTNNmRrIcglobdNFMHNwBQEXgxCexkhCXIvTJBMIqEOumRmcZAKhSHRnBKXPSyUQZhFUUhyJpdkgXmXlcTzozHabprnMuQsseghklHXRpfrjDnbqFAXcdmTVqVxrpDaIWCReCYmnKebBNYTEGviiJXKWRLMQyKzTWPfuZxXJdTlNsaIRXqutKyPFnCjXBkGgRdlTAbgTzIypOwQzKlGbdsSEIxOzCTbBKodiDTSwOesWfNvlafjIbRZqfnHopxmJTEquiaJxImtsmnviwMlXoUmraOJoVdvFKfVzuhcfZiGhWYTsZweSbFSIHrkacuaExMITkrdgqyYbqzLXvUvbzuwrhTpZyQehZiRLoSDAXKLThBGbQAszxrzYednCfgUgawMvLUOGAPdexnuvfLUcMmSDjrRoGBJkwOuAfaZlDInwnJqfwVYmzxYBUTFREMcfAyTmddosHxjpMvRkxdXSEGlOxaMFhbbCojFVTNzxtzCoUErFmbLAEwcqTdPZBVKVgfMZoVweTsSfqlwawcKyvwMKZBEnkLGCBvQmaxyLifdjIGKeYilLfPsyDaEmYOQhckFpzrWfuHzaNNAwhKNWcFqudsBPzmKanQJMvucRgwWzTPHYXKQMSGkWRvniMpEIbiZcUQBBRAyYRkvUSXZgRQNuBgVscKAwYNVQDDnFJqKaHKlVmhtZsPxLMgSSZSuPlMksUspQiYkBZKYCMJvbjarMwvxZMUoZoXhGHTFmxKvOZLsVyZBgNMBtBvullZTkxcvPasyvKUATIQecVlMGaAPRhYqkxgdnkylNgxqiuCyUpKEspPhhHXhkiubXstfbbgHUWFKKNTqJXRwRiLcDVgRWordqRRSQSdYMogScdodIyOBFMnmjwGQwZjQbtBpdqSBLpZLqSxWDldqyMSbsjbKDRcYYUtETxvRuUAeZvkPEwPdgEthlkWnrUmdehYptiXyhedXntlrgbSPFcddtAlHLqYOBXAftqxDCxLmwKsVYXKwIeYCyvetBvnkOIGFbTohdbQDTgjWaMgfqaeevlbyuwfJhDqIhJuFrWDhwTZWGioEimetCPvTnsJyLRSKaMuKyxpVENjWGFobpwaZtnNOgatAtFFjGhskhlXpUdpfAmFIWnqsdObgIKQAuRcvRDoSqMepSNbekTqDKOldlPxSaZAQgrZjSEyKxbcaVomlTZtWCtFsFgnlfcoedweFpwhFfsHppmPZWvDsnIuGRBbZQUbDeMYTTyRkdLVKDOQtZmoWFufpDmOkNFeYCpbtCitGzNaOGmlEEqfZfgOliosdYumhtjhMCYHysyPnGtStGbaVHVRWoQkVRydfoSqMgcwPewLpFWVXkqoQvOLLWwLpPcKHGTFztPJYItJDRinWGXTBrELHTQDVvAmyNFZfGNEigfsXCnoHNsowCqdTGqlEazrJgJyzpdehbObWdWIimZZwUgOeZDKHVEiQdfjDiJFVoDHtzJWvLhKMtvzNMkapzRQOPtEKTpcTjklxhJaFrIoHXXgtgfxnYlvtJcfMlvzwUnvuXzkcXuxLtwIHqhcLiSjuFvimgPDhnEgmLwpqiLyFaesHpTdeTkgEOZUeBmGZzrAvtzkcqEaAEzIqVFIiURjjIbTgWZalUoeGRPUIzunIjQWFxhFYyenMTQEoxEFcnRsxXBaLuTplGmsIMzLMcgtgJFdeQBlFNVubaPdkxycAtHWDyUwvPyhRSrNuHFvRDSlxOYFxUsGIKyIzsLWindaHRlyPHgbEWptFAIhttpGSLZUijFExDChtNAfUBZJdCPwrYvmmBEkqZrosSxXCrsJXUZSfCaGGmoyYBhNhZAZqoOqLAFqogvVOGhHkCKocpNczEkIYgZXTLOQvoqdTbQRsdlQzcPzMZPnWPMuuChlShuHBSpYEiqbKSMYqwsXrDBJSchTheZhoJmBYReUpbBjdxBBeVHGCxOqIPEmAIFRuSmyLCFVzsXRKUEoVelsnLhuYWcewvlMjCARsGEkgozuVPEODeZDnqLyeiUsvFYBPUIJBpZeVbqwBdRvmoeVVuIbTMAaytkzfmFqHTJsOFUKCXXGwmTseJklVuUTPjBPQiZhYXWIIZQoSBTzKaYTrFEfhpiMvJvkqmUWHRYXASPvQGLiXiqkONtlrBhnJvfSvPeNvYRtrsXNEnUHpxCyKNHQmEGrGnevkYgBmoEwbDAJAWJZcFXGzgrktPADXsZGSITCgKyKImDOFfFMRBOmFwWCgDDItLWFlpBpouxXKzKgAXJbrTKTCBLFvhVcZJTKsoSWfdWKnBKZVLMExUpOzjajzGLFgWgcENPCgDkozqMeJzidPotbpcqRAVJyVKZmjSycYcxdYHfYYxPnVkyEFEkBiEdisbtyrlVhPRJwBqqqUbVKeONWtEeuuAUscCVEGhVAlBJsJnicUujHagjdfnNkcMbkmEBSZNSZyPAYSYATYZShZfTwQabjyLWTSZqxHcbRuGhosmiOoqcPUryjhqjzqdLpSKoEsRqXUpNrSWcZpiKdRulDGDGyKOMidrynLBqfpcBcmxsHVtnwZRHEhIhBYhfEreRyvwzyIGoFlDRuIswJazPGBDDltMWWTMddXtiebcycntqMkZnZQmWWIwYcDNsDnBIjElLdkeNbLQuWkLBcwOSjPbWIVciPrvwOyXQiUeSjEnwdRZQeeRNjbgnLkwujUsKIaxapSPcQAmIRetvVnvDqGHewNWxaflHsDscYrRMEalGfDUuyNIOPAsLLdifvgiXyopBBXKjAqvsERjYNGXmqIlUwBHiYjmltumoRPRSGbVmKJdQPFtOFHzVdfhlqhsPKbEFdknOsJiBbLKLdqtGYNmuBAqWrMtuLRNKcRgbIcZsTXKzrKEaVfOoUJSsqmPtKCzYhAQhNGtLXfBWNDKYHMAQiqUcpQMsSGwMqyqGuXjstDLKRFxSWcFqDFrjnwQDmQxaKtwAyfTPRWlJRkNpYAyIBmvVVctpAbpQTmaKkNCtDuJJUiqCsrEypnRXYeeOzaGdDUpmBrosvsLFZOalnrvDzcgfXwPPJIjfVJKkwBlFaJHBgtwctlfKIaVfnXxhsNVVcZKUDNUfhBZPbPMbNUAwXElnZtOdNHyJUqeOYhYwUUmrcUzpBZpQDhxRCOhLcHLBEXgasStGsmYmMsCzvCOqakMHVeXzjlzxtooaxCCuoSCTzlyfjOXtRvOfjidKarreDtywWVPpcDRIMeFzJxymCRWghcHjvLUAjdSDRTPSPXrHOQFOVZfhipXmMItVrWPOGKrCkbigusTtfexlXUIKnKLFZXVVWENBiXlQzpSStFiEIZpTeuXGoHXlDLKXVyPIamuGPMCuuSACNVCihDFZgORcuRBCMAeQLbfKQPaaohkVmPVfQJumqlhvBdwHLNndBEaJTriNoYxSSrtCRtCmgZqmmmXrNtTMSDsMXSnbFerydqcHdeFwPYjaiHUMDbzPPWzKnUAeMDCuRxAUyRAfJbfbHKIRKQyjEwqcHezqJgOfpoUCIXEhKlxPMATfCKmADGIqmcvLVPJUrfoeaTWVavJcnDERPJYiqIxMHTHxbgRzaMgCzGWMoAPdejuVJAOUpGqiBwsemAYRZinjqOgmitvRtcHiJkXBiJeRBjLxtJBwxILOYLwPfYSesCchhYuFnvRaxLkWadmdWQuyddMmHThVaJrKJOARnfXGpMGBKCkpAlnfvgJbHxOIpGeluQzVaLpkpcsCROZiNrdQvuuzhkaTMKDDvwruDCsSSPUYnxkVsoHsQmsTcnlLyWfPQKXoHtauFCbVXqZbBvUGLrvAANReFpykUlGDKtMljMKNaopATTClWUOfcOQNejcrlcXrWqfduyLaCepXOiSJweCIEacOqWdrszOIAFMSdSOIcWynzWgjFxnmCfgpNLDBTUZuijoBwjPUZhMuDTbPCpwlnezsNEeMODqSHIyeVrrioacdigykNVkAMoUowdCWRvwrdqtdseawRVfNGQrRmwTKoGdRLbPgRhAPcorikjVhfKnDjySdVSMeMPJfcFrmTWzJDEwaWpypIsIUEvHgpxszLGVMefgWWNqpKXmtNkdtwWBimMEUfcwadBztrjLUMbYluGJzOyscjzUTuiBpWTbbsgqdglrtBKZpAuYFXpwASFUAbhlREZSOfYFHjUboMkDWAEIeIhCAkvslyLWLDBOOirMrQBtYJNwqlmTZLDrcJZmlJLnvHgNvwvvVBaIZFwejtlHjNVQANASkCqmwJaHjQFMCxScESCQiYfhhTWoYOFxEmnLzrepPTZGsIAzTLzzdjLWAbgQKybSbNqaxRQxpWgQUHxSdIkeuWzzLVCzWiZbRHLwaMbdjYlPbTBIXTtcvEsByNXPoMBaBTRMsOTVQWRGEVFcBNcwtITSHNpahvySAbSUxlWtRMyEtVfCAsmilkoTVlJvoWTBgsZHaIywfMsewljZcFrxHpYpQYurQGlSNxBPLgGHMCvWENsBJNwgRGyWtddfOniGumOQGbdpQVRlGtAeiWyOlRaWnwrdpsHHIREbYGzJCnchwRCZXFmKCyFxetXbSHLqznnmdhqAKGnmhdoYIaVympMyHmGMHBtyzhfmioojNvbNKaPcYmKiyQViKslEhVrlNScvULPdsYbVecuxqTWLzBhWpUIiPYJLaLbSJvWDORvnzBJGhFbhDDwVaYyKsBlHkCxSSEClFoOUVNXOZWifCVzxzrtbsVDYCScoBnSrGINKbxYJQmSnVtkxCUGYQcqKnsoOYDFjRJudDOOhyWFwrTzfYAdMONSybcoSpsFbikRMGcadcaKBJHncnpmlWvDKJVCHSUllhhEiWUNjSlAuPBwnmdAVxhdeeDqmieaDaFOfVVqcCvaouaprPYOMBPSfuvLNzzOSLAUcroOOjCGxkUXINTPkBGFrWeuOybgJEgXtFmtbvdgdengZDRCvwgNBWEAEhaCQTLIRWvfmoTFVgWycFSgXtFfkXBOBMyiOHbZPTkPVGvPBsvsMxwQGKhZxRfhCwxdVelVWimgICBVPUASeemvZZsWrcgVxJOZNtyOhzgNzWduwnfUdsXjLnMCFScveATmZCErMWnceOyKEJKkfVpBPPGHONoVZEFSWnNzdSHhLytbOAzdaCdQrTlAOQRadATzszkKtRekUxEjxDrKnhwkLFTAmFqNqXxKYTvEYXfBRhCWWGllRySoNlPssWZAlhiKSRseWAQfIMFYyHSEmMuwJzIhOKdrbVoEnWzCZtBYBXLJqaVKaFpEefEXrqpzsoZAZMSbyGDhwiWjGWDXMrAQnOhkbnPSVuThfTiwwbFXvBoGPtIMPzLqXBpCnhxLYTycSuWXePKBTlzydmcbRVWlbLvyYolaNRRrivGCzrkJRXntdggoTcQNljeLlJegDSqcZlxPqIqPrrIsmMnmyCLznVGvCOoiCWxaphdbrLisgMyNEAJsLASjqmkTlZrHdpjeRLUYeXATnifOigVkCyjZokJacBcSJXjEHIaLbyeGAuxzPmPJniOFpdZYHGhfpsJljqzZvwqPQJwkCwKVjSdbEiRvYidtcuywEPqIjqNOJRJDjkEznzckYbIcccnTmgfymfFKhltQlTymyDbPMXqPMblSqdnKceZknFvoCNONsYtypHNlRQbMxqazLHYWXJBgpoahFrAeRzfOeRdEKfkyqJvyJcAiIlfcumDHZVAyJGEiOFRVsOHQHqOjvmszlTZIPYaHXvMuxdPzKVClcorcLqFoiVkGpprPRTVAmiGcZCWCjKtvvJwkCtHaoJSvhqQsHrpCMFFMykKUUIzZcBNVHrEPGoqpRCegwBTCXBmMZvdrmQsprdOZvrNMHmqPfjEtYEESDXkpEzrESipfHsAwKFlHydmwAOrTpJqaYDLATVbOwwsxBNPiDAwUQtuXHBOQoFBkcHPaGxVLfpirYDJMgqtQMGGCkEpSaKaKWtgelUOXXJhHqVRDjCkJPrlaZCcAOSItdwENAJnQIcANPMBDxQArewdwElhNJqAmbMTAvDSRPmKMFnmEBHSQvzmcfQNulpJkSGLxUmCvCWRJuwTWTpMSRGnIPUwDDpLSXtSFosBiOxcNiYmpTbwVBzjoXoznkIVmBEZHbsGQKNcVuzQpDPFhpknVfaQVyxqDTnXQynJazsEAXlvaFrvkVcnrNVQMudCLTNmSeMRhgyaveyRNgIhyIgnXekaZMrlgWCNdkwMSSVFqAEwGyhxzkIGFTvfQfgebijThTiqxdzTuaOxMWfrdWGodBjLoesLnbEfQpnCGZBIFlvFqigqKpOXgtcPHrWZhGDDZBfrGSXdVxOHcFUSTpaDdNFpEOHLwRNatMbWdxsMJYwmZyNyeaMreHIoWpxUfwBeGfPLbybAnWphziVljocZkCtPPftFzMVauOeDSwVMGTEiTCOdCKgNqlgBMAYRgHRMgZdDuNtCkiYbKXXfUfpBkrqYupbPkyctROsiRUetNGRsOqEpPJLBseIqdbmzcaDDkILPXlpsFinzUoroEvJgIyIYjcwJQUEzzx\x01L'
-        message = Serialization().decode_response(message)
+        message = decode_response(message)
         self.assertEqual(message.message, unicode_message)
 
         unicode_message = "BlpQpbYDXyuaGQBuysOSBcXSfWzFhhNVmkdwbKVVMDxsxkoKEjUjLOcPwLBsxbxYKvuBsMzVmPOWLxpUbJWCDFlCjUuhKreQVDyygruqKevqUbiEhEjfSYRbmCyteFOuOmfXpyOcJcZZokZLlcDSstnFJxUrDKuMzykTRHiUBxuxmEpbjaeNifBSjvZrNlgreHGdSHZUycDzbeNoyFqQTMbKOxYirewArtRIasTUhraGKNFDfadtwqleVUOcpGpUMQHCOAhvlRQFTJDZXZINhpUCEXIJfShXMdRIIErxvZXDcMNEzbGWQpaUzakkmIQsbfrHhRqAxeBdMSYoCbwwFJtLXakpBIUsVFLlaMzUiAKMPUUDfhHOEVGULHRQNRewuAlQxFnRXTYUnAlNNekuoVXChvnwHUnnMrCRrIWVBpBJsOezcvZoPbdOFhCBnrRpuGUPQxdXwkxWqfsdSLrANndiNqfDnWBXsemGfFchdkDeylvPYJyZozvppXjMHdEczhdArKPtGTzaBrEfDamLIrKAIQgPeYUdIamDqoETibhuBhREYNYCiBxDHgjAZCiWpobsiNupUFilATncROBOBslEOEEkXFMVltEEDKdjpYBbnWZoDVHWHBdXFKSzoztJJMSGprzPPHMKjmwbIMeEtiTTBZYebWoToVhzrlxPjInTxGdTMnfdMMJkfoXZJEKgdhEUtDUmKdlWmOrXpqaUaqZDCNxBarmCXdcPNIozCdHLykPmWJUaOSabMNQEHeplJGNYUGkgGbRQXcOdlSqydvetDZXqcyjKTxgzaIOchlVXBNhxqyVLuihjxCPwuzCUZucNhNAcZFSgYGcHkBwEApqHgaFUTYZQWJuwTQuGlfumacvzaFzEVjhIqZBCbqBzoyhkLXfWXnHmgwiATPvRsFEmdNXiYdUFbhMmtDucISTfEWWmfJtjbixohibImKmibTFfsRDarcoWNKwIpWFBXaTqEOqJFXyIlcDCGpEGoDsIOkFinWCBLkwbpirhnsYcCKvIwoaZOLegMteNGkwLjcsPycVhRavXHWgxjmGjiuZPwpUZGuKNXHVOtWUYoiaRoHYwCiBQFwoVGpLiDqPROpodlaxXInexntRILdDxbpomuVrSTZMqaBpzGQWkZCekSnxtUZuZvqmntulZcKXDQDzAcOnAXNtjqdqgWsmqEAFfwYMbSLFbeJlVYptLdrjZkPopYHoDqQNsGyNRQvFPinMCqDabixiFZJmALVMcXKhlmGgDqViwMOrApmCesuOzDTRTWBwZJpwhfLfOWBVPMDFopoSBuWOWnvAIvLxFvOwGlldDqvHnAjXYegSscpGTeHdBienHtxaHzMTBanWgZPqxcNtiPmndLGxUAzsBXEoqblTGTuatAgqyQBOXapLfAWlVxyXGzrtGqstUkGICiakbAqEzCIEmRyVFWwqmSsmlAdYMyelTpzViVdklInnKbysTJWszwIAavvSMwOKLcTAsdvouDXnEoDZFueiDrwGSjdszkrdQNoVSEAgaFULxnKmiLQwmOBlTeSftHDFGmuZxDhQKIXOfQlPHZDoPmJbfobvBrlrVyehcOmYKCMiEUubGIwbCCDMmKFFKeGAeZVPPqNIkCsTmbbjmcWMrYQagnZdGNjIbVcUuvxkiTYICuirkEqrrsheoHMSCyHIguStGhrvbIaUbCmQzgOdBdDrcdZucvEMGnyuMZwUcezZIvXBkBmPQRWUairDINbMXjtXTxDRcwMaqLQxiZQaOlMrapFLCGQrflRucLJopnKHrMiZZxvOiLeYCtpRQpdnJjGqPUvJYtKdFtIKrOHgTUGwCbsmrSesLiCCSUrhvaffDrPuforIRSxpfYCzfwKQHnXVkFrdhYnAdXKnGmcnFeqXYzeSeVUJBbAxWCGwzMbLhFouJCllIOUUrrawsqTLATMDgveKyTDVlwYgmPXhFhjJSoHmSzkrvZlLTGeMhMOHdfEWczDvFnOrrZhhqavqrSEsycgtTxgRfCirdhwgjGegYeHxkVYwAQxowFEXXEDhcTuDpCUzpYKWrbKdzFTOTUpSyZfjaoSsTOJXXPwVjqBxkMkMeZOmGBtiVsgmoTxGlJCcKIebylWjVpdcWTFNFKZoLYEdiKYmXoSfBPxheZtGajXeiNhAhQQdNaArBgxaquFyuuMwErGifVHEJkPDGsiwtbXULkIjwSHMjdnjFCWJmuGahwnJyeMTTVRHSvufXuRiykDDWgtgURwXQXJMdItoKtxskDTaDDRuHBJfPfjojuVQrpBLYHXpchfEoeyNHnVXOKzstaJxBCQscFUmZcVyOyiKVNoEtHYwsApDBPtwAHSsgbEWQzOXXLucJuxyqNUGCKZmGGhtKnxagkZRYiotZDmXTKXyfJRMKPmyQMHpzufFrBDMaQxXCkgdpZDXwwzkPNhVQglslrNcZiMqzIKGJNAnKxrFswyENkMcAdgdaJEWiKIKEUvaflLbkwQzohswUtuMtUCIiotUKXAqHcQKnBLSuvaJzovBSRLJOKLPZHkcBlJctwOipLbMnHYmWsOwqSWBtebMPYcZyMgILCuhehQULOmZjozXFFHccWWaRWQjfsdQrOlidrqyAhtllfwXeuEvftpGrZWPWCQtmTncGovoXfHfEDOVaklEaHUIqPjJxMcSkxMYWlHuAKvoZcAxBQdwRDAdOAweanjLMjPjNKWbowvjfmdPrVEMjYTnMiLIFcNZEUuBJOmzeOhwxVuYCwMzfqbftDIMdtSEyEBvgcNJcuiQWVaFRsglYPpKVbwntIWUMhHUhfjoqIutgUskHnxnuEOxNyBLApBFBKLNPcwBhnsXkuvbscPPNplixYnJNSaZjaBbuFcFyGQKEZzrIbWxiCreuuQCtdYtINrjjFgIgaNYNAYJfJdarlzlmyiZpMPSoiocaOMQKRsisyZuwGItoBPKTCWIYBEbRbKFSFDWmeMIAIwZFnDBWtOSAtDCzUxYNDHSIIdBbaeYyLPDsfeLTgdDjvuvbntpbphWfVyTSTKvuJmkEbdplIgEQSffdNFcSjVHtPUxYYaKAhvQbiNNkcWWGXQuEKAqcPHxmEwZEAaPxVloPALeTamiGcdICAmCEJoWoJnLxoaLbYJRqjpaxtDYMZXCfblTTxnUOvWenTCJSgDxHmvTmsuVkvctluvltFvoAbfeSiYnZyrcNrQeGOZZXlqaNgGcVgyoYSOTifeKHFhqbWiPxJqfGxdwBUQbrYBCopPqyboFeOQqwwvQjrnffCztOQDEdkXhGKEecEjsRbCLzpAItcEdZyLRWvrSHemuRoWTXUtBXbXQFFyirDWAtMQxoPZJGpzggtJHLJjeZvTKcLOuGJAYHyLUhAowHKNjiyUtfQTRPjORYHCCoHGjSyXQhYBLRPpCjlnhsPwlpLPrwFUNchYVYOKxkAivSZqEjvtcPHKMaVaIrTjZYnbcpCwYkPbFnZUQDBCjYOCSnJjVqLYgkfUpDZcBotRxgrhezBMZgSsfdaHEWgTubKycCYHLmkmXkjWjEFreKUwsBgKJOtHjuJdrPIaOyTcoQYToljZxoBjEmYcKHSATBdVXbJHEXQUGHrPZMycxihtRsxFowdpMnwJXyIDNLImJJPZmoItlCFRUarpPASBBXvpmayacVBFZaVLxPotdEwjAVZnOVhnAabrVmcSviSqSkypLXZSzZVjCDnShVKNYqZCfggHzYaxTvGilJQNxJDwNxxqELmhckAAMVjxVcZlCnwXVDHKWgrkBLYLZFdCvFNKKlmiftzMIwRdwKWVeyxCJnsBJLKqxJRKshFkGYSaMVigCaSdJExjzPCwdHrjSDWUEtNBrRduNKlvqrmTwbEkmnuDaBShAqFhUUXrQYjiuqHkjbFYzNNuslApAlhEybihZHbNLQEDpComJmmPBmkaVjwUnPHmHrhNUlxIJUOqdlOkIXLkhQBjOLbqzgNEpBiokNWIdFuIBQdnrhuZPFGJJOoKqLfJbvOQNAKYugaupdeSZYWEypccuXFUDiAIBfrlMskYZRivVaRlwEWrelYyycnzSNejTEJGwalDNIaPPezLiEFURmUpIKBzosgoaUHZVjbdMVFwnWOvAzplBSDsuphGJJFhmIZnuQJoKsTrSOeOQjTeWIGmhwNrKpZqCPPqsIXunSwkJonRaakShSlNBAJroHiatOKMhtPaSuQuGixVomZrUYYAkJwREoxegyRVucuFUoemtwdLIKQrzkhLcUcnbSPaUcrpQMRzKWtirxaHOurtOjoBaPCHqHiyJXocRAhUNXweilGWkIOzktUFIBOPKLYrMIqBVbyagMglQmipIYgVeJWRzeqsIPdEcXrkgweHbPYNHtWGUNraRdqjnGOjeBAZomuMhFSObHLWpUvakIIxOCVtHjomKXxEWiYbIlhDogELVmIRgUSiTvFLgAsvzXDIGTtEhmSvtHsOAlziCJbtFXQvHYAPOJnyCdHPlyECxOmtyGaFzdYgKSlqxTpUMpGPVvhvnpnzzUSDKZcQVkMQuuPLAsMSEwcBqDHyAFubJtGoLcaYYZxyQJUwibBviSdzwSBrGXNgrumafNpziyFTxvcbZGRPeefyClAmbaLHoNGIAcTtMklKIqBGfInJwUwENoToKWtmZDttzrAseWZsopoKczRDZcNmTQZLcelztzvCbBpcaftfXhBMODhvtBYSWbCARHQtxuMYmMEOyjIyVAcVUHVQBXCRuaPKxLMhuEUrtiKNtCGViFIMlETNRoMCZlrBLZnZIvXcYBqAXCctLOoRkVOCScVFHGatsyBlOpEXqgNgjNIIWuSVmBjrAGYamJzrSaoInlojlQzaBeOSHPwmesRohdoMZNZiLKurebPKwbYdEwxnRZTuVeWzNFGFcEmxELrDGWCwYkOgzeTihKXVpQFDRCdHNecMXhdLhXhxmlriBDGUszermIveBPLIjvlpOtmJxIqAWeRzAygVgTwUNbJWzxjUjwvHMcuCBxlcrpvbdYLDEGVmdFFJBEbPPDDMsjwJGqPcWyUYYzmxQYwtekXHwlhXKgaSJxHrBedZkOUsBnLwttMcdSwZKvedCxoUvwRcbhxgVgkwfQOErrSmibKOuKqSIFHCwBLtzzmPclrffOQWGOSqRqUjohxsEpWJoZfGlwmWuKjVTDTmePxNNsjwvfoOemGIkOTEfMsvCGJYEpvwdpPbfrtwZpJEOzljNuySegBSNyoOKVwhDWgfpPGFBJDTtZuRVzDaUjHYyeSnfLuHNpoHGsPdeXFjnTdWwHQeniZttozNbTHCuJmshtwGuIUiQTOXDhpafkwbftOWrXyiqFCSyynjzFiMzTgxmhEBfeGLbDdwxFUPrGhidGRjwjOeQhoYuExOVmnIdrnQcccPoLHBICIlEaLhxguKLuIiOBcbpCbfAIPnobNTXZkkKLEimFQoWxtCjrVNcJvyGgtZfnjyHQMtHPYJSeUZPHGocdSuFiSMTvkLzSkjqVQuxVyKbYUjHBovGQbFMqkALGkABhcSvVuVjompGDHCtajzbCkeydtUDNllSnORVmxMfvqTDhVWcsuAiArMwjBSOdRJizmDnWfVEFQIuGrijFHEAQsykJZfZJECbnEwaMtdHQXWcgSMACKyHToyzJunveWFnkjpUOeQmUfhcNJwqizgvPEJMnuuxDZFoTszCMcsnPQcHpwbAyVSDwgpSPilcoDZqetYBLOUVEokFBzyCKlrkPkFzRewCDZbhoNxLfvAGcAhpSnWaJwMGhVjcJetvYGirGnZgIOfCLUMyYZpNLLbUXklVWiPursfMjkNLcryUGlRfRByAZBvinveuXnvJvoEZXpGTvIZxxuzElGtIgvHoVdSQKUchOrAmcnqBnNzWdccvsuinvQUbsuikNNAoKbIpaPPCyCABwjZOMnBQgFYsDKTwfnfQxlSiAYHlDvUkIriuocXnMkpEeSSBGCyjzsCfSCGeSOSeVcaOaulXTjNkYpuZcAWAbEvKdcPJRlUKCuFTTSRobYgjEGfGYmIIIEYBWEgdBPfqEiebTnRZjTOVQAhLcTjWmKpkbguhcRfeOVxJpQdVyEvuWuQKfiORgyaXRwdQaeCCGdqnEfAaJpfwikTDiXagZgOgKLTQBCEsHgFLKdmUymBRENjTKjYHxoomlWAvcQlQWurcXfuFeFiHXngZDowMnGPCpYbAigEAupIYKpiQTGNwVFrFyjJfGwPYGFAuZHwXDYrrcThvuWrhlJJbiTNjqFGjrjmLjtAxOAJTGvNeIqJzFPXtyoWZAcVypQUVPvLXsurmNtWMxlYGKsgqUyEzwXCWKXBXETflnyNoSxRTsOuALgKaLEuiwgGRBouDFQfdhkkqIoAgqPWiBPxdivMUVFbtMjUoJZeWVtgpqFfUVGSGvfqysyxRsBFaBrUuaSkjrAFolICaeYRRJLxDKYraVmZeZtiXxDrJqrOtuhrcjmFgpnTmmsbuKxAxFMaWdyGrNzmDVpIcZuveieEpBjDZuzmxWPYJCazJtowZciCNFfdVBlGCKWlFVdTPXRwTjjLoJwHXjNFgBHoZGlevGLlWaMVPztBRQeQTTvzLuwxcMllnmPpbkJjraIZYqUTnTyAKcmzihtfZxqfscORkoUKapGreZlkPCshjNvdmEubskTWRVzvpiIIUwjNYwSDtOnYVgxKWPTPwTabegLaNdCxuOpbzBqMwOobVDUUpMGYKZyckGMYWFXBxLMMLPWeVtjFSPSZwXrIZpEjVclrdxFNUauYzTUdkWfTbYxobUVbxIvGqLWhymtnPpDjVhJXAVMpCXabwoKptJangqKCWVjWmbjAVycRIwvljZuhURxuGJMJFSCGqKwSQEmwLQVITekCNykkcUDWEIkbPuujHXzcneBZgujsDSloVustHPdTRijRTROUMJcRvnKMAjkIYRvDcyJxoiDfllGPcGXqxssqIAfTSOJdtyROsOsVdSUVYtaJdyQSXweasVdJABxflevGOHAzjbNXngFkoHokedjoLREMmXEBpZenlVhsQlBrjcuMoYRsVEgjqEHPuLoqDTptmphsBGlmIsqOldqhklrJnTLAcIBATqvQTBWuiYsldluowdghgGoAbmswdUjDMHytSWZfjRkKbBstJaSRIWOceBJyFzTaqvlmcwjREQFRKIcdjdYmvJrPDNAIXfuuywSLuEenOItdIUsvXkFtXduGdHBcoIeLPdHRDVaCVAhPoUZDNUgMdIgnpKDKhvZfyABcaEknDCquzeavomVtwVuHneMzdMmktLTqsPJgVVRHBYiIcHnxDognRlXcJuNsVKXjsfDXcRyXxGlGSkCUuqNKLzJpMAStLZrkogufJfdlKQwIBzYXmpOfVboDxGrTAgYYzflOPjZPImHsKHhuCQLTHFlPUHoJUlPqfSrRMWXMOzTmXoUETbJtJTVHsqNGutCjDXHewYhwsqmvpOVUfiuILcuGiqNIhbJOPNCGTgESHUOmnXXwmAdGZRguXuLJqALNKjeYTpyrQromhAqUOgQDGRzDATjuzxjXCrzXWKCdWywQUuggkbqBYyKdKIIwsGnvTvavrZMonbRKJcNDOWprWtzRbvEilMChsslLFcKshUCQavczggPzSIGBbIAFLMRjSwieRSucSywfDfGnFORHEAcTrVmFzfTJLlSajRqZdopWUnRpKJooyXIPidTLJSFiTTPZPYabzKFTVEiZFIRJlOyhYKbOfUpHGcOvFQKLaSkXVZfGFEXvmhoxZhrtaKujOrbVHFEIeYYsrjsZumakiOyHHhElePzaLtbqGrvxykevunUXhbRPJtzEerpDoklqcrlmNdhgjfmgcpCTHbmoltlHdcsZhgZZHgZEmPHYydvwbyNWesLSYwYGtWfmlMvMyvQJlQjjzCXiaOdruwPRwbzifkAeeSKKnUDnlLtpGcCNWTLWdpGiJlHGXejAKvqdYLjGSarnzgUOpnxQeflxzhJHTDFwvaOAMKvKlHPSggoVYumYwFdNAUJXqMnBInjIUtRtQZOpIZvKQGbKSzkywrvNtMYhdboIZVpFgMbyxMqjYJxQcABxjroAmJseVPaNNHyqcZjWiBLwOlAJKyjhiDTZhgIbeFyVOThhzWguMVUIlZBVqvSiMxgsSvmpMYFHuXJgFMLLRnupHpmfjimbWWukADojRaesVinAjjuLjdinMYXniYOGEHeAjTYKFKMPMYFywdAkIvvgRXmiAAsWDKEQGZBRMpPMleGQfUnOXKDOtqpyHrIjZrqCfQLpwIgKlnzUhHTArbakNdMQeWXuGExFyVvYpOYNJdWqytTxkKXMBfLGxlTKxVPxffMnVjXVIBMLhwLzVTMaNbwtclfAvgEvrfuJLHmhEZepzMCgYixTnKJzaFdYHKKyoZILbTKvLiQhjywuwSLhweXYRQfuzvKanXKHloRXZNBwsjPoGTNPdVEMYKjkABpQgAvwPRImGYoYjXgYuyLLwDUgkTUiXZKwNxxlViacoZiTFssvufqwYUMzLLqxwanErvBDwthqFPsbOcVFJZTPRRLeaVQcfMtOMkkfZdGBLAjQndhOgRaplPdyLPvTbClHoajjVXXtJsOhTmhPWXgETRnOttYfTUsATxXaodNFoObGpVDIygAIHehnfKhbXTxbOFfoUaoQDLDsVpKVsJPsIaIvcoSNaWnVrKlPXiGONEKEMZfxnxVQYjcUWrvwhWhtjTCBABQIVmFcKUfXOGOmPYOmTAQQMFWCAIlOFpiMvVcJAPxeZKRGGsfSurAIWpXvmniJfJWXeEveOJgqeKMqpetDKYSFTtOaHYDliAeDmloEgpAubhUqDxZDCstnOKbTIDORxTCmyWYfizsfAmhoroAkotHMfTztbtZbwIrRsobIAgRpchXPjFaeFLwDvXQEHWbUKjfhJjpmhTJBjCPxRNCBRhjysXpjxEahbikbglFbTbsYAugnXWnUZrQbvJApSweplOEVsPCuHgEJrxWtrvoiDdkGYMgKXJrzUOwrSSyYoQNQHkSQxPkQUybRctqcOqjsvsoukUOjgUpSgLkeBzYRqTZZajvYGTtPVtqGuEDpvuJOKDtlSYLWFiQEjjGRQBGymOlcCuBNSImBhkWRylJdSzOsYfaIuKmCzpctGSmhcnuGczblrPQuTkzsfADNvvbqksUPLmxymqkhoVxpkCNFcRUWKrXswsfIvjUwmZnREDLlDpgZwkSsItdLUQmRxtEHLvQFAdsmlzzMsnrZLPZwwgpsbErkCvMZhKfEkOXaEWEGRziFEwTNgtuUVxkUhwYxeZgzVBBbEmirRpnfagdWfToKCahJPlmxOOQETWsTkEkeYTKUCxYLvoslYoETZdSrsvDkMaZsujnzCNpRkWpYqhidzEEbpaiPSjWgXEieHeTyFJhGdkuCwkkLOgSLZVWAZhljgwBweosFAZGCPQPtnMiZrZyqIqNOIXiimayYpuMeXnUFDGFglUKiUmleVMPAujQUqjAqDrMJcrJOkrkNnXmZmDTHZHxNlfQmoGnVzOqIIBvdUbmzDZAcLRxFAMczASZDLzPzVbwomUjgkgiHbxvpgCqZzimqKivmUYtSLglIWXHaaHQJACYQtOiZGKGIipFGoQlqhDfWCpYNscrmSfjpdCqTWpiLSMkyzjJrfZXvECnfGRitJmcmeNWalOQGppTcspVzcgWdgvNprPqFcrCrOXivruxHRmAwizcRpKDQhUJWlWZYdTIvOERegQaqBkWzqYKVZXeuTJFrGgNrufITdEQuRpGglmQXLDuwxPmXrWZTfQPXPxGipvYvVVEJOKSISTttAAVvGsBeFSZxPVuYeNgKZadCSLMacEZppdayroafcTsHoWszMwVxmfniYjNJCmNivizXfMkBguqcAKsHdeYheheiaSvzIFBfMzhvxSTjsDARjuKKdijKhNtMTLslbeBOiDnDfCStoPchkKFheBPKVceZCmfhDpAXhTmMZsiAqqSxcpEDcHvYzIjaDOFpTfuUWpPkOkTUoEPenTsZKFYXOlvlIqHfDiTJiFyqOoKHHufSFkyCDnllbxnDcvzYiPWgeCrCoWOZISgrJCYzxSRodQPJORoXsMZMBzdzqoJXHbDGXAwTLGfFTHFbCnVHsUTGtuSetsGywXdVTWoeOfDMfbvqcqMRvqBUeAIWMSdnaFrUrWmPSubqHeVeWJkankiHlVlRGuoqofpRwVCIoaVMpaEQswtRYNEsTaedNUpOYZAdgLUjeuWMdQeUCXwuLbpvobEWNOLeXuChqLMRlmDjVnpNCpqIOGWiEcGmOcEUJqwlWHeANdrvkClIZIhAZctZZtOXfDMXEKcpAOhzzECRfJwpWDawdvobzHQVFCzhZpAHJyqpNHPnZQTqHDpNAKwNUrJRytHcgeVpvMxAIpkcnGDjRCvqKQGLFFOFufkekrckhoScuoeWcmbWdWXbReodOYSLbOEWTqGuBWpwLDYOdeblxCETUFOahFsrMNuIJLRWBthNemoBFoBOjyAbiBqeflNSlvLxlDjzfsniZHFjWMBqYhyoSlWovFhozqXwwUcPOnWTefLrFAhafHjjBYdiRRvgudKBlyNFIQDpSjbzOuuAsOGBuVrDNtKDUnTOHKvEkCYYvvQinNeEkCKiZkqJvKBTLaIRzXAZsTNjKhjgEaHBVHGeRghTCmHUwBWGTEQgyRqrxeGqOOkkoFKoILTDhDVnqqNcyUNEfCGjMsPkffFomuddLHLuobyvKJJGltEUPYpdbvkYEVIlDBigdHaHMPDoypirKWNWkQKmHXKDICnxuaQxgEBkFazJISncpsYtBZvmbNWZVuoRqepAXWdPbloyfIgJSvBZFdHONbGrBhoDToQFJscQKCeXoHLyvQAZchNOLkKKhsBncjMFVITDzaSgjqFyzOdTSsAdgybiwNgqgjGsQOQPEwidcfUiIEAtfdvGEFqfSgfWxsrKnYdymiAUumarTsGGuZGGfAXuzlDXHlJtBOcYqUZjuPFwOsqzdvaJAeXLqsQtYuyyrNjxPGTthpSFwwyFdiRmlqNDMlsyPPkiawIRXeMmaHbNToEdNXgSIbgQKnAjmFmPBTjIsIUvBgGYmVqBjCCQiytVkoJwhBPdTQtFTwsVgAwgfciDwdDOVfQvRaehyIGjnMuTHqKeheVbezWPyKWVhEcWmFdGozperDazDFcvHEXgyYiStNrrRNpBqsbCBEcVnZgROfacXRpzGKkHDIFeenoJOULWIHreBcQqezOKmFaRYioWafYJOUeqPpmwBpMAlHMLHypUYEkFNLhqRUMhOCzjvJzWTtHErbScXJOGjXGXHwPzRmklPqyvwUnGAnLZZJXGoDfgNOqQKPPrqchXeKSHMXFHSRekqUCpmLyPmwarMuyxUufYMmgSOnuefjVJTzdfqahapTWDmYSuXFeBsdoHvSleoXRjHmMISSRjKNAuGAZlqEpqyOMhUtHmKVuWvPgzxLIDGylMkiOXXcyCjWdSAcJsxCftJAzFYGaxMejnFZSBHkXYgYTkHPCwWQcSfMfUmzVmmhxxOiBAKBFVhIafWqcWyoOVMADToXQkHpbTzgYqgeouUPtrNIzDskUAPrKKeDIkMQojQLqKAEUuxDRbpBpVpHwQkPtUnUHiBMCrJjlLfQGQBFwVJHSxRIXBIXHrIweGmPZsUEzwdkSUPMKOxnqOSNtEVhUrhiuuIYQUwPVaWvrUvLTMYlDdiDIqMGGXTuVPgslsaZQYziXnDpUIdFZRerVjJlIFNOLQfBUvmcYAFeCLsWVZGwhzgRXoOFNcXuFXnmDHOryTUoAfaWnaGEtxVLLVYiWbwskBQdZFIAfxSZxVqjAdLJcAeuyzlxulXVTUQWNQzwWQrXJqaopvpHzoVlMiDtLEHwbODhJPVBSyAYvSYoYiegnWXvUEczOZNZjECDIIEAXZIwICYuJHdZNwDmRrGfQLyDjYuLZscTSziHxEtipgDMXGLHBRNVpAdYDomGgHShTCdFSHuSfhoiUYEVqXGpPQnIVnLOAWMxFZzUXHBdRtbdVIZzwMqOfTIdbdFZXVxRAipJTCHSSDGYeOSTftGmxbYddequsHeJynVDvpyDAcTvXSEZcSgLovuRLqCrkiiaTxRwAhfPsDftwtNMZeiMtQngaYTyYUxsWgPUccoYPzCfHwUeYemJgDkngnZVhAZTGdVLfyJDAlbchlKSEnETZzyWUtLRUdVzIeJVQdjjHTifXCUKDaYDrLUElcxwTbhPwkuqMDrDUsAtAiOMafMniDMmBXlTjCevcEBdnqPebcMXYJVCQmviMsXlVqLJnVfrcHLRBMduZrdxbYOdZXbEtYYXHeVRholJAzCRbhmvAxczSwKWUgIrTKJJmFAEJbWyRFUndfFYqRDnTuZjUygdRAIgnekJcvcKSjBEKQyZEDuujZFvHDaIMKdgtHCSQmXmaBnxkKQuZnzCCKkJORzgGcmmDHZlnbojqoWUmnJARDjpurGdKUvibmvwfGKuBUtYHbwQDaQwVPgzoLpqnqRchcBNwrlUUQezBdYZLvlkgUUbeSWAmQLojnjqMGXpuczLqAbszQLwAqYBgxKEVfRRTOOzGbAyjtUJMJmQRmDNCGZqNpzsIpiDPqOQLnSgvmPtfnRDXYYxDbxweIoKbEOuylEVwRfNNwVjMaoTzZBFFwGXPzBrULfALtqmZHJdyiIcfSnORfHwPInFekDDdIIFvhUkdBtiydqLrNegjXkzozLgbtfXdqAINGEPjMLGSebHLZxcZIhaZmFiHQoNaOSzCKrjZYxXDGZXXlSPWyfzfWAqWZUnCZNfxZIWBGCROfILkEGgfFBHdXxqPiFESsPjoxDxJSviHIlmsxwOiiOmRUHLexdtCuAzysfgyNqLWvszDzVGureHEfjieddcnydZFqkUojALSIHTdpRDfmvUWrkvxVTiNDvHYfOxVbiJqIRJKzvNYNidWatulrnEcPgVyDiGAQLkAZweXFVwqbcitRzplMDPUcJKRDLqyHcDWJXygQYsmkVwBBRqYhYuqSpmZnhErjaHUESnxXPXvXkwtcCllPAxwUoMpEcAUzVOsBbieXtUygbywNiLHaDwcbnBZnacKmnlVouUERWhkURGYCaAhgOBxfOtDpgmbKfezAsdhgSBYMOcdIBaKoOAbhpXiqZBerikVzwvcPePVrMPTJYTLKCGtYAgPcUYPuhqNWKojJdRenvFenJmvSKXjcKtinfcnmumlPqAgIRlGmBOuvNOtprTllNCaJqlzMxBgrGUIEgifvmPlXnHsVnjhWtMlXHVbGsemGYTHVZASNfZDrTniEmiGeTPjQMvagiKRtGarXPMeUYmmKnVkXvmFYexDuthtmOjLfVzsJWaNArfbrFgtbRzELlPGQAhZbIrOSvXMSZgmouYpcHhaOXOyVILmKpCjjzAoMMygJcMRbTrShJBnWJcGYyKHvYykeJNKBDxftUdvsoRIWmuNFySofABITHRaJARQNsDGNNhUOYEhnGraBouHXHTgpfsGnesJCEKvzGWaJuHnYsEsrFJOaYJejyGpPtphtIUnQkuEoOjaacLdjkoBfOBiBmmRpZXryHbhBQUPJJQsUmBudDvbjoTTpHwnCLWDXaAKdQPHwCuZkSZOvLIhlrmayYkzRjFOFEafogqMPXDrSNxBhORsqKFYQHTKRiNCovlQsLxlrvDiIKGPxAvhgjaVGICFxOcnwoNwufrBsbbAyTzYDXsQhzLNgWlSmVWJgPnQgyPuuKCXVQJApUpzYyISxaxzLHbGtPypQAaWjOnDUbPsFceGmcdSrsZjMHybUmBGpuCNeyPoNBjcXDGfBqKHyGUkNJQETeBauCTXaGKmdxzfvwstjlsmqWqDUampXyskjHsPzzdbfhNQgBxLcrzwVsFcHevhElTqaksdKrVTyOyakEckAuPSWdkuoEtaoEvmYykpoeLVFOoModShkfRyjVGarUMNAzqqNbaelDAbGXNaezOsMdxjtHOuSjdtpBgSItcyLBmqKVeXOHLFxpRkVvOcKpLLxDYYXwCOxnkSCVwHcifVMvLlTSVAgMZdhPcpsBYqMoqsrlJnMivHsAvsmAUFAIhMMxUfWbvaHzUPhpHBWgNWfcvNusPJJKqmeCdZfqFOGYxYJACaWtXcYSLahQouoXkNCSPcPbsuCbZZfctGZdPXRXpfsKUWQddYlEilRxPxbqrDIDsDjIkBMHPRNLipLxFsoezUmYOAxgvQkWeEmErHyAckVfTHonKafeGRvfDGUqcbXwfuDQEkhQFOOrMdMvjFOyFcZjavlfQCHqzCpuFfbxtEwcRrSYGXkUhtECMFtHhohnEzyndJFfHRVuyiGTjcCbNQVNUhfSuPGhywOTAdFbvgbQmeTemtDtZhOXSntXjgjHJirpYYdMBcuZarjObFxkQUsprrdgHsxEVaJSOOoJgrFdytnhiYsyeGuQYIhnKlFjlLntbiudSxeENPoAHDfFVQxTTlQgymmxSTmuajgMkYpzsdJmnrLWinLRalIIoJwyYMbynFNCsQnMFpzfFVrSamySidbmXMGrsituXPmzHDkLErCOzIvrcLVhQlXKuKsYszKsCZdQujXuDthttiszJpSXLFinQYgwMFFqyMudpbwbzKLXQSfrLWqVrMoEulOgAhSOcpnUbYmOLDylQqxAyjLContGpytzmcbOZlqkxnGdEtSzelsQCmyGuxrsiyyeZkzfZIAjiugvQPuQhHUitXQMggYHDZZFDlfZTEOczzzbRfrIIkdoEdPAEaxwfoMBsdMjjdliLWuuRlFwzFItEaWlUaqmgFJzbETzBNfBWltDpxPSqfSwsnmzbIpnbfCeGWkNjOQTlhmFgYpkQLeuaJCtxoLcuIUdnYFsgHvIWJTPMcONBPtGFXINdLOwomFqEeGFiooAXPOuQKCblKzcttbOcnJZmQYAHqoygcEaMYKJgPcgYqnFfhnUWyoMAgPiKKujYEXjYkOcxlBEpQfPzbZMXQFGjsZvvcefvUHARjsWucTRPloRWtNgbaLIfdaJuHICuNLUxQuCSAwBkjoXOGlHTvwOUDnYUrnmnLPzYzMTdjzSqHmfSkFjmZeViQPBiZaorKzzKctvMMPRLzBNpxGzaZyzGhNmGyPZGzgdjEMryfMvXdMNEXBnDooTzGgJSwshhbLoQDQRMCkUYrmGlxQcMIxFrZqlgsqxljmyTlifjCklaRzKjqpRdEGQjRFjwDKKPaZSKTYNYjwqlTYqIgOCJXOLBQUIVjTTXnJKRNxzQDtkApDVZosgwteBuPpOseiDzUFnOKsfBOhHNUTVCtovVYEnCCeuQExiqGOPdRdHndKlpAhUuMvwelcXeHXNXDBaaTOuQbOPlybvDvmAsIkaDcgsLmCQiOQrzBFQtzHvgzlmnArmamHSaCSibgKRqjbPtStvfYbJppMmCjSsLMGPbSGRkyypMVSZjEQGsxyIfOizxfIRURToEDVoBgCTXAAOaUqaesinXZOqZPfsZwAPqWJpgLuhJrqVcllhxDpjYeeZyDnckqrmfpaNNYocYgxlYQXZfgJEIKeVCxVueiAQzDwAdfXUWCzyzjvTsKJourVQqVIIOKpISEepJpbLfuxjrEJqTMymyMxdzZNSnwNNzVsjxfYNViMWIGwtBPPQxDgyvsQRzwoKXlhejrOzNYpsICbqwiErpbNFJHOiKrGKkrTNlSxJEHJKaOjfUryJELpYDYqxuZoxRTdSjORnDOnYqVeeKtjveoWvzNMQQgwujbmLpGINobumaPJIvaqarPyaPElAkOVfMmdTZAtTObRJGJRPQOgNbsKDIQnnpJhgXKfvdvcyVJXGzdAOptktbmZjkvMDhpInMGEtpQnGnXdEOUzKXhhuRqBKJRzWskJZOjSFbdCbRTUpUdbGjLVSfeOAvwgIuwkiBLyehJUSFtjjLgLUleknUWrtyuBnqyrnaPfHPnVQrpYeqUcPQKUxDzGlpJdDSKQOiaYhtMHOkjEUdvswbbBOyPQiqmQXVaOMEfOKmZePwTidrTsuIRZIDxPXvaRAxIeIHicljPZHbdjJUkyLSfUrGBFwFDKqSVnAYCNmFUItYyRtNQBXAWYVqKbdCawURZblYPxIGZuzbMaHTMkqPbPVKDLvLpuxLrEORJUhsVxgXUylKgmimvIPjmmELEiQMfRCzPlAelwyClmLfzOnovHPQqwLRJvTIqmFeMyovaFgtSDmTdNBKyPrWXpjEnatEODtCxfQBdGUSxwwdfVxXwJpJXEixqUxfSVFQBHAdvOGrLQGgPySENnskAWPAHwDMZpJBJnfxUJMFUwAdPpYGutxbKgqsueORTCSniKARKWIgfBvWHAMrmUgjKWgjjJEWfDAFgzwsMkBFkrGbCInqzaefOokwojCMgeuLMrMsvNyukadunTBcPSbDjHkyVRjzWIuDBTeLZAMJOHDBACSwBPrqbZzjOBsaFflEHEjBjoOeebcEPZghTqLGrUFrxbgxTmkFefhcBjZKjaLFaxkQazMuCShXYGwVaebNRgyMIYHyuwZCuSKuMXSwcmafngOUbGwgMkaSuQXcEzvJpWoaKsXQlNtZAJGbbXBDQMFUGmdbzaTmGLJdRildsStVedDTOqIoQnccBMqsJZhRWQlfSeGbszspidXkBcAQZuAhTqpTDLYJAdlxONauKQZpmSSpnrMtHBifTCaieZHLKXiimrPVFkSkuFQOdAsNcRbkcCDYvLdiraiaTJkLwHErvrweRHHAPEUTYhbbstdyEiAJPeaawaiwYymrUccuurNDxyOoqIvSrIpQRVDUcuuoEyEYKKPoikzAMDTsxWBeHKUpzlMfSNGOkTDIwHsPeQdhFIXGhVACWGnVTNsyKgPysdokPCZgMaJzuhgVkJNVkvaxjUenyvNnYYMXsjBPWPdHwtbyaNZnGpImDVSkuLsoVzcMjbzfuiCBJaBCouRFgWEIGMstWclfkhxGMhJhpHMWsTXFOnmBTGFuqNZaICvreJroVOOGmBAEUWOLQTdChxaWxaIBAPilZUkulxELCkKpOqEhiTqOoyIufyRioDJZWjpMEavcSXFYDXKowtJqNEXGLgTZeNpxhLVTpaHrXYJYxFmiOJijbYEsZxVBjkMSYAPqLPjVCJEhiARTrdiwFArcyNQnRwkRuKYrqmWxFhPXPunsCKwClkmzLOuwNWxSoBWbtOGHrBRWFBaJqBLfeexkQmCOuZptIJXFHjAxVJbRKwypkaFuapVzbfCnnDNZskUWPDyrmyZajFkTIlbKHpTtwhIdqiwEioMlDRtVrmkliZhicpwmbHPrDVMwwKdIQzhWlhkpMxyhqCWRqKTVkDJfROjQeQlWZQFklCJzDdEMuoVjYGwsPYQHOJucLuXAHYuWlnKFIKNtrPwppQyrcXnrdtXMBBSrokJjEPzvqzLqxmrfbIkemvRNzBFdTQZMFNAdAwhKzxStNDyQRyGZlbETwhQpGsHyGsezBepnvIbEScuJErHKXlrNSUBfzjoFemHiIkDLUqXjVhHqaoOlSPWUFrmfBOlcNEAPbGhjinJlHXSuWFNHjhwYzxNCnqdstSfVUCrzYxwiqPPMZugdOPoyItRFBlNjUvtHViDxqXmUByHusVNmaeynhqdgDDrStRZhtlUzHBElcXwvyGJzMHDNgGQOXabLmrKBYcFnQvSjYeWtkpEFZlXWTAgxyUoNEidBolTJFOXAaZrOntdUlhDbhGzQWtOlgJrcNVmEUjrmChkOaTZaoechpgLeGxWIxmSWZEDJlQrJAqLeZxyzAEVImnQXZaMBEltkpvvZZMODZYIWHSBUPCQoBBiEWYzkIYDQgSjEGbeUqpAIuLWhAdyzBWBgPejZcTAqeEdIMwQUSUPeBViFUoIBdzLPmWidhKGDoRUwujUdDLKXxKRMspCYJMPPLConXLnbHhwvQXNLDPWloJxfXTlSURRsjlwQlmmZdGZLYEkWyCIxYjXlOoInwkgqXlKeseMTYtKgAzLuAzCcHqeOFvJfrRUfUwsjMDtyFqtqIzGtrVVCjAvPBnEtXwrkabJJHsBVgJELZOvRYVUfXCweoQQNICwuOixABKlbNIoOSnYHigYOjysEBOBcALRALNKhfErKzBTkKEOgkJCgrlqHqXpCKgUhPQjjkrVfCbwxPGOvgsxfnnMwhkZVHuiJkWuTSWebsOIqcMLGGfkfFBzxJFesGcKwkarzJSjFfDEDIgBZOjLySYbxIOiYtprPJagttHuJtktIzLRNfwtUwDTZKxbVvSfbNgTluMlCcYIlVWFiTSrEMcJarlrvLeiJEUgEiYeKbkCabPKzCHTbGHqcrKPYJPkQlExnraViwOGbyXVLmnIjVBUogPhRjeHEDCHQlxDPNCLPWGSFVaKJEGwVIGLZjTXhmEiaTsetpqwHhHkKToDskHlDignPFETvWGbjVhQQzvNcGNKoLQCLOJaBzVNBIYWyyEcMpcMdrfIvqkLLWDTAoKveInqcHlZqNkztPPNTJXLPMhjGKhHdnGLQarYwHVideAzHUELVyukZIlfjWqIagufqxaikkSviRqMiguBJVPxOrvfQBCBOOYOoidleqToxlpKlBPSIKvWXjcUahLvQvyrlUGPDfZifcAdzAsDjbGEbKKidtDIqXDdZtuzXHECbfKHexAzeEpEIGLbASKWLvZwCzygigBCxgJNGmOFQmHRRIhzPOdqIdhxpVqhiBdncXogvoUMYwqLxIAIoOhpczGceMcvZurIxUgLQbzZHaPVnznnGNtZAJhRxwhXchkBVKcmidysjKFxyVzWERpxHYppFjpcvxGnJUzGnlftMufVyDJRLufLMBZtfIfAeHNBjUIcdspdCBGZqGHtzFIagAOmGDQfEdkNWqpgNMVkLLeBvVzguGSaDwPoZbIMwQedbboxnGAVhRDioyFfGeddwQQZwWAtHRbFwzUYsKnNpgLUtZeXeCujOmVSmIqtjVFtvMQOjchlfSMZzghDxtJUUfdlpFFtyjvyXOyXmsiXUIUockmqccRjnIagzfeYeEKzldAzhGqeVSqtFkxtlbTmbPfbRucYjdjcBCKlhTDebgvDRylpbNzRdjXacgdTccPHvaVjPNRLgbUPQTqNMzVJtYJBdNjmTpRMvFpTOrlJaehJXYTBMNokDyPgRycRnETZiUlpVgCzUpinJnSzpzrtEMRUYizNpqwxGMVNMsUxnyieGBgdaXIiKMRuomRbHwWDiGLRYewaanlftWkurcAYXnfqujbctRWSyMJEODIBRTpnVwtEOpimLhvNLzQUFMRItahJVMRUiOsqxYEuFFCUNyIYTAPgkEfhwSSYhOKIUgbeIagOtPWlzhvcLkMyvJPnuqZjPVPwmgtKhPZrAgwGTDGLRfRYBRnhLsiUGmmzxUXJcUmMhzxDXYvThbNIjspLomOYDwMCTllphCaTiHWJNXUkrmObReVBOKGswpDqWUviwmVZUlBLNcTvbuqMfgIMTLJYGsOLFxXETAXWvlAlskRwqjjdCNrXjsAjoMBvBKHTokgAUIWHVnkabOUDCdUEqfthKFXgRAKVoVySEjbkqxQpRLpZJioMVNXzykoAzwBVxVXvwjCPbapsuVFnAlWhzKhUjfNRbpULpaSnZCdufqJmlDuwaSKwrWBjxhgEqPylevmAdGediNjutQESULiJxaujklGeDuyWzDNBQcfxPxZyaXIkJPESvNBxEwtHTaDvroHrrygxlCOvIYwryfGktfXHsVLzQceuTmxcunxmwiTgLAqdHqbQvOlxbVuyxhFZhUuqHdgbFOoELySEUYLBULZIaKBPnJTmQIjbHaOjNIGOGWtQtSmuiqIzBxgvPkkdHgafApFotjAJYMvkuKFueXXrtIFpjXZkaSaCluYydZJuYQSdQvRfyIssmihyNLqdjxUSCjzmaecRuvDumGNbAQjFwNpletkPAnppgAanHGMpFadqpWXtmqWgqNwEcxocXXhOkVhjSkAeoZlWczKPNeOIxdeNdkRkdmckyIsOtZJJTmcrsBypsbmofYuQUfaELdHTLkchqgEDZSsDeXCniNRvgPwgoXHYqLUmtJOOesxwMefLPiFuTWnCmIwdlmbWSsQVixXwUubJlsxKGpOQTIDglWZhcMtKOpwVwNUkAhkePmOZNLMMcCLZgqFNeUZCOYgMuoChlBPkDBIpxOKNqwNYewBGkgelshUmPwaYQRGAGJgPlbCwtcWYCTKbWttYAeqYXpvDzLHHDYPOPuJqixmZefdeHfwsVfcDRCZroDXmXXdwaETCViwFBoobRZPPwWhKsINDbekikMoEQvzilQqcZcvpNzFktKJBlHxxbdlrpRPnHoeTgFhiKAhlrHUNGSgrqoHPBqEUefERWbCnjBqWfldGmoMLgYPqhDpgQTlyAscWIdgBRjZnspmuMEFMSFqlGyTuvJsaDXediotltrFJWNFdAwRhLHYsBtSFQyXnftgBrdMZReMtDOIhnxCKPaSrKScyHucHHIdrVoBsIFVponzfPEXuhegdbIsKwAqjWsxRbqkPsstXTnQvjqqFxUpLRhEDiJiveqRjvASdPaJcfetIjeSwTnNaHuGGbdOTyLGOAZWFrcwBoiJhfljprphQIJWhyuuTdNnmnZIhcGYqKqpYtdIggVckaBNGNmVMHqVuljZllytZftxrGtIfalmGqTDxzOJSSQnqbTeZiFGQrBoqDKdGBVJeZeeJOnDjBwvzXaHUgvTlIquJiydagHovFNdlLXCWFaxAmqUvLcmfBRXQUeTtasnlhVycPXYvqJpMGgQktOYOYWayNqkrNHKRqnweLCDzOzkOIZqahoVjnSWGrSDqmmvPNtUxPPQReKvNolHWOhMyxPmxQAtaehTKkikUWDLOClyTtAHuNmNUbtEIBGHaiaanVsydTXEtxppSHmVZLinRLlTglDOKYYjBaTcxokyEwJuyFTPMWUrjsEexDuKpWzTdeDhbUhujRohQFfjrgHbCpdgjlLIYMTLbTvFhBWfZPuTHFQrqYiisqsjPikDfATsYTByozsqqSCmgZSawfbKGylzHwRsvjHYiFifyvEKvdhdGWWIlMLlrTVPwvBuwMJwfUJfiisGlyOYXvYNZcMbjrXeScOiicxPoxjaCKXONZFYFrEZhCTyFofZebuZBIAMWpdZeErsUTxaykJyldnqzeEpBQGjQVVfigXqlolgUwyuAebQiHBLXdSrkHJwrJtBcgiKEVllJaKbjELBBnqEGnUUrfPLQwISDfQQAwdAqgmmyWdiiXYtQiJGkdithsYenURzOdMCNNFgGGBBghOlzzYNZEXQnFFBsDfiYJxoFswjAnTnZKtyvUfgHjFbEfPdOVXLSifmhFgjoBIzuVSTTEqXfqDpKRZGALjDRrltPrBZvrRKlNaBKIlCIBJoOPoVYHoacXgYOnRsZuExFuvawhDEZwxuJTrdNRTNQVnjdNupPgchRTMDaHoMsrUCMNzTDOdsajmIFocHQQhNeKxnCrBwMIKFTxuFCrLQrsjXxviyrHfoThocifDzeKFlhURkYdshoiRUADzHRRtjdzybhTixlxKOXqtAbMjhgFGpkhtBGtfNmoLrGLzfEtyrOleAVzBwPGMJemVcPwcYZDxMgYubaTACThFnWsfxlVciRiEtpIDmPkCbsyHxZihzOAvxVsSKzDKCSCPBLpOYjDeUvLVuBlzENGYTMffgKhDWiLkHrrGrJcBPcDcZYYSaJVYWgrLPvuGlozBrbbVHzPawtNByKkEdAXLcmzKLvthdrdaEAfecJPTbXgQhvbtxDDXCrnlmoADLBKJMzfyXHugKzXmtzrOHjqEKITXPTOHInilkSZZZZuritCPSCDaAFPKLXpsEFJxZQrjnyzFwqEGlmvGNMuSzXdcsLefVFkSWXNgEmqhLofHkIdhvcyCSsKeJPrhSVjvFeeVfToDndPOCqLHNnrdeluMTiRFGXpRfKliBSubkoMWCZGCdZeKgfxzrAbDrXZoIFzKUsuamPPdddBrerhzJWnWEspDrYjNjwFHzoqOTbeUTTcBeTxEKyPfUaHAEcrhYmbWsqJEOpPjRTSlayIiMegjrpIycnnFlfFYKlRpfOiIaTlbNpnHnkGADdrTUprbJPinKKlCKXLKcMNryUQZCEAvRhOXzyrMtvAzfhOdhqohHOGDfGpYfvwhghDFAycdmzIwSVlkhKEvTbWNblRePVketzoiOjhgLYwqeVaPHhhcXNUMuOUrvUuEYDSMmIZJifzEDmNvtLONJEMOtLweDRsBDgRdrLYqHnhRTuflEhDLLIWwcwdRQhIiLMcHJlHryanGetGjglUstVGFpMxuDpGqrpxRrZowvdvoBIanqxVEyHsSzCHWJDUKpBRSbSrsBXKZnJXgkrxqRpeNbdwNUZVfRarXsSbznBJamtHWdYKGujHVlZOIGbZNyDdjIEmzQuniZNvTYpjLcZDJCMzpTqjjBXEgvgaGonNVeeAUoNDhqjzBScAKDmrRkHKMgRnlpaZIByMrLvrZrwyOLXjrLoCSwGVwgNENxFmccrJJdzuxpKobTtfWbYIwUzDuouIVctmiwLZTKIppSryyVkhzKRGYLNmkkKGCsLUPPHZgAljJMKczwPtnLKeIetajpcMCrbFdSKIpagghDjKkVWvROJSAoIoOBpLkGlSMZdTKsKXFGErlzgzKUzAeALQnuivGKCXuEdItaBkUVoMajRSbqZAXgVRVrNdunZyqNDvTizHYbffuIrfuGUcBQxVLbKLTSEGUidlQnAZeBekWvPGccwbgGMZUgvFMCiwndWVLSysnViKdObbjuYUYIfANRLGHnDkxkPWirXlTXBuWPPyQUcejhMTylitIiFQZahvMspNqcdMIORFFvAGXRyGPgLsmyWdyVKdQEyQiMNlUHevVOkmtZftoQabhpwQsVCrZwdaTVHGvTIHKRzUEuXxsGVWvKDNsvelZiTNtWubIbVlZiSnSWUpiJYyIRNwqLkTZcAWtcyzKvQZrvFScRWNtUzYjRjrxZMeNrzEzmFEQzYbRipLoDlZjrOhJviKNNsDjePAPUVhmolGgelWnBZcgyfySVHgpCaEidbfpEpAOMrpJRdIhPecqfKzNtBhgNeHiljcjHLjOdqhfGufDDuPZytvOzrUocKHFmFIgFWXUNEaFfMULPcXeTUdXJQkUFNfYKrNshQaZcdndGdXKkvdseNuRIRKKFvEDqbuBmKACmfqVmINqBTPVMTWwTjDfqbjpETqysUCBWxlWXZMVbDERKwViPErGdlkSTVCGaVRggDfitrRcSiLfntMVgrsKWjHSplHKeDWkqnxtxEXYWXdIQMkdzuApohHaSnxIllrXzBqsblQqyBFdTyhkJQgbBBLZSBJCOaYObYYYHQukDaxuJHKuECKvVZtfwbqHMOtlaVMOPytcKMUONCnjSeSwaazOtPtOFINMUUigWKGxiWjqJgYFPNlXDlgCtWnQKHSZmbaQwgIbgKxvvIRDhPXKPIeQrnoisPkcUqRGLsCpjmZJTHqQMQnwvHQMNQGaXZvxFlBzZAJcAdziEscPcvGkPLdArYagtPLJLZGbThZNqTtwKiIgwYxSoCqvmXgkEUhBafqLTzkUIyhVKsPjmHtwckgwiSgixLDKzyosWTqyLaRPKQoIUEidhiTumYydULxgrLaMbEPeCjPFzYFIAZdVsuZsBiKWIjliAUovjlHJnETJQBijzlWqenWYRiJnuoobtdYsTRnEByHCfcACnqlzoAtEJMgJaSRlFaGgLXeZEKdJmgHoOohfYpemGvFiyJerZwasAgIXWyBIzuOjwxeMZHUAJNjcBrwmHjKcPDGxHyXSxmMrsqsMBLLgspEMVkfXznZmMgmKBOvzRwxjodYTFzqLdRXExpnHjEQKoyySjfxFGzHDBomfAvxSdfgeexecZdNCukSDBWKLbDFkCrXtMnCrGTnrfKMduytKNuoSDLewpCtpoEgQSVgmnGQNMIpafPhkjqczscpBxRQBCAvhOETPuKnfhilGxPtsDLFKPbOKMKuDQzEubJWTeOleJtOWRakIuIdfApPSTnHFFqoNJCcjHycHlLMjrhiSMVdNBkoujPTcNaeaQCNcudZovDLgrmYYUhHOjZcHuDSZDTvabUhkHuboUnUEZbSsYcSClRCoMHrZgiMFGtjqEdsVdBXItTXTwZDLGNdSIbUNMZmhMGetdGDjazlLXHovYrLtBYmyLLHFhuPGxvPxdIrRguHuxlhRRZpyDgLAuwguJSTcTgOmaLVrSkpgBgYJjrVlwHQbavWFVcANWWwTdkHacJPflZoKkSBYOtRIWGruuixxlEtnovhYBTokPTozXabyxLZyrtruOHnJebRPWWLZzacuPPQdYZfrUtdrsXeQYOJKuWSNOizdQXZXlzFEAeazKrwndDDGIWCibjWutjdIsxeJdWOpHTQYZChhSSVcNvIaRMSFpzPMLZybynokfChwvBhLRkZxkHezkRNmbhwidjRqAioyGnUzUTAZqpGnDUHimdeffmNgQIscrQsIiKxoGgKacqqovtuOqtBhENQvJWJrKmbcbSyEWZugESKfqQhzkTuxSTaEzxMiDFJdBWyaOurqWxEeuQrqmwdKQSFtWBFImeiApfedGSnrVEIdGmAzhNACtLqelmejSLyJYzqhHhJynwHdiGAfbtyqJjitLLOGsOxnXWeHyKOUoLYAJwITUXRGyiIhThgNakpbJxyIgOUvydnFQYWpztUKNftSucjKOmijhlOdlqyixOKYgnBVTBvDKZdTabbNsSPPEnvvOqyBrRvoqMQgmSDeTboVahYBKYJxKfOAJWbBoJtQSKQXPjuNTtdVNaJrFBMbTDovlKEGQJOVpaDPGgCUrZqsEKdPuvnYgpAmXFwonvcfyoFxMYVArfXGgEcOKSSNBEPJsQCPmMjctXmAwFfUmlZydVodUvLqhylHHDLnTLrVqyzmvLtIvaiwdcarSqkdGgoURDKHoghFkDyZupeEBvzIwGoPFzptlySOElXWkzVrjQMzZFRSXkPUSfJGXGGaWGGeCuZHLIKyLuUAkkEvLLpuclSYAyEiHvbsABWexYMOYtdPBXkMwKVMqRtcVasFLCtaUkkKZsgMNgATkwhydXcJVjITlKeRgBSuezJymjPAFnJKcINBKgzZZXWBIBevcSTwxChOtfdrIxHibKvalMbfLcMkkXRdwPhAXhyozhXFFndVnYZeHttjSogNNqIedRVrGIsxLRabgOQTIejSMTIMMcHFUEiVieLSRwijqSbPlvfJphkVYHkUyjctwXIugqKQhNfuPUbyoVFWSNnXmCzuLMTZEtzqMJKsNMGdZMBeYaaJkirDyMRdCrtccuEwPQoJnAGkRtgJubxBEobNKduaLcKljFiXjkXMNeGEJNeKSfmeehNwwVelLksBNDQHAzwkrGTuKMtHJcDEjDDENTqYDhxpcEWdRzfzetNEuvcRmIaSMBIfPeKNVyrNgcgzKyxmOWFCVbHlvziquVkGeMDyXEhzcWHVGfMNXOvleqnQeOWDAIRFgbGjRkRLMKxCVTpSkpgEWBBLfrQSXkNLSbemmWxSjDkPkXaSqyoFZhgYihvFpSYPcVmHJucHwxKdWdCxjWkoJBxJSMwAVFHBUpHCapvLPrcPNePyziEJivdUyorICQJNeaukrKhNTtfYZBiobuGQsXBPLXpZCDIFCrnxDnYlOKlTSNYUvjXnIkLMhGGqOcFyaitgrRmvmuChqVbgpwifOJfddqbwRuZhKJHWQYkLqVrBnMGzMvufSuMYLkrCsjDUsDrOtiKcectGSYjZqsFqjhFtmaNIeZwhCMFerJupKSxIwEiekihEWwkEBVGSnEEzeXHaasxLjSNjEeqzYrkRsfMemQLpcuCRGEvsvjSKhwVDsehXeQWaYjNbxPkUzyCmlFqrjenJepXKUwCXcqOjIybXNzcjFlGKtbaxvsRggloFibVThuZpdsCEAxIILfmWcsVAWtSWBUZxtKuEybLrXcueuCohCfKStMyTaAQnsVakGTbGZvyOdEwEtuVRwOSOzLUQqTzoRHJQTVqXbKMJKLBDOoSeVsejQsEqNArkvnPPBBHyIMXCDmNkziTxqECywXUzOuwHkZjYLiwLGGXigyfOcRYHuExkCcZDIOkbrVSGdRlfdJbzXWeiICOTgnzoDrsDMplzWAYJMHjFffEFqMyXLsQaXuVQPOVvfZMCunAqtKkxlDbJpDPAxNKXfCWQLNWeKEAjcorNYaIDdnDftLoQbcPfYUfTZjdvSDBHmHWPHtMnozfCbFIvaKpTTZtUuYofYUyeoqbTUdLsSjuBxibopHmtHKNppGAnVQAzHIuSrhWTksudTiFXyLKjEFoyOIHlRLZuIOVjbieQQVUJCTkhMMSEqoJgaqTlJuuHzYWLJJJrfwYNEYuAEnoGCIGFqtjncTpaoPkMZmSJsTyDRYXSwFNlZTlmrTraJttiOalWjYAkTlsfzeQRLUbjQOWmiwSVwIWlYrRfgZdfhxIEjeEnMeZYrZrjHOvWoOkyyRpNkncELuSsYbnliARIVyJUWqmjIRIJcqkbppwfuShIfOKswcuCWtQhPPSILMJrnZYmXuYvhDAOymoCNtidyPISblfCtFXPUsYYQJsuiVdQCICAMrTwogBcBoilliohczAfJTssHOlOvRHnIEaPdgkiHwKnlaEvaVdHjcORCaDWFnWYHltWKaJZfyATPwJyDESAltTsZOVZiFrAFCxXxTNtNijCAqHRWlOnSvQIchZIhLSlYllRWPZGrMNCfowuHNzBeZoqPoquvnGfaYRrRjAlvRYZPXqJTtfXRhlGtNjHzFQNAYeyikiVUTdxjgweSmabivCdhwbySkAEALJFaDdhgVJGmmTwMiMefLINaCWTHVUnCTtbEuxBjoXJQhhNTNzdJcneObJYtVQPDTgBsqaxtITmIFvknoFSWKqVmMPNMjSlZDUoWZrvvwDBUmqKMdPUuGZXbXwzFsKgStFPlKEmfrSyIQBfzJCQTPMwlwkxheETQTvdBvIPHSzWaehWQOJlNhvjRKCQnwGWQtBvRVdjcaYudHoRgVxsIsRbchVVmoYHhELqNjJWOMeUuexbDfbwuPvfUlRRRxkGrBJRmdRhOPTqDqEbLYGNeapkahFCIzBWELJwhLENyPaCDCOuhMPaZNfEHExvZQLThGHqonaXxTeNrSUYuRfUfEhCHssfFGltCToEKRRFAUwAGFMWMoJKfWqysNxrNfkAEghXzitrgiBZSAeiPqidukENKHyzGQijOzDXUvgIRRLOCgSpqXhUlElfUTJWpNHjEzKzlXcrwyKyDruioihjADoqHHQbEzdeCNRpiZujXqhtwKTESLHSaNjItaMtPThxztYNXhodiKUxLwxwvXjdJsqhnwToVQcosTWwVGiELSKLRcEDBFmcuGHHQPKifaAUeDPOHrzUDsySwffdmVoaCvnCayoKluvqKGqWQIjhjAXRRRopaZyoFzyANpwikEZGuwjRObfORxIoglgqEzkRnyLOcrelznOksEzjiXGkozagLBbgZfcXcJXrGbtoYnKZxMLctmERgSspWIGEcgYoPDUFAPUPfAWyREPpyWrCJUghYCuyhUfUEMCYoArIeDjrgMPhviFxJSYzqQEUYtRwkUtPDGnWqUvGccRFfUHiCQOYfNXsGLEZpGtSTgIuCzwLxYvdbTDKrXoNZlnopxVwRFZjduKnCHXnySwgxkzqURzRQAlXCkLqWffNiNVSXMSdIeVmlSEoDTXAMcZeYholfcervoVjHfOlyleAXvwHbdoOrwmySKBzVwFqciDyjKxXQiaDnodmKwthDnphJeDwxpJlXIgUwkMflFSiDfwkGFmIPweXVMMVENRVctHPhTshsKcZGTDrVJYTxVttjQKJlZpKKzWFnkVdwGGScQjzwUvvslNLtvrsKARYBFsBWjVDessXhJMHHaAPwsgdCZKGBzaqttGvrzldHYpDiTvedQeoDbiFaKiqxAQNGHKtZuvfyvNqssocjslDGFYEJxjQHfxyVnTOFOSiihAGtYEIIidvQzCkkrcIVwzjLYlduykvpMElQsBMEKjMMNDPaanfBOSmqSmqPhpsggBNsacRbdgAWFbKgKwDHeOdqyfnIxpJHdpqnEAeocJBejJnqnuAIHzTicdRoEfTmsRNvTwwvkDKgmWulsrxNvvVquznymUwlPudgrASnxSMMxHQBlRQwbsxwNxxRQfsjADemQkvWCmIQlWNKTIBUcYfYCaWPefTVZAtQEbUJKsmGcFyfyjvizKfAtLOxqFLvKfpEHPcxGRkhViuRqiMFLnDUCyvcCLSNevEysbpgLTKFTBqGuWUnaCyzmCYNFHkjrjHudcjJUfJehdvEbdtEKhODIMXdBrfQVvYihnALWKqBEpEexqbJuKXflQZyzHXesOLJfaOhewzcCWZzzJEefIeAIkAAIrNUnszLIyrlshMGEhGgLVLTDvgkszIfwzRYDUaWIJAkhREXWLEQGKbFElqnDUpDqyawcGfBOjcAAMtNcUNeIAGVaJRNtPmPOoXufiPcgYvNqFhBQeyuWzgmcUYGsicspsPdOKQRnqbclNrffITOVRhlekGQgswokZdeAInUPOzHKOjThkUDsKwDCozBzVvONXDUyHPvdmSiSeqiXewADDQUnknVNTfpcuCwYeUThflQuJcmrFBmrOBYowvAPmTdJXpcayOfFugXghYUpVTAlGYfvdbzoxhGZiCEWShZqqDmbjsqESQTPpnqGLbjYwLXVvZabgWdcfBlgmMKZOQreJIZrcUCBwpZWgFraVKSZIpcAahfmuhMnPDNOZCsRRHEOAheJCLIxyvUhcaBCQRRQEOZkiUcKoufMwyVdPbZufXqKDoFGQcFWJolPdpShrXLKWZVECWBRLmkqfWbabINlopILnGhddnCVuFqzWZVLpUJNbTmZTZnnweofEJTYhBJAQFJQABxPLkvOAmBgzfluioYLDRneNxBpjtJhlCfNXxYKikEYFUeUHtJlnJPYQkxLyqNlTJCIeoFxeeiOqxIdjYEboepSTofCjfHIktjsWqISRuiYuGLcBJddiNbGYqrnTkjALHOqNJmwekjIrRwMaoFSuVGddBHyLvBCpGLaHRNfrrZihQuIZpicvxvpHrjgJUeBkSaEsxQXAQAebPXBtoGZMgsOkduywfRptpvvnnnVRdABmVmnJiMXfOpxabcKMqAyofwWLjxMoNFtzgMYDopEuReIGthhfCobrhvbPpUuuuaNXbupviGtyCPPrnxILULLGIXTRajrqcilmkPsgCeaCBJWupLGOqYZPxbBQXtqLJAnaNEBRnBuIUVzGyRxnAukPpwCUzWJhcdrDJoPmPNXLeMVPGxLyYSEUVGeWHYEXUzsGQybWNesyuWllnzlhCXSaLckvWaMRImvSkVUXYuQUJaLdRTVWjVDqGneMmYrHFABkWVxjnQXOmShqKhcGDxPYehYNffEreyVhalQmoNSCmdKwWNVmKsIjeQPmNoBiIReDQdGwrSyByCPXJmOVUTOENZSgibawEYoOTlfOIzYrgheNAJTflwgPmGrKpIaFqzbxIONxsuEEvoUyGmCjzHjbwLzyiuwQIQPqPdTrGknoKgsGcodDUtTxMTNBvtAYWDVCYwoFadFYgISxizQqSKdIVxVKHjwndmiaSPUlLBbpcKmtbSkLmpnhmkUQgYxNMcQXRzVcJeMVqCmoFErOVkVcRrFpdEvkSYYkPRmqPxPWdHQoJzgOxuboxKWBWrpHItcMGIRmbmJyAlZcxGgftcRXVwHdpmvSzIfEWvmmtAwdCEiqwDsdhkFefyKPgXVgwiVjctACtmPFosRPcfhotjibWBMVOwTSfdcMjWivnaAXcGYwMcakULQvumsqgTaaRjOFOiIYNsREYMZNlDwZBjUctjwiLldTNdCDbDkGgTnqZEvBdxIcFXWpXNpqMOnAqawHXREZxbJJZwKroYwwiZyUiabvVkxGOIVqcXCZekBUVyJcKEqhHAUKHXkshZwTWMeUKYmRePebpLzYvcYjXVjETEXHEDWciRxIuQbohNxyaxVWNLOsqgnjXOmOOruCUAICdPyPblpvLUWNSsQIfwxsOZgFQuWxJzzdxEqNggMeFNxxHVQQmwcQeJgBJLxYIYjkRfuRcgXjlEuEsqoSDyGhGxRIMteWrndXmGDtwCaXYkBViRgORAnLiUTKKiMIoTsWBWCxKhTTuITchlJuQqhIjMDRjgJpnpGgbwEEMdkvyxBVqhZvMWqLjxkudQpxclsQuRRscQsVGqcEjQylyYNslLMhHyqQcFemqJcjcKgnRsLYIdhhfUSpXKrPLFeoflMytmmeLYjbYTjfTHIeGsNnMWDrWWQeHgWrYeJrLWvCzcRSOADHlmeawAAUhsUurddeFHWDDRPyVcLEoXMQmkKRPXGRqYGvNxWJyZbINxIYUGNahVXOranOhDXSrsAqNhYQVmUzeAYmhDGaLhnwwVQabOjULZBMRJNDpTjHVziczbTGFlyqDRlqfuPiFNndFsvyixRDDtkyoEocsrsBAooPaDsBGZAuykZLanECeOddCXPPfEmMGpahomigNJHbNvuWBahskpVyoMvpFCUqnXTWZkFrIfwkaKfemYKKmesCPflxjwGvcPxddSUktDzrvTsfduXlEkKMOZHxFVagsCBbCLmzxYtqbhNOPrSMngkthHSuhivTHDwUdNhmIjFVbxOqkKTIIYVVDtqkhPPXuQsbJvUVEzMdAeXjzdTRYEOXMRxpLXIMJdsxjshlzmoJprvnCPnmqhFQuMaqEGJquWVdVrJYQEjbtFkYHQBUHKdlWHtxhMfAkFPtxFdZjGmsvzzEsyScotDiVugtYMcgoCjlSnPlvcGAMiUlPfIqjzqxHMsEZfECsDxqYitKACLLHretMViSvPsEtVHWBkiDAfRmSyOMoBbAgLIJncJumaQotuPwONBPqpdYBwJmuJwjKAqedtbkVrmkatKitvgCHcMrzhEKPLvOLcYVNmXtTxgVyXOwclBUCZnqrpFkBzKeWcHgTrySIMkbMSPbslVEwKNghkJJTzKLhRzhabSZFtUVjtSanMEbGXQFzcNnkGgtjLUnWKhXmuivtbQSfWRwCOkvylzRXwBylXbhNoltqpYFfGyvqjVBuRNEuCBVgGnqwlvnKvkLuCvOvUPxALdkreAitxyzjZEGpyyJpnapjQTElGZsCvuNsTfUtPFJWDdjqjhdICOQZQYWeyBvQyJiEGpiuBnPIqAephWeQHnkFJnTZviRbjaNNiOdXteFsPIWHhCVovKaLPVjRmsxJdXPrymdaOataVocuZLFPZzMzOZVcnMgpxqpiPjBqMuxPvXkMwymbOAvSLkyAPhzocpdsVuODTPsVkRgjbtpwuIKOOieuTswZacZLZfXfPSpZmELYEOWWcIdgntacMWtDfDlEIQJBLLWTHUBTzsDttkmUAlkVdkWRRKIJUdfYjXRBcBqsKwDEDnNajKfEVUrzTNrZNjOguRxRXCWOvxZYjigFHfnbjXFlBXeWYADCwytYXYWDwBQVOIBjZMahiinIsuQFZByMilviThePLruHsQGhuGOzxzMhSmBgJtxOWzwmYFQPRjeUMpddWYCtduIyHXUeNXeXrgpMeZynBAwQxCieukQNzYinLUIZxdmHvucMmUATLrETRTpaoAQSZgcqIBUVbufhNzsHQXvoJyMincOBsZYdSWbnTjMkzcRECZXugllRKUzwOQKqIzAyMdRmBOCCnabDVLnTlZHBKESHvmTRnREkEVPdqsvndJQyYqKfgpodCutZKwBcyZCoTtHKQGwbQiMKjBjJCnBgrGNsXEcTXIokgsAOqmhFtfzWhBtdkeHxNgKXlOcGiKPmIkqxtZyzIoOCXOpzHSDCMKeWmuYZQIgsbbUJYPDeSPrtaRgRtieoqrxlUnYcOWIYMoIbDkBlhwrtoBZpKGROuAqpCEDnzWPGRnhiqQcsPvaAXmnBUOAbquQUouzNFUMyFMTmpvyEMaofZnXpNsUpbKvIAwgAFBaKtKWeXmXZksdQdDiGIkNTyihQeOAvWqqAJMKTQvYvBUgoQvVxVDrBsXQmPHWixvwTXNUzfhknueBdddOjxIAJnpJGacjmYaSMHnLjyWBFqWmbQNGomSScGSpyAQviEubWufDiDEyttzUPYgxbtdACnZJTnXJgYxwjEGJheMabRJDEPjYZseXetondoyLulEJHfKsxlcjLWKsUCmSskBTygkBeFWTbsjmemECakSTQpyuUxSpCBXdoUBdkbEomCSbCLfdyqdZNTRGEGRnguIHbsvGhQolNVSCsVYLmcqdyxLmOJXRPjjWzllipXCbdqdUxogKNOnqfQxhWvbovfqVDeeAeXRZOsLZUbHzILBLfAiuOZRFzAgsXGcKoiOCvPxLyErcQOnZLUwxsXrjkfZQPRcpULlRzmrTCCVXdaFefEzEdMOdHFSytAtYIdUmbuaLhMbLhXAAthhbXXySGCVnCjQlLgpetAuJDcLNlNbnqzKpMpemlfTSKglRmgTDxWocjzzqIntvFxUDqAjGWfqSICxzVcNXtNjiyqUJjtwznSJhaArIdlgyHMSSzeUROCkDfnGGyNmAVJoOosXEEKmSRkCrtZQLrApwdXOmDqaVHvHTVhnokYkvebjjfyQnrfKvqcmnjuqRwdqBjRKWCbaqVlSAmCAsdTyBLrvhXfaWueIRxFglQNTvPusJxGtjBynzeFJuzfLDTaspRNmxllgWVRYtcYLPtVsBiSlRIAYetAxFMDwShUEfpbiWoUGRugJUdMmgiABQbzsSrlixMNrswbpzDhCNwcmVUNsJcdhLgrddrKtRWJIJKEHERYPASLqCwlmKWdpxsTWZRyAUvtsmJTslVWGxGWppotcFUUtTUNmfjivyEARJgXHFjNcUEDSzUTSHvGHxPeBXrDTkYSWFdhOlLMEhPJqWIZajGVQNFRWNTesTTNogGhDPIoFhQBTQqcDdPPlLXJyBDLpKMIzHaQhyIwjtPDgGclfTBPOpTJbhEEEDQmDdXWHVcZyvWDAAKgCYsWqTGHfWnIgOqrYmBbrdlnrYERjEvshgYiESywNezZZbCvUfHsmaCNrhlZLQlXTMfHAoQoNUJvzNVgEButURCSAZzTbLUOyjGEDyJGYeSIVxCgalMLcZOZkuZafVAjcTBWkPqGjbcgrfJAsStaiixSMZHDoJimHsFnFPooMFcVBWHYZggWHrMIuFVshuCGpzJfYukmLashYiCSBXwWYsxvuyVXFaicqehyWKbulvOkYhdglDteOnYqjnZDoAPiVpZBVwULUjHWKqwMEKQgePDODjtpUpTDYmyJKXXEqxpVfNSgEgfxUrmHEqgreQdEVNWFqLLwWKQsorOxztyLbJUjyJaNUyAsUTnvSQCatxwCwknwqeHzkSHxGHAGWfXmIeocTRkSZLiUYVezSMdsjaEuTUfsVmNHhzgNpBirLVobpTmVlWiYTGvFkzcrluSgDuifzGAILvTovglPNDyTTJljhpKSZYbGodnAuSmuTtGipfitBVSQjefHbjPKHfjEavoTQbERVINnxxYArcekFQmRtOIIoskptvjKLCnKUlNCXbrVBodnZCnGbCwsTPFlMTkPzVJSCVKDPWHGggZNezEnJyYtujEeyuTWrETcACjPJYSASsqSDGPatxQDBqwmbEOkOmFISgeqCWkkvENWvqgmcqhWaFKSWSESIfzfcWxuFUMybnJFIBPMkgqRsptQgJoFeddkYwdIZiisFLMtcveYLFuluykMQFfXIsMElCrDDVJTWLRdADyxrHckcxBccVkZSHjvzdspnqkUctcNFMNclPZCWeGJZDWtJLFEvCEJZeyWTKVLXTFBxoSmJslDMVlHOdnjSankVRTKXKOlXcApHxCniYNpQNqjrVJpmOZZmyMLgkgzdqmodgusVaaupBHQlzNkIvwFZzpryWITLcwLbopZmqnwBUABuLEhmPkprLwKlnNgczvJeKGjobSaHXDaLVOJFUeXBXBcBsEviTOwFxmarzCFeTMTmVcNbJcwVhBbTluVLNgFhpDyEwTyGOIOCgkTvaoyEMuQcLTOUTZjSsDxxHLpoMogVhwnnbYLQnTAClbGEfudXgDSSMRpFVsdiTTUUYJDxCLNKEwYYIcjdfUeJMCiNdnLFDpnuBqZDJBEsBGWHaKQzJYdzMywLYIOAzSwEYjEeFwxrqhxJzHLOohwJOCtxbykjpcgtLDVdrAPMRHpaXyeVcaSeupYhhjVcTAzadihWXQuWCBpAQIbcneyFlwjTFEKWqSYSSgHlMKWbyHItfWdYLpuPedjVAcBBugobYpKVyWyLJaYxhFaxKZkhDNShJpKVXEFQNqCweTiVfeQYvwMVnHSfoDSPfcgOJbuRhPIiXIWJsGAcvmzBUOeQhGvYIeMNwIldUXJbSGTBRpsNxNIeRwzhwcFSrMGVSFXLKIXCbjmAuuZnJbkCGjrnBAKcpmYUDfCkFhdXNcAwZGqZUUlHyDaPpANcyLbPMfDNDNDQemmBDaOnUZQKxsTSpIRgvVWzKGHaSAlTVIMrekvGHizYKozNTbNSOAXOQspWHEofUoAiwaRskjReCfqgCybZmQKapkswsTcnXhPrUhSDyHKkkvDihMRNJYmrlARLLulWXDZWhmhqAFOGfZSQcCgCAZqJpGBonUASrsEhqVgqagLSnBOEPFBwGtEMolAkHSTaTiGfPgkBUxbjCKZenCcCmGBvmwKrnJYIbSIQJvHMnwkgnRrQggnnOqkbAljygvqGDqUZLVroJcYEKQxSPKOPltjzFyQIPKaFrrSoOLsJMEZVISjvYIMRKtTNQsWqRTjodUrqzflMMCHUihIfUlinTFWtrumKFPgFYNmarrzOjYiWdibVukzGFzFTOLMoFXLgFQQmRIaqpYQKSLcssPbQHKRNiyuoEKTMlUUaavqWdFbUjTmYpUTYFelCUiYreSxoBlekrMKWXJlyCUqMTlIZONkBcpbxUquXoWlOLzuxVzzEdLNaSGlkgTAIKpIBSPhOntwitXWSFbaWJBOcVhgMoThejwNZCQUJrjHfLaWYFWlXDFAwSmYNryyXAJDVwDTNHNcVpLypmvVzDKHdCNVRHBQpSOWqCjTvrYschwQpFLhRuJDrGYhUWWQWPewKOnqhmBujuOhZiiLZFkRgdPxeekqMXbsMqPGsESEquUwiWwfSDEEFrgmhMlFcRZhNAOxfBSIeheJRqqiEvNGpZrdLFvMJwxLIHqGkAEYtbLcBYUreAnECoDbzbhaorqqhKZpJHTebnYjyndyvACDshAogQvbCWqmBxgKZPBnoISzyLoiqJXdWfjLVEHUHbvwqKZTistYerCvvbLfTRFzgIdObDJLPopZxwlPZasipBnLYbgysdqHzWEOOZJqylMFXlrRgUkvJJqRySMgXyNEvgqRWLRzEjioYqJgTlaqfeTpSzSmIfPYCTzeFotPfazkMxpsWOkiQwVVBjQEaKlBcGoIKvsStduGIwSQlODNeeEmgaChnviNjOOqLHvQaBoeyqMaNMcAdaWqnVezDamwEgXqJlKHGydkvNvgPOpgUITWANxnajHsxUrSToTaKyyikZRmyZlAiHoNFZBUMfYuuKxfVrsaoOMEmYmSLFmNqafdRwYAwZyakNYlnKxctNoEixxsNbyCqNGqMFHklDPSZwUIUiZDqhubtUDIfuxhOYQEhsWALGSCIlaJRzLDGlhMFMNvJgqUeYlfAaHjaTUTslIAjlIvFYcPHSARUrUawpjXuQIOVFaAcufmERIznymlczXDgrLmvjVJMbcaIQNZpUNHHPTisFAITvSiSNZWezDDWjPzbdijLDDigWjqNjMifSuHuDSvNkXpVBoVuZhFovjgbyQftHWEgPzkClWiroVCNsOGzIJjBzFjcudHxysoxuGRTEIwBvfObeNCptlJepiOpJrIzfmrvRwfZLwgXmNmxJaPYKCzqvEiawiEWuNDiMcjJGmZXWGRoxXylyFFrGllulhksWeOiPtZMxbOvxkxQMqNJIsZPhqHzxgJmdiGuwWoaaUkXAEJSAaWNoORskNXfxFRSrHMQPoJsttzPoENmWDOxiYhkvyFvGcwKsTtqnlzamwEkNGSGEoSpbOnbmTvozPeTvsuTWcvymEgmNRNShbpWBzlyNdrmACLrQhNbrVvdIXhMRngjRHzTdqpRVMCCFQUvwfVUqiLtztNUQDEAiCCDXParCofZuFUixeuXUmMjuedenWuyOcwcrzPKfjwZzUKttpcFPPfdCwfPdMyqKobzLLlRGPfXWZLVIVlrEMokUJXeFUJjFXeRDexLzYikxbbUchkNBvDAtDEIxUkTBomCZEkOlWyDYvxIvTOlhkQMHnpZGTMyZEDdKhDXEVjcJcBFvvYPszuodyCNYZrUpNSMqLgVPZuSTBpFzKFUnkQqTdBpkbgglXmQrKTQfGltaGaaYNESKMgLVJoZGOKEaJBLWJGLjlNQSnYcLFWoVumUfNIiMJAOcYdsxChlIFfgrfILdkWUFNHcuivWybRbpSIeuNybaSVlxGMzJKXtCdpjUcVCfNfOlywDpAKYEgIOzJYvjIycisThbAknHIzyeqHaxNJEZDEFuxXEHHMtsQFaxXXAAzQiERANEsfJMJwBEdlrHxkRrRgxzcSwfvlDtWKmixPVzYHbeCmjiBmgwSvaBGUqLqZMMQLSkGFgUJImiUHZgphiDpGlllTWPdirrjTSjHjmPBcYPxDVIKcAlYlNnnxbfbHIrAvGBaOmwtkstmlvYcmEeysMmXplfaSIhzSNAEvrJyPHsXtVzJJKnPMvLYfRpjaKqVrNCmfnSwauabntEXlyUXxMpECxTBaEEfwWuasxrkZfzoeqhhbSnjvFcdAxLPAXglmnlqzZMaBRBvQkKIyWEClzDiLajtcKDOktEJebXgFudtfuQiytuRGsOtlbHzPmZgIMxiYPcobRckWBtUzLPzyvRBmWzeCrHINxAkELGtBPaqUaSelsFjgpHcFZOtEBrcnOgDKiUqVWDmibPzibKyObvczFZXAHRhcLLAQVilOhOEGecuiBJtktqRbPGqnyMgYtjsvLpybQxSsVcTrbdITfRXsKdXmUhyHjPFQxNBjnExVVtsdmYcGPFuWzBQOYtYRBiTtPkHWnwGUsGNpnglbLDrbJpChctyTDpRjXevCklQeoleKuOUikDPwSvPsGUmndQAYnRoGddgjTClhPlMTBBaXxpPhlzQFGusEDFxglvoAjIqbSMiYJSZNTvTxRPLtOTpyaMYdeEAwfiEhMgLjxHUBUVwXjOTfuqneBVgkaASgDGcvtpfuYHGtSuHCZaywjOHkSAwTHkHWUipLWhTqLePLBTHUWyKAncMPxXafBnYJnWzRhriFuAXhzwNPvIPUUrCNThsrpWqtmytKrlhUufQYqECBKEwvNZpusvvUuofcoEbCszjcPrhRnlETUPYXgusqJwPGncHOcWewzmkchaurdIYonnDiryfVBVyTMMkbddsFcZEuchXgBqZJhXkxyWiEwXQLRUHXeaXPAGTuWGndYFGStaotlyMuHBqARQbSvoZxCesJzLItlaKMJbvOeyaYPSzJhwjQiXKUNHxPTVGmMMKiqjhElabjGFFoLRKKsMhWAuDSBCHlcbqhQiGQbbJeTaRlIJqruMcKexXDTRRNGNjRmfLefNoiSJhbbEIAarCjYfqYJrKHqhjzBgujtoZEnoUpxnwyrVGSNBxDSCsxeqYoKRyQaGRVqkrDpfDKwoLBTLlkQEuiZzStBAUedhPnTXtUFvtLZSFDaNqadTlZqPVaHoNYNCmTzMoRpbIMlnGOADRtKqKZwLhzCeVRgBSnYtwuaLGBxYESvjPvDbSSGmZVnPdbElvwQldEYnlTklaXTRgYiLVPmMBwxmoAHggIpCfVSxMPozeTjckFqiBBZgxcAOQsmgulwmlqJbjeoZqcnKRwadhlmnEXdFfUMSodqcacOqwuwOCOHncehDzklVlmtkPpZokrwHHixcafJLyZUEDNOiIrtlvAnXgEOsPzTzZYameTBFLRweTuzpSVvKgzcpOWYTiIclfReWTUNbrIcXnMpoqhoYVbyFghxLyegbTdSjkvxjKmeUCJXhnwjNAMsgpBLkzUbzdyvUyVVJIoAZNahfhKdCADyoMqosfuBMDOOFoMKIolreRyZzozXVwWNnofprSPqaNtYUJPrWPyFWYXTeIwTFkgoyUdbZujfDyuopCblbDxVLDOiTomqvxgTdrESBRRJPAoCQBbFAbFOnwqndlgonwgiCvbilWyiYLRiTGDUkXBHvOjDUzNrbILvxmKrSkHLQxhjolQqYErFiMqxFHnXBdIrmmAAsyisFbBmBvFFBiYqCSVVVYtYczhjRWiKwvOKaoMvcoMAwTcxMiwllCKpZGvCRGnjHULKYppJwySLMJubpKqfczJEhMRSEHHKxgiDJoeLigRhLmUOjRSyKOrlHQXLaNCtYbrMqWhdrNxmheUcPfNoskEKCcWMGppbpNAEsRGUXLVwPbMzZFqkUWrEVdfpzMsHZYdRWAIGlZmGfiVFrFMGneObaQcvEAAJISdIySCnbGtmIknJJqoyRmthlWiHpJnRuomAYDlDYGkDSutJzjJBAZkLIAxQRkvEQyMLJsusjuDKsVSeMkKQhNmYirDFxeBvczfJnVpPrOjtWgTkBpPYOWFWZxLHAhMdfQBNyZNNUwRMvSAWWGacWkhVnupqpbakuruLXWWzDvChhNArztbcWuuSXBPPIfPoNzjZqHCZGJKuCdmQYioZbBlBprFNmByiNoCziMUqNUmNSWEwkefQYHgzQcHbozThBoEftLehKfzsirCGnMMzHvzAwhTFgxRRwkSZTgPICYFcKuwDJCnokJFZSWThDhkKFabCeiTYsdkpkGmxsrqfQKFWweBkdujoYWINUbOdZtFZHiTwBnuzPOfxuQyeaGEIuCTtQNFgDLyoysUSTdiEPIcXTofigFiMStsiXKTCjGWqkEhUcjooKhYxemkJGMshaFFwHjGpAuKImClChOnIHGDWcwqexXEKZndqZXFEeGzOFeGsAUvOuZUfFuwyUTALImVsxzatbWGnZXFYjjZeofstXiyRlFwKTSJyJOrjmngYwuoZJbxDTYTeslDwkVXlkYJjuAyiOtDrkwnAAMRuuFvjQPbvUIDCSHbHJPgDdilhlBZmIIpUWmecLNoQHYmMiNiCrmqQoqAnajTUPuaHVRqcerpUzBVrBUzGdfPNYykCHTsPHsApVXNKIyAICTIlauKRoikCSARkFXurnWteZfZbGSrNbvTcqyBLIRylUaExmAYQmNqRuEVSiNCFPETgmZpCjJjjzoBySPhUUiuthkVdGpQXPbQXAkjsGRyXzbbnQkYZmsxnKNOlncmHBGvDLyXsJCtXIULvVBGcGLgoTVEgXDfzrzYDZegPTyqNuUJmULlraqmyOLWUotYoUcIdZuMlgBKQTlqHTNuJcjUwzRAjjLivaUxiRAAURXyBjRbkaWCBkWGysmlkBnAkQmLtvzzrjVANwPQnctZIXaRmxlVUGVFudSAKDLDwymrNVbzlXXNTewtRARWHtqKaWRfnlcVnjYLhwPKtUqWALdZOujclRSktoWZJAStaqMfrKRWLUPnksaohtJeHMIoARdSMpVGXeuhYCPudHKflFBBKEQhQrCGEmBeZefZhJOkWbweDZflwXeDpwofDZYawBufXPmYvrMLBjKSZaUDtnGrzOGhNFkzQnKqdLUFqVvdVYOmrByVVOqQfahnQtZbtNKZbNXYThpRusUIvcsnVDifdqAREmFlDaejIrpWkywCYsknJhnHPVNWzvFxcNCeOJzQicCvLtwTipZZDAlVNfCwwKmchyefDuXKYwVPWCqjEGqAUsrqZipGIcgFGmZkTqZIPcpELjSwSdrriOBdQRfXQraktqvGYffLnKVTiMlTijxRBdZDFXJpIIdYiALCHIVXLIYehJtrVsjxARLNFdujNsbGQIiaXHZgVaUKkmtWrRLfoYikOzGEXVkBREiTOoYmtBGOsaOcJWbuNWKFKWrAzIMszKmEkQpueSFBIhcyOqYRxISBrGxbVpXgTjLHGjWLgxyqaWPBFFtHeBfxcDReeLUMDDYNUqpPqDofAthkrKeOUlvgrLMsPBWCkGDKmWKhRxtIawkjjCpOINKLQEQqgmaQKnYjfjLvXMzWtCUauwFjfrVBgMuARhgaqZUVZhTNSrAFlTAVJqdlCyOuqmMlAOvHuussnSgnBbtJoQdBrovQjbzzgCXIEifcBvsVHsqDUIZFNTjmzxHRRcExgFiaHpnyCpZlQzJsVmouexaFymwrtzHsJNoclbRDQpsfVJUrMLecPQlsOLaAbtyqeFMEkgPKDfheQVMvZiegdoWbWMdNBzqrpmCOlgeyyaQivEdIJTxJqdeZEMrmXGvUZsttkcaDcoQDqEBCSbbBduueGMmWToDqYZXFwIzFrlPhqKCONyasJSVCqbGRRXySTsyYUpIBllalnTluCPrtTbIjvpUaoEeqfglnZJPaOAeWLliKphQUvPOwYNqYXQxrlcqoxKlURtifHLvrivsaYNuqSWKOakZHkJZSRuanzJFVogQdRAtCZzmTVeqbVMbJwLQIcsQfsJkvZSUNeYAzDlyvdOpOiAFlCCbdzeBPCwBVTBdPjnjqygRWSubPAxZklCHCcsbrdrlHRuQJrOMfmSVpNcTjeKYFjWWGmtlBMwFCcRpCThbApwiepJIERXcpOBmtEReWDcXLsDhEGVWvbPUJKnynJeEbXguNIzsHpKIEzwDbwFTetsEPdKwqsRgfijxlWZkXMYAycBeZSXJALvaBouoPpXidAnsbcyLpWYNcrrHuSgAbXivCFNOLhuCIMhNhpWonHwoOzDFULeilmsOwevLMbdubsRSIpBWCYXzbuKMMejOzTBOghbuuauyefDrgZrZJcKUnIcDcoIsDWPQmLCErbhgqhTiNWolVYUOXCbsCmGJBAzovCPAvTsRRMumbgVpamKVQrPRHPmKXAJfZckvbowRejaYaReTbsPTVjUbOYRJsiLHffoNnmtcjOMrzvjGQehYQFPEFOUwQtrnkLPrAQUVPZCWKVOFTxYByiFiPNmEtAgAmCOsHwaXeJojiRXzPSRTGIVoQljMVezEetHpcjTbKTlyNrmOkmsDYdQLyueFHCnkRdXzGzVSPQiQaGKxbIMeYXFUCoTEhDpucQpOBqUTadtzHLjzzsYtscGxTWLiTMFtkEnyhFWMpzExLtnRZUAoMfuvXyzypsxqsEPOUGuTJchgiOWUqFQvyHcfqgXhLqWzelzKGWSpYfpBxkwWAYTMkjUsJnfLiEbsBnXQVQkLvbzvHVzxTwthJAZLwxUIVvWbOpFrwWmGAIjbhSTdGjGOwxzqzArZvZfFlSxlNAoINxKGeTNoiXgZwnTWGKxnOtfROGcSTUzUVRdrZwrAtqnQpagTRIOEKxvCkFDRZpauGpznQLToCzjBuXBKgLepBOKEbGFGrRmHbzGEDnsBpbJKZxFEDCGdYyuBWccWgqXpQmiNynSFUgQOgTXsrzRpCDCCheVjIBsKOgOIaCqemROGzYfDPlgwfTRxzKADIUKmyrvPvwAObmfejlMDPAEqtoIvtXezermNiRgMaNdEkEfknUPVOGaDHRnzLtEEEWmSGnVLaPgFDHtBVDrMbnXOrNddkzNYMJtlULpJnBUaxOWPPNNocZEfBbYiCrySVwbghHNOqcOTOnLKEzxKYEXLpUtiBTFPkSWjFPvmwYaIUYfTYvZSPgOaPuyRMwBRHnsNHmGHHJXIevSodaiTamYYuMDnaEBTRwcIBygpwpQlXPwmRicUEHkfXJAuOzBguxtYWxaDRNXmjaIKBQTshwXusdImjIHJqqVpRMrTtihAtFmpOHacEZSradOfODPvpLFIKHhuQTMucHSCGgrNKsTgVCRccEBRtzmINeOXzdvvnofopbQyapDSMGDuVvfkSEiDJKFLOqycPfVDKFTrxgatLAXPaHTnSPvYrGBfyCkrVtXcNnDgQJRzXQYBwJoSxxDlenaPqBKLpbtDwomdrplspnnloQSBvbsJIvzibKPBBMatpWGJwcycqaRgHnjwWsXhsVjfTEMaJCHmYvhoraCJjzgYrSmTjEsFPGOECrvLBRbLzmhklQzKqXJNRTyhPajImsIJYwKTAblghfRfTJQEaLIllbqXQKnBPHjqxrTyeCeFQqaGPewaZLJImHXbQhaRtBsxcTyejFPHfIzFOEfDGfVYojXWKPcaCEmIFxOzcvThFuiQAyJGUIhDhlHyBOJkRCeEORhyfDDSMJOMvnZMRMctixJLUZgsxsAkRiWVwQgRPFtQYKQqorqfIToEILsIaydggIDmrfPqXTvFlSVHNKKujOioAsdaysaHuHtxRgBEQjMyvgkXpMalyqILYZJoJYinKBfTAODvdhrjxfHGRWPqWJQKagKKrKqCDMMAGJbHnwgRCMpBQvcCAWXkiZGbCkkxjoUTJAsubjSyyXmcdXNIBllMbLTmfHnmwMCZenyZWKHOkQmWRVqjurRYnkttPSJRgBUPlLXBwPMPGXvliyoXHUawYSGvQMaLNGbNUMUsoSdToEiErhgrurZWRQKGLnMxgEqwimTDLSZBpFLHQFTKORBaLJoRgggwPbBGqWdoBACCXtbcWSplbJBrIcDLHFtIgMXuMrUQdetKpMKSugfjDHnDPkRffAWhqBbXOVJZiAfvNnbjuYujnbPBIliEqoxENqBoSbznchnpsOhbRVSsxWTuMemyFqmiVBGQwJUJlnnVFvaMunUKjeDnBRMkhkIqAmuKMYRsMjKTIlDbIOIWAFYKdIuEqHVZndabxFwyIfXgsNRHURJuvwZIPYtUCaBmZFTWpzApvdCeebWKWYmYnmoGnkNoPlfurciMCeDnevhajilFGGNxjtkLsDWegZOSHjyhzHvNgyzEtjuMxIEZNrVAmjjKgcacznEwvdmZjSUHrLDUFvRZWcTQKsXHoeDissQCSbVlUsBXxqNGNNJIOYXyXXvXhlhvbrKuvvcGPghPtOsLptYdqMcUqGKPkYduADqSDWBDXAZlcgEuASXTnuoRYjGkpzzaXVLikRezQiMtkrSgyeMyfINQUOdNSEdOzFkjzooiLVASWEHWtpgmOmNIuIXLGpYOJuYvjfEnKRUYBeHSIgOgVOQwwfqlDBaZtdRnHQmXySQzwPmKHhFXQSAFHIYPSLlZTlmoMVXDTqOkUeGhWSEgvAKEsNGPVYEjOyEFQkIiNwqfDGnXxFctUKyHxfgTCvuRMrwPBjTMCiZZoJcIpWfJkFXtWhTRYhYDyHudXhLukRrzjsffiOkSYeFKUBKalGhZgkYcRrDQxSIeAbSsIXzezsgnkHWTlBfHUeiwPstLyoMDMpYIApsxFJiyrQGghPKXwQGQUpdVGqyLIMMpVzmZyOcqzcdiJtumhakMEHtwAPUnUdgfCamlzvAVGqcVjZmIudWfEsjKbmPwwywuGYZVeoGBGEUNXpoFMIYuGGeRzYgwiMXBbNYuBMDULnDbsXikyDtvIjyfkLoaIfZOSxtPBkUQrjzJUOjNgokuBToXfVjwlVAtkxmybDfnnmMjIFLYZMAtLpiUlVZTWEYKdPPtSQKxYZXSAFQCwbEkhEPzmNnFIlfyfohzEfuCuwBJIZpnXTNpwwGIzxCqEUBNJuKliQYcLNsWWfFYopnUIpdZMTdFKcnbhmdlAWsIQXonRIePdbUEgBfxTNZLvPhVruqSujTdsQbmryQUsmDMNGicAtCIidvGfLHrlOniaxLXuuwWphgvjISjRCyCTilOpdxENsAGlRYNCPegFrpjmgdfkDRSYHHnWQvEsagyDlOmRmPHgGbCllFldHWVQXiYtRSHCkVUbLfaVVcaRoAOYsKxjJTANUzplMztQFdJgTUHkOONBBUiEHlomCLKDpoPFUUkriyjlThAvkMYjonirCqDLwJoSsUGOCbuUIgGvYPZOHivQHeWumQsMsbwdkLXpWNeVqrgsfWKSCfNJiESYBdAHVHviHBqOmVlVJVZGJGlVfpdCqDLADLrxwYilGFpQJcdpKVxkbPxGCluqOvPgeZlrEtpcWYwOQqqPhccwoaaBlrroJVxJKssuvdZQNOtJOSPuSfOMJtgZngSVKDFZhXfGpeJxgjVuAEriYYXAwAWvFXrUvBMBnaXfDmeSudQbqxWLZZlEqQLCUIhgpGJcqFaatkbHDBAKbwirxLZhxUelJjxcDUWbJHhFiokkEciWEBXUHVluNKMxqcJTHderSNhcXyfVJKyyizXIOWNIwwLQOLzXeHLFeigyhdlmUmrafEOpgcJjSViOaHtBrfjQVJuwueZxHrsbfYIuMKusjEWSmEjTTVKeJNSBNUtXOMIyyaPZRToFIDBHNcMsykppTigxVloXDTswTuzyEjSbFyRRCQYRqXAJYVpxcXnYwPrqxEYLwinIUNsztVyZrLVNxvsBwDjVKtzjLXkBwGbtSeZhDKZyxRdUhXBuXgSkCqxvXNLWSiOTvhqhETIZwllDKyYPLkQyUZUVGJloXnmTwiAJBuHgvKzExOEdcPwJrxdQPrQGlJjSVCVmQoynxUxcxwhLurZoRZngXyjzBkkgNFMctiZLpYJFCddBXgKjbMnqdwbqmJCkaTpqxFYGlrWBhlZsCjcqGCOyyyApxKPNDJfBegdKIBSxMWtUeWKnNteZbTGPiTdTMbLTxkJtgQxsIqgvqdHdxYiBozCYpcSJSdxljPQIgorHRPKFLhEtIqIzNitMiPqxEaWhQGYvcjjjcMTvAOFpvUdXbPKrpFAzIPIYPDzYLHJTLHbdauxgQdrZcHKRhCFAgQaOkJgkjphivLxOIckOejXzMQZzACmNekFMmfbbOpTMxoYVLekpnMwiiFcoqIttaiDFcxPQMuaeOMjdvHSXnBrYoZfeoxERZdQuRiHZTyPGbFZYVTSeQuhenCSCISCzAKEgxylyBaeJMpNcbcHnIxIZkpvAPuqoZyhjGiDmvydoDYJLusbWTUcknSbpreyJwdJeZZniXlJbrlfinzfsjOghaFBBsGINZqlIgbPlUOkwiBRYxQnvVAQtNluPhwlSgufOWXSyiaJZnAcfTYecXAjfxxTvDlIwbICWxCQdaYDrLtUIUYYVAqYFmQLGzKhXOlavSdtPtYcvxhgtaCSMUmLNknlkxVMRDvqutmuBaazJudiBmurVQtdoeAXnQNUObAIOfFaaIoEfOHbvSOFwdhxSgPepgsGfrGYSziXTMIwHrkqGVKJjLSEkOmqAJSbnsTSbGFcNxTBqbgSRNgtzRBgVhBTqOGsFQSjFJIGuzkPGlhtqnxFUuiaAxsRLhYVXmPcCUbGsjRHqwnqiWQSyglAEnqispeUkGTQiZpXuUDSzSdKtKQudYAjEgRQzfvoBFjVzGyCUdvMaIfUZKvlHGtGkaiyjGIMzHPVGBLCMACmpfbVOJHJlfRimeBAiBHzEVPApSmDgTckUMWpeNPrRnNBoGapPhpVIfEYCgAcWtSQWGluHdbGITluCvTpXpivcPmhTXtdKXhcCMDmGmXnULmIzKtULsrMmgiDqInNotrSTCdnSZjNndGmIsDWRcGWzsnKfWpHkWHkYqncPuohKagBDYrDHIdIrWJYfSqovlUMrmeAXXHoJLoYnfGGhfnPktbsfnQhgqTfIRodxVxWXZdZdOTeOLUhntyapyhMbRNOcafgdQjaaaWKMRdGyjPZpVQWVTCCUVUrVxHPIjNgXGRNFZEILOiCyrPlofQhNoXaHfmckGAEelBlrrBhwrCuvDsKxvOeIapCwMEYGKJkbjsmevqnrWzjAflqPJmbFJsziaCUDaFlwWWmMPaMcsHdmlCsZEKgLGrecFRGxDaTeeuqCnAJUMCHLJRliDTKrBuvRxtjuGnRMsVyrtVgSCeONQQqzDbzjOVwPShuYAGYlhzjSsmviLwzqKbqiBiFMcSAeeazShwJLKSjYsNfNIkrEwnaZGAeUdDBNfXgWqTRttmoRrpsSVrnrOhVngrnwokVpcEaefjWqWNLlPotxLKGlGClZuhjeiziSOZnQnIEOXnaQhmmCoalGIwGdxpUJldqDmwbAGzmjwkGYEsoLisROcjEUIKKwEpYPJGoRWVqOEcMrFsEnRBykHgePabUhTQrirteKjGFDjxfJDAXCAPrDQeZLcJPgRKgaqaYBfFUZcqnZqBGmhJxWslJOnGBsfxsvgEZBAKqXxRZrRAkgZdKwhZGYvnFuKmsbBDHQlRsqyWPIcybYbmQjsKPJmNwcnQUJwDGYChHxtyvfZyHoIAeVAGDxAPifPdrdVFecthFeQlSFaqPwhddWlGoNfkhpMLNYttNIvLurFPtnQdlECazunyLKSnvnVCeiDQgXZVsoACfvWpWEnLLnxuyyxYNZXaGFSqhXOhdLjiNPVizFehDXCBMSOqVScsjKIzpHGhwrujwYMCyqxveyBDcUKMZduhLiHQzeTgLcyCjznGWSeOICXVwVCXTfEBtScXroJnpJNZUouqnSmKiyxbkqDWLiBTYqmBNXJgzDIZARolraYdfMeQtWgbhjVvazOfiCYwwcaLQPxUZJapURSlGgxQgKRRNbJpUwgOKCQfrJDpOvsyqFzrEBzOQKIPrfSSXQNAfQCbfbrMXsPAJhPGEVNBQILITrKrrwxrrazEbXHkemtWEgFzmYmqIxxnqXQzQcwRMjJTxCjQVvfrMZOKqKPCBXbVDSCNSxngfiURmsrFqwZaVmGBfreHrkbfqpFTQaBQBaYBltnZRanXrAcSQSNzCaSljaZGaooWnbApGqtzTRQUCdODNyohlSVkWeLjHKjstpVMWfcqUyukHkeXejDquIXTJjRSTUVKdjMSRXnntNzDJpcbqjNjZtRhmOsrwNtyTppWOyrSjIbbVpvAPctcjoPpEFuFsyZGgHJdsomZJZmDJKnUGLcuXDWwJSpfhdlpkeQVuFNjRbRPXmapsMCOFXhoQNzloApUFHXDNcMZDQQRFoNVeTUCCKzBjbCZjtfYKkXLyDzwRCqsCxfsetGTxooYRsoPuwBBJUSofptSTtqtyWWuWcsuusUGhJmaQtPlsbHWgYDhvwFVzMONjtNRvXiJJsAEzpkAKDxsOQJSVprqhbTNVnVgtwDkHruKQRhoAZMoqztaYNOWKZySQoiGsRCdwqpmoBBpLgYLZSPgxlZBmvFtJugecOhhmkmvPEYEnVGMsRAsAimMmGtYSMvYDwuzySdTScTbSqclTVRDmWYrurXLXUAQcHvRVPGxxvydNfjNWWZBxwLpVrdMPhBTaqdAZSLFTLfRiKJubmEIoNLnVKRAiTHtGnfrJThRIguAOjPnVAOuLxcGgCapPZfqRinqRTHFdLzfWhcIdaQClYeFvSbbykPolIgbrejPIOLLLoTgSCUnbwaesULcxJYEYYCqkpJlecfQoPkEqECHjZiPiKXzdvvXhBpgCxcbOvigqXjOzHJZlywRIsKrMaTbYDYiqdoPiBJBJUEBqMhMtjoaRbgqHzmzeCdJOsDTbdTmtxqKopHYEPaEyMqViwqCcpDqJhkOHBQWJxfWebgTVEFfsqUGWzJLHZEGHvhhdHoPryDuIxTJvRWknhnSKaLPhOaEALDQouuQSPLIowFyKepQooyAjbnMnqCGsaCuFUxsncNAjVuynpJykprfHsAQHsxKIOJLgjANQkNYLWJDpXuHeDEpTUnrNXtdmFbpoqYhLCedaucUcBgWdVLoyJVrNvYjKlQWrvAgXAAgIqbmiKYvawBFJkuyfQtsaMqujktQERPIcfATfIsPQRphvUmyYavnRgwRcIvqRRhSRUcjPoLcRKAaZvdQjCXbYLMohrkRCBgrybpWuHKvnyAjaOdHJIPNrjyliawCzokfchcejlFqJhblBDEZVXZwmAMIZPOjcsBvHokPiBpasDcGvvnTqyXshgSQjiTnSqfBASbXZpxsaUYLvUHtDSJtkcFaeKCkIEElXIvkCtwZxpcKTJZKhiFSdLtpzGtkzgNRXAyBMvZYMWAOucrSqeTGbSMXNLpiiSDUpWIMhsXyydcnRipTaiovTrMKDYAlbjSKiZxvVIYmCIzqRBwvHumBvkMDtlJhokWIhvrwGHHEpheWnuAumiHSvZxuzWieeGpPLwgVBTNCdBOKEbLTphzcCNSDdLrOCsfndLVZFkwpZZCVylKpOswgguIYRLQrDQTkcuPKAtGjQdpPRqmSXjcbpKWTIOypONgrEASefjvYSZojlMCieVueEWZPxUQdEnnMSnkiksEqdIXSYiJEdqzrmQsKFZdePEWNMlvzvTgxEjeUroVHTjJLTxlheEPATleRPeITWOIfSPianjqPmtsEIKHisdWShqhYXJTZWntTyftNGftbrJoRroCBRkgiqiBubcDrqLdqpXcZrNdYRVioLGhVxEatUeazzazEzIFAjKdjehSfSnujwysYigEJVdRtfXlktUYRlpwSCjPXllphGfdGozdrLTrEalYNXaaDscouiKOaKiJcTUeJbiuKkenEdxaQoaRkNqheLFzFqLimJRXnNPiKKWtPBTfJGIwKeDURTVEWrPBmGSrglDHSbIyrgHVTyhpQqKmRZWwJMclYdBQInLCXZnOyGHKrtykkryimPUkEgNtAYUesgcJfZtPqXqTHzfxyixFlXDIAzNWIucxBrljegQifaURiDPjhbYkzukHgHkYQeGmmZugiOwsjypBLRfXPzAQfTRuDwMAnTwDPZeCgvoYYWwYxJwvXdEonCTYvHPGcDkvYDpRswnFKxkiMjBxSzNVGSikkVoTgQceWRTYnkcZeViWaSRJYUhTNTtBseNwZmHBhTOLIimfVlFptlImbNRhSIPldokiNDFmZtyTsDvVgUpGBbafYMnHagIzGVVhkuzMiJaYrDfXTRCruYNjBwaZTKBCfysUDhVQQOwRyBLmlGEhbuTfygaUPYanazMUsndAwKeEnEYwncZlEeHdKYFnwkcZNTpBeoPXtaiJBlGZFUqtTudcqsbZfkQzdoAkuiomTyLyHhBIQDFhLPCukokzsLnxqnrGpwsAiILPIzCQMMsfcXRGIYhDHlAxFHcaytRJojUMcaPvFVdFCeoMkUlBMCYgHztFLUvxazreybhEFUjsqgQXzfUJyvDSspcJWcWSVaEQzLIuUucFIKVsjpRbccmGrkeJKXTFdFNkaEGWcTxFFmlhcSxIaMJQEUsAfmFHYuPinoZIQvYNXlsPOEbcZcQPkTWLJqZxlTgwhtSnFTrTrYvCzhHBlolvhoCWdFuMvHHERKAwKtNdcftUbXViVaTbQaZApPxhXWkxQgSckADiyuzecPRYfZoHrbRxONuzFHXbtOGdPskyeopXHFYJBPUyVYJaVZgKYdDWHYAezHzbtfgepIerXnwvGGwVrQMVKXbjmoEEYNGHtFjdSFolyOSNEJztAluAIQRhWEkBQenwswfZNJpRRyOmuwwvOGsZcSfnCyZbimVOEHFlVcRRuCqKWRYqmhelFuggiuOvtWjducplfsMhCqLrljQothKtDmgjCUJdDecQsByOXszbpYIUghQMoWYdkBWwWSmpWmkmTbQllcYFCTKHePPiHmYKOWNSMAXNbZQekxzAJIAhazGctbUngeLsrDXBNOcOaddkKcSzlegdPcTTNqfrrdtexdanrBSesvYHXieVdePbodOosEnMUuSrNrGTOTqVAvxKizBRvaTJnrPBuCOFJpQFMCTypyqAwaxKvlYKmnbpoYjjPOokKgpcQtTWAInylThnfLSjxrOJmdCnauEwkzkmvAcDOTxpPyxzPeCtOZMbThTkjEygosUTQKRLsSvBXIWuXgyYnEMFPsRkdKGxsuSVRuvycTbdeoQZaaAtyIUylLoIrOZVHetYsslahsIPtsgDuBawiDuHgreFpUkYyhDsZYHCwRTVXrhKYQcjTqqNutYILVbGmGQIJEftUUVBdgjQGuUXeZZNvYegTJquuxlzYaouhkwGPABxLGYjdziRIWlbOtZFOpzcAVOlNwkayxSwxkeavTEEwewWXhDHJqDEVcmOcIcSLkqNrKCGQvKAbOrUXDlTuiqDFupUoqiMZPiPSaKvlpyHgPpivkwgGRTRreTUQdzWztKCbHBvJUiLNxAGQNcidFqvSMpALCcXyGShcufcdfAYxwmexMcQkSKeOYDzMMIDJrlRJyQHiesUPjLhOhatxtwyABLgzhUHccoGfMmPNGVtjlcVeHmtGcjYDOsUhJtyhyiIsXcvQjQsGJciWIKXngnFlQcmLtIzkbHOLenvahxvdensMFNOsxcwzypeIuVoFDznzynwxHzHpqCKrXaPHqbjKHFvYDKwPxOgtyKbCUuDVKSspsRBffMzWLtOouFjtvXQecMOsaHyNruaWQBzZbuDmsqHVyDAupQZfCmVlBvltapRLSvPyMirQwWBAEPwFrLPtyOltRKXXZqqMqRFQwxLKAORevDzmHQeIFRlWWRyjWYxHokAwpbPykQVBiRisXMALWJYbXMCpACDPeWxkurLvpHjPsKlAitZrazFJpZXBYeqeaiTxscoOqzcjDQblGOrtDTKvKTgKkQTfNTEkZkavCiqcKwvBDqOonCKrZuWQdskgPfEkTBbbLmTZPkSKGTSRXXKwHeYBbYtStIHeYbOmHKWWKQeLBRmXxjoXPsLoQxQnafttiYuAGZgqwBQyIUbenVShawMHsUOXunhUTpWvKprifowNyjDKVNkfbPRcbtqATKxGZKJENIogReGSnCQuDTSLJNzzjNoNxIxWnPIUAPvAxrVlETaySIfeRrKAONsKoVuthHBuGAQIPlFJmhSVkWGkMJHhfLzsUQdOIPzSNMSAkothmsJluOFxmrKTKJDYwwaMBjhnWNSPpUtKUegVxCxuuuoYwwkmSOvcDrvHEHimlnNsotqDsofXYsCsVDBPcqZLZnLKCdvCoKnREbIXpNYIsZRtDLdypjqGqGXTRIoHaQxSKQtPJRRvjwSjrHWngkneEIahdFJJcleCiQHbHjqNnZkBywejtjrrsXFKLpIHfaCKXwaIFdpvKrWvmCtvytBUjOlGnpMDiyPzcauVkiENRiPZaRVYDsZYeMhSkHXcKRyGfVvvFFqgfVwyOkkyadlGWBsUJUCJOVYXgaAIoktQYweLPbuqMmyGSgZHKVoEVuHzihTbyhPhsBGwQapqbPLPGqDImYfUvtktxTCophozpWVeYKJfhrCDgJoZTEovXSqvjOZhLBnleEYXcvlZDfjBJjlazlXgjXeFInofOliVTnaUffwZZzGMrxyGcgIvbVTvKQNlRlRUSHcmbfUCCmmEsYKDYDHBwZochhQopuOJtnFVqekSVoMEMHameWUMylsjThINlADEJBnpdWmygpxRZQXVvxHuetGTBbrnmWZOVziEhmmrnWxQDRJelGXEqGGNOGmIXrfFIqktsFNtTwjKZegxzVyOYjVrwDxVwHtsEzBxyupPYLGQlGwuLADtfNvlorVEGTQlBhMVuNlRAFrQuhlvDjQWizzcwEaUSNFtVLcedALLZNWRbhVbMrqFeTJtxrqDkJkHEpLudTXsrOdqrmvbTQKcxnsaJhLukhpiznXNakOeXJvVZyciRKfIBPIlRqJBObQJwnqszIgOxFOIqoTbTavCicvtRypAoCYEBNClUnTWwwNXOKsZoITsDZlJIrJIMgPCpVDLJeKdmCehkZAUTcLLMGJfKWpMwyPAXABArPAnfqwRgRdoCGVcyaYQsFCdhTSUtvcoKcXukexptwcNvcjnWWBfPIKxdNrRoiguogjfjVgXgurgGjZWHyQsvZiuGssBSbYTlzRsgwUmiBTzohgaFXzscxQHtokiQChIAFYmfNOjosPzLrzDBDoAKumqQvnpigIcfiUnbkiXOvwqCALkawxNtBIieybrWbYNUHJbvgKNCmSevJjhAOdrRfKvnrYZRicRtwZwPioCbIXfjgVaGZNgUHeZrfVNoWVHqgQlzftRjQVzTFmBbjRZagpjLBkjDYKswBeFMKFCtkJFmkOQUeVXSIOfJQePYztehrkpxcedfQRuOKMEEKwBijmJIUZjKfpQcOUDxZyMQVzxcmkmvibXJuwLfaxyxGkcaVtLISUruAeQIabctVDwcZkyDgPBNDIwHWLddAStakLfniNJgbeUvCsZJfLEgXJaKTcAsoQgiFDuGGzeyycjahOLvGZwveRiYDKQmpbMzaFKvOJUdttcCUmDdhdpAEHRCImEvwGtRJbwcEuJfiYDdJYYbTLnNgfghQumWRpUdtmplzjyKWJAsegVgXrlQlonuOwLkUQqeHlsIQEcdcMGLOCpeLrhsPmXaqginVedktapmgndzDThzZJyWArowTLQkOHTYbJkOIhfzxXNPDNnzncBtIFDHxAchQWnmHOPGNBqUYuiVYxNvpzChsQnvUTKGSsjviwePDERbgTpzNWOIohASOSrAOqSkgRIWOXElsNfKgOUwbsxrDneIwMIngJDdLpzAvaJwxrNZmGufmlthVYCSJFBhHUfyAEnAzQMGQYARnsHJMvqjnhyFdKVSfqqJnXxpUZfHAaYncPwQyTgrTrAINxbpblYXZUNEchLVoLQOLiqCbXDSflkeYJCTPEHnmBQGcohZSrvstUvdluspoPGYBVSVFQfLAsZyzGcSmVzNytiyXHMuemPVgfiwrkeBrDkkhMLmBBYkvgRLvRUmnvMqmxIzPtWLKqsmNHGOaeMqkbRuQTIpubiLWsBTGZtncKrwfJeveQOzfDKIRPYuUJiYVQnUzeDnINAuczlhxkBllePCswxRnZtQkeCiOMpUrhKCaLrMqjFpDwFTEODnKBMLGaarbudmxvHRLNjKmQyspXdfAfHMXVlsHncCPGvKKrGukKQkDRBYXGHefVIWzEEDvfNagXKwIzDNHorgUvRavsLJkkiAincQgEfbVeGkcoHoggeasFkUsCWfHqhDIgKbYFhikWdUYLkaepLLFKsGIikENbSxNMMvYIyDlBfTvfzKihsTANuYcwqDsqlSrPTPMxktyPpnJfkuhrLECmuVYXVSipZTrEMZsDbSNmqtmWtjmUHXeyibHDQsKcgqnwUEhAZEYVgYAQpHRTEzbthrwpBaSNvMbGjfpdxbcfRADcHiOIEbjRzbycVpXchSbmaAJiVEVglqyLdvdcjAnWPyAMKHbDUURYalwDINcNejpKSvsQciCUMhKMWSnCUBDADapfeHnzlTMIhaPgDaTtXOJnPrDbIGLWARNqOcoWTENTOfwxfOhmWViTfDqyfMzwIURKlJxWGaRPByFzFxkfoVFkQzUQiAndMNezGBgsoaYOorKxnLZmVtfqFNuPQHhUgqhxOZCFSWDolisyvAEDCRCiGvKzMQxgXScGzYdTNtxQPeZmkpXWJInPQsblwPByhUWpVDlLhTFIpybljozEQbAzFmryAeRDaWkUGaerXqkFiazPGQmmvNIjjLiKKqhcUVEyeqgPvwzGuUfGYQPqpEyguoqwruQLpHbiuabdlfBXlXlKXlePDKFvQTvfvNKEqJhnxOEqufBaNAFnGfEuqxievdlekteciDYZzoAiYeXzflUUVdaTaRoqVOCfBZKvBbBkQLjiLOuhuhkdUqHgFPckYxibjPzvFyKCbEshfYiGJRnHzGcjkJLBFqSByQWNyngBbpjkDsLPWjyToPooIplhCvMBjCHjDwZmMWfMeqzwPWrSdjNuzEhSsVFVVpusFkZBsidbxfpriOMtWyKTGKoUYKpIxaLIJDGFcDlLKVEBSGxhjVqlXLblBSvnfjMlDGbugeLGmsygPEJRHikSoJxpVuBvOSrMKnMqZOQJzBoqhFEXZHqPbxigXUqPBhPUbXgRJtcxoiWAUqoTjvUuHqoccdGBndZzAOeeOPXyrgePzOxhqPwDxcekWduEMlyLFwnMoIJspnTSLeSbxaqceYdNRtdQBiucpDlCzndrYPSGHLVrKjRZIuUXvanUCanctmGlTvQSDQWdWHkXtRnFBULzwSmcBcPOGMlTNuvvZvpcdVVhWMcvuQTTUzjIacYqLjpPTUrCxMMMxiXSTmpMvJLmEebxCYZHFYwRATotSzapdZRXIwUTQNNrLKmDTzLRYDXPZsuDQaKqIYjxcNngVKSWJtbfNzJDcZUnsSzhoXbZtYLmMfvXJwcsanyFSeOyhZhdqvOfpnhaYckNRgQbUtxtMCEZAkYEXUKxlQXofoAZUVefmvfQgrBnkIqorJYQloOOdDbmSpsHrxCZpWNrrcoLCFmPOkusqsLmlPInUEIYElCMUsEJCchtrAwRDrkWbGIGLAfpvyIfFzFKUckqkpIPDOVvpKGrOHmBJAIjBmSfVQomScImUryUjZfIgmuFmpoPxBAheNvXuacrGfgRQbrWfNtrllXSZFOMzdGusysTjnTvufOcsnQzZxPafDuUxInGItxdkCjjJrnXHQOPbBcaIfHCOjXGbXfIxYvVtmJWbCYYcXvypIzePdYGosrsqzPHnKVenwXhoisTwaOOXhQFRDDIirgTdGKfSgEDYlBIgFusNoCNjzClwAfGxizVTrUtLsoHCTxrLfMcylZBcyNGTbNHqOloqxFOmZHAlglsKCbScRFKdgUtpHjzuVCxNXowVarvvNcNjkZBGYtDdojQXqUHmynRpbDCOukECmAEGNwzvnjHbjnmuSJkXNEVTdwdOVYqTUkzBRDpVqaZoiyrvoYXTfQaowgCghEBilDHBsxGvzjQKWTJaBXCcaYRyZMRlDPnrUSyeQLfuALogByPRblwgOGxwWeXKhdJMSjvdgihnDHNyLyPGadvaFqNCppitIflKDzBuemDhPhcdAvBvOOqpJALdonYynXMtnfGvreQcXoFvwMlAYjLIjBzdkPfVxIQbLoWamoHWkVhZdsbRxIptWIvoTNOpSofFvHkIUzDYObSCWvdCLBYtwNrfKQdXNTtxAfZuHhUUQtuveVjTURooLsLpwJEHewurJpraDPSyzgHexmtXqzQhBhUbXuXOsvDWRNjFXOdzRNeQGUvIIWmTQMtAvaAlvzWOuqEQaclgavtVtVbdSqrWymNHcILDKJVtPCRISAhQXAfTYOYrPEpmAolhsjQWOrtPyVcdlYczSMlNNshAfvsEIJBuEzAyDmcbmgDlVjSRCKYycXcxXHFqvOGVsUuddVkEMIKjFUTCyJKfZaRCiXTfbIMaNVrBcfPccbLzNiOGfamUDEInKefMFZZJTZKKmzywtzazodhoTeCiZpDDllxEJELjQgGEWWECtTVnBhLwupVPXuUpOybSVnzvdNqFWCvWnKZSaCrkVQfZgpNyfbpNztZsfQejAuMCrpquCSeHkhIVSAUhkwFsnrgsMemJOfkTvrLTTkppFxZcfKQOHekJwQuLIqOMZKQNIpqcigSOMYRahNePjwaPkEIYVyaCCvusRHoXufejUfoOZhroIFvUYGjSqORHxxWYwxktRarnHlZRsoeBDluNEuVUEjPEahPgwdzPFPijwBbAocORuwKHMBrRfmzJAnzFHlYJRiXbqjbhzjXNvVWdPznIvhfErbuDOheRPVRLvZehENaYgvsVFsaWInSIfagModEFdalnbMIvsdAazSSFZADhakbVFGUePRcAncTHJrnMpDiQQUjOFFfdxQwDQFxOaBeqLusZjtXSNTgOkFmDJXLxIdDEwnignvOJwBhuWxLIOaKBeUkQdlhlAZjVCqLkjGWSGKnUrsZCjWyDeCZvmpqWMENlJWPbZSnPdcaBeOiKafGpuSmWyfubaRHCWFkeuAvQNSchwawpkELjdLgAsJPksvGolnswCFJdQzNAlKEvvWATBGPfuyVKrdxiYPFdFMUSCSYkzQOBmFfesSTwhdXoBmEhxjboNjJOMMniGKdGKxbGzddffLnTmTJMUsTKxiXyxddLjaCsBBMRtispxyvwbrfwCgVydEoQOQUWHCLytZZGCvADVvLLoDUjNOMQBrQvUDulWoApnehuDNTzHCOEBmFpfWKqgHdKSAsEOSxOlVTdVYQKJffzIHVrNkMymUhzluogtVMXFPyETdnEhCBkMbBjGvIVXYhH"
         message = b'\xda\xbb\x02\x14\x00\x00\x00\x00\xba\xd3\xf3+\x00\x00\xdc\x07\x91R\x80\x00BlpQpbYDXyuaGQBuysOSBcXSfWzFhhNVmkdwbKVVMDxsxkoKEjUjLOcPwLBsxbxYKvuBsMzVmPOWLxpUbJWCDFlCjUuhKreQVDyygruqKevqUbiEhEjfSYRbmCyteFOuOmfXpyOcJcZZokZLlcDSstnFJxUrDKuMzykTRHiUBxuxmEpbjaeNifBSjvZrNlgreHGdSHZUycDzbeNoyFqQTMbKOxYirewArtRIasTUhraGKNFDfadtwqleVUOcpGpUMQHCOAhvlRQFTJDZXZINhpUCEXIJfShXMdRIIErxvZXDcMNEzbGWQpaUzakkmIQsbfrHhRqAxeBdMSYoCbwwFJtLXakpBIUsVFLlaMzUiAKMPUUDfhHOEVGULHRQNRewuAlQxFnRXTYUnAlNNekuoVXChvnwHUnnMrCRrIWVBpBJsOezcvZoPbdOFhCBnrRpuGUPQxdXwkxWqfsdSLrANndiNqfDnWBXsemGfFchdkDeylvPYJyZozvppXjMHdEczhdArKPtGTzaBrEfDamLIrKAIQgPeYUdIamDqoETibhuBhREYNYCiBxDHgjAZCiWpobsiNupUFilATncROBOBslEOEEkXFMVltEEDKdjpYBbnWZoDVHWHBdXFKSzoztJJMSGprzPPHMKjmwbIMeEtiTTBZYebWoToVhzrlxPjInTxGdTMnfdMMJkfoXZJEKgdhEUtDUmKdlWmOrXpqaUaqZDCNxBarmCXdcPNIozCdHLykPmWJUaOSabMNQEHeplJGNYUGkgGbRQXcOdlSqydvetDZXqcyjKTxgzaIOchlVXBNhxqyVLuihjxCPwuzCUZucNhNAcZFSgYGcHkBwEApqHgaFUTYZQWJuwTQuGlfumacvzaFzEVjhIqZBCbqBzoyhkLXfWXnHmgwiATPvRsFEmdNXiYdUFbhMmtDucISTfEWWmfJtjbixohibImKmibTFfsRDarcoWNKwIpWFBXaTqEOqJFXyIlcDCGpEGoDsIOkFinWCBLkwbpirhnsYcCKvIwoaZOLegMteNGkwLjcsPycVhRavXHWgxjmGjiuZPwpUZGuKNXHVOtWUYoiaRoHYwCiBQFwoVGpLiDqPROpodlaxXInexntRILdDxbpomuVrSTZMqaBpzGQWkZCekSnxtUZuZvqmntulZcKXDQDzAcOnAXNtjqdqgWsmqEAFfwYMbSLFbeJlVYptLdrjZkPopYHoDqQNsGyNRQvFPinMCqDabixiFZJmALVMcXKhlmGgDqViwMOrApmCesuOzDTRTWBwZJpwhfLfOWBVPMDFopoSBuWOWnvAIvLxFvOwGlldDqvHnAjXYegSscpGTeHdBienHtxaHzMTBanWgZPqxcNtiPmndLGxUAzsBXEoqblTGTuatAgqyQBOXapLfAWlVxyXGzrtGqstUkGICiakbAqEzCIEmRyVFWwqmSsmlAdYMyelTpzViVdklInnKbysTJWszwIAavvSMwOKLcTAsdvouDXnEoDZFueiDrwGSjdszkrdQNoVSEAgaFULxnKmiLQwmOBlTeSftHDFGmuZxDhQKIXOfQlPHZDoPmJbfobvBrlrVyehcOmYKCMiEUubGIwbCCDMmKFFKeGAeZVPPqNIkCsTmbbjmcWMrYQagnZdGNjIbVcUuvxkiTYICuirkEqrrsheoHMSCyHIguStGhrvbIaUbCmQzgOdBdDrcdZucvEMGnyuMZwUcezZIvXBkBmPQRWUairDINbMXjtXTxDRcwMaqLQxiZQaOlMrapFLCGQrflRucLJopnKHrMiZZxvOiLeYCtpRQpdnJjGqPUvJYtKdFtIKrOHgTUGwCbsmrSesLiCCSUrhvaffDrPuforIRSxpfYCzfwKQHnXVkFrdhYnAdXKnGmcnFeqXYzeSeVUJBbAxWCGwzMbLhFouJCllIOUUrrawsqTLATMDgveKyTDVlwYgmPXhFhjJSoHmSzkrvZlLTGeMhMOHdfEWczDvFnOrrZhhqavqrSEsycgtTxgRfCirdhwgjGegYeHxkVYwAQxowFEXXEDhcTuDpCUzpYKWrbKdzFTOTUpSyZfjaoSsTOJXXPwVjqBxkMkMeZOmGBtiVsgmoTxGlJCcKIebylWjVpdcWTFNFKZoLYEdiKYmXoSfBPxheZtGajXeiNhAhQQdNaArBgxaquFyuuMwErGifVHEJkPDGsiwtbXULkIjwSHMjdnjFCWJmuGahwnJyeMTTVRHSvufXuRiykDDWgtgURwXQXJMdItoKtxskDTaDDRuHBJfPfjojuVQrpBLYHXpchfEoeyNHnVXOKzstaJxBCQscFUmZcVyOyiKVNoEtHYwsApDBPtwAHSsgbEWQzOXXLucJuxyqNUGCKZmGGhtKnxagkZRYiotZDmXTKXyfJRMKPmyQMHpzufFrBDMaQxXCkgdpZDXwwzkPNhVQglslrNcZiMqzIKGJNAnKxrFswyENkMcAdgdaJEWiKIKEUvaflLbkwQzohswUtuMtUCIiotUKXAqHcQKnBLSuvaJzovBSRLJOKLPZHkcBlJctwOipLbMnHYmWsOwqSWBtebMPYcZyMgILCuhehQULOmZjozXFFHccWWaRWQjfsdQrOlidrqyAhtllfwXeuEvftpGrZWPWCQtmTncGovoXfHfEDOVaklEaHUIqPjJxMcSkxMYWlHuAKvoZcAxBQdwRDAdOAweanjLMjPjNKWbowvjfmdPrVEMjYTnMiLIFcNZEUuBJOmzeOhwxVuYCwMzfqbftDIMdtSEyEBvgcNJcuiQWVaFRsglYPpKVbwntIWUMhHUhfjoqIutgUskHnxnuEOxNyBLApBFBKLNPcwBhnsXkuvbscPPNplixYnJNSaZjaBbuFcFyGQKEZzrIbWxiCreuuQCtdYtINrjjFgIgaNYNAYJfJdarlzlmyiZpMPSoiocaOMQKRsisyZuwGItoBPKTCWIYBEbRbKFSFDWmeMIAIwZFnDBWtOSAtDCzUxYNDHSIIdBbaeYyLPDsfeLTgdDjvuvbntpbphWfVyTSTKvuJmkEbdplIgEQSffdNFcSjVHtPUxYYaKAhvQbiNNkcWWGXQuEKAqcPHxmEwZEAaPxVloPALeTamiGcdICAmCEJoWoJnLxoaLbYJRqjpaxtDYMZXCfblTTxnUOvWenTCJSgDxHmvTmsuVkvctluvltFvoAbfeSiYnZyrcNrQeGOZZXlqaNgGcVgyoYSOTifeKHFhqbWiPxJqfGxdwBUQbrYBCopPqyboFeOQqwwvQjrnffCztOQDEdkXhGKEecEjsRbCLzpAItcEdZyLRWvrSHemuRoWTXUtBXbXQFFyirDWAtMQxoPZJGpzggtJHLJjeZvTKcLOuGJAYHyLUhAowHKNjiyUtfQTRPjORYHCCoHGjSyXQhYBLRPpCjlnhsPwlpLPrwFUNchYVYOKxkAivSZqEjvtcPHKMaVaIrTjZYnbcpCwYkPbFnZUQDBCjYOCSnJjVqLYgkfUpDZcBotRxgrhezBMZgSsfdaHEWgTubKycCYHLmkmXkjWjEFreKUwsBgKJOtHjuJdrPIaOyTcoQYToljZxoBjEmYcKHSATBdVXbJHEXQUGHrPZMycxihtRsxFowdpMnwJXyIDNLImJJPZmoItlCFRUarpPASBBXvpmayacVBFZaVLxPotdEwjAVZnOVhnAabrVmcSviSqSkypLXZSzZVjCDnShVKNYqZCfggHzYaxTvGilJQNxJDwNxxqELmhckAAMVjxVcZlCnwXVDHKWgrkBLYLZFdCvFNKKlmiftzMIwRdwKWVeyxCJnsBJLKqxJRKshFkGYSaMVigCaSdJExjzPCwdHrjSDWUEtNBrRduNKlvqrmTwbEkmnuDaBShAqFhUUXrQYjiuqHkjbFYzNNuslApAlhEybihZHbNLQEDpComJmmPBmkaVjwUnPHmHrhNUlxIJUOqdlOkIXLkhQBjOLbqzgNEpBiokNWIdFuIBQdnrhuZPFGJJOoKqLfJbvOQNAKYugaupdeSZYWEypccuXFUDiAIBfrlMskYZRivVaRlwEWrelYyycnzSNejTEJGwalDNIaPPezLiEFURmUpIKBzosgoaUHZVjbdMVFwnWOvAzplBSDsuphGJJFhmIZnuQJoKsTrSOeOQjTeWIGmhwNrKpZqCPPqsIXunSwkJonRaakShSlNBAJroHiatOKMhtPaSuQuGixVomZrUYYAkJwREoxegyRVucuFUoemtwdLIKQrzkhLcUcnbSPaUcrpQMRzKWtirxaHOurtOjoBaPCHqHiyJXocRAhUNXweilGWkIOzktUFIBOPKLYrMIqBVbyagMglQmipIYgVeJWRzeqsIPdEcXrkgweHbPYNHtWGUNraRdqjnGOjeBAZomuMhFSObHLWpUvakIIxOCVtHjomKXxEWiYbIlhDogELVmIRgUSiTvFLgAsvzXDIGTtEhmSvtHsOAlziCJbtFXQvHYAPOJnyCdHPlyECxOmtyGaFzdYgKSlqxTpUMpGPVvhvnpnzzUSDKZcQVkMQuuPLAsMSEwcBqDHyAFubJtGoLcaYYZxyQJUwibBviSdzwSBrGXNgrumafNpziyFTxvcbZGRPeefyClAmbaLHoNGIAcTtMklKIqBGfInJwUwENoToKWtmZDttzrAseWZsopoKczRDZcNmTQZLcelztzvCbBpcaftfXhBMODhvtBYSWbCARHQtxuMYmMEOyjIyVAcVUHVQBXCRuaPKxLMhuEUrtiKNtCGViFIMlETNRoMCZlrBLZnZIvXcYBqAXCctLOoRkVOCScVFHGatsyBlOpEXqgNgjNIIWuSVmBjrAGYamJzrSaoInlojlQzaBeOSHPwmesRohdoMZNZiLKurebPKwbYdEwxnRZTuVeWzNFGFcEmxELrDGWCwYkOgzeTihKXVpQFDRCdHNecMXhdLhXhxmlriBDGUszermIveBPLIjvlpOtmJxIqAWeRzAygVgTwUNbJWzxjUjwvHMcuCBxlcrpvbdYLDEGVmdFFJBEbPPDDMsjwJGqPcWyUYYzmxQYwtekXHwlhXKgaSJxHrBedZkOUsBnLwttMcdSwZKvedCxoUvwRcbhxgVgkwfQOErrSmibKOuKqSIFHCwBLtzzmPclrffOQWGOSqRqUjohxsEpWJoZfGlwmWuKjVTDTmePxNNsjwvfoOemGIkOTEfMsvCGJYEpvwdpPbfrtwZpJEOzljNuySegBSNyoOKVwhDWgfpPGFBJDTtZuRVzDaUjHYyeSnfLuHNpoHGsPdeXFjnTdWwHQeniZttozNbTHCuJmshtwGuIUiQTOXDhpafkwbftOWrXyiqFCSyynjzFiMzTgxmhEBfeGLbDdwxFUPrGhidGRjwjOeQhoYuExOVmnIdrnQcccPoLHBICIlEaLhxguKLuIiOBcbpCbfAIPnobNTXZkkKLEimFQoWxtCjrVNcJvyGgtZfnjyHQMtHPYJSeUZPHGocdSuFiSMTvkLzSkjqVQuxVyKbYUjHBovGQbFMqkALGkABhcSvVuVjompGDHCtajzbCkeydtUDNllSnORVmxMfvqTDhVWcsuAiArMwjBSOdRJizmDnWfVEFQIuGrijFHEAQsykJZfZJECbnEwaMtdHQXWcgSMACKyHToyzJunveWFnkjpUOeQmUfhcNJwqizgvPEJMnuuxDZFoTszCMcsnPQcHpwbAyVSDwgpSPilcoDZqetYBLOUVEokFBzyCKlrkPkFzRewCDZbhoNxLfvAGcAhpSnWaJwMGhVjcJetvYGirGnZgIOfCLUMyYZpNLLbUXklVWiPursfMjkNLcryUGlRfRByAZBvinveuXnvJvoEZXpGTvIZxxuzElGtIgvHoVdSQKUchOrAmcnqBnNzWdccvsuinvQUbsuikNNAoKbIpaPPCyCABwjZOMnBQgFYsDKTwfnfQxlSiAYHlDvUkIriuocXnMkpEeSSBGCyjzsCfSCGeSOSeVcaOaulXTjNkYpuZcAWAbEvKdcPJRlUKCuFTTSRobYgjEGfGYmIIIEYBWEgdBPfqEiebTnRZjTOVQAhLcTjWmKpkbguhcRfeOVxJpQdVyEvuWuQKfiORgyaXRwdQaeCCGdqnEfAaJpfwikTDiXagZgOgKLTQBCEsHgFLKdmUymBRENjTKjYHxoomlWAvcQlQWurcXfuFeFiHXngZDowMnGPCpYbAigEAupIYKpiQTGNwVFrFyjJfGwPYGFAuZHwXDYrrcThvuWrhlJJbiTNjqFGjrjmLjtAxOAJTGvNeIqJzFPXtyoWZAcVypQUVPvLXsurmNtWMxlYGKsgqUyEzwXCWKXBXETflnyNoSxRTsOuALgKaLEuiwgGRBouDFQfdhkkqIoAgqPWiBPxdivMUVFbtMjUoJZeWVtgpqFfUVGSGvfqysyxRsBFaBrUuaSkjrAFolICaeYRRJLxDKYraVmZeZtiXxDrJqrOtuhrcjmFgpnTmmsbuKxAxFMaWdyGrNzmDVpIcZuveieEpBjDZuzmxWPYJCazJtowZciCNFfdVBlGCKWlFVdTPXRwTjjLoJwHXjNFgBHoZGlevGLlWaMVPztBRQeQTTvzLuwxcMllnmPpbkJjraIZYqUTnTyAKcmzihtfZxqfscORkoUKapGreZlkPCshjNvdmEubskTWRVzvpiIIUwjNYwSDtOnYVgxKWPTPwTabegLaNdCxuOpbzBqMwOobVDUUpMGYKZyckGMYWFXBxLMMLPWeVtjFSPSZwXrIZpEjVclrdxFNUauYzTUdkWfTbYxobUVbxIvGqLWhymtnPpDjVhJXAVMpCXabwoKptJangqKCWVjWmbjAVycRIwvljZuhURxuGJMJFSCGqKwSQEmwLQVITekCNykkcUDWEIkbPuujHXzcneBZgujsDSloVustHPdTRijRTROUMJcRvnKMAjkIYRvDcyJxoiDfllGPcGXqxssqIAfTSOJdtyROsOsVdSUVYtaJdyQSXweasVdJABxflevGOHAzjbNXngFkoHokedjoLREMmXEBpZenlVhsQlBrjcuMoYRsVEgjqEHPuLoqDTptmphsBGlmIsqOldqhklrJnTLAcIBATqvQTBWuiYsldluowdghgGoAbmswdUjDMHytSWZfjRkKbBstJaSRIWOceBJyFzTaqvlmcwjREQFRKIcdjdYmvJrPDNAIXfuuywSLuEenOItdIUsvXkFtXduGdHBcoIeLPdHRDVaCVAhPoUZDNUgMdIgnpKDKhvZfyABcaEknDCquzeavomVtwVuHneMzdMmktLTqsPJgVVRHBYiIcHnxDognRlXcJuNsVKXjsfDXcRyXxGlGSkCUuqNKLzJpMAStLZrkogufJfdlKQwIBzYXmpOfVboDxGrTAgYYzflOPjZPImHsKHhuCQLTHFlPUHoJUlPqfSrRMWXMOzTmXoUETbJtJTVHsqNGutCjDXHewYhwsqmvpOVUfiuILcuGiqNIhbJOPNCGTgESHUOmnXXwmAdGZRguXuLJqALNKjeYTpyrQromhAqUOgQDGRzDATjuzxjXCrzXWKCdWywQUuggkbqBYyKdKIIwsGnvTvavrZMonbRKJcNDOWprWtzRbvEilMChsslLFcKshUCQavczggPzSIGBbIAFLMRjSwieRSucSywfDfGnFORHEAcTrVmFzfTJLlSajRqZdopWUnRpKJooyXIPidTLJSFiTTPZPYabzKFTVEiZFIRJlOyhYKbOfUpHGcOvFQKLaSkXVZfGFEXvmhoxZhrtaKujOrbVHFEIeYYsrjsZumakiOyHHhElePzaLtbqGrvxykevunUXhbRPJtzEerpDoklqcrlmNdhgjfmgcpCTHbmoltlHdcsZhgZZHgZEmPHYydvwbyNWesLSYwYGtWfmlMvMyvQJlQjjzCXiaOdruwPRwbzifkAeeSKKnUDnlLtpGcCNWTLWdpGiJlHGXejAKvqdYLjGSarnzgUOpnxQeflxzhJHTDFwvaOAMKvKlHPSggoVYumYwFdNAUJXqMnBInjIUtRtQZOpIZvKQGbKSzkywrvNtMYhdboIZVpFgMbyxMqjYJxQcABxjroAmJseVPaNNHyqcZjWiBLwOlAJKyjhiDTZhgIbeFyVOThhzWguMVUIlZBVqvSiMxgsSvmpMYFHuXJgFMLLRnupHpmfjimbWWukADojRaesVinAjjuLjdinMYXniYOGEHeAjTYKFKMPMYFywdAkIvvgRXmiAAsWDKEQGZBRMpPMleGQfUnOXKDOtqpyHrIjZrqCfQLpwIgKlnzUhHTArbakNdMQeWXuGExFyVvYpOYNJdWqytTxkKXMBfLGxlTKxVPxffMnVjXVIBMLhwLzVTMaNbwtclfAvgEvrfuJLHmhEZepzMCgYixTnKJzaFdYHKKyoZILbTKvLiQhjywuwSLhweXYRQfuzvKanXKHloRXZNBwsjPoGTNPdVEMYKjkABpQgAvwPRImGYoYjXgYuyLLwDUgkTUiXZKwNxxlViacoZiTFssvufqwYUMzLLqxwanErvBDwthqFPsbOcVFJZTPRRLeaVQcfMtOMkkfZdGBLAjQndhOgRaplPdyLPvTbClHoajjVXXtJsOhTmhPWXgETRnOttYfTUsATxXaodNFoObGpVDIygAIHehnfKhbXTxbOFfoUaoQDLDsVpKVsJPsIaIvcoSNaWnVrKlPXiGONEKEMZfxnxVQYjcUWrvwhWhtjTCBABQIVmFcKUfXOGOmPYOmTAQQMFWCAIlOFpiMvVcJAPxeZKRGGsfSurAIWpXvmniJfJWXeEveOJgqeKMqpetDKYSFTtOaHYDliAeDmloEgpAubhUqDxZDCstnOKbTIDORxTCmyWYfizsfAmhoroAkotHMfTztbtZbwIrRsobIAgRpchXPjFaeFLwDvXQEHWbUKjfhJjpmhTJBjCPxRNCBRhjysXpjxEahbikbglFbTbsYAugnXWnUZrQbvJApSweplOEVsPCuHgEJrxWtrvoiDdkGYMgKXJrzUOwrSSyYoQNQHkSQxPkQUybRctqcOqjsvsoukUOjgUpSgLkeBzYRqTZZajvYGTtPVtqGuEDpvuJOKDtlSYLWFiQEjjGRQBGymOlcCuBNSImBhkWRylJdSzOsYfaIuKmCzpctGSmhcnuGczblrPQuTkzsfADNvvbqksUPLmxymqkhoVxpkCNFcRUWKrXswsfIvjUwmZnREDLlDpgZwkSsItdLUQmRxtEHLvQFAdsmlzzMsnrZLPZwwgpsbErkCvMZhKfEkOXaEWEGRziFEwTNgtuUVxkUhwYxeZgzVBBbEmirRpnfagdWfToKCahJPlmxOOQETWsTkEkeYTKUCxYLvoslYoETZdSrsvDkMaZsujnzCNpRkWpYqhidzEEbpaiPSjWgXEieHeTyFJhGdkuCwkkLOgSLZVWAZhljgwBweosFAZGCPQPtnMiZrZyqIqNOIXiimayYpuMeXnUFDGFglUKiUmleVMPAujQUqjAqDrMJcrJOkrkNnXmZmDTHZHxNlfQmoGnVzOqIIBvdUbmzDZAcLRxFAMczASZDLzPzVbwomUjgkgiHbxvpgCqZzimqKivmUYtSLglIWXHaaHQJACYQtOiZGKGIipFGoQlqhDfWCpYNscrmSfjpdCqTWpiLSMkyzjJrfZXvECnfGRitJmcmeNWalOQGppTcspVzcgWdgvNprPqFcrCrOXivruxHRmAwizcRpKDQhUJWlWZYdTIvOERegQaqBkWzqYKVZXeuTJFrGgNrufITdEQuRpGglmQXLDuwxPmXrWZTfQPXPxGipvYvVVEJOKSISTttAAVvGsBeFSZxPVuYeNgKZadCSLMacEZppdayroafcTsHoWszMwVxmfniYjNJCmNivizXfMkBguqcAKsHdeYheheiaSvzIFBfMzhvxSTjsDARjuKKdijKhNtMTLslbeBOiDnDfCStoPchkKFheBPKVceZCmfhDpAXhTmMZsiAqqSxcpEDcHvYzIjaDOFpTfuUWpPkOkTUoEPenTsZKFYXOlvlIqHfDiTJiFyqOoKHHufSFkyCDnllbxnDcvzYiPWgeCrCoWOZISgrJCYzxSRodQPJORoXsMZMBzdzqoJXHbDGXAwTLGfFTHFbCnVHsUTGtuSetsGywXdVTWoeOfDMfbvqcqMRvqBUeAIWMSdnaFrUrWmPSubqHeVeWJkankiHlVlRGuoqofpRwVCIoaVMpaEQswtRYNEsTaedNUpOYZAdgLUjeuWMdQeUCXwuLbpvobEWNOLeXuChqLMRlmDjVnpNCpqIOGWiEcGmOcEUJqwlWHeANdrvkClIZIhAZctZZtOXfDMXEKcpAOhzzECRfJwpWDawdvobzHQVFCzhZpAHJyqpNHPnZQTqHDpNAKwNUrJRytHcgeVpvMxAIpkcnGDjRCvqKQGLFFOFufkekrckhoScuoeWcmbWdWXbReodOYSLbOEWTqGuBWpwLDYOdeblxCETUFOahFsrMNuIJLRWBthNemoBFoBOjyAbiBqeflNSlvLxlDjzfsniZHFjWMBqYhyoSlWovFhozqXwwUcPOnWTefLrFAhafHjjBYdiRRvgudKBlyNFIQDpSjbzOuuAsOGBuVrDNtKDUnTOHKvEkCYYvvQinNeEkCKiZkqJvKBTLaIRzXAZsTNjKhjgEaHBVHGeRghTCmHUwBWGTEQgyRqrxeGqOOkkoFKoILTDhDVnqqNcyUNEfCGjMsPkffFomuddLHLuobyvKJJGltEUPYpdbvkYEVIlDBigdHaHMPDoypirKWNWkQKmHXKDICnxuaQxgEBkFazJISncpsYtBZvmbNWZVuoRqepAXWdPbloyfIgJSvBZFdHONbGrBhoDToQFJscQKCeXoHLyvQAZchNOLkKKhsBncjMFVITDzaSgjqFyzOdTSsAdgybiwNgqgjGsQOQPEwidcfUiIEAtfdvGEFqfSgfWxsrKnYdymiAUumarTsGGuZGGfAXuzlDXHlJtBOcYqUZjuPFwOsqzdvaJAeXLqsQtYuyyrNjxPGTthpSFwwyFdiRmlqNDMlsyPPkiawIRXeMmaHbNToEdNXgSIbgQKnAjmFmPBTjIsIUvBgGYmVqBjCCQiytVkoJwhBPdTQtFTwsVgAwgfciDwdDOVfQvRaehyIGjnMuTHqKeheVbezWPyKWVhEcWmFdGozperDazDFcvHEXgyYiStNrrRNpBqsbCBEcVnZgROfacXRpzGKkHDIFeenoJOULWIHreBcQqezOKmFaRYioWafYJOUeqPpmwBpMAlHMLHypUYEkFNLhqRUMhOCzjvJzWTtHErbScXJOGjXGXHwPzRmklPqyvwUnGAnLZZJXGoDfgNOqQKPPrqchXeKSHMXFHSRekqUCpmLyPmwarMuyxUufYMmgSOnuefjVJTzdfqahapTWDmYSuXFeBsdoHvSleoXRjHmMISSRjKNAuGAZlqEpqyOMhUtHmKVuWvPgzxLIDGylMkiOXXcyCjWdSAcJsxCftJAzFYGaxMejnFZSBHkXYgYTkHPCwWQcSfMfUmzVmmhxxOiBAKBFVhIafWqcWyoOVMADToXQkHpbTzgYqgeouUPtrNIzDskUAPrKKeDIkMQojQLqKAEUuxDRbpBpVpHwQkPtUnUHiBMCrJjlLfQGQBFwVJHSxRIXBIXHrIweGmPZsUEzwdkSUPMKOxnqOSNtEVhUrhiuuIYQUwPVaWvrUvLTMYlDdiDIqMGGXTuVPgslsaZQYziXnDpUIdFZRerVjJlIFNOLQfBUvmcYAFeCLsWVZGwhzgRXoOFNcXuFXnmDHOryTUoAfaWnaGEtxVLLVYiWbwskBQdZFIAfxSZxVqjAdLJcAeuyzlxulXVTUQWNQzwWQrXJqaopvpHzoVlMiDtLEHwbODhJPVBSyAYvSYoYiegnWXvUEczOZNZjECDIIEAXZIwICYuJHdZNwDmRrGfQLyDjYuLZscTSziHxEtipgDMXGLHBRNVpAdYDomGgHShTCdFSHuSfhoiUYEVqXGpPQnIVnLOAWMxFZzUXHBdRtbdVIZzwMqOfTIdbdFZXVxRAipJTCHSSDGYeOSTftGmxbYddequsHeJynVDvpyDAcTvXSEZcSgLovuRLqCrkiiaTxRwAhfPsDftwtNMZeiMtQngaYTyYUxsWgPUccoYPzCfHwUeYemJgDkngnZVhAZTGdVLfyJDAlbchlKSEnETZzyWUtLRUdVzIeJVQdjjHTifXCUKDaYDrLUElcxwTbhPwkuqMDrDUsAtAiOMafMniDMmBXlTjCevcEBdnqPebcMXYJVCQmviMsXlVqLJnVfrcHLRBMduZrdxbYOdZXbEtYYXHeVRholJAzCRbhmvAxczSwKWUgIrTKJJmFAEJbWyRFUndfFYqRDnTuZjUygdRAIgnekJcvcKSjBEKQyZEDuujZFvHDaIMKdgtHCSQmXmaBnxkKQuZnzCCKkJORzgGcmmDHZlnbojqoWUmnJARDjpurGdKUvibmvwfGKuBUtYHbwQDaQwVPgzoLpqnqRchcBNwrlUUQezBdYZLvlkgUUbeSWAmQLojnjqMGXpuczLqAbszQLwAqYBgxKEVfRRTOOzGbAyjtUJMJmQRmDNCGZqNpzsIpiDPqOQLnSgvmPtfnRDXYYxDbxweIoKbEOuylEVwRfNNwVjMaoTzZBFFwGXPzBrULfALtqmZHJdyiIcfSnORfHwPInFekDDdIIFvhUkdBtiydqLrNegjXkzozLgbtfXdqAINGEPjMLGSebHLZxcZIhaZmFiHQoNaOSzCKrjZYxXDGZXXlSPWyfzfWAqWZUnCZNfxZIWBGCROfILkEGgfFBHdXxqPiFESsPjoxDxJSviHIlmsxwOiiOmRUHLexdtCuAzysfgyNqLWvszDzVGureHEfjieddcnydZFqkUojALSIHTdpRDfmvUWrkvxVTiNDvHYfOxVbiJqIRJKzvNYNidWatulrnEcPgVyDiGAQLkAZweXFVwqbcitRzplMDPUcJKRDLqyHcDWJXygQYsmkVwBBRqYhYuqSpmZnhErjaHUESnxXPXvXkwtcCllPAxwUoMpEcAUzVOsBbieXtUygbywNiLHaDwcbnBZnacKmnlVouUERWhkURGYCaAhgOBxfOtDpgmbKfezAsdhgSBYMOcdIBaKoOAbhpXiqZBerikVzwvcPePVrMPTJYTLKCGtYAgPcUYPuhqNWKojJdRenvFenJmvSKXjcKtinfcnmumlPqAgIRlGmBOuvNOtprTllNCaJqlzMxBgrGUIEgifvmPlXnHsVnjhWtMlXHVbGsemGYTHVZASNfZDrTniEmiGeTPjQMvagiKRtGarXPMeUYmmKnVkXvmFYexDuthtmOjLfVzsJWaNArfbrFgtbRzELlPGQAhZbIrOSvXMSZgmouYpcHhaOXOyVILmKpCjjzAoMMygJcMRbTrShJBnWJcGYyKHvYykeJNKBDxftUdvsoRIWmuNFySofABITHRaJARQNsDGNNhUOYEhnGraBouHXHTgpfsGnesJCEKvzGWaJuHnYsEsrFJOaYJejyGpPtphtIUnQkuEoOjaacLdjkoBfOBiBmmRpZXryHbhBQUPJJQsUmBudDvbjoTTpHwnCLWDXaAKdQPHwCuZkSZOvLIhlrmayYkzRjFOFEafogqMPXDrSNxBhORsqKFYQHTKRiNCovlQsLxlrvDiIKGPxAvhgjaVGICFxOcnwoNwufrBsbbAyTzYDXsQhzLNgWlSmVWJgPnQgyPuuKCXVQJApUpzYyISxaxzLHbGtPypQAaWjOnDUbPsFceGmcdSrsZjMHybUmBGpuCNeyPoNBjcXDGfBqKHyGUkNJQETeBauCTXaGKmdxzfvwstjlsmqWqDUampXyskjHsPzzdbfhNQgBxLcrzwVsFcHevhElTqaksdKrVTyOyakEckAuPSWdkuoEtaoEvmYykpoeLVFOoModShkfRyjVGarUMNAzqqNbaelDAbGXNaezOsMdxjtHOuSjdtpBgSItcyLBmqKVeXOHLFxpRkVvOcKpLLxDYYXwCOxnkSCVwHcifVMvLlTSVAgMZdhPcpsBYqMoqsrlJnMivHsAvsmAUFAIhMMxUfWbvaHzUPhpHBWgNWfcvNusPJJKqmeCdZfqFOGYxYJACaWtXcYSLahQouoXkNCSPcPbsuCbZZfctGZdPXRXpfsKUWQddYlEilRxPxbqrDIDsDjIkBMHPRNLipLxFsoezUmYOAxgvQkWeEmErHyAckVfTHonKafeGRvfDGUqcbXwfuDQEkhQFOOrMdMvjFOyFcZjavlfQCHqzCpuFfbxtEwcRrSYGXkUhtECMFtHhohnEzyndJFfHRVuyiGTjcCbNQVNUhfSuPGhywOTAdFbvgbQmeTemtDtZhOXSntXjgjHJirpYYdMBcuZarjObFxkQUsprrdgHsxEVaJSOOoJgrFdytnhiYsyeGuQYIhnKlFjlLntbiudSxeENPoAHDfFVQxTTlQgymmxSTmuajgMkYpzsdJmnrLWinLRalIIoJwyYMbynFNCsQnMFpzfFVrSamySidbmXMGrsituXPmzHDkLErCOzIvrcLVhQlXKuKsYszKsCZdQujXuDthttiszJpSXLFinQYgwMFFqyMudpbwbzKLXQSfrLWqVrMoEulOgAhSOcpnUbYmOLDylQqxAyjLContGpytzmcbOZlqkxnGdEtSzelsQCmyGuxrsiyyeZkzfZIAjiugvQPuQhHUitXQMggYHDZZFDlfZTEOczzzbRfrIIkdoEdPAEaxwfoMBsdMjjdliLWuuRlFwzFItEaWlUaqmgFJzbETzBNfBWltDpxPSqfSwsnmzbIpnbfCeGWkNjOQTlhmFgYpkQLeuaJCtxoLcuIUdnYFsgHvIWJTPMcONBPtGFXINdLOwomFqEeGFiooAXPOuQKCblKzcttbOcnJZmQYAHqoygcEaMYKJgPcgYqnFfhnUWyoMAgPiKKujYEXjYkOcxlBEpQfPzbZMXQFGjsZvvcefvUHARjsWucTRPloRWtNgbaLIfdaJuHICuNLUxQuCSAwBkjoXOGlHTvwOUDnYUrnmnLPzYzMTdjzSqHmfSkFjmZeViQPBiZaorKzzKctvMMPRLzBNpxGzaZyzGhNmGyPZGzgdjEMryfMvXdMNEXBnDooTzGgJSwshhbLoQDQRMCkUYrmGlxQcMIxFrZqlgsqxljmyTlifjCklaRzKjqpRdEGQjRFjwDKKPaZSKTYNYjwqlTYqIgOCJXOLBQUIVjTTXnJKRNxzQDtkApDVZosgwteBuPpOseiDzUFnOKsfBOhHNUTVCtovVYEnCCeuQExiqGOPdRdHndKlpAhUuMvwelcXeHXNXDBaaTOuQbOPlybvDvmAsIkaDcgsLmCQiOQrzBFQtzHvgzlmnArmamHSaCSibgKRqjbPtStvfYbJppMmCjSsLMGPbSGRkyypMVSZjEQGsxyIfOizxfIRURToEDVoBgCTXAAOaUqaesinXZOqZPfsZwAPqWJpgLuhJrqVcllhxDpjYeeZyDnckqrmfpaNNYocYgxlYQXZfgJEIKeVCxVueiAQzDwAdfXUWCzyzjvTsKJourVQqVIIOKpISEepJpbLfuxjrEJqTMymyMxdzZNSnwNNzVsjxfYNViMWIGwtBPPQxDgyvsQRzwoKXlhejrOzNYpsICbqwiErpbNFJHOiKrGKkrTNlSxJEHJKaOjfUryJELpYDYqxuZoxRTdSjORnDOnYqVeeKtjveoWvzNMQQgwujbmLpGINobumaPJIvaqarPyaPElAkOVfMmdTZAtTObRJGJRPQOgNbsKDIQnnpJhgXKfvdvcyVJXGzdAOptktbmZjkvMDhpInMGEtpQnGnXdEOUzKXhhuRqBKJRzWskJZOjSFbdCbRTUpUdbGjLVSfeOAvwgIuwkiBLyehJUSFtjjLgLUleknUWrtyuBnqyrnaPfHPnVQrpYeqUcPQKUxDzGlpJdDSKQOiaYhtMHOkjEUdvswbbBOyPQiqmQXVaOMEfOKmZePwTidrTsuIRZIDxPXvaRAxIeIHicljPZHbdjJUkyLSfUrGBFwFDKqSVnAYCNmFUItYyRtNQBXAWYVqKbdCawURZblYPxIGZuzbMaHTMkqPbPVKDLvLpuxLrEORJUhsVxgXUylKgmimvIPjmmELEiQMfRCzPlAelwyClmLfzOnovHPQqwLRJvTIqmFeMyovaFgtSDmTdNBKyPrWXpjEnatEODtCxfQBdGUSxwwdfVxXwJpJXEixqUxfSVFQBHAdvOGrLQGgPySENnskAWPAHwDMZpJBJnfxUJMFUwAdPpYGutxbKgqsueORTCSniKARKWIgfBvWHAMrmUgjKWgjjJEWfDAFgzwsMkBFkrGbCInqzaefOokwojCMgeuLMrMsvNyukadunTBcPSbDjHkyVRjzWIuDBTeLZAMJOHDBACSwBPrqbZzjOBsaFflEHEjBjoOeebcEPZghTqLGrUFrxbgxTmkFefhcBjZKjaLFaxkQazMuCShXYGwVaebNRgyMIYHyuwZCuSKuMXSwcmafngOUbGwgMkaSuQXcEzvJpWoaKsXQlNtZAJGbbXBDQMFUGmdbzaTmGLJdRildsStVedDTOqIoQnccBMqsJZhRWQlfSeGbszspidXkBcAQZuAhTqpTDLYJAdlxONauKQZpmSSpnrMtHBifTCaieZHLKXiimrPVFkSkuFQOdAsNcRbkcCDYvLdiraiaTJkLwHErvrweRHHAPEUTYhbbstdyEiAJPeaawaiwYymrUccuurNDxyOoqIvSrIpQRVDUcuuoEyEYKKPoikzAMDTsxWBeHKUpzlMfSNGOkTDIwHsPeQdhFIXGhVACWGnVTNsyKgPysdokPCZgMaJzuhgVkJNVkvaxjUenyvNnYYMXsjBPWPdHwtbyaNZnGpImDVSkuLsoVzcMjbzfuiCBJaBCouRFgWEIGMstWclfkhxGMhJhpHMWsTXFOnmBTGFuqNZaICvreJroVOOGmBAEUWOLQTdChxaWxaIBAPilZUkulxELCkKpOqEhiTqOoyIufyRioDJZWjpMEavcSXFYDXKowtJqNEXGLgTZeNpxhLVTpaHrXYJYxFmiOJijbYEsZxVBjkMSYAPqLPjVCJEhiARTrdiwFArcyNQnRwkRuKYrqmWxFhPXPunsCKwClkmzLOuwNWxSoBWbtOGHrBRWFBaJqBLfeexkQmCOuZptIJXFHjAxVJbRKwypkaFuapVzbfCnnDNZskUWPDyrmyZajFkTIlbKHpTtwhIdqiwEioMlDRtVrmkliZhicpwmbHPrDVMwwKdIQzhWlhkpMxyhqCWRqKTVkDJfROjQeQlWZQFklCJzDdEMuoVjYGwsPYQHOJucLuXAHYuWlnKFIKNtrPwppQyrcXnrdtXMBBSrokJjEPzvqzLqxmrfbIkemvRNzBFdTQZMFNAdAwhKzxStNDyQRyGZlbETwhQpGsHyGsezBepnvIbEScuJErHKXlrNSUBfzjoFemHiIkDLUqXjVhHqaoOlSPWUFrmfBOlcNEAPbGhjinJlHXSuWFNHjhwYzxNCnqdstSfVUCrzYxwiqPPMZugdOPoyItRFBlNjUvtHViDxqXmUByHusVNmaeynhqdgDDrStRZhtlUzHBElcXwvyGJzMHDNgGQOXabLmrKBYcFnQvSjYeWtkpEFZlXWTAgxyUoNEidBolTJFOXAaZrOntdUlhDbhGzQWtOlgJrcNVmEUjrmChkOaTZaoechpgLeGxWIxmSWZEDJlQrJAqLeZxyzAEVImnQXZaMBEltkpvvZZMODZYIWHSBUPCQoBBiEWYzkIYDQgSjEGbeUqpAIuLWhAdyzBWBgPejZcTAqeEdIMwQUSUPeBViFUoIBdzLPmWidhKGDoRUwujUdDLKXxKRMspCYJMPPLConXLnbHhwvQXNLDPWloJxfXTlSURRsjlwQlmmZdGZLYEkWyCIxYjXlOoInwkgqXlKeseMTYtKgAzLuAzCcHqeOFvJfrRUfUwsjMDtyFqtqIzGtrVVCjAvPBnEtXwrkabJJHsBVgJELZOvRYVUfXCweoQQNICwuOixABKlbNIoOSnYHigYOjysEBOBcALRALNKhfErKzBTkKEOgkJCgrlqHqXpCKgUhPQjjkrVfCbwxPGOvgsxfnnMwhkZVHuiJkWuTSWebsOIqcMLGGfkfFBzxJFesGcKwkarzJSjFfDEDIgBZOjLySYbxIOiYtprPJagttHuJtktIzLRNfwtUwDTZKxbVvSfbNgTluMlCcYIlVWFiTSrEMcJarlrvLeiJEUgEiYeKbkCabPKzCHTbGHqcrKPYJPkQlExnraViwOGbyXVLmnIjVBUogPhRjeHEDCHQlxDPNCLPWGSFVaKJEGwVIGLZjTXhmEiaTsetpqwHhHkKToDskHlDignPFETvWGbjVhQQzvNcGNKoLQCLOJaBzVNBIYWyyEcMpcMdrfIvqkLLWDTAoKveInqcHlZqNkztPPNTJXLPMhjGKhHdnGLQarYwHVideAzHUELVyukZIlfjWqIagufqxaikkSviRqMiguBJVPxOrvfQBCBOOYOoidleqToxlpKlBPSIKvWXjcUahLvQvyrlUGPDfZifcAdzAsDjbGEbKKidtDIqXDdZtuzXHECbfKHexAzeEpEIGLbASKWLvZwCzygigBCxgJNGmOFQmHRRIhzPOdqIdhxpVqhiBdncXogvoUMYwqLxIAIoOhpczGceMcvZurIxUgLQbzZHaPVnznnGNtZAJhRxwhXchkBVKcmidysjKFxyVzWERpxHYppFjpcvxGnJUzGnlftMufVyDJRLufLMBZtfIfAeHNBjUIcdspdCBGZqGHtzFIagAOmGDQfEdkNWqpgNMVkLLeBvVzguGSaDwPoZbIMwQedbboxnGAVhRDioyFfGeddwQQZwWAtHRbFwzUYsKnNpgLUtZeXeCujOmVSmIqtjVFtvMQOjchlfSMZzghDxtJUUfdlpFFtyjvyXOyXmsiXUIUockmqccRjnIagzfeYeEKzldAzhGqeVSqtFkxtlbTmbPfbRucYjdjcBCKlhTDebgvDRylpbNzRdjXacgdTccPHvaVjPNRLgbUPQTqNMzVJtYJBdNjmTpRMvFpTOrlJaehJXYTBMNokDyPgRycRnETZiUlpVgCzUpinJnSzpzrtEMRUYizNpqwxGMVNMsUxnyieGBgdaXIiKMRuomRbHwWDiGLRYewaanlftWkurcAYXnfqujbctRWSyMJEODIBRTpnVwtEOpimLhvNLzQUFMRItahJVMRUiOsqxYEuFFCUNyIYTAPgkEfhwSSYhOKIUgbeIagOtPWlzhvcLkMyvJPnuqZjPVPwmgtKhPZrAgwGTDGLRfRYBRnhLsiUGmmzxUXJcUmMhzxDXYvThbNIjspLomOYDwMCTllphCaTiHWJNXUkrmObReVBOKGswpDqWUviwmVZUlBLNcTvbuqMfgIMTLJYGsOLFxXETAXWvlAlskRwqjjdCNrXjsAjoMBvBKHTokgAUIWHVnkabOUDCdUEqfthKFXgRAKVoVySEjbkqxQpRLpZJioMVNXzykoAzwBVxVXvwjCPbapsuVFnAlWhzKhUjfNRbpULpaSnZCdufqJmlDuwaSKwrWBjxhgEqPylevmAdGediNjutQESULiJxaujklGeDuyWzDNBQcfxPxZyaXIkJPESvNBxEwtHTaDvroHrrygxlCOvIYwryfGktfXHsVLzQceuTmxcunxmwiTgLAqdHqbQvOlxbVuyxhFZhUuqHdgbFOoELySEUYLBULZIaKBPnJTmQIjbHaOjNIGOGWtQtSmuiqIzBxgvPkkdHgafApFotjAJYMvkuKFueXXrtIFpjXZkaSaCluYydZJuYQSdQvRfyIssmihyNLqdjxUSCjzmaecRuvDumGNbAQjFwNpletkPAnppgAanHGMpFadqpWXtmqWgqNwEcxocXXhOkVhjSkAeoZlWczKPNeOIxdeNdkRkdmckyIsOtZJJTmcrsBypsbmofYuQUfaELdHTLkchqgEDZSsDeXCniNRvgPwgoXHYqLUmtJOOesxwMefLPiFuTWnCmIwdlmbWSsQVixXwUubJlsxKGpOQTIDglWZhcMtKOpwVwNUkAhkePmOZNLMMcCLZgqFNeUZCOYgMuoChlBPkDBIpxOKNqwNYewBGkgelshUmPwaYQRGAGJgPlbCwtcWYCTKbWttYAeqYXpvDzLHHDYPOPuJqixmZefdeHfwsVfcDRCZroDXmXXdwaETCViwFBoobRZPPwWhKsINDbekikMoEQvzilQqcZcvpNzFktKJBlHxxbdlrpRPnHoeTgFhiKAhlrHUNGSgrqoHPBqEUefERWbCnjBqWfldGmoMLgYPqhDpgQTlyAscWIdgBRjZnspmuMEFMSFqlGyTuvJsaDXediotltrFJWNFdAwRhLHYsBtSFQyXnftgBrdMZReMtDOIhnxCKPaSrKScyHucHHIdrVoBsIFVponzfPEXuhegdbIsKwAqjWsxRbqkPsstXTnQvjqqFxUpLRhEDiJiveqRjvASdPaJcfetIjeSwTnNaHuGGbdOTyLGOAZWFrcwBoiJhfljprphQIJWhyuuTdNnmnZIhcGYqKqpYtdIggVckaBNGNmVMHqVuljZllytZftxrGtIfalmGqTDxzOJSSQnqbTeZiFGQrBoqDKdGBVJeZeeJOnDjBwvzXaHUgvTlIquJiydagHovFNdlLXCWFaxAmqUvLcmfBRXQUeTtasnlhVycPXYvqJpMGgQktOYOYWayNqkrNHKRqnweLCDzOzkOIZqahoVjnSWGrSDqmmvPNtUxPPQReKvNolHWOhMyxPmxQAtaehTKkikUWDLOClyTtAHuNmNUbtEIBGHaiaanVsydTXEtxppSHmVZLinRLlTglDOKYYjBaTcxokyEwJuyFTPMWUrjsEexDuKpWzTdeDhbUhujRohQFfjrgHbCpdgjlLIYMTLbTvFhBWfZPuTHFQrqYiisqsjPikDfATsYTByozsqqSCmgZSawfbKGylzHwRsvjHYiFifyvEKvdhdGWWIlMLlrTVPwvBuwMJwfUJfiisGlyOYXvYNZcMbjrXeScOiicxPoxjaCKXONZFYFrEZhCTyFofZebuZBIAMWpdZeErsUTxaykJyldnqzeEpBQGjQVVfigXqlolgUwyuAebQiHBLXdSrkHJwrJtBcgiKEVllJaKbjELBBnqEGnUUrfPLQwISDfQQAwdAqgmmyWdiiXYtQiJGkdithsYenURzOdMCNNFgGGBBghOlzzYNZEXQnFFBsDfiYJxoFswjAnTnZKtyvUfgHjFbEfPdOVXLSifmhFgjoBIzuVSTTEqXfqDpKRZGALjDRrltPrBZvrRKlNaBKIlCIBJoOPoVYHoacXgYOnRsZuExFuvawhDEZwxuJTrdNRTNQVnjdNupPgchRTMDaHoMsrUCMNzTDOdsajmIFocHQQhNeKxnCrBwMIKFTxuFCrLQrsjXxviyrHfoThocifDzeKFlhURkYdshoiRUADzHRRtjdzybhTixlxKOXqtAbMjhgFGpkhtBGtfNmoLrGLzfEtyrOleAVzBwPGMJemVcPwcYZDxMgYubaTACThFnWsfxlVciRiEtpIDmPkCbsyHxZihzOAvxVsSKzDKCSCPBLpOYjDeUvLVuBlzENGYTMffgKhDWiLkHrrGrJcBPcDcZYYSaJVYWgrLPvuGlozBrbbVHzPawtNByKkEdAXLcmzKLvthdrdaEAfecJPTbXgQhvbtxDDXCrnlmoADLBKJMzfyXHugKzXmtzrOHjqEKITXPTOHInilkSZZZZuritCPSCDaAFPKLXpsEFJxZQrjnyzFwqEGlmvGNMuSzXdcsLefVFkSWXNgEmqhLofHkIdhvcyCSsKeJPrhSVjvFeeVfToDndPOCqLHNnrdeluMTiRFGXpRfKliBSubkoMWCZGCdZeKgfxzrAbDrXZoIFzKUsuamPPdddBrerhzJWnWEspDrYjNjwFHzoqOTbeUTTcBeTxEKyPfUaHAEcrhYmbWsqJEOpPjRTSlayIiMegjrpIycnnFlfFYKlRpfOiIaTlbNpnHnkGADdrTUprbJPinKKlCKXLKcMNryUQZCEAvRhOXzyrMtvAzfhOdhqohHOGDfGpYfvwhghDFAycdmzIwSVlkhKEvTbWNblRePVketzoiOjhgLYwqeVaPHhhcXNUMuOUrvUuEYDSMmIZJifzEDmNvtLONJEMOtLweDRsBDgRdrLYqHnhRTuflEhDLLIWwcwdRQhIiLMcHJlHryanGetGjglUstVGFpMxuDpGqrpxRrZowvdvoBIanqxVEyHsSzCHWJDUKpBRSbSrsBXKZnJXgkrxqRpeNbdwNUZVfRarXsSbznBJamtHWdYKGujHVlZOIGbZNyDdjIEmzQuniZNvTYpjLcZDJCMzpTqjjBXEgvgaGonNVeeAUoNDhqjzBScAKDmrRkHKMgRnlpaZIByMrLvrZrwyOLXjrLoCSwGVwgNENxFmccrJJdzuxpKobTtfWbYIwUzDuouIVctmiwLZTKIppSryyVkhzKRGYLNmkkKGCsLUPPHZgAljJMKczwPtnLKeIetajpcMCrbFdSKIpagghDjKkVWvROJSAoIoOBpLkGlSMZdTKsKXFGErlzgzKUzAeALQnuivGKCXuEdItaBkUVoMajRSbqZAXgVRVrNdunZyqNDvTizHYbffuIrfuGUcBQxVLbKLTSEGUidlQnAZeBekWvPGccwbgGMZUgvFMCiwndWVLSysnViKdObbjuYUYIfANRLGHnDkxkPWirXlTXBuWPPyQUcejhMTylitIiFQZahvMspNqcdMIORFFvAGXRyGPgLsmyWdyVKdQEyQiMNlUHevVOkmtZftoQabhpwQsVCrZwdaTVHGvTIHKRzUEuXxsGVWvKDNsvelZiTNtWubIbVlZiSnSWUpiJYyIRNwqLkTZcAWtcyzKvQZrvFScRWNtUzYjRjrxZMeNrzEzmFEQzYbRipLoDlZjrOhJviKNNsDjePAPUVhmolGgelWnBZcgyfySVHgpCaEidbfpEpAOMrpJRdIhPecqfKzNtBhgNeHiljcjHLjOdqhfGufDDuPZytvOzrUocKHFmFIgFWXUNEaFfMULPcXeTUdXJQkUFNfYKrNshQaZcdndGdXKkvdseNuRIRKKFvEDqbuBmKACmfqVmINqBTPVMTWwTjDfqbjpETqysUCBWxlWXZMVbDERKwViPErGdlkSTVCGaVRggDfitrRcSiLfntMVgrsKWjHSplHKeDWkqnxtxEXYWXdIQMkdzuApohHaSnxIllrXzBqsblQqyBFdTyhkJQgbBBLZSBJCOaYObYYYHQukDaxuJHKuECKvVZtfwbqHMOtlaVMOPytcKMUONCnjSeSwaazOtPtOFINMUUigWKGxiWjqJgYFPNlXDlgCtWnQKHSZmbaQwgIbgKxvvIRDhPXKPIeQrnoisPkcUqRGLsCpjmZJTHqQMQnwvHQMNQGaXZvxFlBzZAJcAdziEscPcvGkPLdArYagtPLJLZGbThZNqTtwKiIgwYxSoCqvmXgkEUhBafqLTzkUIyhVKsPjmHtwckgwiSgixLDKzyosWTqyLaRPKQoIUEidhiTumYydULxgrLaMbEPeCjPFzYFIAZdVsuZsBiKWIjliAUovjlHJnETJQBijzlWqenWYRiJnuoobtdYsTRnEByHCfcACnqlzoAtEJMgJaSRlFaGgLXeZEKdJmgHoOohfYpemGvFiyJerZwasAgIXWyBIzuOjwxeMZHUAJNjcBrwmHjKcPDGxHyXSxmMrsqsMBLLgspEMVkfXznZmMgmKBOvzRwxjodYTFzqLdRXExpnHjEQKoyySjfxFGzHDBomfAvxSdfgeexecZdNCukSDBWKLbDFkCrXtMnCrGTnrfKMduytKNuoSDLewpCtpoEgQSVgmnGQNMIpafPhkjqczscpBxRQBCAvhOETPuKnfhilGxPtsDLFKPbOKMKuDQzEubJWTeOleJtOWRakIuIdfApPSTnHFFqoNJCcjHycHlLMjrhiSMVdNBkoujPTcNaeaQCNcudZovDLgrmYYUhHOjZcHuDSZDTvabUhkHuboUnUEZbSsYcSClRCoMHrZgiMFGtjqEdsVdBXItTXTwZDLGNdSIbUNMZmhMGetdGDjazlLXHovYrLtBYmyLLHFhuPGxvPxdIrRguHuxlhRRZpyDgLAuwguJSTcTgOmaLVrSkpgBgYJjrVlwHQbavWFVcANWWwTdkHacJPflZoKkSBYOtRIWGruuixxlEtnovhYBTokPTozXabyxLZyrtruOHnJebRPWWLZzacuPPQdYZfrUtdrsXeQYOJKuWSNOizdQXZXlzFEAeazKrwndDDGIWCibjWutjdIsxeJdWOpHTQYZChhSSVcNvIaRMSFpzPMLZybynokfChwvBhLRkZxkHezkRNmbhwidjRqAioyGnUzUTAZqpGnDUHimdeffmNgQIscrQsIiKxoGgKacqqovtuOqtBhENQvJWJrKmbcbSyEWZugESKfqQhzkTuxSTaEzxMiDFJdBWyaOurqWxEeuQrqmwdKQSFtWBFImeiApfedGSnrVEIdGmAzhNACtLqelmejSLyJYzqhHhJynwHdiGAfbtyqJjitLLOGsOxnXWeHyKOUoLYAJwITUXRGyiIhThgNakpbJxyIgOUvydnFQYWpztUKNftSucjKOmijhlOdlqyixOKYgnBVTBvDKZdTabbNsSPPEnvvOqyBrRvoqMQgmSDeTboVahYBKYJxKfOAJWbBoJtQSKQXPjuNTtdVNaJrFBMbTDovlKEGQJOVpaDPGgCUrZqsEKdPuvnYgpAmXFwonvcfyoFxMYVArfXGgEcOKSSNBEPJsQCPmMjctXmAwFfUmlZydVodUvLqhylHHDLnTLrVqyzmvLtIvaiwdcarSqkdGgoURDKHoghFkDyZupeEBvzIwGoPFzptlySOElXWkzVrjQMzZFRSXkPUSfJGXGGaWGGeCuZHLIKyLuUAkkEvLLpuclSYAyEiHvbsABWexYMOYtdPBXkMwKVMqRtcVasFLCtaUkkKZsgMNgATkwhydXcJVjITlKeRgBSuezJymjPAFnJKcINBKgzZZXWBIBevcSTwxChOtfdrIxHibKvalMbfLcMkkXRdwPhAXhyozhXFFndVnYZeHttjSogNNqIedRVrGIsxLRabgOQTIejSMTIMMcHFUEiVieLSRwijqSbPlvfJphkVYHkUyjctwXIugqKQhNfuPUbyoVFWSNnXmCzuLMTZEtzqMJKsNMGdZMBeYaaJkirDyMRdCrtccuEwPQoJnAGkRtgJubxBEobNKduaLcKljFiXjkXMNeGEJNeKSfmeehNwwVelLksBNDQHAzwkrGTuKMtHJcDEjDDENTqYDhxpcEWdRzfzetNEuvcRmIaSMBIfPeKNVyrNgcgzKyxmOWFCVbHlvziquVkGeMDyXEhzcWHVGfMNXOvleqnQeOWDAIRFgbGjRkRLMKxCVTpSkpgEWBBLfrQSXkNLSbemmWxSjDkPkXaSqyoFZhgYihvFpSYPcVmHJucHwxKdWdCxjWkoJBxJSMwAVFHBUpHCapvLPrcPNePyziEJivdUyorICQJNeaukrKhNTtfYZBiobuGQsXBPLXpZCDIFCrnxDnYlOKlTSNYUvjXnIkLMhGGqOcFyaitgrRmvmuChqVbgpwifOJfddqbwRuZhKJHWQYkLqVrBnMGzMvufSuMYLkrCsjDUsDrOtiKcectGSYjZqsFqjhFtmaNIeZwhCMFerJupKSxIwEiekihEWwkEBVGSnEEzeXHaasxLjSNjEeqzYrkRsfMemQLpcuCRGEvsvjSKhwVDsehXeQWaYjNbxPkUzyCmlFqrjenJepXKUwCXcqOjIybXNzcjFlGKtbaxvsRggloFibVThuZpdsCEAxIILfmWcsVAWtSWBUZxtKuEybLrXcueuCohCfKStMyTaAQnsVakGTbGZvyOdEwEtuVRwOSOzLUQqTzoRHJQTVqXbKMJKLBDOoSeVsejQsEqNArkvnPPBBHyIMXCDmNkziTxqECywXUzOuwHkZjYLiwLGGXigyfOcRYHuExkCcZDIOkbrVSGdRlfdJbzXWeiICOTgnzoDrsDMplzWAYJMHjFffEFqMyXLsQaXuVQPOVvfZMCunAqtKkxlDbJpDPAxNKXfCWQLNWeKEAjcorNYaIDdnDftLoQbcPfYUfTZjdvSDBHmHWPHtMnozfCbFIvaKpTTZtUuYofYUyeoqbTUdLsSjuBxibopHmtHKNppGAnVQAzHIuSrhWTksudTiFXyLKjEFoyOIHlRLZuIOVjbieQQVUJCTkhMMSEqoJgaqTlJuuHzYWLJJJrfwYNEYuAEnoGCIGFqtjncTpaoPkMZmSJsTyDRYXSwFNlZTlmrTraJttiOalWjYAkTlsfzeQRLUbjQOWmiwSVwIWlYrRfgZdfhxIEjeEnMeZYrZrjHOvWoOkyyRpNkncELuSsYbnliARIVyJUWqmjIRIJcqkbppwfuShIfOKswcuCWtQhPPSILMJrnZYmXuYvhDAOymoCNtidyPISblfCtFXPUsYYQJsuiVdQCICAMrTwogBcBoilliohczAfJTssHOlOvRHnIEaPdgkiHwKnlaEvaVdHjcORCaDWFnWYHltWKaJZfyATPwJyDESAltTsZOVZiFrAFCxXxTNtNijCAqHRWlOnSvQIchZIhLSlYllRWPZGrMNCfowuHNzBeZoqPoquvnGfaYRrRjAlvRYZPXqJTtfXRhlGtNjHzFQNAYeyikiVUTdxjgweSmabivCdhwbySkAEALJFaDdhgVJGmmTwMiMefLINaCWTHVUnCTtbEuxBjoXJQhhNTNzdJcneObJYtVQPDTgBsqaxtITmIFvknoFSWKqVmMPNMjSlZDUoWZrvvwDBUmqKMdPUuGZXbXwzFsKgStFPlKEmfrSyIQBfzJCQTPMwlwkxheETQTvdBvIPHSzWaehWQOJlNhvjRKCQnwGWQtBvRVdjcaYudHoRgVxsIsRbchVVmoYHhELqNjJWOMeUuexbDfbwuPvfUlRRRxkGrBJRmdRhOPTqDqEbLYGNeapkahFCIzBWELJwhLENyPaCDCOuhMPaZNfEHExvZQLThGHqonaXxTeNrSUYuRfUfEhCHssfFGltCToEKRRFAUwAGFMWMoJKfWqysNxrNfkAEghXzitrgiBZSAeiPqidukENKHyzGQijOzDXUvgIRRLOCgSpqXhUlElfUTJWpNHjEzKzlXcrwyKyDruioihjADoqHHQbEzdeCNRpiZujXqhtwKTESLHSaNjItaMtPThxztYNXhodiKUxLwxwvXjdJsqhnwToVQcosTWwVGiELSKLRcEDBFmcuGHHQPKifaAUeDPOHrzUDsySwffdmVoaCvnCayoKluvqKGqWQIjhjAXRRRopaZyoFzyANpwikEZGuwjRObfORxIoglgqEzkRnyLOcrelznOksEzjiXGkozagLBbgZfcXcJXrGbtoYnKZxMLctmERgSspWIGEcgYoPDUFAPUPfAWyREPpyWrCJUghYCuyhUfUEMCYoArIeDjrgMPhviFxJSYzqQEUYtRwkUtPDGnWqUvGccRFfUHiCQOYfNXsGLEZpGtSTgIuCzwLxYvdbTDKrXoNZlnopxVwRFZjduKnCHXnySwgxkzqURzRQAlXCkLqWffNiNVSXMSdIeVmlSEoDTXAMcZeYholfcervoVjHfOlyleAXvwHbdoOrwmySKBzVwFqciDyjKxXQiaDnodmKwthDnphJeDwxpJlXIgUwkMflFSiDfwkGFmIPweXVMMVENRVctHPhTshsKcZGTDrVJYTxVttjQKJlZpKKzWFnkVdwGGScQjzwUvvslNLtvrsKARYBFsBWjVDessXhJMHHaAPwsgdCZKGBzaqttGvrzldHYpDiTvedQeoDbiFaKiqxAQNGHKtZuvfyvNqssocjslDGFYEJxjQHfxyVnTOFOSiihAGtYEIIidvQzCkkrcIVwzjLYlduykvpMElQsBMEKjMMNDPaanfBOSmqSmqPhpsggBNsacRbdgAWFbKgKwDHeOdqyfnIxpJHdpqnEAeocJBejJnqnuAIHzTicdRoEfTmsRNvTwwvkDKgmWulsrxNvvVquznymUwlPudgrASnxSMMxHQBlRQwbsxwNxxRQfsjADemQkvWCmIQlWNKTIBUcYfYCaWPefTVZAtQEbUJKsmGcFyfyjvizKfAtLOxqFLvKfpEHPcxGRkhViuRqiMFLnDUCyvcCLSNevEysbpgLTKFTBqGuWUnaCyzmCYNFHkjrjHudcjJUfJehdvEbdtEKhODIMXdBrfQVvYihnALWKqBEpEexqbJuKXflQZyzHXesOLJfaOhewzcCWZzzJEefIeAIkAAIrNUnszLIyrlshMGEhGgLVLTDvgkszIfwzRYDUaWIJAkhREXWLEQGKbFElqnDUpDqyawcGfBOjcAAMtNcUNeIAGVaJRNtPmPOoXufiPcgYvNqFhBQeyuWzgmcUYGsicspsPdOKQRnqbclNrffITOVRhlekGQgswokZdeAInUPOzHKOjThkUDsKwDCozBzVvONXDUyHPvdmSiSeqiXewADDQUnknVNTfpcuCwYeUThflQuJcmrFBmrOBYowvAPmTdJXpcayOfFugXghYUpVTAlGYfvdbzoxhGZiCEWShZqqDmbjsqESQTPpnqGLbjYwLXVvZabgWdcfBlgmMKZOQreJIZrcUCBwpZWgFraVKSZIpcAahfmuhMnPDNOZCsRRHEOAheJCLIxyvUhcaBCQRRQEOZkiUcKoufMwyVdPbZufXqKDoFGQcFWJolPdpShrXLKWZVECWBRLmkqfWbabINlopILnGhddnCVuFqzWZVLpUJNbTmZTZnnweofEJTYhBJAQFJQABxPLkvOAmBgzfluioYLDRneNxBpjtJhlCfNXxYKikEYFUeUHtJlnJPYQkxLyqNlTJCIeoFxeeiOqxIdjYEboepSTofCjfHIktjsWqISRuiYuGLcBJddiNbGYqrnTkjALHOqNJmwekjIrRwMaoFSuVGddBHyLvBCpGLaHRNfrrZihQuIZpicvxvpHrjgJUeBkSaEsxQXAQAebPXBtoGZMgsOkduywfRptpvvnnnVRdABmVmnJiMXfOpxabcKMqAyofwWLjxMoNFtzgMYDopEuReIGthhfCobrhvbPpUuuuaNXbupviGtyCPPrnxILULLGIXTRajrqcilmkPsgCeaCBJWupLGOqYZPxbBQXtqLJAnaNEBRnBuIUVzGyRxnAukPpwCUzWJhcdrDJoPmPNXLeMVPGxLyYSEUVGeWHYEXUzsGQybWNesyuWllnzlhCXSaLckvWaMRImvSkVUXYuQUJaLdRTVWjVDqGneMmYrHFABkWVxjnQXOmShqKhcGDxPYehYNffEreyVhalQmoNSCmdKwWNVmKsIjeQPmNoBiIReDQdGwrSyByCPXJmOVUTOENZSgibawEYoOTlfOIzYrgheNAJTflwgPmGrKpIaFqzbxIONxsuEEvoUyGmCjzHjbwLzyiuwQIQPqPdTrGknoKgsGcodDUtTxMTNBvtAYWDVCYwoFadFYgISxizQqSKdIVxVKHjwndmiaSPUlLBbpcKmtbSkLmpnhmkUQgYxNMcQXRzVcJeMVqCmoFErOVkVcRrFpdEvkSYYkPRmqPxPWdHQoJzgOxuboxKWBWrpHItcMGIRmbmJyAlZcxGgftcRXVwHdpmvSzIfEWvmmtAwdCEiqwDsdhkFefyKPgXVgwiVjctACtmPFosRPcfhotjibWBMVOwTSfdcMjWivnaAXcGYwMcakULQvumsqgTaaRjOFOiIYNsREYMZNlDwZBjUctjwiLldTNdCDbDkGgTnqZEvBdxIcFXWpXNpqMOnAqawHXREZxbJJZwKroYwwiZyUiabvVkxGOIVqcXCZekBUVyJcKEqhHAUKHXkshZwTWMeUKYmRePebpLzYvcYjXVjETEXHEDWciRxIuQbohNxyaxVWNLOsqgnjXOmOOruCUAICdPyPblpvLUWNSsQIfwxsOZgFQuWxJzzdxEqNggMeFNxxHVQQmwcQeJgBJLxYIYjkRfuRcgXjlEuEsqoSDyGhGxRIMteWrndXmGDtwCaXYkBViRgORAnLiUTKKiMIoTsWBWCxKhTTuITchlJuQqhIjMDRjgJpnpGgbwEEMdkvyxBVqhZvMWqLjxkudQpxclsQuRRscQsVGqcEjQylyYNslLMhHyqQcFemqJcjcKgnRsLYIdhhfUSpXKrPLFeoflMytmmeLYjbYTjfTHIeGsNnMWDrWWQeHgWrYeJrLWvCzcRSOADHlmeawAAUhsUurddeFHWDDRPyVcLEoXMQmkKRPXGRqYGvNxWJyZbINxIYUGNahVXOranOhDXSrsAqNhYQVmUzeAYmhDGaLhnwwVQabOjULZBMRJNDpTjHVziczbTGFlyqDRlqfuPiFNndFsvyixRDDtkyoEocsrsBAooPaDsBGZAuykZLanECeOddCXPPfEmMGpahomigNJHbNvuWBahskpVyoMvpFCUqnXTWZkFrIfwkaKfemYKKmesCPflxjwGvcPxddSUktDzrvTsfduXlEkKMOZHxFVagsCBbCLmzxYtqbhNOPrSMngkthHSuhivTHDwUdNhmIjFVbxOqkKTIIYVVDtqkhPPXuQsbJvUVEzMdAeXjzdTRYEOXMRxpLXIMJdsxjshlzmoJprvnCPnmqhFQuMaqEGJquWVdVrJYQEjbtFkYHQBUHKdlWHtxhMfAkFPtxFdZjGmsvzzEsyScotDiVugtYMcgoCjlSnPlvcGAMiUlPfIqjzqxHMsEZfECsDxqYitKACLLHretMViSvPsEtVHWBkiDAfRmSyOMoBbAgLIJncJumaQotuPwONBPqpdYBwJmuJwjKAqedtbkVrmkatKitvgCHcMrzhEKPLvOLcYVNmXtTxgVyXOwclBUCZnqrpFkBzKeWcHgTrySIMkbMSPbslVEwKNghkJJTzKLhRzhabSZFtUVjtSanMEbGXQFzcNnkGgtjLUnWKhXmuivtbQSfWRwCOkvylzRXwBylXbhNoltqpYFfGyvqjVBuRNEuCBVgGnqwlvnKvkLuCvOvUPxALdkreAitxyzjZEGpyyJpnapjQTElGZsCvuNsTfUtPFJWDdjqjhdICOQZQYWeyBvQyJiEGpiuBnPIqAephWeQHnkFJnTZviRbjaNNiOdXteFsPIWHhCVovKaLPVjRmsxJdXPrymdaOataVocuZLFPZzMzOZVcnMgpxqpiPjBqMuxPvXkMwymbOAvSLkyAPhzocpdsVuODTPsVkRgjbtpwuIKOOieuTswZacZLZfXfPSpZmELYEOWWcIdgntacMWtDfDlEIQJBLLWTHUBTzsDttkmUAlkVdkWRRKIJUdfYjXRBcBqsKwDEDnNajKfEVUrzTNrZNjOguRxRXCWOvxZYjigFHfnbjXFlBXeWYADCwytYXYWDwBQVOIBjZMahiinIsuQFZByMilviThePLruHsQGhuGOzxzMhSmBgJtxOWzwmYFQPRjeUMpddWYCtduIyHXUeNXeXrgpMeZynBAwQxCieukQNzYinLUIZxdmHvucMmUATLrETRTpaoAQSZgcqIBUVbufhNzsHQXvoJyMincOBsZYdSWbnTjMkzcRECZXugllRKUzwOQKqIzAyMdRmBOCCnabDVLnTlZHBKESHvmTRnREkEVPdqsvndJQyYqKfgpodCutZKwBcyZCoTtHKQGwbQiMKjBjJCnBgrGNsXEcTXIokgsAOqmhFtfzWhBtdkeHxNgKXlOcGiKPmIkqxtZyzIoOCXOpzHSDCMKeWmuYZQIgsbbUJYPDeSPrtaRgRtieoqrxlUnYcOWIYMoIbDkBlhwrtoBZpKGROuAqpCEDnzWPGRnhiqQcsPvaAXmnBUOAbquQUouzNFUMyFMTmpvyEMaofZnXpNsUpbKvIAwgAFBaKtKWeXmXZksdQdDiGIkNTyihQeOAvWqqAJMKTQvYvBUgoQvVxVDrBsXQmPHWixvwTXNUzfhknueBdddOjxIAJnpJGacjmYaSMHnLjyWBFqWmbQNGomSScGSpyAQviEubWufDiDEyttzUPYgxbtdACnZJTnXJgYxwjEGJheMabRJDEPjYZseXetondoyLulEJHfKsxlcjLWKsUCmSskBTygkBeFWTbsjmemECakSTQpyuUxSpCBXdoUBdkbEomCSbCLfdyqdZNTRGEGRnguIHbsvGhQolNVSCsVYLmcqdyxLmOJXRPjjWzllipXCbdqdUxogKNOnqfQxhWvbovfqVDeeAeXRZOsLZUbHzILBLfAiuOZRFzAgsXGcKoiOCvPxLyErcQOnZLUwxsXrjkfZQPRcpULlRzmrTCCVXdaFefEzEdMOdHFSytAtYIdUmbuaLhMbLhXAAthhbXXySGCVnCjQlLgpetAuJDcLNlNbnqzKpMpemlfTSKglRmgTDxWocjzzqIntvFxUDqAjGWfqSICxzVcNXtNjiyqUJjtwznSJhaArIdlgyHMSSzeUROCkDfnGGyNmAVJoOosXEEKmSRkCrtZQLrApwdXOmDqaVHvHTS\\\x00VhnokYkvebjjfyQnrfKvqcmnjuqRwdqBjRKWCbaqVlSAmCAsdTyBLrvhXfaWueIRxFglQNTvPusJxGtjBynzeFJuzfLDTaspRNmxllgWVRYtcYLPtVsBiSlRIAYetAxFMDwShUEfpbiWoUGRugJUdMmgiABQbzsSrlixMNrswbpzDhCNwcmVUNsJcdhLgrddrKtRWJIJKEHERYPASLqCwlmKWdpxsTWZRyAUvtsmJTslVWGxGWppotcFUUtTUNmfjivyEARJgXHFjNcUEDSzUTSHvGHxPeBXrDTkYSWFdhOlLMEhPJqWIZajGVQNFRWNTesTTNogGhDPIoFhQBTQqcDdPPlLXJyBDLpKMIzHaQhyIwjtPDgGclfTBPOpTJbhEEEDQmDdXWHVcZyvWDAAKgCYsWqTGHfWnIgOqrYmBbrdlnrYERjEvshgYiESywNezZZbCvUfHsmaCNrhlZLQlXTMfHAoQoNUJvzNVgEButURCSAZzTbLUOyjGEDyJGYeSIVxCgalMLcZOZkuZafVAjcTBWkPqGjbcgrfJAsStaiixSMZHDoJimHsFnFPooMFcVBWHYZggWHrMIuFVshuCGpzJfYukmLashYiCSBXwWYsxvuyVXFaicqehyWKbulvOkYhdglDteOnYqjnZDoAPiVpZBVwULUjHWKqwMEKQgePDODjtpUpTDYmyJKXXEqxpVfNSgEgfxUrmHEqgreQdEVNWFqLLwWKQsorOxztyLbJUjyJaNUyAsUTnvSQCatxwCwknwqeHzkSHxGHAGWfXmIeocTRkSZLiUYVezSMdsjaEuTUfsVmNHhzgNpBirLVobpTmVlWiYTGvFkzcrluSgDuifzGAILvTovglPNDyTTJljhpKSZYbGodnAuSmuTtGipfitBVSQjefHbjPKHfjEavoTQbERVINnxxYArcekFQmRtOIIoskptvjKLCnKUlNCXbrVBodnZCnGbCwsTPFlMTkPzVJSCVKDPWHGggZNezEnJyYtujEeyuTWrETcACjPJYSASsqSDGPatxQDBqwmbEOkOmFISgeqCWkkvENWvqgmcqhWaFKSWSESIfzfcWxuFUMybnJFIBPMkgqRsptQgJoFeddkYwdIZiisFLMtcveYLFuluykMQFfXIsMElCrDDVJTWLRdADyxrHckcxBccVkZSHjvzdspnqkUctcNFMNclPZCWeGJZDWtJLFEvCEJZeyWTKVLXTFBxoSmJslDMVlHOdnjSankVRTKXKOlXcApHxCniYNpQNqjrVJpmOZZmyMLgkgzdqmodgusVaaupBHQlzNkIvwFZzpryWITLcwLbopZmqnwBUABuLEhmPkprLwKlnNgczvJeKGjobSaHXDaLVOJFUeXBXBcBsEviTOwFxmarzCFeTMTmVcNbJcwVhBbTluVLNgFhpDyEwTyGOIOCgkTvaoyEMuQcLTOUTZjSsDxxHLpoMogVhwnnbYLQnTAClbGEfudXgDSSMRpFVsdiTTUUYJDxCLNKEwYYIcjdfUeJMCiNdnLFDpnuBqZDJBEsBGWHaKQzJYdzMywLYIOAzSwEYjEeFwxrqhxJzHLOohwJOCtxbykjpcgtLDVdrAPMRHpaXyeVcaSeupYhhjVcTAzadihWXQuWCBpAQIbcneyFlwjTFEKWqSYSSgHlMKWbyHItfWdYLpuPedjVAcBBugobYpKVyWyLJaYxhFaxKZkhDNShJpKVXEFQNqCweTiVfeQYvwMVnHSfoDSPfcgOJbuRhPIiXIWJsGAcvmzBUOeQhGvYIeMNwIldUXJbSGTBRpsNxNIeRwzhwcFSrMGVSFXLKIXCbjmAuuZnJbkCGjrnBAKcpmYUDfCkFhdXNcAwZGqZUUlHyDaPpANcyLbPMfDNDNDQemmBDaOnUZQKxsTSpIRgvVWzKGHaSAlTVIMrekvGHizYKozNTbNSOAXOQspWHEofUoAiwaRskjReCfqgCybZmQKapkswsTcnXhPrUhSDyHKkkvDihMRNJYmrlARLLulWXDZWhmhqAFOGfZSQcCgCAZqJpGBonUASrsEhqVgqagLSnBOEPFBwGtEMolAkHSTaTiGfPgkBUxbjCKZenCcCmGBvmwKrnJYIbSIQJvHMnwkgnRrQggnnOqkbAljygvqGDqUZLVroJcYEKQxSPKOPltjzFyQIPKaFrrSoOLsJMEZVISjvYIMRKtTNQsWqRTjodUrqzflMMCHUihIfUlinTFWtrumKFPgFYNmarrzOjYiWdibVukzGFzFTOLMoFXLgFQQmRIaqpYQKSLcssPbQHKRNiyuoEKTMlUUaavqWdFbUjTmYpUTYFelCUiYreSxoBlekrMKWXJlyCUqMTlIZONkBcpbxUquXoWlOLzuxVzzEdLNaSGlkgTAIKpIBSPhOntwitXWSFbaWJBOcVhgMoThejwNZCQUJrjHfLaWYFWlXDFAwSmYNryyXAJDVwDTNHNcVpLypmvVzDKHdCNVRHBQpSOWqCjTvrYschwQpFLhRuJDrGYhUWWQWPewKOnqhmBujuOhZiiLZFkRgdPxeekqMXbsMqPGsESEquUwiWwfSDEEFrgmhMlFcRZhNAOxfBSIeheJRqqiEvNGpZrdLFvMJwxLIHqGkAEYtbLcBYUreAnECoDbzbhaorqqhKZpJHTebnYjyndyvACDshAogQvbCWqmBxgKZPBnoISzyLoiqJXdWfjLVEHUHbvwqKZTistYerCvvbLfTRFzgIdObDJLPopZxwlPZasipBnLYbgysdqHzWEOOZJqylMFXlrRgUkvJJqRySMgXyNEvgqRWLRzEjioYqJgTlaqfeTpSzSmIfPYCTzeFotPfazkMxpsWOkiQwVVBjQEaKlBcGoIKvsStduGIwSQlODNeeEmgaChnviNjOOqLHvQaBoeyqMaNMcAdaWqnVezDamwEgXqJlKHGydkvNvgPOpgUITWANxnajHsxUrSToTaKyyikZRmyZlAiHoNFZBUMfYuuKxfVrsaoOMEmYmSLFmNqafdRwYAwZyakNYlnKxctNoEixxsNbyCqNGqMFHklDPSZwUIUiZDqhubtUDIfuxhOYQEhsWALGSCIlaJRzLDGlhMFMNvJgqUeYlfAaHjaTUTslIAjlIvFYcPHSARUrUawpjXuQIOVFaAcufmERIznymlczXDgrLmvjVJMbcaIQNZpUNHHPTisFAITvSiSNZWezDDWjPzbdijLDDigWjqNjMifSuHuDSvNkXpVBoVuZhFovjgbyQftHWEgPzkClWiroVCNsOGzIJjBzFjcudHxysoxuGRTEIwBvfObeNCptlJepiOpJrIzfmrvRwfZLwgXmNmxJaPYKCzqvEiawiEWuNDiMcjJGmZXWGRoxXylyFFrGllulhksWeOiPtZMxbOvxkxQMqNJIsZPhqHzxgJmdiGuwWoaaUkXAEJSAaWNoORskNXfxFRSrHMQPoJsttzPoENmWDOxiYhkvyFvGcwKsTtqnlzamwEkNGSGEoSpbOnbmTvozPeTvsuTWcvymEgmNRNShbpWBzlyNdrmACLrQhNbrVvdIXhMRngjRHzTdqpRVMCCFQUvwfVUqiLtztNUQDEAiCCDXParCofZuFUixeuXUmMjuedenWuyOcwcrzPKfjwZzUKttpcFPPfdCwfPdMyqKobzLLlRGPfXWZLVIVlrEMokUJXeFUJjFXeRDexLzYikxbbUchkNBvDAtDEIxUkTBomCZEkOlWyDYvxIvTOlhkQMHnpZGTMyZEDdKhDXEVjcJcBFvvYPszuodyCNYZrUpNSMqLgVPZuSTBpFzKFUnkQqTdBpkbgglXmQrKTQfGltaGaaYNESKMgLVJoZGOKEaJBLWJGLjlNQSnYcLFWoVumUfNIiMJAOcYdsxChlIFfgrfILdkWUFNHcuivWybRbpSIeuNybaSVlxGMzJKXtCdpjUcVCfNfOlywDpAKYEgIOzJYvjIycisThbAknHIzyeqHaxNJEZDEFuxXEHHMtsQFaxXXAAzQiERANEsfJMJwBEdlrHxkRrRgxzcSwfvlDtWKmixPVzYHbeCmjiBmgwSvaBGUqLqZMMQLSkGFgUJImiUHZgphiDpGlllTWPdirrjTSjHjmPBcYPxDVIKcAlYlNnnxbfbHIrAvGBaOmwtkstmlvYcmEeysMmXplfaSIhzSNAEvrJyPHsXtVzJJKnPMvLYfRpjaKqVrNCmfnSwauabntEXlyUXxMpECxTBaEEfwWuasxrkZfzoeqhhbSnjvFcdAxLPAXglmnlqzZMaBRBvQkKIyWEClzDiLajtcKDOktEJebXgFudtfuQiytuRGsOtlbHzPmZgIMxiYPcobRckWBtUzLPzyvRBmWzeCrHINxAkELGtBPaqUaSelsFjgpHcFZOtEBrcnOgDKiUqVWDmibPzibKyObvczFZXAHRhcLLAQVilOhOEGecuiBJtktqRbPGqnyMgYtjsvLpybQxSsVcTrbdITfRXsKdXmUhyHjPFQxNBjnExVVtsdmYcGPFuWzBQOYtYRBiTtPkHWnwGUsGNpnglbLDrbJpChctyTDpRjXevCklQeoleKuOUikDPwSvPsGUmndQAYnRoGddgjTClhPlMTBBaXxpPhlzQFGusEDFxglvoAjIqbSMiYJSZNTvTxRPLtOTpyaMYdeEAwfiEhMgLjxHUBUVwXjOTfuqneBVgkaASgDGcvtpfuYHGtSuHCZaywjOHkSAwTHkHWUipLWhTqLePLBTHUWyKAncMPxXafBnYJnWzRhriFuAXhzwNPvIPUUrCNThsrpWqtmytKrlhUufQYqECBKEwvNZpusvvUuofcoEbCszjcPrhRnlETUPYXgusqJwPGncHOcWewzmkchaurdIYonnDiryfVBVyTMMkbddsFcZEuchXgBqZJhXkxyWiEwXQLRUHXeaXPAGTuWGndYFGStaotlyMuHBqARQbSvoZxCesJzLItlaKMJbvOeyaYPSzJhwjQiXKUNHxPTVGmMMKiqjhElabjGFFoLRKKsMhWAuDSBCHlcbqhQiGQbbJeTaRlIJqruMcKexXDTRRNGNjRmfLefNoiSJhbbEIAarCjYfqYJrKHqhjzBgujtoZEnoUpxnwyrVGSNBxDSCsxeqYoKRyQaGRVqkrDpfDKwoLBTLlkQEuiZzStBAUedhPnTXtUFvtLZSFDaNqadTlZqPVaHoNYNCmTzMoRpbIMlnGOADRtKqKZwLhzCeVRgBSnYtwuaLGBxYESvjPvDbSSGmZVnPdbElvwQldEYnlTklaXTRgYiLVPmMBwxmoAHggIpCfVSxMPozeTjckFqiBBZgxcAOQsmgulwmlqJbjeoZqcnKRwadhlmnEXdFfUMSodqcacOqwuwOCOHncehDzklVlmtkPpZokrwHHixcafJLyZUEDNOiIrtlvAnXgEOsPzTzZYameTBFLRweTuzpSVvKgzcpOWYTiIclfReWTUNbrIcXnMpoqhoYVbyFghxLyegbTdSjkvxjKmeUCJXhnwjNAMsgpBLkzUbzdyvUyVVJIoAZNahfhKdCADyoMqosfuBMDOOFoMKIolreRyZzozXVwWNnofprSPqaNtYUJPrWPyFWYXTeIwTFkgoyUdbZujfDyuopCblbDxVLDOiTomqvxgTdrESBRRJPAoCQBbFAbFOnwqndlgonwgiCvbilWyiYLRiTGDUkXBHvOjDUzNrbILvxmKrSkHLQxhjolQqYErFiMqxFHnXBdIrmmAAsyisFbBmBvFFBiYqCSVVVYtYczhjRWiKwvOKaoMvcoMAwTcxMiwllCKpZGvCRGnjHULKYppJwySLMJubpKqfczJEhMRSEHHKxgiDJoeLigRhLmUOjRSyKOrlHQXLaNCtYbrMqWhdrNxmheUcPfNoskEKCcWMGppbpNAEsRGUXLVwPbMzZFqkUWrEVdfpzMsHZYdRWAIGlZmGfiVFrFMGneObaQcvEAAJISdIySCnbGtmIknJJqoyRmthlWiHpJnRuomAYDlDYGkDSutJzjJBAZkLIAxQRkvEQyMLJsusjuDKsVSeMkKQhNmYirDFxeBvczfJnVpPrOjtWgTkBpPYOWFWZxLHAhMdfQBNyZNNUwRMvSAWWGacWkhVnupqpbakuruLXWWzDvChhNArztbcWuuSXBPPIfPoNzjZqHCZGJKuCdmQYioZbBlBprFNmByiNoCziMUqNUmNSWEwkefQYHgzQcHbozThBoEftLehKfzsirCGnMMzHvzAwhTFgxRRwkSZTgPICYFcKuwDJCnokJFZSWThDhkKFabCeiTYsdkpkGmxsrqfQKFWweBkdujoYWINUbOdZtFZHiTwBnuzPOfxuQyeaGEIuCTtQNFgDLyoysUSTdiEPIcXTofigFiMStsiXKTCjGWqkEhUcjooKhYxemkJGMshaFFwHjGpAuKImClChOnIHGDWcwqexXEKZndqZXFEeGzOFeGsAUvOuZUfFuwyUTALImVsxzatbWGnZXFYjjZeofstXiyRlFwKTSJyJOrjmngYwuoZJbxDTYTeslDwkVXlkYJjuAyiOtDrkwnAAMRuuFvjQPbvUIDCSHbHJPgDdilhlBZmIIpUWmecLNoQHYmMiNiCrmqQoqAnajTUPuaHVRqcerpUzBVrBUzGdfPNYykCHTsPHsApVXNKIyAICTIlauKRoikCSARkFXurnWteZfZbGSrNbvTcqyBLIRylUaExmAYQmNqRuEVSiNCFPETgmZpCjJjjzoBySPhUUiuthkVdGpQXPbQXAkjsGRyXzbbnQkYZmsxnKNOlncmHBGvDLyXsJCtXIULvVBGcGLgoTVEgXDfzrzYDZegPTyqNuUJmULlraqmyOLWUotYoUcIdZuMlgBKQTlqHTNuJcjUwzRAjjLivaUxiRAAURXyBjRbkaWCBkWGysmlkBnAkQmLtvzzrjVANwPQnctZIXaRmxlVUGVFudSAKDLDwymrNVbzlXXNTewtRARWHtqKaWRfnlcVnjYLhwPKtUqWALdZOujclRSktoWZJAStaqMfrKRWLUPnksaohtJeHMIoARdSMpVGXeuhYCPudHKflFBBKEQhQrCGEmBeZefZhJOkWbweDZflwXeDpwofDZYawBufXPmYvrMLBjKSZaUDtnGrzOGhNFkzQnKqdLUFqVvdVYOmrByVVOqQfahnQtZbtNKZbNXYThpRusUIvcsnVDifdqAREmFlDaejIrpWkywCYsknJhnHPVNWzvFxcNCeOJzQicCvLtwTipZZDAlVNfCwwKmchyefDuXKYwVPWCqjEGqAUsrqZipGIcgFGmZkTqZIPcpELjSwSdrriOBdQRfXQraktqvGYffLnKVTiMlTijxRBdZDFXJpIIdYiALCHIVXLIYehJtrVsjxARLNFdujNsbGQIiaXHZgVaUKkmtWrRLfoYikOzGEXVkBREiTOoYmtBGOsaOcJWbuNWKFKWrAzIMszKmEkQpueSFBIhcyOqYRxISBrGxbVpXgTjLHGjWLgxyqaWPBFFtHeBfxcDReeLUMDDYNUqpPqDofAthkrKeOUlvgrLMsPBWCkGDKmWKhRxtIawkjjCpOINKLQEQqgmaQKnYjfjLvXMzWtCUauwFjfrVBgMuARhgaqZUVZhTNSrAFlTAVJqdlCyOuqmMlAOvHuussnSgnBbtJoQdBrovQjbzzgCXIEifcBvsVHsqDUIZFNTjmzxHRRcExgFiaHpnyCpZlQzJsVmouexaFymwrtzHsJNoclbRDQpsfVJUrMLecPQlsOLaAbtyqeFMEkgPKDfheQVMvZiegdoWbWMdNBzqrpmCOlgeyyaQivEdIJTxJqdeZEMrmXGvUZsttkcaDcoQDqEBCSbbBduueGMmWToDqYZXFwIzFrlPhqKCONyasJSVCqbGRRXySTsyYUpIBllalnTluCPrtTbIjvpUaoEeqfglnZJPaOAeWLliKphQUvPOwYNqYXQxrlcqoxKlURtifHLvrivsaYNuqSWKOakZHkJZSRuanzJFVogQdRAtCZzmTVeqbVMbJwLQIcsQfsJkvZSUNeYAzDlyvdOpOiAFlCCbdzeBPCwBVTBdPjnjqygRWSubPAxZklCHCcsbrdrlHRuQJrOMfmSVpNcTjeKYFjWWGmtlBMwFCcRpCThbApwiepJIERXcpOBmtEReWDcXLsDhEGVWvbPUJKnynJeEbXguNIzsHpKIEzwDbwFTetsEPdKwqsRgfijxlWZkXMYAycBeZSXJALvaBouoPpXidAnsbcyLpWYNcrrHuSgAbXivCFNOLhuCIMhNhpWonHwoOzDFULeilmsOwevLMbdubsRSIpBWCYXzbuKMMejOzTBOghbuuauyefDrgZrZJcKUnIcDcoIsDWPQmLCErbhgqhTiNWolVYUOXCbsCmGJBAzovCPAvTsRRMumbgVpamKVQrPRHPmKXAJfZckvbowRejaYaReTbsPTVjUbOYRJsiLHffoNnmtcjOMrzvjGQehYQFPEFOUwQtrnkLPrAQUVPZCWKVOFTxYByiFiPNmEtAgAmCOsHwaXeJojiRXzPSRTGIVoQljMVezEetHpcjTbKTlyNrmOkmsDYdQLyueFHCnkRdXzGzVSPQiQaGKxbIMeYXFUCoTEhDpucQpOBqUTadtzHLjzzsYtscGxTWLiTMFtkEnyhFWMpzExLtnRZUAoMfuvXyzypsxqsEPOUGuTJchgiOWUqFQvyHcfqgXhLqWzelzKGWSpYfpBxkwWAYTMkjUsJnfLiEbsBnXQVQkLvbzvHVzxTwthJAZLwxUIVvWbOpFrwWmGAIjbhSTdGjGOwxzqzArZvZfFlSxlNAoINxKGeTNoiXgZwnTWGKxnOtfROGcSTUzUVRdrZwrAtqnQpagTRIOEKxvCkFDRZpauGpznQLToCzjBuXBKgLepBOKEbGFGrRmHbzGEDnsBpbJKZxFEDCGdYyuBWccWgqXpQmiNynSFUgQOgTXsrzRpCDCCheVjIBsKOgOIaCqemROGzYfDPlgwfTRxzKADIUKmyrvPvwAObmfejlMDPAEqtoIvtXezermNiRgMaNdEkEfknUPVOGaDHRnzLtEEEWmSGnVLaPgFDHtBVDrMbnXOrNddkzNYMJtlULpJnBUaxOWPPNNocZEfBbYiCrySVwbghHNOqcOTOnLKEzxKYEXLpUtiBTFPkSWjFPvmwYaIUYfTYvZSPgOaPuyRMwBRHnsNHmGHHJXIevSodaiTamYYuMDnaEBTRwcIBygpwpQlXPwmRicUEHkfXJAuOzBguxtYWxaDRNXmjaIKBQTshwXusdImjIHJqqVpRMrTtihAtFmpOHacEZSradOfODPvpLFIKHhuQTMucHSCGgrNKsTgVCRccEBRtzmINeOXzdvvnofopbQyapDSMGDuVvfkSEiDJKFLOqycPfVDKFTrxgatLAXPaHTnSPvYrGBfyCkrVtXcNnDgQJRzXQYBwJoSxxDlenaPqBKLpbtDwomdrplspnnloQSBvbsJIvzibKPBBMatpWGJwcycqaRgHnjwWsXhsVjfTEMaJCHmYvhoraCJjzgYrSmTjEsFPGOECrvLBRbLzmhklQzKqXJNRTyhPajImsIJYwKTAblghfRfTJQEaLIllbqXQKnBPHjqxrTyeCeFQqaGPewaZLJImHXbQhaRtBsxcTyejFPHfIzFOEfDGfVYojXWKPcaCEmIFxOzcvThFuiQAyJGUIhDhlHyBOJkRCeEORhyfDDSMJOMvnZMRMctixJLUZgsxsAkRiWVwQgRPFtQYKQqorqfIToEILsIaydggIDmrfPqXTvFlSVHNKKujOioAsdaysaHuHtxRgBEQjMyvgkXpMalyqILYZJoJYinKBfTAODvdhrjxfHGRWPqWJQKagKKrKqCDMMAGJbHnwgRCMpBQvcCAWXkiZGbCkkxjoUTJAsubjSyyXmcdXNIBllMbLTmfHnmwMCZenyZWKHOkQmWRVqjurRYnkttPSJRgBUPlLXBwPMPGXvliyoXHUawYSGvQMaLNGbNUMUsoSdToEiErhgrurZWRQKGLnMxgEqwimTDLSZBpFLHQFTKORBaLJoRgggwPbBGqWdoBACCXtbcWSplbJBrIcDLHFtIgMXuMrUQdetKpMKSugfjDHnDPkRffAWhqBbXOVJZiAfvNnbjuYujnbPBIliEqoxENqBoSbznchnpsOhbRVSsxWTuMemyFqmiVBGQwJUJlnnVFvaMunUKjeDnBRMkhkIqAmuKMYRsMjKTIlDbIOIWAFYKdIuEqHVZndabxFwyIfXgsNRHURJuvwZIPYtUCaBmZFTWpzApvdCeebWKWYmYnmoGnkNoPlfurciMCeDnevhajilFGGNxjtkLsDWegZOSHjyhzHvNgyzEtjuMxIEZNrVAmjjKgcacznEwvdmZjSUHrLDUFvRZWcTQKsXHoeDissQCSbVlUsBXxqNGNNJIOYXyXXvXhlhvbrKuvvcGPghPtOsLptYdqMcUqGKPkYduADqSDWBDXAZlcgEuASXTnuoRYjGkpzzaXVLikRezQiMtkrSgyeMyfINQUOdNSEdOzFkjzooiLVASWEHWtpgmOmNIuIXLGpYOJuYvjfEnKRUYBeHSIgOgVOQwwfqlDBaZtdRnHQmXySQzwPmKHhFXQSAFHIYPSLlZTlmoMVXDTqOkUeGhWSEgvAKEsNGPVYEjOyEFQkIiNwqfDGnXxFctUKyHxfgTCvuRMrwPBjTMCiZZoJcIpWfJkFXtWhTRYhYDyHudXhLukRrzjsffiOkSYeFKUBKalGhZgkYcRrDQxSIeAbSsIXzezsgnkHWTlBfHUeiwPstLyoMDMpYIApsxFJiyrQGghPKXwQGQUpdVGqyLIMMpVzmZyOcqzcdiJtumhakMEHtwAPUnUdgfCamlzvAVGqcVjZmIudWfEsjKbmPwwywuGYZVeoGBGEUNXpoFMIYuGGeRzYgwiMXBbNYuBMDULnDbsXikyDtvIjyfkLoaIfZOSxtPBkUQrjzJUOjNgokuBToXfVjwlVAtkxmybDfnnmMjIFLYZMAtLpiUlVZTWEYKdPPtSQKxYZXSAFQCwbEkhEPzmNnFIlfyfohzEfuCuwBJIZpnXTNpwwGIzxCqEUBNJuKliQYcLNsWWfFYopnUIpdZMTdFKcnbhmdlAWsIQXonRIePdbUEgBfxTNZLvPhVruqSujTdsQbmryQUsmDMNGicAtCIidvGfLHrlOniaxLXuuwWphgvjISjRCyCTilOpdxENsAGlRYNCPegFrpjmgdfkDRSYHHnWQvEsagyDlOmRmPHgGbCllFldHWVQXiYtRSHCkVUbLfaVVcaRoAOYsKxjJTANUzplMztQFdJgTUHkOONBBUiEHlomCLKDpoPFUUkriyjlThAvkMYjonirCqDLwJoSsUGOCbuUIgGvYPZOHivQHeWumQsMsbwdkLXpWNeVqrgsfWKSCfNJiESYBdAHVHviHBqOmVlVJVZGJGlVfpdCqDLADLrxwYilGFpQJcdpKVxkbPxGCluqOvPgeZlrEtpcWYwOQqqPhccwoaaBlrroJVxJKssuvdZQNOtJOSPuSfOMJtgZngSVKDFZhXfGpeJxgjVuAEriYYXAwAWvFXrUvBMBnaXfDmeSudQbqxWLZZlEqQLCUIhgpGJcqFaatkbHDBAKbwirxLZhxUelJjxcDUWbJHhFiokkEciWEBXUHVluNKMxqcJTHderSNhcXyfVJKyyizXIOWNIwwLQOLzXeHLFeigyhdlmUmrafEOpgcJjSViOaHtBrfjQVJuwueZxHrsbfYIuMKusjEWSmEjTTVKeJNSBNUtXOMIyyaPZRToFIDBHNcMsykppTigxVloXDTswTuzyEjSbFyRRCQYRqXAJYVpxcXnYwPrqxEYLwinIUNsztVyZrLVNxvsBwDjVKtzjLXkBwGbtSeZhDKZyxRdUhXBuXgSkCqxvXNLWSiOTvhqhETIZwllDKyYPLkQyUZUVGJloXnmTwiAJBuHgvKzExOEdcPwJrxdQPrQGlJjSVCVmQoynxUxcxwhLurZoRZngXyjzBkkgNFMctiZLpYJFCddBXgKjbMnqdwbqmJCkaTpqxFYGlrWBhlZsCjcqGCOyyyApxKPNDJfBegdKIBSxMWtUeWKnNteZbTGPiTdTMbLTxkJtgQxsIqgvqdHdxYiBozCYpcSJSdxljPQIgorHRPKFLhEtIqIzNitMiPqxEaWhQGYvcjjjcMTvAOFpvUdXbPKrpFAzIPIYPDzYLHJTLHbdauxgQdrZcHKRhCFAgQaOkJgkjphivLxOIckOejXzMQZzACmNekFMmfbbOpTMxoYVLekpnMwiiFcoqIttaiDFcxPQMuaeOMjdvHSXnBrYoZfeoxERZdQuRiHZTyPGbFZYVTSeQuhenCSCISCzAKEgxylyBaeJMpNcbcHnIxIZkpvAPuqoZyhjGiDmvydoDYJLusbWTUcknSbpreyJwdJeZZniXlJbrlfinzfsjOghaFBBsGINZqlIgbPlUOkwiBRYxQnvVAQtNluPhwlSgufOWXSyiaJZnAcfTYecXAjfxxTvDlIwbICWxCQdaYDrLtUIUYYVAqYFmQLGzKhXOlavSdtPtYcvxhgtaCSMUmLNknlkxVMRDvqutmuBaazJudiBmurVQtdoeAXnQNUObAIOfFaaIoEfOHbvSOFwdhxSgPepgsGfrGYSziXTMIwHrkqGVKJjLSEkOmqAJSbnsTSbGFcNxTBqbgSRNgtzRBgVhBTqOGsFQSjFJIGuzkPGlhtqnxFUuiaAxsRLhYVXmPcCUbGsjRHqwnqiWQSyglAEnqispeUkGTQiZpXuUDSzSdKtKQudYAjEgRQzfvoBFjVzGyCUdvMaIfUZKvlHGtGkaiyjGIMzHPVGBLCMACmpfbVOJHJlfRimeBAiBHzEVPApSmDgTckUMWpeNPrRnNBoGapPhpVIfEYCgAcWtSQWGluHdbGITluCvTpXpivcPmhTXtdKXhcCMDmGmXnULmIzKtULsrMmgiDqInNotrSTCdnSZjNndGmIsDWRcGWzsnKfWpHkWHkYqncPuohKagBDYrDHIdIrWJYfSqovlUMrmeAXXHoJLoYnfGGhfnPktbsfnQhgqTfIRodxVxWXZdZdOTeOLUhntyapyhMbRNOcafgdQjaaaWKMRdGyjPZpVQWVTCCUVUrVxHPIjNgXGRNFZEILOiCyrPlofQhNoXaHfmckGAEelBlrrBhwrCuvDsKxvOeIapCwMEYGKJkbjsmevqnrWzjAflqPJmbFJsziaCUDaFlwWWmMPaMcsHdmlCsZEKgLGrecFRGxDaTeeuqCnAJUMCHLJRliDTKrBuvRxtjuGnRMsVyrtVgSCeONQQqzDbzjOVwPShuYAGYlhzjSsmviLwzqKbqiBiFMcSAeeazShwJLKSjYsNfNIkrEwnaZGAeUdDBNfXgWqTRttmoRrpsSVrnrOhVngrnwokVpcEaefjWqWNLlPotxLKGlGClZuhjeiziSOZnQnIEOXnaQhmmCoalGIwGdxpUJldqDmwbAGzmjwkGYEsoLisROcjEUIKKwEpYPJGoRWVqOEcMrFsEnRBykHgePabUhTQrirteKjGFDjxfJDAXCAPrDQeZLcJPgRKgaqaYBfFUZcqnZqBGmhJxWslJOnGBsfxsvgEZBAKqXxRZrRAkgZdKwhZGYvnFuKmsbBDHQlRsqyWPIcybYbmQjsKPJmNwcnQUJwDGYChHxtyvfZyHoIAeVAGDxAPifPdrdVFecthFeQlSFaqPwhddWlGoNfkhpMLNYttNIvLurFPtnQdlECazunyLKSnvnVCeiDQgXZVsoACfvWpWEnLLnxuyyxYNZXaGFSqhXOhdLjiNPVizFehDXCBMSOqVScsjKIzpHGhwrujwYMCyqxveyBDcUKMZduhLiHQzeTgLcyCjznGWSeOICXVwVCXTfEBtScXroJnpJNZUouqnSmKiyxbkqDWLiBTYqmBNXJgzDIZARolraYdfMeQtWgbhjVvazOfiCYwwcaLQPxUZJapURSlGgxQgKRRNbJpUwgOKCQfrJDpOvsyqFzrEBzOQKIPrfSSXQNAfQCbfbrMXsPAJhPGEVNBQILITrKrrwxrrazEbXHkemtWEgFzmYmqIxxnqXQzQcwRMjJTxCjQVvfrMZOKqKPCBXbVDSCNSxngfiURmsrFqwZaVmGBfreHrkbfqpFTQaBQBaYBltnZRanXrAcSQSNzCaSljaZGaooWnbApGqtzTRQUCdODNyohlSVkWeLjHKjstpVMWfcqUyukHkeXejDquIXTJjRSTUVKdjMSRXnntNzDJpcbqjNjZtRhmOsrwNtyTppWOyrSjIbbVpvAPctcjoPpEFuFsyZGgHJdsomZJZmDJKnUGLcuXDWwJSpfhdlpkeQVuFNjRbRPXmapsMCOFXhoQNzloApUFHXDNcMZDQQRFoNVeTUCCKzBjbCZjtfYKkXLyDzwRCqsCxfsetGTxooYRsoPuwBBJUSofptSTtqtyWWuWcsuusUGhJmaQtPlsbHWgYDhvwFVzMONjtNRvXiJJsAEzpkAKDxsOQJSVprqhbTNVnVgtwDkHruKQRhoAZMoqztaYNOWKZySQoiGsRCdwqpmoBBpLgYLZSPgxlZBmvFtJugecOhhmkmvPEYEnVGMsRAsAimMmGtYSMvYDwuzySdTScTbSqclTVRDmWYrurXLXUAQcHvRVPGxxvydNfjNWWZBxwLpVrdMPhBTaqdAZSLFTLfRiKJubmEIoNLnVKRAiTHtGnfrJThRIguAOjPnVAOuLxcGgCapPZfqRinqRTHFdLzfWhcIdaQClYeFvSbbykPolIgbrejPIOLLLoTgSCUnbwaesULcxJYEYYCqkpJlecfQoPkEqECHjZiPiKXzdvvXhBpgCxcbOvigqXjOzHJZlywRIsKrMaTbYDYiqdoPiBJBJUEBqMhMtjoaRbgqHzmzeCdJOsDTbdTmtxqKopHYEPaEyMqViwqCcpDqJhkOHBQWJxfWebgTVEFfsqUGWzJLHZEGHvhhdHoPryDuIxTJvRWknhnSKaLPhOaEALDQouuQSPLIowFyKepQooyAjbnMnqCGsaCuFUxsncNAjVuynpJykprfHsAQHsxKIOJLgjANQkNYLWJDpXuHeDEpTUnrNXtdmFbpoqYhLCedaucUcBgWdVLoyJVrNvYjKlQWrvAgXAAgIqbmiKYvawBFJkuyfQtsaMqujktQERPIcfATfIsPQRphvUmyYavnRgwRcIvqRRhSRUcjPoLcRKAaZvdQjCXbYLMohrkRCBgrybpWuHKvnyAjaOdHJIPNrjyliawCzokfchcejlFqJhblBDEZVXZwmAMIZPOjcsBvHokPiBpasDcGvvnTqyXshgSQjiTnSqfBASbXZpxsaUYLvUHtDSJtkcFaeKCkIEElXIvkCtwZxpcKTJZKhiFSdLtpzGtkzgNRXAyBMvZYMWAOucrSqeTGbSMXNLpiiSDUpWIMhsXyydcnRipTaiovTrMKDYAlbjSKiZxvVIYmCIzqRBwvHumBvkMDtlJhokWIhvrwGHHEpheWnuAumiHSvZxuzWieeGpPLwgVBTNCdBOKEbLTphzcCNSDdLrOCsfndLVZFkwpZZCVylKpOswgguIYRLQrDQTkcuPKAtGjQdpPRqmSXjcbpKWTIOypONgrEASefjvYSZojlMCieVueEWZPxUQdEnnMSnkiksEqdIXSYiJEdqzrmQsKFZdePEWNMlvzvTgxEjeUroVHTjJLTxlheEPATleRPeITWOIfSPianjqPmtsEIKHisdWShqhYXJTZWntTyftNGftbrJoRroCBRkgiqiBubcDrqLdqpXcZrNdYRVioLGhVxEatUeazzazEzIFAjKdjehSfSnujwysYigEJVdRtfXlktUYRlpwSCjPXllphGfdGozdrLTrEalYNXaaDscouiKOaKiJcTUeJbiuKkenEdxaQoaRkNqheLFzFqLimJRXnNPiKKWtPBTfJGIwKeDURTVEWrPBmGSrglDHSbIyrgHVTyhpQqKmRZWwJMclYdBQInLCXZnOyGHKrtykkryimPUkEgNtAYUesgcJfZtPqXqTHzfxyixFlXDIAzNWIucxBrljegQifaURiDPjhbYkzukHgHkYQeGmmZugiOwsjypBLRfXPzAQfTRuDwMAnTwDPZeCgvoYYWwYxJwvXdEonCTYvHPGcDkvYDpRswnFKxkiMjBxSzNVGSikkVoTgQceWRTYnkcZeViWaSRJYUhTNTtBseNwZmHBhTOLIimfVlFptlImbNRhSIPldokiNDFmZtyTsDvVgUpGBbafYMnHagIzGVVhkuzMiJaYrDfXTRCruYNjBwaZTKBCfysUDhVQQOwRyBLmlGEhbuTfygaUPYanazMUsndAwKeEnEYwncZlEeHdKYFnwkcZNTpBeoPXtaiJBlGZFUqtTudcqsbZfkQzdoAkuiomTyLyHhBIQDFhLPCukokzsLnxqnrGpwsAiILPIzCQMMsfcXRGIYhDHlAxFHcaytRJojUMcaPvFVdFCeoMkUlBMCYgHztFLUvxazreybhEFUjsqgQXzfUJyvDSspcJWcWSVaEQzLIuUucFIKVsjpRbccmGrkeJKXTFdFNkaEGWcTxFFmlhcSxIaMJQEUsAfmFHYuPinoZIQvYNXlsPOEbcZcQPkTWLJqZxlTgwhtSnFTrTrYvCzhHBlolvhoCWdFuMvHHERKAwKtNdcftUbXViVaTbQaZApPxhXWkxQgSckADiyuzecPRYfZoHrbRxONuzFHXbtOGdPskyeopXHFYJBPUyVYJaVZgKYdDWHYAezHzbtfgepIerXnwvGGwVrQMVKXbjmoEEYNGHtFjdSFolyOSNEJztAluAIQRhWEkBQenwswfZNJpRRyOmuwwvOGsZcSfnCyZbimVOEHFlVcRRuCqKWRYqmhelFuggiuOvtWjducplfsMhCqLrljQothKtDmgjCUJdDecQsByOXszbpYIUghQMoWYdkBWwWSmpWmkmTbQllcYFCTKHePPiHmYKOWNSMAXNbZQekxzAJIAhazGctbUngeLsrDXBNOcOaddkKcSzlegdPcTTNqfrrdtexdanrBSesvYHXieVdePbodOosEnMUuSrNrGTOTqVAvxKizBRvaTJnrPBuCOFJpQFMCTypyqAwaxKvlYKmnbpoYjjPOokKgpcQtTWAInylThnfLSjxrOJmdCnauEwkzkmvAcDOTxpPyxzPeCtOZMbThTkjEygosUTQKRLsSvBXIWuXgyYnEMFPsRkdKGxsuSVRuvycTbdeoQZaaAtyIUylLoIrOZVHetYsslahsIPtsgDuBawiDuHgreFpUkYyhDsZYHCwRTVXrhKYQcjTqqNutYILVbGmGQIJEftUUVBdgjQGuUXeZZNvYegTJquuxlzYaouhkwGPABxLGYjdziRIWlbOtZFOpzcAVOlNwkayxSwxkeavTEEwewWXhDHJqDEVcmOcIcSLkqNrKCGQvKAbOrUXDlTuiqDFupUoqiMZPiPSaKvlpyHgPpivkwgGRTRreTUQdzWztKCbHBvJUiLNxAGQNcidFqvSMpALCcXyGShcufcdfAYxwmexMcQkSKeOYDzMMIDJrlRJyQHiesUPjLhOhatxtwyABLgzhUHccoGfMmPNGVtjlcVeHmtGcjYDOsUhJtyhyiIsXcvQjQsGJciWIKXngnFlQcmLtIzkbHOLenvahxvdensMFNOsxcwzypeIuVoFDznzynwxHzHpqCKrXaPHqbjKHFvYDKwPxOgtyKbCUuDVKSspsRBffMzWLtOouFjtvXQecMOsaHyNruaWQBzZbuDmsqHVyDAupQZfCmVlBvltapRLSvPyMirQwWBAEPwFrLPtyOltRKXXZqqMqRFQwxLKAORevDzmHQeIFRlWWRyjWYxHokAwpbPykQVBiRisXMALWJYbXMCpACDPeWxkurLvpHjPsKlAitZrazFJpZXBYeqeaiTxscoOqzcjDQblGOrtDTKvKTgKkQTfNTEkZkavCiqcKwvBDqOonCKrZuWQdskgPfEkTBbbLmTZPkSKGTSRXXKwHeYBbYtStIHeYbOmHKWWKQeLBRmXxjoXPsLoQxQnafttiYuAGZgqwBQyIUbenVShawMHsUOXunhUTpWvKprifowNyjDKVNkfbPRcbtqATKxGZKJENIogReGSnCQuDTSLJNzzjNoNxIxWnPIUAPvAxrVlETaySIfeRrKAONsKoVuthHBuGAQIPlFJmhSVkWGkMJHhfLzsUQdOIPzSNMSAkothmsJluOFxmrKTKJDYwwaMBjhnWNSPpUtKUegVxCxuuuoYwwkmSOvcDrvHEHimlnNsotqDsofXYsCsVDBPcqZLZnLKCdvCoKnREbIXpNYIsZRtDLdypjqGqGXTRIoHaQxSKQtPJRRvjwSjrHWngkneEIahdFJJcleCiQHbHjqNnZkBywejtjrrsXFKLpIHfaCKXwaIFdpvKrWvmCtvytBUjOlGnpMDiyPzcauVkiENRiPZaRVYDsZYeMhSkHXcKRyGfVvvFFqgfVwyOkkyadlGWBsUJUCJOVYXgaAIoktQYweLPbuqMmyGSgZHKVoEVuHzihTbyhPhsBGwQapqbPLPGqDImYfUvtktxTCophozpWVeYKJfhrCDgJoZTEovXSqvjOZhLBnleEYXcvlZDfjBJjlazlXgjXeFInofOliVTnaUffwZZzGMrxyGcgIvbVTvKQNlRlRUSHcmbfUCCmmEsYKDYDHBwZochhQopuOJtnFVqekSVoMEMHameWUMylsjThINlADEJBnpdWmygpxRZQXVvxHuetGTBbrnmWZOVziEhmmrnWxQDRJelGXEqGGNOGmIXrfFIqktsFNtTwjKZegxzVyOYjVrwDxVwHtsEzBxyupPYLGQlGwuLADtfNvlorVEGTQlBhMVuNlRAFrQuhlvDjQWizzcwEaUSNFtVLcedALLZNWRbhVbMrqFeTJtxrqDkJkHEpLudTXsrOdqrmvbTQKcxnsaJhLukhpiznXNakOeXJvVZyciRKfIBPIlRqJBObQJwnqszIgOxFOIqoTbTavCicvtRypAoCYEBNClUnTWwwNXOKsZoITsDZlJIrJIMgPCpVDLJeKdmCehkZAUTcLLMGJfKWpMwyPAXABArPAnfqwRgRdoCGVcyaYQsFCdhTSUtvcoKcXukexptwcNvcjnWWBfPIKxdNrRoiguogjfjVgXgurgGjZWHyQsvZiuGssBSbYTlzRsgwUmiBTzohgaFXzscxQHtokiQChIAFYmfNOjosPzLrzDBDoAKumqQvnpigIcfiUnbkiXOvwqCALkawxNtBIieybrWbYNUHJbvgKNCmSevJjhAOdrRfKvnrYZRicRtwZwPioCbIXfjgVaGZNgUHeZrfVNoWVHqgQlzftRjQVzTFmBbjRZagpjLBkjDYKswBeFMKFCtkJFmkOQUeVXSIOfJQePYztehrkpxcedfQRuOKMEEKwBijmJIUZjKfpQcOUDxZyMQVzxcmkmvibXJuwLfaxyxGkcaVtLISUruAeQIabctVDwcZkyDgPBNDIwHWLddAStakLfniNJgbeUvCsZJfLEgXJaKTcAsoQgiFDuGGzeyycjahOLvGZwveRiYDKQmpbMzaFKvOJUdttcCUmDdhdpAEHRCImEvwGtRJbwcEuJfiYDdJYYbTLnNgfghQumWRpUdtmplzjyKWJAsegVgXrlQlonuOwLkUQqeHlsIQEcdcMGLOCpeLrhsPmXaqginVedktapmgndzDThzZJyWArowTLQkOHTYbJkOIhfzxXNPDNnzncBtIFDHxAchQWnmHOPGNBqUYuiVYxNvpzChsQnvUTKGSsjviwePDERbgTpzNWOIohASOSrAOqSkgRIWOXElsNfKgOUwbsxrDneIwMIngJDdLpzAvaJwxrNZmGufmlthVYCSJFBhHUfyAEnAzQMGQYARnsHJMvqjnhyFdKVSfqqJnXxpUZfHAaYncPwQyTgrTrAINxbpblYXZUNEchLVoLQOLiqCbXDSflkeYJCTPEHnmBQGcohZSrvstUvdluspoPGYBVSVFQfLAsZyzGcSmVzNytiyXHMuemPVgfiwrkeBrDkkhMLmBBYkvgRLvRUmnvMqmxIzPtWLKqsmNHGOaeMqkbRuQTIpubiLWsBTGZtncKrwfJeveQOzfDKIRPYuUJiYVQnUzeDnINAuczlhxkBllePCswxRnZtQkeCiOMpUrhKCaLrMqjFpDwFTEODnKBMLGaarbudmxvHRLNjKmQyspXdfAfHMXVlsHncCPGvKKrGukKQkDRBYXGHefVIWzEEDvfNagXKwIzDNHorgUvRavsLJkkiAincQgEfbVeGkcoHoggeasFkUsCWfHqhDIgKbYFhikWdUYLkaepLLFKsGIikENbSxNMMvYIyDlBfTvfzKihsTANuYcwqDsqlSrPTPMxktyPpnJfkuhrLECmuVYXVSipZTrEMZsDbSNmqtmWtjmUHXeyibHDQsKcgqnwUEhAZEYVgYAQpHRTEzbthrwpBaSNvMbGjfpdxbcfRADcHiOIEbjRzbycVpXchSbmaAJiVEVglqyLdvdcjAnWPyAMKHbDUURYalwDINcNejpKSvsQciCUMhKMWSnCUBDADapfeHnzlTMIhaPgDaTtXOJnPrDbIGLWARNqOcoWTENTOfwxfOhmWViTfDqyfMzwIURKlJxWGaRPByFzFxkfoVFkQzUQiAndMNezGBgsoaYOorKxnLZmVtfqFNuPQHhUgqhxOZCFSWDolisyvAEDCRCiGvKzMQxgXScGzYdTNtxQPeZmkpXWJInPQsblwPByhUWpVDlLhTFIpybljozEQbAzFmryAeRDaWkUGaerXqkFiazPGQmmvNIjjLiKKqhcUVEyeqgPvwzGuUfGYQPqpEyguoqwruQLpHbiuabdlfBXlXlKXlePDKFvQTvfvNKEqJhnxOEqufBaNAFnGfEuqxievdlekteciDYZzoAiYeXzflUUVdaTaRoqVOCfBZKvBbBkQLjiLOuhuhkdUqHgFPckYxibjPzvFyKCbEshfYiGJRnHzGcjkJLBFqSByQWNyngBbpjkDsLPWjyToPooIplhCvMBjCHjDwZmMWfMeqzwPWrSdjNuzEhSsVFVVpusFkZBsidbxfpriOMtWyKTGKoUYKpIxaLIJDGFcDlLKVEBSGxhjVqlXLblBSvnfjMlDGbugeLGmsygPEJRHikSoJxpVuBvOSrMKnMqZOQJzBoqhFEXZHqPbxigXUqPBhPUbXgRJtcxoiWAUqoTjvUuHqoccdGBndZzAOeeOPXyrgePzOxhqPwDxcekWduEMlyLFwnMoIJspnTSLeSbxaqceYdNRtdQBiucpDlCzndrYPSGHLVrKjRZIuUXvanUCanctmGlTvQSDQWdWHkXtRnFBULzwSmcBcPOGMlTNuvvZvpcdVVhWMcvuQTTUzjIacYqLjpPTUrCxMMMxiXSTmpMvJLmEebxCYZHFYwRATotSzapdZRXIwUTQNNrLKmDTzLRYDXPZsuDQaKqIYjxcNngVKSWJtbfNzJDcZUnsSzhoXbZtYLmMfvXJwcsanyFSeOyhZhdqvOfpnhaYckNRgQbUtxtMCEZAkYEXUKxlQXofoAZUVefmvfQgrBnkIqorJYQloOOdDbmSpsHrxCZpWNrrcoLCFmPOkusqsLmlPInUEIYElCMUsEJCchtrAwRDrkWbGIGLAfpvyIfFzFKUckqkpIPDOVvpKGrOHmBJAIjBmSfVQomScImUryUjZfIgmuFmpoPxBAheNvXuacrGfgRQbrWfNtrllXSZFOMzdGusysTjnTvufOcsnQzZxPafDuUxInGItxdkCjjJrnXHQOPbBcaIfHCOjXGbXfIxYvVtmJWbCYYcXvypIzePdYGosrsqzPHnKVenwXhoisTwaOOXhQFRDDIirgTdGKfSgEDYlBIgFusNoCNjzClwAfGxizVTrUtLsoHCTxrLfMcylZBcyNGTbNHqOloqxFOmZHAlglsKCbScRFKdgUtpHjzuVCxNXowVarvvNcNjkZBGYtDdojQXqUHmynRpbDCOukECmAEGNwzvnjHbjnmuSJkXNEVTdwdOVYqTUkzBRDpVqaZoiyrvoYXTfQaowgCghEBilDHBsxGvzjQKWTJaBXCcaYRyZMRlDPnrUSyeQLfuALogByPRblwgOGxwWeXKhdJMSjvdgihnDHNyLyPGadvaFqNCppitIflKDzBuemDhPhcdAvBvOOqpJALdonYynXMtnfGvreQcXoFvwMlAYjLIjBzdkPfVxIQbLoWamoHWkVhZdsbRxIptWIvoTNOpSofFvHkIUzDYObSCWvdCLBYtwNrfKQdXNTtxAfZuHhUUQtuveVjTURooLsLpwJEHewurJpraDPSyzgHexmtXqzQhBhUbXuXOsvDWRNjFXOdzRNeQGUvIIWmTQMtAvaAlvzWOuqEQaclgavtVtVbdSqrWymNHcILDKJVtPCRISAhQXAfTYOYrPEpmAolhsjQWOrtPyVcdlYczSMlNNshAfvsEIJBuEzAyDmcbmgDlVjSRCKYycXcxXHFqvOGVsUuddVkEMIKjFUTCyJKfZaRCiXTfbIMaNVrBcfPccbLzNiOGfamUDEInKefMFZZJTZKKmzywtzazodhoTeCiZpDDllxEJELjQgGEWWECtTVnBhLwupVPXuUpOybSVnzvdNqFWCvWnKZSaCrkVQfZgpNyfbpNztZsfQejAuMCrpquCSeHkhIVSAUhkwFsnrgsMemJOfkTvrLTTkppFxZcfKQOHekJwQuLIqOMZKQNIpqcigSOMYRahNePjwaPkEIYVyaCCvusRHoXufejUfoOZhroIFvUYGjSqORHxxWYwxktRarnHlZRsoeBDluNEuVUEjPEahPgwdzPFPijwBbAocORuwKHMBrRfmzJAnzFHlYJRiXbqjbhzjXNvVWdPznIvhfErbuDOheRPVRLvZehENaYgvsVFsaWInSIfagModEFdalnbMIvsdAazSSFZADhakbVFGUePRcAncTHJrnMpDiQQUjOFFfdxQwDQFxOaBeqLusZjtXSNTgOkFmDJXLxIdDEwnignvOJwBhuWxLIOaKBeUkQdlhlAZjVCqLkjGWSGKnUrsZCjWyDeCZvmpqWMENlJWPbZSnPdcaBeOiKafGpuSmWyfubaRHCWFkeuAvQNSchwawpkELjdLgAsJPksvGolnswCFJdQzNAlKEvvWATBGPfuyVKrdxiYPFdFMUSCSYkzQOBmFfesSTwhdXoBmEhxjboNjJOMMniGKdGKxbGzddffLnTmTJMUsTKxiXyxddLjaCsBBMRtispxyvwbrfwCgVydEoQOQUWHCLytZZGCvADVvLLoDUjNOMQBrQvUDulWoApnehuDNTzHCOEBmFpfWKqgHdKSAsEOSxOlVTdVYQKJffzIHVrNkMymUhzluogtVMXFPyETdnEhCBkMbBjGvIVXYhH'
-        message = Serialization().decode_response(message)
+        message = decode_response(message)
         self.assertEqual(message.message, unicode_message)
+
+    def test_request_without_version(self):
+        # 没有版本的服务两种序列化都按 0.0.0 发送
+        for serialization in (HessianSerialization, FastJSONSerialization):
+            message = RequestMessage()
+            message.dubbo_version = "2.6.2"
+            message.service_name = "com.pubbo.UserFacade"
+            message.service_version = None
+            message.method_name = "getUser"
+            message.method_parameter_types = ["java.lang.Integer"]
+            message.method_arguments = [1]
+            message.attachments = {"trace_id": 1}
+
+            request = serialization().encode_request(message)
+            invocation, _ = DubboServer.parse(request[2] & 0x1f, request[16:])
+            self.assertEqual(invocation.service_version, "0.0.0")
+            self.assertEqual(invocation.attachments["version"], "0.0.0")
@@ -0,0 +1,176 @@
+import asyncio
+import socket
+import threading
+import time
+import unittest
+
+from pubbo.client import DubboClient, batch
+from pubbo.common import GenericException, JavaClass
+from pubbo.hessian import Hessian2Serializer
+from pubbo.serialization import HessianSerialization
+from pubbo.server import DubboServer, from_json, parameter_count, parameter_types
+
+INTERFACE = "com.pubbo.UserFacade"
+
+
+class UserService(object):
+    def get_user(self, user_id, name="user"):
+        return {"id": user_id, "name": "{}-{}".format(name, user_id)}
+
+    def fail(self):
+        raise ValueError("bad user")
+
+    def describe(self, order, tags):
+        # 返回参数的形状 两种序列化应该一致
+        item = order.items[0]
+        return [isinstance(order, JavaClass), order._class, order.order_id, order.buyer_name, tags,
+                isinstance(item, JavaClass), item._class, item.sku_id]
+
+    def slow(self, seconds):
+        time.sleep(seconds)
+        return seconds
+
+    async def get_user_async(self, user_id):
+        await asyncio.sleep(0.01)
+        return {"id": user_id}
+
+
+def call(url, body, flag=0b11000010):
+    # 按 Java consumer 的格式发一个非泛化调用
+    ip, port = url.split(":")
+    with socket.create_connection((ip, int(port)), timeout=5) as connection:
+        head = b"\xda\xbb" + bytes((flag, 0)) + (7).to_bytes(8, "big") + len(body).to_bytes(4, "big")
+        connection.sendall(head + body)
+        data = b""
+        while len(data) < 16 or len(data) < 16 + int.from_bytes(data[12:16], "big"):
+            data += connection.recv(65536)
+    serialization = HessianSerialization()
+    serialization.deserialize_head(data[:16])
+    return data[:16], serialization.deserialize_payload(data[16:])
+
+
+def request_body(method, desc, args, version="1.0.0"):
+    serializer = Hessian2Serializer()
+    for value in ("2.6.2", INTERFACE, version, method, desc):
+        serializer.serialize_string(value)
+    for value in args:
+        serializer.serialize(value)
+    serializer.serialize({"path": INTERFACE, "version": version})
+    return bytes(serializer.message)
+
+
+class DubboServerTest(unittest.TestCase):
+    def setUp(self):
+        self.server = DubboServer("127.0.0.1", 0, workers=2, queue_size=0)
+        self.server.export(INTERFACE, UserService(), "1.0.0")
+        self.server.start()
+
+    def tearDown(self):
+        self.server.close()
+
+    def test_parameter_count(self):
+        self.assertEqual(parameter_count(""), 0)
+        self.assertEqual(parameter_count("Ljava/lang/String;I[J[[Lcom/x/Y;Z"), 5)
+        self.assertEqual(parameter_types("Lcom/x/Y;I[J"), ("com.x.Y", "I", "[J"))
+
+    def test_from_json(self):
+        order = from_json({"orderId": 1, "item": {"class": "com.x.Item", "skuId": 2}, "extra": {"aB": 3}}, "com.x.Order")
+        self.assertEqual((order._class, order.order_id, order.item._class, order.item.sku_id), ("com.x.Order", 1, "com.x.Item", 2))
+        # 没有类型的 dict 为 map
+        self.assertEqual(order.extra, {"aB": 3})
+        self.assertEqual(from_json({"aB": 1}, "java.util.Map"), {"aB": 1})
+        self.assertEqual(from_json([{"@type": "com.x.Item", "skuId": 1}])[0].sku_id, 1)
+
+    def test_invoke(self):
+        body = request_body("getUser", "Ljava/lang/Integer;Ljava/lang/String;", [3, "a"])
+        head, response = call(self.server.url, body)
+        self.assertEqual(head[4:12], (7).to_bytes(8, "big"))
+        self.assertEqual(response.message, {"id": 3, "name": "a-3"})
+
+        _, response = call(self.server.url, request_body("fail", "", []))
+        self.assertEqual(response.message._class, "java.lang.RuntimeException")
+        self.assertEqual(response.message.detail_message, "ValueError: bad user")
+
+        with self.assertRaises(Exception) as context:
+            call(self.server.url, request_body("getUser", "I", [1], version="2.0.0"))
+        self.assertEqual(str(context.exception), "SERVICE_NOT_FOUND")
+
+        with self.assertRaises(Exception) as context:
+            call(self.server.url, b"\x05hello")
+        self.assertEqual(str(context.exception), "BAD_REQUEST")
+
+    def test_heartbeat(self):
+        ip, port = self.server.url.split(":")
+        with socket.create_connection((ip, int(port)), timeout=5) as connection:
+            request = HessianSerialization().encode_heartbeat()
+            connection.sendall(request)
+            response = connection.recv(1024)
+        self.assertEqual(response, HessianSerialization().encode_heartbeat(request[4:12]))
+
+    def test_client(self):
+        for serialization in (HessianSerialization, None):
+            client = DubboClient(self.server.url, **({"serialization": serialization} if serialization else {}))
+            proxy = client.proxy(INTERFACE, "1.0.0")
+            try:
+                self.assertEqual(proxy.get_user(1), {"id": 1, "name": "user-1"})
+                self.assertEqual(proxy.get_user_async(2), {"id": 2})
+                with self.assertRaises(GenericException) as context:
+                    proxy.fail()
+                self.assertEqual(context.exception.exception_message, "bad user")
+                results = batch(proxy, [("get_user", (i,)) for i in range(20)], concurrency=2)
+                self.assertEqual([i["id"] for i in results], list(range(20)))
+
+                order = JavaClass("com.pubbo.Order")
+                order.order_id, order.buyer_name = 1, "buyer"
+                order.items = [JavaClass("com.pubbo.OrderItem")]
+                order.items[0].sku_id = 2
+                self.assertEqual(
+                    proxy.describe(order, {"tagName": "a"}),
+                    [True, "com.pubbo.Order", 1, "buyer", {"tagName": "a"}, True, "com.pubbo.OrderItem", 2],
+                )
+            finally:
+                client.close()
+
+    def test_backpressure(self):
+        client = DubboClient(self.server.url)
+        proxy = client.proxy(INTERFACE, "1.0.0")
+        threads = [threading.Thread(target=proxy.slow, args=(0.3,)) for _ in range(2)]
+        try:
+            for thread in threads:
+                thread.start()
+            time.sleep(0.1)
+            with self.assertRaises(Exception) as context:
+                proxy.get_user(1)
+            self.assertEqual(str(context.exception), "SERVER_THREAD_POOL_EXHAUSTED_ERROR")
+            self.assertEqual(self.server.rejected, 1)
+
+            for thread in threads:
+                thread.join()
+            self.assertEqual(proxy.get_user(1)["id"], 1)
+        finally:
+            client.close()
+
+    def test_close(self):
+        loop = self.server.loop
+        ip, port = self.server.url.split(":")
+        with socket.create_connection((ip, int(port)), timeout=5) as connection:
+            # 先调用一次 确认连接已经被接受
+            body = request_body("getUser", "I", [1])
+            head = b"\xda\xbb\xc2\x00" + (7).to_bytes(8, "big") + len(body).to_bytes(4, "big")
+            connection.sendall(head + body)
+            self.assertGreater(len(connection.recv(65536)), 16)
+
+            self.server.close()
+            self.assertTrue(loop.is_closed())
+            self.assertEqual(self.server.connections, set())
+            # 关闭前接受的连接已经断开 之后的请求没有响应
+            try:
+                connection.sendall(head + body)
+                self.assertEqual(connection.recv(65536), b"")
+            except OSError:
+                pass
+
+        # 关闭后读线程交来的请求直接断开连接
+        with self.assertRaises(OSError):
+            self.server.submit(lambda message: None, head, body)
+        self.assertEqual(self.server.active, 0)
@@ -0,0 +1,292 @@
+import asyncio
+import os
+import resource
+import socket
+import threading
+import time
+import unittest
+
+from pubbo.aio import AsyncConnection
+from pubbo.client import DubboClient, InterfaceProxy
+from pubbo.mock import MockProvider
+from pubbo.serialization import EVENT_FLAG, REQUEST_FLAG, HessianSerialization
+from pubbo.server import DubboServer
+from pubbo.transport import HEAD_LENGTH, Connection, ConnectionPool
+
+INTERFACE = "com.pubbo.UserFacade"
+
+
+class ScriptedProvider(object):
+    # 按帧收发的 provider 由 script(provider, connection) 决定每一步收发什么 收到的帧头记在 heads 中
+    def __init__(self, script):
+        self.script = script
+        self.heads = []
+        self.error = None
+        self.server = socket.socket()
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    @property
+    def address(self):
+        return self.server.getsockname()
+
+    def run(self):
+        connection, _ = self.server.accept()
+        try:
+            self.script(self, connection)
+            # 等 consumer 先关闭连接
+            while connection.recv(4096):
+                pass
+        except Exception as e:
+            self.error = e
+        finally:
+            connection.close()
+            self.server.close()
+
+    def receive(self, connection):
+        head = self.read(connection, HEAD_LENGTH)
+        self.heads.append(head)
+        return head, self.read(connection, int.from_bytes(head[12:16], byteorder="big"))
+
+    @staticmethod
+    def read(connection, length):
+        data = b""
+        while len(data) < length:
+            chunk = connection.recv(length - len(data))
+            if not chunk:
+                raise EOFError()
+            data += chunk
+        return data
+
+
+def heartbeat_during_call(provider, connection):
+    # 收到调用后先发心跳请求 收到心跳响应后才返回调用结果
+    head, _ = provider.receive(connection)
+    heartbeat = HessianSerialization().encode_heartbeat()
+    connection.sendall(heartbeat)
+    reply, _ = provider.receive(connection)
+    if not reply[2] & EVENT_FLAG or reply[2] & REQUEST_FLAG or reply[4:12] != heartbeat[4:12]:
+        raise Exception("bad heartbeat reply")
+    connection.sendall(DubboServer().response(head, {"id": 1}))
+
+
+def answer_heartbeats(provider, connection):
+    while True:
+        head, _ = provider.receive(connection)
+        if head[2] & EVENT_FLAG:
+            connection.sendall(HessianSerialization().encode_heartbeat(head[4:12]))
+
+
+def request_frame(request_id):
+    message = HessianSerialization().encode_heartbeat()
+    # 借用心跳帧的格式 去掉 event 标记即为一个普通请求
+    return message[:2] + bytes((message[2] & ~EVENT_FLAG,)) + message[3:4] + request_id.to_bytes(8, "big") + message[12:]
+
+
+class ConnectionTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.provider = MockProvider()
+        cls.provider.register(INTERFACE, "getUser", lambda i: {"id": i})
+        cls.provider.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.provider.close()
+
+    def test_high_fd(self):
+        # fd 超过 1024 时带 deadline 的发送仍然可用
+        if resource.getrlimit(resource.RLIMIT_NOFILE)[0] < 1200:
+            self.skipTest("RLIMIT_NOFILE too small")
+        fds = []
+        client = None
+        try:
+            while not fds or fds[-1] < 1100:
+                fds.append(os.dup(0))
+            client = DubboClient(self.provider.url)
+            self.assertEqual(client.proxy(INTERFACE, "1.0.0").get_user(1), {"id": 1})
+            self.assertGreater(client.pool.connections[0].socket.fileno(), 1024)
+        finally:
+            if client is not None:
+                client.close()
+            for fd in fds:
+                os.close(fd)
+
+    def test_send_error(self):
+        ip, port = self.provider.url.split(":")
+        connection = Connection(ip, port)
+
+        def send(message, deadline=None):
+            raise ValueError("send error")
+
+        connection.send = send
+        try:
+            with self.assertRaises(ValueError):
+                connection.request(1, b"", deadline=None)
+            self.assertEqual(connection.pending, {})
+        finally:
+            connection.close()
+
+
+    def test_async_send_timeout(self):
+        # 对端一直不读 发送卡在 drain 时也按 timeout 报错
+        stop = threading.Event()
+        provider = ScriptedProvider(lambda provider, connection: stop.wait(5))
+
+        async def main():
+            connection = await AsyncConnection.open(*provider.address)
+            try:
+                start = time.monotonic()
+                with self.assertRaises(asyncio.TimeoutError):
+                    await connection.request(1, b"\0" * 64 * 1024 * 1024, 0.2)
+                self.assertEqual(connection.pending, {})
+                self.assertFalse(connection.closed)
+                return time.monotonic() - start
+            finally:
+                connection.close()
+
+        try:
+            self.assertLess(asyncio.run(main()), 2)
+        finally:
+            stop.set()
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.provider = MockProvider()
+        cls.provider.start()
+        cls.ip, cls.port = cls.provider.url.split(":")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.provider.close()
+
+    def pool(self, **kwargs):
+        pool = ConnectionPool(self.ip, self.port, **kwargs)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_checkout_timeout(self):
+        # 所有连接都满了 等到 timeout 仍没有连接归还时报错
+        pool = self.pool(max_size=1, max_pending=1)
+        connection = pool.checkout()
+        start = time.monotonic()
+        with self.assertRaises(TimeoutError):
+            pool.checkout(0.1)
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+
+        # 等待中的 checkout 在连接归还后拿到同一条连接
+        threading.Timer(0.05, pool.checkin, (connection,)).start()
+        self.assertIs(pool.checkout(2), connection)
+        self.assertEqual(len(pool.connections), 1)
+
+    def test_evict_closed(self):
+        pool = self.pool(max_size=1)
+        connection = pool.checkout()
+        pool.checkin(connection)
+        connection.close()
+
+        replaced = pool.checkout()
+        self.assertIsNot(replaced, connection)
+        self.assertFalse(replaced.closed)
+        self.assertEqual(pool.connections, [replaced])
+        pool.checkin(replaced)
+
+    def test_evict_broken(self):
+        # 对端断开后读线程把连接标记为关闭 下次 checkout 换一条新连接
+        pool = self.pool(max_size=1)
+        connection = pool.checkout()
+        pool.checkin(connection)
+        connection.socket.shutdown(socket.SHUT_RDWR)
+        deadline = time.monotonic() + 2
+        while not connection.closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(connection.closed)
+
+        replaced = pool.checkout()
+        self.assertIsNot(replaced, connection)
+        self.assertEqual(pool.connections, [replaced])
+        pool.checkin(replaced)
+
+    def test_max_idle_time(self):
+        pool = self.pool(max_idle_time=0.05, heartbeat=None)
+        connection = pool.checkout()
+        pool.checkin(connection)
+        time.sleep(0.1)
+
+        replaced = pool.checkout()
+        self.assertIsNot(replaced, connection)
+        self.assertTrue(connection.closed)
+        self.assertEqual(pool.connections, [replaced])
+        pool.checkin(replaced)
+
+        # 开启心跳时保留最后一条空闲连接
+        pool = self.pool(max_idle_time=0.05)
+        connection = pool.checkout()
+        pool.checkin(connection)
+        time.sleep(0.1)
+        self.assertIs(pool.checkout(), connection)
+        self.assertFalse(connection.closed)
+        pool.checkin(connection)
+
+
+class HeartbeatTest(unittest.TestCase):
+    def heartbeats(self, provider):
+        return [i for i in provider.heads if i[2] & EVENT_FLAG and i[2] & REQUEST_FLAG]
+
+    def test_event_during_call(self):
+        provider = ScriptedProvider(heartbeat_during_call)
+        connection = Connection(*provider.address)
+        try:
+            head, payload = connection.request(7, request_frame(7)).result(2)
+            self.assertEqual(int.from_bytes(head[4:12], "big"), 7)
+            self.assertEqual(InterfaceProxy._decode(head, payload), {"id": 1})
+            self.assertFalse(connection.closed)
+        finally:
+            connection.close()
+        provider.thread.join(2)
+        self.assertIsNone(provider.error)
+
+    def test_async_event_during_call(self):
+        provider = ScriptedProvider(heartbeat_during_call)
+
+        async def main():
+            connection = await AsyncConnection.open(*provider.address)
+            try:
+                head, payload = await connection.request(7, request_frame(7), 2)
+                self.assertFalse(connection.closed)
+                return InterfaceProxy._decode(head, payload)
+            finally:
+                connection.close()
+
+        self.assertEqual(asyncio.run(main()), {"id": 1})
+        provider.thread.join(2)
+        self.assertIsNone(provider.error)
+
+    def test_keep_alive(self):
+        # 空闲超过 heartbeat 秒发心跳 收到心跳响应后连接保持打开
+        provider = ScriptedProvider(answer_heartbeats)
+        connection = Connection(*provider.address, timeout=0.02, heartbeat=0.05)
+        try:
+            time.sleep(0.3)
+            self.assertGreaterEqual(len(self.heartbeats(provider)), 2)
+            self.assertFalse(connection.closed)
+        finally:
+            connection.close()
+
+    def test_async_keep_alive(self):
+        provider = ScriptedProvider(answer_heartbeats)
+
+        async def main():
+            connection = await AsyncConnection.open(*provider.address, heartbeat=0.05)
+            try:
+                await asyncio.sleep(0.3)
+                return connection.closed
+            finally:
+                connection.close()
+
+        self.assertFalse(asyncio.run(main()))
+        self.assertGreaterEqual(len(self.heartbeats(provider)), 2)